@@ -40,7 +40,7 @@ def create_basic_messages_slide(prs, theme):
         sender="Support Agent",
         timestamp="10:30 AM",
         variant="received",
-        theme=theme.__dict__,
+        theme=theme.to_dict(),
     )
     received.render(slide, left=0.5, top=2.0, width=7.0)
 
@@ -49,13 +49,13 @@ def create_basic_messages_slide(prs, theme):
         text="I need help with my account settings",
         timestamp="10:31 AM",
         variant="sent",
-        theme=theme.__dict__,
+        theme=theme.to_dict(),
     )
     sent.render(slide, left=0.5, top=3.3, width=7.0)
 
     # System message (centered)
     system = ChatMessage(
-        text="Support Agent joined the conversation", variant="system", theme=theme.__dict__
+        text="Support Agent joined the conversation", variant="system", theme=theme.to_dict()
     )
     system.render(slide, left=0.5, top=4.5, width=7.0)
 
@@ -80,7 +80,7 @@ def create_avatar_messages_slide(prs, theme):
         timestamp="2:15 PM",
         variant="received",
         show_avatar=True,
-        theme=theme.__dict__,
+        theme=theme.to_dict(),
     )
     msg1.render(slide, left=0.5, top=2.0, width=7.0)
 
@@ -89,7 +89,7 @@ def create_avatar_messages_slide(prs, theme):
         text="Great! I have a question about billing.",
         timestamp="2:16 PM",
         variant="sent",
-        theme=theme.__dict__,
+        theme=theme.to_dict(),
     )
     msg2.render(slide, left=0.5, top=3.5, width=7.0)
 
@@ -101,7 +101,7 @@ def create_avatar_messages_slide(prs, theme):
         timestamp="2:17 PM",
         variant="received",
         show_avatar=True,
-        theme=theme.__dict__,
+        theme=theme.to_dict(),
     )
     msg3.render(slide, left=0.5, top=4.7, width=7.0)
 
@@ -153,7 +153,7 @@ def create_customer_support_conversation(prs, theme):
 
     # Reduce spacing and adjust positioning to fit within slide boundaries
     # Slide height is 7.5", title takes ~1.3", leaving ~6.2" for content
-    conversation = ChatConversation(messages, spacing=0.15, theme=theme.__dict__)
+    conversation = ChatConversation(messages, spacing=0.15, theme=theme.to_dict())
     conversation.render(slide, left=1.0, top=1.8, width=8.0)
 
 
@@ -204,7 +204,7 @@ def create_team_messaging_conversation(prs, theme):
         },
     ]
 
-    conversation = ChatConversation(messages, spacing=0.2, theme=theme.__dict__)
+    conversation = ChatConversation(messages, spacing=0.2, theme=theme.to_dict())
     conversation.render(slide, left=1.0, top=1.8, width=8.0)
 
 
@@ -247,7 +247,7 @@ def create_product_demo_conversation(prs, theme):
         },
     ]
 
-    conversation = ChatConversation(messages, spacing=0.18, theme=theme.__dict__)
+    conversation = ChatConversation(messages, spacing=0.18, theme=theme.to_dict())
     conversation.render(slide, left=1.0, top=1.8, width=8.0)
 
 
@@ -283,7 +283,7 @@ def create_mixed_scenarios_slide(prs, theme):
         },
     ]
 
-    conv1 = ChatConversation(messages_left, spacing=0.18, theme=theme.__dict__)
+    conv1 = ChatConversation(messages_left, spacing=0.18, theme=theme.to_dict())
     conv1.render(slide, left=0.5, top=1.8, width=4.5)
 
     # Short exchange - right column
@@ -299,7 +299,7 @@ def create_mixed_scenarios_slide(prs, theme):
         {"text": "Happy to be here!", "variant": "sent"},
     ]
 
-    conv2 = ChatConversation(messages_right, spacing=0.18, theme=theme.__dict__)
+    conv2 = ChatConversation(messages_right, spacing=0.18, theme=theme.to_dict())
     conv2.render(slide, left=5.2, top=1.8, width=4.5)
 
 
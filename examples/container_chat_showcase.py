@@ -55,7 +55,7 @@ def create_iphone_imessage_slide(prs, theme):
         title_shape.text_frame.paragraphs[0].font.color.rgb = theme.get_color("foreground.DEFAULT")
 
     # iPhone container
-    iphone = iPhoneContainer(show_notch=True, theme=theme.__dict__)
+    iphone = iPhoneContainer(show_notch=True, theme=theme.to_dict())
     content_area = iphone.render(slide, left=3.0, top=0.8, width=4.0, height=6.5)
 
     # iMessage conversation inside (3 messages to fit container)
@@ -65,7 +65,7 @@ def create_iphone_imessage_slide(prs, theme):
         {"text": "Perfect! 👍", "variant": "received", "timestamp": "11:32 AM"},
     ]
 
-    conversation = iMessageConversation(messages, theme=theme.__dict__)
+    conversation = iMessageConversation(messages, theme=theme.to_dict())
     conversation.render(
         slide, left=content_area["left"], top=content_area["top"], width=content_area["width"]
     )
@@ -84,7 +84,7 @@ def create_samsung_android_slide(prs, theme):
         title_shape.text_frame.paragraphs[0].font.color.rgb = theme.get_color("foreground.DEFAULT")
 
     # Samsung container
-    samsung = SamsungContainer(variant="galaxy-s", theme=theme.__dict__)
+    samsung = SamsungContainer(variant="galaxy-s", theme=theme.to_dict())
     content_area = samsung.render(slide, left=3.0, top=0.8, width=4.0, height=6.5)
 
     # Android Messages conversation inside (3 messages to fit container)
@@ -99,7 +99,7 @@ def create_samsung_android_slide(prs, theme):
         {"text": "Yes please", "sender": "Sarah", "variant": "received", "timestamp": "2:52 PM"},
     ]
 
-    conversation = AndroidConversation(messages, theme=theme.__dict__)
+    conversation = AndroidConversation(messages, theme=theme.to_dict())
     conversation.render(
         slide, left=content_area["left"], top=content_area["top"], width=content_area["width"]
     )
@@ -122,7 +122,7 @@ def create_browser_slack_slide(prs, theme):
         title="Slack - #general",
         url="slack.com/messages/general",
         browser_type="chrome",
-        theme=theme.__dict__,
+        theme=theme.to_dict(),
     )
     content_area = browser.render(slide, left=1.0, top=1.5, width=8.0, height=5.2)
 
@@ -150,7 +150,7 @@ def create_browser_slack_slide(prs, theme):
         },
     ]
 
-    conversation = SlackConversation(messages, spacing=0.15, theme=theme.__dict__)
+    conversation = SlackConversation(messages, spacing=0.15, theme=theme.to_dict())
     conversation.render(
         slide, left=content_area["left"], top=content_area["top"], width=content_area["width"]
     )
@@ -170,7 +170,7 @@ def create_windows_teams_slide(prs, theme):
 
     # Windows window
     windows = WindowsWindow(
-        title="Microsoft Teams", app_icon="👥", show_menubar=False, theme=theme.__dict__
+        title="Microsoft Teams", app_icon="👥", show_menubar=False, theme=theme.to_dict()
     )
     content_area = windows.render(slide, left=1.0, top=1.5, width=8.0, height=5.5)
 
@@ -198,7 +198,7 @@ def create_windows_teams_slide(prs, theme):
         },
     ]
 
-    conversation = TeamsConversation(messages, spacing=0.15, theme=theme.__dict__)
+    conversation = TeamsConversation(messages, spacing=0.15, theme=theme.to_dict())
     conversation.render(
         slide, left=content_area["left"], top=content_area["top"], width=content_area["width"]
     )
@@ -218,7 +218,7 @@ def create_macos_messages_slide(prs, theme):
 
     # macOS window
     macos_window = MacOSWindow(
-        title="Messages", app_icon="💬", show_toolbar=False, theme=theme.__dict__
+        title="Messages", app_icon="💬", show_toolbar=False, theme=theme.to_dict()
     )
     content_area = macos_window.render(slide, left=1.5, top=1.5, width=7.0, height=5.5)
 
@@ -229,7 +229,7 @@ def create_macos_messages_slide(prs, theme):
         {"text": "Almost done! Sending it over now", "variant": "received", "timestamp": "3:02 PM"},
     ]
 
-    conversation = iMessageConversation(messages, theme=theme.__dict__)
+    conversation = iMessageConversation(messages, theme=theme.to_dict())
     conversation.render(
         slide, left=content_area["left"], top=content_area["top"], width=content_area["width"]
     )
@@ -249,7 +249,7 @@ def create_browser_chatgpt_slide(prs, theme):
 
     # Browser window
     browser = BrowserWindow(
-        title="ChatGPT", url="chat.openai.com", browser_type="safari", theme=theme.__dict__
+        title="ChatGPT", url="chat.openai.com", browser_type="safari", theme=theme.to_dict()
     )
     content_area = browser.render(slide, left=1.0, top=1.5, width=8.0, height=5.2)
 
@@ -262,7 +262,7 @@ def create_browser_chatgpt_slide(prs, theme):
         },
     ]
 
-    conversation = ChatGPTConversation(messages, spacing=0.2, theme=theme.__dict__)
+    conversation = ChatGPTConversation(messages, spacing=0.2, theme=theme.to_dict())
     conversation.render(
         slide, left=content_area["left"], top=content_area["top"], width=content_area["width"]
     )
@@ -286,7 +286,7 @@ def create_generic_container_slide(prs, theme):
         show_header=True,
         show_border=True,
         variant="outlined",
-        theme=theme.__dict__,
+        theme=theme.to_dict(),
     )
     content_area = container.render(slide, left=2.0, top=1.5, width=6.0, height=5.5)
 
@@ -297,7 +297,7 @@ def create_generic_container_slide(prs, theme):
         {"text": "Great work team!", "sender": "Bob", "variant": "received", "timestamp": "14:02"},
     ]
 
-    conversation = WhatsAppConversation(messages, theme=theme.__dict__)
+    conversation = WhatsAppConversation(messages, theme=theme.to_dict())
     conversation.render(
         slide, left=content_area["left"], top=content_area["top"], width=content_area["width"]
     )
@@ -316,39 +316,39 @@ def create_comparison_slide(prs, theme):
         title_shape.text_frame.paragraphs[0].font.color.rgb = theme.get_color("foreground.DEFAULT")
 
     # iPhone (left)
-    iphone = iPhoneContainer(show_notch=True, theme=theme.__dict__)
+    iphone = iPhoneContainer(show_notch=True, theme=theme.to_dict())
     iphone_area = iphone.render(slide, left=0.5, top=1.8, width=3.0, height=5.0)
 
     iphone_msgs = [
         {"text": "iPhone", "variant": "sent"},
         {"text": "Container", "variant": "received"},
     ]
-    iphone_conv = iMessageConversation(iphone_msgs, theme=theme.__dict__)
+    iphone_conv = iMessageConversation(iphone_msgs, theme=theme.to_dict())
     iphone_conv.render(
         slide, left=iphone_area["left"], top=iphone_area["top"], width=iphone_area["width"]
     )
 
     # Samsung (middle-left)
-    samsung = SamsungContainer(theme=theme.__dict__)
+    samsung = SamsungContainer(theme=theme.to_dict())
     samsung_area = samsung.render(slide, left=3.75, top=1.8, width=3.0, height=5.0)
 
     samsung_msgs = [
         {"text": "Samsung", "variant": "sent"},
         {"text": "Container", "variant": "received"},
     ]
-    samsung_conv = AndroidConversation(samsung_msgs, theme=theme.__dict__)
+    samsung_conv = AndroidConversation(samsung_msgs, theme=theme.to_dict())
     samsung_conv.render(
         slide, left=samsung_area["left"], top=samsung_area["top"], width=samsung_area["width"]
     )
 
     # Generic container (right)
-    generic = ChatContainer(title="Generic", show_header=True, theme=theme.__dict__)
+    generic = ChatContainer(title="Generic", show_header=True, theme=theme.to_dict())
     generic_area = generic.render(slide, left=7.0, top=1.8, width=2.5, height=5.0)
 
     generic_msgs = [
         {"text": "Generic chat container", "variant": "received"},
     ]
-    generic_conv = WhatsAppConversation(generic_msgs, theme=theme.__dict__)
+    generic_conv = WhatsAppConversation(generic_msgs, theme=theme.to_dict())
     generic_conv.render(
         slide, left=generic_area["left"], top=generic_area["top"], width=generic_area["width"]
     )
@@ -368,7 +368,7 @@ def create_browser_facebook_slide(prs, theme):
 
     # Browser window
     browser = BrowserWindow(
-        title="Messenger", url="messenger.com", browser_type="chrome", theme=theme.__dict__
+        title="Messenger", url="messenger.com", browser_type="chrome", theme=theme.to_dict()
     )
     content_area = browser.render(slide, left=1.0, top=1.5, width=8.0, height=5.2)
 
@@ -379,7 +379,7 @@ def create_browser_facebook_slide(prs, theme):
         {"text": "Perfect! See you then", "variant": "received", "avatar_text": "JS"},
     ]
 
-    conversation = FacebookMessengerConversation(messages, spacing=0.12, theme=theme.__dict__)
+    conversation = FacebookMessengerConversation(messages, spacing=0.12, theme=theme.to_dict())
     conversation.render(
         slide, left=content_area["left"], top=content_area["top"], width=content_area["width"]
     )
@@ -403,7 +403,7 @@ def create_generic_aol_slide(prs, theme):
         show_header=True,
         show_border=True,
         variant="outlined",
-        theme=theme.__dict__,
+        theme=theme.to_dict(),
     )
     content_area = container.render(slide, left=2.0, top=1.5, width=6.0, height=5.5)
 
@@ -429,7 +429,7 @@ def create_generic_aol_slide(prs, theme):
         },
     ]
 
-    conversation = AIMConversation(messages, spacing=0.15, theme=theme.__dict__)
+    conversation = AIMConversation(messages, spacing=0.15, theme=theme.to_dict())
     conversation.render(
         slide, left=content_area["left"], top=content_area["top"], width=content_area["width"]
     )
@@ -453,7 +453,7 @@ def create_generic_msn_slide(prs, theme):
         show_header=True,
         show_border=True,
         variant="outlined",
-        theme=theme.__dict__,
+        theme=theme.to_dict(),
     )
     content_area = container.render(slide, left=2.0, top=1.5, width=6.0, height=5.5)
 
@@ -481,7 +481,7 @@ def create_generic_msn_slide(prs, theme):
         },
     ]
 
-    conversation = MSNConversation(messages, spacing=0.12, theme=theme.__dict__)
+    conversation = MSNConversation(messages, spacing=0.12, theme=theme.to_dict())
     conversation.render(
         slide, left=content_area["left"], top=content_area["top"], width=content_area["width"]
     )
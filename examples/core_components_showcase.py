@@ -350,7 +350,7 @@ def create_tile_avatar_showcase(prs, theme):
     ]
 
     for tile, left in tiles:
-        tile.theme = theme.__dict__
+        tile.theme = theme.to_dict()
         tile.render(slide, left=left, top=2.0)
 
     # Avatars - different sizes and variants
@@ -362,7 +362,7 @@ def create_tile_avatar_showcase(prs, theme):
     ]
 
     for avatar, left, top in avatars:
-        avatar.theme = theme.__dict__
+        avatar.theme = theme.to_dict()
         avatar.render(slide, left=left, top=top)
 
     # Avatar with label - horizontal
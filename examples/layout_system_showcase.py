@@ -35,37 +35,37 @@ def create_grid_demo(prs, theme):
 
     # Row 1: Full width example
     pos = grid.get_span(col_span=12, col_start=0, left=0.5, top=1.8, width=9.0, height=0.6)
-    Badge(text="12 Columns - Full Width", variant="outline", theme=theme.__dict__).render(
+    Badge(text="12 Columns - Full Width", variant="outline", theme=theme.to_dict()).render(
         slide, left=pos["left"] + 3.5, top=pos["top"] + 0.1
     )
 
     # Row 2: Two equal columns (6 + 6)
     pos1 = grid.get_span(col_span=6, col_start=0, left=0.5, top=2.6, width=9.0, height=0.6)
-    Badge(text="6 Columns", variant="default", theme=theme.__dict__).render(
+    Badge(text="6 Columns", variant="default", theme=theme.to_dict()).render(
         slide, left=pos1["left"] + 1.5, top=pos1["top"] + 0.1
     )
 
     pos2 = grid.get_span(col_span=6, col_start=6, left=0.5, top=2.6, width=9.0, height=0.6)
-    Badge(text="6 Columns", variant="default", theme=theme.__dict__).render(
+    Badge(text="6 Columns", variant="default", theme=theme.to_dict()).render(
         slide, left=pos2["left"] + 1.5, top=pos2["top"] + 0.1
     )
 
     # Row 3: Three equal columns (4 + 4 + 4)
     for i in range(3):
         pos = grid.get_span(col_span=4, col_start=i * 4, left=0.5, top=3.4, width=9.0, height=0.6)
-        Badge(text="4 Cols", variant="secondary", theme=theme.__dict__).render(
+        Badge(text="4 Cols", variant="secondary", theme=theme.to_dict()).render(
             slide, left=pos["left"] + 0.8, top=pos["top"] + 0.1
         )
 
     # Row 4: Asymmetric layout (8 + 4) - Main + Sidebar pattern
     main = grid.get_span(col_span=8, col_start=0, left=0.5, top=4.2, width=9.0, height=1.8)
-    card_main = Card(variant="elevated", theme=theme.__dict__)
+    card_main = Card(variant="elevated", theme=theme.to_dict())
     card_main.add_child(Card.Title("Main Content (8 cols)"))
     card_main.add_child(Card.Description("Primary content area"))
     card_main.render(slide, **main)
 
     sidebar = grid.get_span(col_span=4, col_start=8, left=0.5, top=4.2, width=9.0, height=1.8)
-    card_sidebar = Card(variant="outlined", theme=theme.__dict__)
+    card_sidebar = Card(variant="outlined", theme=theme.to_dict())
     card_sidebar.add_child(Card.Title("Sidebar (4)"))
     card_sidebar.add_child(Card.Description("Secondary info"))
     card_sidebar.render(slide, **sidebar)
@@ -73,7 +73,7 @@ def create_grid_demo(prs, theme):
     # Row 5: Four equal columns
     for i in range(4):
         pos = grid.get_span(col_span=3, col_start=i * 3, left=0.5, top=6.2, width=9.0, height=0.6)
-        Badge(text="3", variant="success", theme=theme.__dict__).render(
+        Badge(text="3", variant="success", theme=theme.to_dict()).render(
             slide, left=pos["left"] + 0.8, top=pos["top"] + 0.1
         )
 
@@ -93,7 +93,7 @@ def create_container_demo(prs, theme):
     # Small container
     container_sm = Container(size="sm", padding="md", center=True)
     bounds_sm = container_sm.render(slide, top=2.0)
-    card_sm = Card(variant="elevated", theme=theme.__dict__)
+    card_sm = Card(variant="elevated", theme=theme.to_dict())
     card_sm.add_child(Card.Title('Small (8")'))
     card_sm.add_child(Card.Description("Focused content"))
     card_sm.render(
@@ -103,7 +103,7 @@ def create_container_demo(prs, theme):
     # Medium container
     container_md = Container(size="md", padding="md", center=True)
     bounds_md = container_md.render(slide, top=3.5)
-    card_md = Card(variant="elevated", theme=theme.__dict__)
+    card_md = Card(variant="elevated", theme=theme.to_dict())
     card_md.add_child(Card.Title('Medium (9")'))
     card_md.add_child(Card.Description("Balanced width"))
     card_md.render(
@@ -113,7 +113,7 @@ def create_container_demo(prs, theme):
     # Large container
     container_lg = Container(size="lg", padding="md", center=True)
     bounds_lg = container_lg.render(slide, top=5.0)
-    card_lg = Card(variant="elevated", theme=theme.__dict__)
+    card_lg = Card(variant="elevated", theme=theme.to_dict())
     card_lg.add_child(Card.Title('Large (10")'))
     card_lg.add_child(Card.Description("Standard slide width"))
     card_lg.render(
@@ -122,7 +122,7 @@ def create_container_demo(prs, theme):
 
     # Visual indicators of centering
     Divider(
-        orientation="vertical", thickness=1, color="border.DEFAULT", theme=theme.__dict__
+        orientation="vertical", thickness=1, color="border.DEFAULT", theme=theme.to_dict()
     ).render(slide, left=5.0, top=1.8, height=4.6)
 
 
@@ -139,14 +139,14 @@ def create_stack_demo(prs, theme):
         title_shape.text_frame.paragraphs[0].font.color.rgb = theme.get_color("foreground.DEFAULT")
 
     # Vertical stack on left
-    Badge(text="Vertical Stack", variant="outline", theme=theme.__dict__).render(
+    Badge(text="Vertical Stack", variant="outline", theme=theme.to_dict()).render(
         slide, left=0.5, top=1.8
     )
 
     # Create cards
     v_cards = []
     for i in range(4):
-        card = Card(variant="default", theme=theme.__dict__)
+        card = Card(variant="default", theme=theme.to_dict())
         card.add_child(Card.Title(f"Item {i + 1}"))
         v_cards.append(card)
 
@@ -155,19 +155,19 @@ def create_stack_demo(prs, theme):
     v_stack.render_children(slide, v_cards, left=0.5, top=2.2, item_width=4.0)
 
     # Vertical divider
-    Divider(orientation="vertical", thickness=1, theme=theme.__dict__).render(
+    Divider(orientation="vertical", thickness=1, theme=theme.to_dict()).render(
         slide, left=4.8, top=1.8, height=4.5
     )
 
     # Horizontal stack on right
-    Badge(text="Horizontal Stack", variant="outline", theme=theme.__dict__).render(
+    Badge(text="Horizontal Stack", variant="outline", theme=theme.to_dict()).render(
         slide, left=5.2, top=1.8
     )
 
     # Create cards
     h_cards = []
     for i in range(3):
-        card = Card(variant="outlined", theme=theme.__dict__)
+        card = Card(variant="outlined", theme=theme.to_dict())
         card.add_child(Card.Title(f"{i + 1}"))
         h_cards.append(card)
 
@@ -199,7 +199,7 @@ def create_spacing_demo(prs, theme):
 
     for gap_size, label in gaps:
         # Label
-        Badge(text=label, variant="outline", theme=theme.__dict__).render(
+        Badge(text=label, variant="outline", theme=theme.to_dict()).render(
             slide, left=0.5, top=top - 0.05
         )
 
@@ -210,12 +210,12 @@ def create_spacing_demo(prs, theme):
         )
 
         for pos in positions:
-            Badge(text="•", variant="default", theme=theme.__dict__).render(
+            Badge(text="•", variant="default", theme=theme.to_dict()).render(
                 slide, left=pos["left"], top=pos["top"]
             )
 
         # Gap size indicator
-        Badge(text=f"gap: {gap_size}", variant="secondary", theme=theme.__dict__).render(
+        Badge(text=f"gap: {gap_size}", variant="secondary", theme=theme.to_dict()).render(
             slide, left=7.5, top=top - 0.05
         )
 
@@ -252,12 +252,12 @@ def create_responsive_dashboard(prs, theme):
         # Grid knows its bounds - just specify cell position
         pos = grid.get_cell(col_span=4, col_start=col_start, row_start=0)
         MetricCard(
-            label=label, value=value, change=change, trend=trend, theme=theme.__dict__
+            label=label, value=value, change=change, trend=trend, theme=theme.to_dict()
         ).render(slide, **pos)
 
     # Row 1 - Main content (8 cols)
     main_pos = grid.get_cell(col_span=8, col_start=0, row_start=1)
-    main_card = Card(variant="elevated", theme=theme.__dict__)
+    main_card = Card(variant="elevated", theme=theme.to_dict())
     main_card.add_child(Card.Title("Main Content (8/12 cols)"))
     main_card.add_child(Card.Description("Primary content area scales with grid system"))
     main_card.render(slide, **main_pos)
@@ -266,15 +266,15 @@ def create_responsive_dashboard(prs, theme):
     sidebar_pos = grid.get_cell(col_span=4, col_start=8, row_start=1)
 
     # Just a label badge for the sidebar section
-    Badge(text="Actions (4/12)", variant="outline", theme=theme.__dict__).render(
+    Badge(text="Actions (4/12)", variant="outline", theme=theme.to_dict()).render(
         slide, left=sidebar_pos["left"] + 0.1, top=sidebar_pos["top"] + 0.1
     )
 
     # Buttons stacked in sidebar - grid provides boundaries
     buttons = [
-        Button("Export", variant="outline", size="sm", theme=theme.__dict__),
-        Button("Refresh", variant="secondary", size="sm", theme=theme.__dict__),
-        Button("Settings", variant="ghost", size="sm", theme=theme.__dict__),
+        Button("Export", variant="outline", size="sm", theme=theme.to_dict()),
+        Button("Refresh", variant="secondary", size="sm", theme=theme.to_dict()),
+        Button("Settings", variant="ghost", size="sm", theme=theme.to_dict()),
     ]
 
     stack = Stack(direction="vertical", gap="sm", align="start")
@@ -310,7 +310,7 @@ def create_divider_demo(prs, theme):
 
     # Create badges
     section_badges = [
-        Badge(text=label, variant=variant, theme=theme.__dict__) for label, variant in sections
+        Badge(text=label, variant=variant, theme=theme.to_dict()) for label, variant in sections
     ]
 
     # Stack badges with proper gap
@@ -327,12 +327,12 @@ def create_divider_demo(prs, theme):
 
         # Add divider below each badge (except last)
         if badge != section_badges[-1]:
-            Divider(orientation="horizontal", thickness=1, theme=theme.__dict__).render(
+            Divider(orientation="horizontal", thickness=1, theme=theme.to_dict()).render(
                 slide, left=pos["left"], top=pos["top"] + 0.4, width=4.0
             )
 
     # Vertical divider in center - taller and more prominent
-    Divider(orientation="vertical", thickness=2, theme=theme.__dict__).render(
+    Divider(orientation="vertical", thickness=2, theme=theme.to_dict()).render(
         slide, left=5.0, top=1.8, height=4.6
     )
 
@@ -355,7 +355,7 @@ def create_divider_demo(prs, theme):
     ]
 
     for (title, description), pos in zip(right_cards, card_positions):
-        card = Card(variant="elevated", theme=theme.__dict__)
+        card = Card(variant="elevated", theme=theme.to_dict())
         card.add_child(Card.Title(title))
         card.add_child(Card.Description(description))
         card.render(slide, left=pos["left"], top=pos["top"], width=pos["width"])
@@ -55,7 +55,7 @@ def create_imessage_slide(prs, theme):
         {"text": "👍", "variant": "received"},
     ]
 
-    conversation = iMessageConversation(messages, theme=theme.__dict__)
+    conversation = iMessageConversation(messages, theme=theme.to_dict())
     conversation.render(slide, left=1.0, top=1.8, width=8.0)
 
 
@@ -90,7 +90,7 @@ def create_android_messages_slide(prs, theme):
         {"text": "Got it 👍", "variant": "sent", "timestamp": "2:52 PM"},
     ]
 
-    conversation = AndroidConversation(messages, theme=theme.__dict__)
+    conversation = AndroidConversation(messages, theme=theme.to_dict())
     conversation.render(slide, left=1.0, top=1.8, width=8.0)
 
 
@@ -120,7 +120,7 @@ def create_chatgpt_slide(prs, theme):
         },
     ]
 
-    conversation = ChatGPTConversation(messages, spacing=0.0, theme=theme.__dict__)
+    conversation = ChatGPTConversation(messages, spacing=0.0, theme=theme.to_dict())
     conversation.render(slide, left=0.5, top=1.7, width=9.0)
 
 
@@ -149,7 +149,7 @@ def create_whatsapp_slide(prs, theme):
         {"text": "👍 Great idea", "variant": "received", "timestamp": "10:19"},
     ]
 
-    conversation = WhatsAppConversation(messages, theme=theme.__dict__)
+    conversation = WhatsAppConversation(messages, theme=theme.to_dict())
     conversation.render(slide, left=1.0, top=1.8, width=8.0)
 
 
@@ -189,7 +189,7 @@ def create_whatsapp_group_chat(prs, theme):
         {"text": "This is going to be great!", "variant": "sent", "timestamp": "14:04"},
     ]
 
-    conversation = WhatsAppConversation(messages, theme=theme.__dict__)
+    conversation = WhatsAppConversation(messages, theme=theme.to_dict())
     conversation.render(slide, left=1.0, top=1.8, width=8.0)
 
 
@@ -207,20 +207,20 @@ def create_comparison_slide(prs, theme):
 
     # Row 1: iMessage and Android
     imsg_messages = [{"text": "iMessage (iOS)", "variant": "sent"}]
-    imsg_conv = iMessageConversation(imsg_messages, theme=theme.__dict__)
+    imsg_conv = iMessageConversation(imsg_messages, theme=theme.to_dict())
     imsg_conv.render(slide, left=0.5, top=2.0, width=4.5)
 
     android_messages = [{"text": "Android Messages", "variant": "sent"}]
-    android_conv = AndroidConversation(android_messages, theme=theme.__dict__)
+    android_conv = AndroidConversation(android_messages, theme=theme.to_dict())
     android_conv.render(slide, left=5.0, top=2.0, width=4.5)
 
     # Row 2: WhatsApp and Facebook Messenger
     whatsapp_messages = [{"text": "WhatsApp", "variant": "sent", "timestamp": "10:30"}]
-    whatsapp_conv = WhatsAppConversation(whatsapp_messages, theme=theme.__dict__)
+    whatsapp_conv = WhatsAppConversation(whatsapp_messages, theme=theme.to_dict())
     whatsapp_conv.render(slide, left=0.5, top=3.3, width=4.5)
 
     fb_messages = [{"text": "Facebook Messenger", "variant": "sent"}]
-    fb_conv = FacebookMessengerConversation(fb_messages, theme=theme.__dict__)
+    fb_conv = FacebookMessengerConversation(fb_messages, theme=theme.to_dict())
     fb_conv.render(slide, left=5.0, top=3.3, width=4.5)
 
 
@@ -266,7 +266,7 @@ def create_slack_slide(prs, theme):
         },
     ]
 
-    conversation = SlackConversation(messages, theme=theme.__dict__)
+    conversation = SlackConversation(messages, theme=theme.to_dict())
     conversation.render(slide, left=1.0, top=1.8, width=8.0)
 
 
@@ -295,7 +295,7 @@ def create_chatgpt_code_example(prs, theme):
         },
     ]
 
-    conversation = ChatGPTConversation(messages, spacing=0.0, theme=theme.__dict__)
+    conversation = ChatGPTConversation(messages, spacing=0.0, theme=theme.to_dict())
     conversation.render(slide, left=0.5, top=1.7, width=9.0)
 
 
@@ -335,7 +335,7 @@ def create_teams_slide(prs, theme):
         },
     ]
 
-    conversation = TeamsConversation(messages, theme=theme.__dict__)
+    conversation = TeamsConversation(messages, theme=theme.to_dict())
     conversation.render(slide, left=1.0, top=1.8, width=8.0)
 
 
@@ -359,7 +359,7 @@ def create_facebook_slide(prs, theme):
         {"text": "Perfect! See you then", "variant": "sent"},
     ]
 
-    conversation = FacebookMessengerConversation(messages, theme=theme.__dict__)
+    conversation = FacebookMessengerConversation(messages, theme=theme.to_dict())
     conversation.render(slide, left=1.0, top=1.8, width=8.0)
 
 
@@ -403,7 +403,7 @@ def create_aol_slide(prs, theme):
         },
     ]
 
-    conversation = AIMConversation(messages, theme=theme.__dict__)
+    conversation = AIMConversation(messages, theme=theme.to_dict())
     conversation.render(slide, left=1.0, top=1.8, width=8.0)
 
 
@@ -450,7 +450,7 @@ def create_msn_slide(prs, theme):
         },
     ]
 
-    conversation = MSNConversation(messages, theme=theme.__dict__)
+    conversation = MSNConversation(messages, theme=theme.to_dict())
     conversation.render(slide, left=1.0, top=1.8, width=8.0)
 
 
@@ -69,7 +69,7 @@ class DomainChartGallery:
             },
             variant="clustered",
             title="Revenue by Region (Millions)",
-            theme=theme.__dict__,
+            theme=theme.to_dict(),
         )
         await column_chart.render(slide, left=0.5, top=1.5, width=4.5, height=2.5)
 
@@ -78,7 +78,7 @@ class DomainChartGallery:
             categories=["Start", "Sales", "COGS", "OpEx", "Tax", "Net"],
             values=[150, 85, -45, -30, -15, 145],
             title="Profit Bridge Analysis",
-            theme=theme.__dict__,
+            theme=theme.to_dict(),
         )
         await waterfall.render(slide, left=5.0, top=1.5, width=4.5, height=2.5)
 
@@ -92,7 +92,7 @@ class DomainChartGallery:
             },
             variant="smooth",
             title="Market Share Trends (%)",
-            theme=theme.__dict__,
+            theme=theme.to_dict(),
         )
         await line_chart.render(slide, left=0.5, top=4.5, width=4.5, height=2.5)
 
@@ -122,7 +122,7 @@ class DomainChartGallery:
                 ],
             },
             title="Product Portfolio Mix",
-            theme=theme.__dict__,
+            theme=theme.to_dict(),
         )
         await sunburst.render(slide, left=5.0, top=4.5, width=4.5, height=2.5)
 
@@ -141,7 +141,7 @@ class DomainChartGallery:
             show_percentages=True,
             show_values=True,
             title="Sales Pipeline Conversion",
-            theme=theme.__dict__,
+            theme=theme.to_dict(),
         )
         await funnel.render(slide2, left=2.5, top=2.0, width=5.0, height=4.0)
 
@@ -176,7 +176,7 @@ class DomainChartGallery:
             },
             variant="markers",
             title="Sprint Burndown Chart",
-            theme=theme.__dict__,
+            theme=theme.to_dict(),
         )
         await burndown.render(slide, left=0.5, top=1.5, width=4.5, height=2.5)
 
@@ -186,7 +186,7 @@ class DomainChartGallery:
             series={"Committed": [45, 48, 52, 50, 55, 58], "Completed": [42, 47, 48, 52, 53, 60]},
             variant="clustered",
             title="Team Velocity (Story Points)",
-            theme=theme.__dict__,
+            theme=theme.to_dict(),
         )
         await velocity.render(slide, left=5.0, top=1.5, width=4.5, height=2.5)
 
@@ -200,7 +200,7 @@ class DomainChartGallery:
             },
             variant="stacked",
             title="Feature Status by Team",
-            theme=theme.__dict__,
+            theme=theme.to_dict(),
         )
         await feature_chart.render(slide, left=0.5, top=4.5, width=4.5, height=2.5)
 
@@ -215,7 +215,7 @@ class DomainChartGallery:
             },
             variant="stacked",
             title="Cumulative Flow Diagram",
-            theme=theme.__dict__,
+            theme=theme.to_dict(),
         )
         await flow_chart.render(slide, left=5.0, top=4.5, width=4.5, height=2.5)
 
@@ -234,7 +234,7 @@ class DomainChartGallery:
             categories=["Revenue", "COGS", "SG&A", "R&D", "Other", "EBITDA"],
             values=[500, -200, -120, -50, -10, 120],
             title="EBITDA Bridge (Millions)",
-            theme=theme.__dict__,
+            theme=theme.to_dict(),
         )
         await ebitda.render(slide, left=0.5, top=1.5, width=4.5, height=2.5)
 
@@ -247,7 +247,7 @@ class DomainChartGallery:
                 "EBITDA Margin %": [18, 19, 20, 21, 22, 23],
             },
             title="Revenue & Margins",
-            theme=theme.__dict__,
+            theme=theme.to_dict(),
         )
         await combo.render(slide, left=5.0, top=1.5, width=4.5, height=2.5)
 
@@ -261,7 +261,7 @@ class DomainChartGallery:
             },
             variant="stacked",
             title="Revenue by Region (Millions)",
-            theme=theme.__dict__,
+            theme=theme.to_dict(),
         )
         await revenue_chart.render(slide, left=0.5, top=4.5, width=4.5, height=2.5)
 
@@ -271,7 +271,7 @@ class DomainChartGallery:
             values=[45, 20, 15, 12, 8],
             variant="exploded",
             title="Operating Expense Breakdown (%)",
-            theme=theme.__dict__,
+            theme=theme.to_dict(),
         )
         await expense_pie.render(slide, left=5.0, top=4.5, width=4.5, height=2.5)
 
@@ -291,7 +291,7 @@ class DomainChartGallery:
             series={"2022": [120, 85, 45, 60, 25, 30], "2023": [145, 95, 52, 68, 28, 35]},
             variant="clustered",
             title="Headcount by Department",
-            theme=theme.__dict__,
+            theme=theme.to_dict(),
         )
         await headcount.render(slide, left=0.5, top=1.5, width=4.5, height=2.5)
 
@@ -306,7 +306,7 @@ class DomainChartGallery:
             variant="filled",
             max_value=10,
             title="Employee Engagement Score",
-            theme=theme.__dict__,
+            theme=theme.to_dict(),
         )
         await radar.render(slide, left=5.0, top=1.5, width=4.5, height=2.5)
 
@@ -320,7 +320,7 @@ class DomainChartGallery:
             },
             variant="markers",
             title="Monthly Attrition Rate (%)",
-            theme=theme.__dict__,
+            theme=theme.to_dict(),
         )
         await attrition.render(slide, left=0.5, top=4.5, width=4.5, height=2.5)
 
@@ -334,7 +334,7 @@ class DomainChartGallery:
             },
             variant="stacked",
             title="Gender Distribution by Level (%)",
-            theme=theme.__dict__,
+            theme=theme.to_dict(),
         )
         await diversity.render(slide, left=5.0, top=4.5, width=4.5, height=2.5)
 
@@ -359,7 +359,7 @@ class DomainChartGallery:
             },
             variant="stacked",
             title="Project Timeline",
-            theme=theme.__dict__,
+            theme=theme.to_dict(),
         )
         await milestone.render(slide, left=0.5, top=1.5, width=4.5, height=2.5)
 
@@ -373,7 +373,7 @@ class DomainChartGallery:
             },
             variant="clustered",
             title="Resource Allocation (FTEs)",
-            theme=theme.__dict__,
+            theme=theme.to_dict(),
         )
         await resource.render(slide, left=5.0, top=1.5, width=4.5, height=2.5)
 
@@ -387,7 +387,7 @@ class DomainChartGallery:
             },
             variant="markers",
             title="Risk Items Trend",
-            theme=theme.__dict__,
+            theme=theme.to_dict(),
         )
         await risk_trend.render(slide, left=0.5, top=4.5, width=4.5, height=2.5)
 
@@ -397,7 +397,7 @@ class DomainChartGallery:
             series={"Completed": [100, 85, 45, 10], "Remaining": [0, 15, 55, 90]},
             variant="stacked",
             title="Project Phase Completion (%)",
-            theme=theme.__dict__,
+            theme=theme.to_dict(),
         )
         await progress.render(slide, left=5.0, top=4.5, width=4.5, height=2.5)
 
@@ -421,7 +421,7 @@ class DomainChartGallery:
             },
             variant="smooth",
             title="Index Performance",
-            theme=theme.__dict__,
+            theme=theme.to_dict(),
         )
         await index_chart.render(slide, left=0.5, top=1.5, width=4.5, height=2.5)
 
@@ -434,7 +434,7 @@ class DomainChartGallery:
             },
             variant="clustered",
             title="Weekly Trading Volume (Millions)",
-            theme=theme.__dict__,
+            theme=theme.to_dict(),
         )
         await volume.render(slide, left=5.0, top=1.5, width=4.5, height=2.5)
 
@@ -457,7 +457,7 @@ class DomainChartGallery:
             size_scale=2.0,
             transparency=30,
             title="Portfolio Risk vs Return Analysis",
-            theme=theme.__dict__,
+            theme=theme.to_dict(),
         )
         await risk_return.render(slide, left=0.5, top=4.5, width=4.5, height=2.5)
 
@@ -466,7 +466,7 @@ class DomainChartGallery:
             categories=["Opening", "Equities", "Bonds", "Options", "FX", "Fees", "Closing"],
             values=[1000, 250, 150, -80, 120, -40, 1400],
             title="Daily P&L Breakdown ($000s)",
-            theme=theme.__dict__,
+            theme=theme.to_dict(),
         )
         await pnl.render(slide, left=5.0, top=4.5, width=4.5, height=2.5)
 
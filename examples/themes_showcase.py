@@ -42,7 +42,7 @@ def create_theme_overview_slide(prs, theme, is_first=False):
     container = Container(size="md", padding="md", center=True)
     bounds = container.render(slide, top=2.5 if not is_first else 3.0)
 
-    card = Card(variant="elevated", theme=theme.__dict__)
+    card = Card(variant="elevated", theme=theme.to_dict())
     card.add_child(Card.Title(f"{theme.name.title()}"))
     card.add_child(
         Card.Description(
@@ -79,16 +79,16 @@ def create_theme_components_slide(prs, theme):
 
     for text, variant, col_start in badges:
         pos = grid.get_cell(col_span=2, col_start=col_start, row_start=0)
-        Badge(text=text, variant=variant, theme=theme.__dict__).render(
+        Badge(text=text, variant=variant, theme=theme.to_dict()).render(
             slide, left=pos["left"] + 0.1, top=pos["top"] + 0.1
         )
 
     # Buttons
     buttons = [
-        Button("Default", variant="default", size="sm", theme=theme.__dict__),
-        Button("Secondary", variant="secondary", size="sm", theme=theme.__dict__),
-        Button("Outline", variant="outline", size="sm", theme=theme.__dict__),
-        Button("Ghost", variant="ghost", size="sm", theme=theme.__dict__),
+        Button("Default", variant="default", size="sm", theme=theme.to_dict()),
+        Button("Secondary", variant="secondary", size="sm", theme=theme.to_dict()),
+        Button("Outline", variant="outline", size="sm", theme=theme.to_dict()),
+        Button("Ghost", variant="ghost", size="sm", theme=theme.to_dict()),
     ]
 
     stack = Stack(direction="horizontal", gap="md", align="start")
@@ -110,7 +110,7 @@ def create_theme_components_slide(prs, theme):
 
     for variant, title, col_start in card_variants:
         pos = grid.get_cell(col_span=4, col_start=col_start, row_start=2)
-        card = Card(variant=variant, theme=theme.__dict__)
+        card = Card(variant=variant, theme=theme.to_dict())
         card.add_child(Card.Title(title))
         card.add_child(Card.Description(f"{variant} card variant"))
         card.render(slide, **pos)
@@ -142,19 +142,19 @@ def create_theme_dashboard_slide(prs, theme):
     for label, value, change, trend, col_start in metrics:
         pos = grid.get_cell(col_span=4, col_start=col_start, row_start=0)
         MetricCard(
-            label=label, value=value, change=change, trend=trend, theme=theme.__dict__
+            label=label, value=value, change=change, trend=trend, theme=theme.to_dict()
         ).render(slide, **pos)
 
     # Main content card
     main_pos = grid.get_cell(col_span=8, col_start=0, row_start=1)
-    main_card = Card(variant="elevated", theme=theme.__dict__)
+    main_card = Card(variant="elevated", theme=theme.to_dict())
     main_card.add_child(Card.Title("Analytics Dashboard"))
     main_card.add_child(Card.Description("Key performance indicators and metrics at a glance"))
     main_card.render(slide, **main_pos)
 
     # Sidebar
     sidebar_pos = grid.get_cell(col_span=4, col_start=8, row_start=1)
-    sidebar_card = Card(variant="outlined", theme=theme.__dict__)
+    sidebar_card = Card(variant="outlined", theme=theme.to_dict())
     sidebar_card.add_child(Card.Title("Actions"))
     sidebar_card.add_child(Card.Description("Quick links"))
     sidebar_card.render(slide, **sidebar_pos)
@@ -176,18 +176,18 @@ async def create_theme_charts_slide(prs, theme):
         categories=["Q1", "Q2", "Q3", "Q4"],
         series={"Sales": [100, 120, 140, 160], "Profit": [20, 25, 30, 35]},
         title="Quarterly Performance",
-        theme=theme.__dict__,
+        theme=theme.to_dict(),
     )
-    await column_chart.render(slide, left=0.5, top=2.0, width=4.5, height=3.5)
+    column_chart.render(slide, left=0.5, top=2.0, width=4.5, height=3.5)
 
     # Pie Chart
     pie_chart = PieChart(
         categories=["Product A", "Product B", "Product C"],
         values=[45, 30, 25],
         title="Market Share",
-        theme=theme.__dict__,
+        theme=theme.to_dict(),
     )
-    await pie_chart.render(slide, left=5.2, top=2.0, width=4.0, height=3.5)
+    pie_chart.render(slide, left=5.2, top=2.0, width=4.0, height=3.5)
 
 
 def create_theme_comparison_slide(prs, theme_manager):
@@ -231,7 +231,7 @@ def create_theme_comparison_slide(prs, theme_manager):
             pos = grid.get_cell(col_span=3, col_start=col, row_start=row)
 
             theme = theme_manager.get_theme(theme_name)
-            card = Card(variant="outlined", theme=theme.__dict__)
+            card = Card(variant="outlined", theme=theme.to_dict())
             card.add_child(Card.Title(theme_name.title()))
             card.add_child(Card.Description(f"{theme.mode} mode"))
             card.render(slide, **pos)
@@ -46,7 +46,7 @@ def create_color_tokens_slide(prs, theme):
 
     for label, variant, col_start in semantic_colors:
         pos = grid.get_cell(col_span=3, col_start=col_start, row_start=0)
-        Badge(text=label, variant=variant, theme=theme.__dict__).render(
+        Badge(text=label, variant=variant, theme=theme.to_dict()).render(
             slide, left=pos["left"] + 0.3, top=pos["top"] + 0.1
         )
 
@@ -59,7 +59,7 @@ def create_color_tokens_slide(prs, theme):
 
     for label, variant, col_start in more_colors:
         pos = grid.get_cell(col_span=3, col_start=col_start, row_start=1)
-        Badge(text=label, variant=variant, theme=theme.__dict__).render(
+        Badge(text=label, variant=variant, theme=theme.to_dict()).render(
             slide, left=pos["left"] + 0.3, top=pos["top"] + 0.1
         )
 
@@ -72,7 +72,7 @@ def create_color_tokens_slide(prs, theme):
 
     for title, desc, col_start in color_cards:
         pos = grid.get_cell(col_span=4, col_start=col_start, row_start=2)
-        card = Card(variant="outlined", theme=theme.__dict__)
+        card = Card(variant="outlined", theme=theme.to_dict())
         card.add_child(Card.Title(title))
         card.add_child(Card.Description(desc))
         card.render(slide, **pos)
@@ -106,7 +106,7 @@ def create_typography_tokens_slide(prs, theme):
 
     cards = []
     for title, desc in type_scale:
-        card = Card(variant="default", theme=theme.__dict__)
+        card = Card(variant="default", theme=theme.to_dict())
         card.add_child(Card.Title(title))
         card.add_child(Card.Description(desc))
         cards.append(card)
@@ -144,7 +144,7 @@ def create_spacing_tokens_slide(prs, theme):
 
     for size, label, top in spacing_scale:
         # Label
-        Badge(text=label, variant="outline", theme=theme.__dict__).render(
+        Badge(text=label, variant="outline", theme=theme.to_dict()).render(
             slide, left=0.5, top=top - 0.05
         )
 
@@ -155,7 +155,7 @@ def create_spacing_tokens_slide(prs, theme):
         )
 
         for pos in positions:
-            Badge(text="•", variant="default", theme=theme.__dict__).render(
+            Badge(text="•", variant="default", theme=theme.to_dict()).render(
                 slide, left=pos["left"], top=pos["top"]
             )
 
@@ -187,12 +187,12 @@ def create_component_composition_slide(prs, theme):
     for label, value, change, trend, col_start in metrics:
         pos = grid.get_cell(col_span=4, col_start=col_start, row_start=0)
         MetricCard(
-            label=label, value=value, change=change, trend=trend, theme=theme.__dict__
+            label=label, value=value, change=change, trend=trend, theme=theme.to_dict()
         ).render(slide, **pos)
 
     # Card showing composition
     main_pos = grid.get_cell(col_span=8, col_start=0, row_start=1)
-    main_card = Card(variant="elevated", theme=theme.__dict__)
+    main_card = Card(variant="elevated", theme=theme.to_dict())
     main_card.add_child(Card.Title("Design Tokens"))
     main_card.add_child(
         Card.Description("Colors, spacing, typography, and borders working together")
@@ -203,9 +203,9 @@ def create_component_composition_slide(prs, theme):
     sidebar_pos = grid.get_cell(col_span=4, col_start=8, row_start=1)
 
     buttons = [
-        Button("Primary", variant="default", size="sm", theme=theme.__dict__),
-        Button("Secondary", variant="secondary", size="sm", theme=theme.__dict__),
-        Button("Outline", variant="outline", size="sm", theme=theme.__dict__),
+        Button("Primary", variant="default", size="sm", theme=theme.to_dict()),
+        Button("Secondary", variant="secondary", size="sm", theme=theme.to_dict()),
+        Button("Outline", variant="outline", size="sm", theme=theme.to_dict()),
     ]
 
     stack = Stack(direction="vertical", gap="sm", align="start")
@@ -244,7 +244,7 @@ def create_variant_system_slide(prs, theme):
 
     for variant, title, desc, col_start in card_variants:
         pos = grid.get_cell(col_span=4, col_start=col_start, row_start=0)
-        card = Card(variant=variant, theme=theme.__dict__)
+        card = Card(variant=variant, theme=theme.to_dict())
         card.add_child(Card.Title(title))
         card.add_child(Card.Description(desc))
         card.render(slide, **pos)
@@ -258,7 +258,7 @@ def create_variant_system_slide(prs, theme):
     ]
 
     for text, variant, left in button_positions:
-        btn = Button(text=text, variant=variant, size="md", theme=theme.__dict__)
+        btn = Button(text=text, variant=variant, size="md", theme=theme.to_dict())
         btn.render(slide, left=bounds["left"] + left, top=bounds["top"] + 3.0, width=2.0)
 
 
@@ -291,13 +291,13 @@ def create_semantic_colors_slide(prs, theme):
     for title, desc, variant, col_start, row_start in semantic_examples:
         pos = grid.get_cell(col_span=6, col_start=col_start, row_start=row_start)
 
-        card = Card(variant="outlined", theme=theme.__dict__)
+        card = Card(variant="outlined", theme=theme.to_dict())
         card.add_child(Card.Title(title))
         card.add_child(Card.Description(desc))
         card.render(slide, **pos)
 
         # Render badge next to card title
-        Badge(text=variant.upper(), variant=variant, theme=theme.__dict__).render(
+        Badge(text=variant.upper(), variant=variant, theme=theme.to_dict()).render(
             slide, left=pos["left"] + pos["width"] - 1.5, top=pos["top"] + 0.15
         )
 
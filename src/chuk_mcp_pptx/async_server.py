@@ -10,7 +10,9 @@ Storage is managed through chuk-mcp-server's built-in artifact store context.
 """
 
 import asyncio
+import json
 import logging
+from typing import Any
 
 from chuk_mcp_server import ChukMCPServer
 from .core.presentation_manager import PresentationManager
@@ -30,7 +32,7 @@ from .constants import (
 # Shape utilities now available as components in components.core
 
 # Import organized tool modules
-from .tools.core import register_placeholder_tools
+from .tools.core import register_placeholder_tools, register_shape_tools
 from .tools.universal import (
     register_universal_component_api,
     register_registry_tools,
@@ -56,7 +58,7 @@ mcp = ChukMCPServer("chuk-mcp-pptx-async")
 # Uses chuk-mcp-server's built-in artifact store context for persistence
 manager = PresentationManager(base_path="presentations")
 
-# Create theme manager instance
+# Create theme manager instance (shared by every tool group, so registered themes are seen by all)
 theme_manager = ThemeManager()
 
 # Create template manager instance (for builtin templates)
@@ -64,7 +66,7 @@ template_manager = TemplateManager()
 
 # Register all modular tools
 # Legacy chart/image/table tools removed - use universal component API instead
-theme_tools = register_theme_tools(mcp, manager)
+theme_tools = register_theme_tools(mcp, manager, theme_manager)
 
 # Register consolidated template tools
 template_tools = register_template_tools(mcp, manager, template_manager)
@@ -74,10 +76,11 @@ extraction_tools = register_extraction_tools(mcp, manager, theme_manager)
 
 # Register organized tool modules
 placeholder_tools = register_placeholder_tools(mcp, manager)
+shape_tools = register_shape_tools(mcp, manager)
 universal_component_api = register_universal_component_api(mcp, manager)
 registry_tools = register_registry_tools(mcp, manager)
-semantic_tools = register_semantic_tools(mcp, manager)
-layout_tools = register_layout_tools(mcp, manager)
+semantic_tools = register_semantic_tools(mcp, manager, theme_manager)
+layout_tools = register_layout_tools(mcp, manager, theme_manager)
 inspection_tools = register_inspection_tools(mcp, manager)
 
 # Make tools available at module level for easier imports
@@ -246,6 +249,52 @@ async def pptx_create(name: str, theme: str | None = None, template_name: str |
         return ErrorResponse(error=str(e)).model_dump_json()
 
 
+def _template_presentation_error(prs, metadata) -> str:
+    """Error for the blank-presentation slide tools used on a template-based deck."""
+    return ErrorResponse(
+        error=f"This presentation was created from template '{metadata.template_path}'. "
+        f"You must use pptx_add_slide_from_template(layout_index=X) to add slides with "
+        f"specific template layouts. Call pptx_analyze_template('{metadata.template_path}') "
+        f"to see all {len(prs.slide_layouts)} available layouts."
+    ).model_dump_json()
+
+
+def _presentation_theme(metadata):
+    """Theme object recorded in the presentation metadata, if any."""
+    if metadata and metadata.theme:
+        return theme_manager.get_theme(metadata.theme)
+    return None
+
+
+def _fill_title_slide(slide, title: str, subtitle: str = "") -> None:
+    """Write title and optional subtitle into a title-layout slide."""
+    slide.shapes.title.text = title
+    if subtitle:
+        # One walk of the shape tree; stops at the subtitle placeholder
+        subtitle_shape = next(
+            (ph for ph in slide.placeholders if ph.placeholder_format.idx == 1), None
+        )
+        if subtitle_shape is not None:
+            subtitle_shape.text = subtitle
+
+
+def _fill_content_slide(slide, title: str, content: list[str]) -> None:
+    """Write title and bullets into a title-and-content-layout slide."""
+    slide.shapes.title.text = title
+
+    # One walk of the shape tree; stops at the body placeholder
+    body = next((ph for ph in slide.placeholders if ph.placeholder_format.idx == 1), None)
+    if body is not None and content:
+        # Replace the placeholder's paragraphs with one first-level <a:p> per
+        # bullet, written on the txBody directly rather than through
+        # add_paragraph() and the _Paragraph proxies
+        tx_body = body.text_frame._txBody
+        for p in tx_body.p_lst:
+            tx_body.remove(p)
+        for bullet in content:
+            tx_body.add_p().append_text(bullet)
+
+
 @mcp.tool  # type: ignore[arg-type]
 async def pptx_add_title_slide(
     title: str, subtitle: str = "", presentation: str | None = None
@@ -284,28 +333,19 @@ async def pptx_add_title_slide(
         # Check if presentation was created from a template
         metadata = await manager.get_metadata(presentation)
         if metadata and metadata.template_path:
-            return ErrorResponse(
-                error=f"This presentation was created from template '{metadata.template_path}'. "
-                f"You must use pptx_add_slide_from_template(layout_index=X) to add slides with "
-                f"specific template layouts. Call pptx_analyze_template('{metadata.template_path}') "
-                f"to see all {len(prs.slide_layouts)} available layouts."
-            ).model_dump_json()
-
-        slide_layout = prs.slide_layouts[SlideLayoutIndex.TITLE]
-        slide = prs.slides.add_slide(slide_layout)
+            return _template_presentation_error(prs, metadata)
 
-        slide.shapes.title.text = title
-        if subtitle and len(slide.placeholders) > 1:
-            slide.placeholders[1].text = subtitle
+        slides = prs.slides
+        slide = slides.add_slide(prs.slide_layouts[SlideLayoutIndex.TITLE])
+        _fill_title_slide(slide, title, subtitle)
 
         # Apply presentation theme to the slide
-        metadata = await manager.get_metadata(presentation)
-        if metadata and metadata.theme:
-            theme_obj = theme_manager.get_theme(metadata.theme)
-            if theme_obj:
-                theme_obj.apply_to_slide(slide)
+        theme_obj = _presentation_theme(metadata)
+        if theme_obj:
+            theme_obj.apply_to_slide(slide)
 
-        slide_index = len(prs.slides) - 1
+        slide_count = len(slides)
+        slide_index = slide_count - 1
 
         # Update metadata
         await manager.update_slide_metadata(slide_index)
@@ -319,7 +359,7 @@ async def pptx_add_title_slide(
             presentation=pres_name,
             slide_index=slide_index,
             message=SuccessMessages.SLIDE_ADDED.format(slide_type="title", presentation=pres_name),
-            slide_count=len(prs.slides),
+            slide_count=slide_count,
         ).model_dump_json()
     except Exception as e:
         logger.error(f"Failed to add title slide: {e}")
@@ -366,36 +406,19 @@ async def pptx_add_slide(title: str, content: list[str], presentation: str | Non
         # Check if presentation was created from a template
         metadata = await manager.get_metadata(presentation)
         if metadata and metadata.template_path:
-            return ErrorResponse(
-                error=f"This presentation was created from template '{metadata.template_path}'. "
-                f"You must use pptx_add_slide_from_template(layout_index=X) to add slides with "
-                f"specific template layouts. Call pptx_analyze_template('{metadata.template_path}') "
-                f"to see all {len(prs.slide_layouts)} available layouts."
-            ).model_dump_json()
-
-        slide_layout = prs.slide_layouts[SlideLayoutIndex.TITLE_AND_CONTENT]
-        slide = prs.slides.add_slide(slide_layout)
+            return _template_presentation_error(prs, metadata)
 
-        slide.shapes.title.text = title
-
-        if len(slide.placeholders) > 1:
-            text_frame = slide.placeholders[1].text_frame
-            for idx, bullet in enumerate(content):
-                if idx == 0:
-                    p = text_frame.paragraphs[0]
-                else:
-                    p = text_frame.add_paragraph()
-                p.text = bullet
-                p.level = 0  # First level bullet
+        slides = prs.slides
+        slide = slides.add_slide(prs.slide_layouts[SlideLayoutIndex.TITLE_AND_CONTENT])
+        _fill_content_slide(slide, title, content)
 
         # Apply presentation theme to the slide
-        metadata = await manager.get_metadata(presentation)
-        if metadata and metadata.theme:
-            theme_obj = theme_manager.get_theme(metadata.theme)
-            if theme_obj:
-                theme_obj.apply_to_slide(slide)
+        theme_obj = _presentation_theme(metadata)
+        if theme_obj:
+            theme_obj.apply_to_slide(slide)
 
-        slide_index = len(prs.slides) - 1
+        slide_count = len(slides)
+        slide_index = slide_count - 1
 
         # Update metadata
         await manager.update_slide_metadata(slide_index)
@@ -411,13 +434,140 @@ async def pptx_add_slide(title: str, content: list[str], presentation: str | Non
             message=SuccessMessages.SLIDE_ADDED.format(
                 slide_type="content", presentation=pres_name
             ),
-            slide_count=len(prs.slides),
+            slide_count=slide_count,
         ).model_dump_json()
     except Exception as e:
         logger.error(f"Failed to add slide: {e}")
         return ErrorResponse(error=str(e)).model_dump_json()
 
 
+# Layout used for each pptx_add_slides entry type
+_BATCH_SLIDE_LAYOUTS = {
+    "title": SlideLayoutIndex.TITLE,
+    "content": SlideLayoutIndex.TITLE_AND_CONTENT,
+}
+
+
+@mcp.tool  # type: ignore[arg-type]
+async def pptx_add_slides(
+    slides: list[dict[str, Any]] | str, presentation: str | None = None
+) -> str:
+    """
+    Add several title and content slides to a blank presentation in one call.
+
+    For template-based presentations use pptx_add_slide_from_template() instead.
+
+    Equivalent to calling pptx_add_title_slide / pptx_add_slide once per entry, but
+    the slide layouts and presentation theme are looked up once for the whole batch
+    and the presentation is saved once at the end. Every entry is validated before
+    any slide is added, so a bad entry leaves the presentation untouched.
+
+    Args:
+        slides: List of slide dicts (or a JSON string of that list). Each dict takes:
+            - type: "title" or "content". Default "content"
+            - title: Slide title (required)
+            - subtitle: Subtitle text (title slides)
+            - content: List of bullet strings (content slides)
+        presentation: Name of presentation to add slides to (uses current if not specified)
+
+    Returns:
+        JSON string with SlideResponse model for the last slide added, or error
+
+    Example (ONLY for blank presentations):
+        await pptx_add_slides(
+            slides=[
+                {"type": "title", "title": "Annual Report 2024", "subtitle": "Results"},
+                {"title": "Highlights", "content": ["Revenue up 20%", "Two new markets"]},
+                {"title": "Next Steps", "content": ["Hire", "Expand"]},
+            ]
+        )
+    """
+    try:
+        # Handle slides - could be a list or a JSON string
+        if isinstance(slides, str):
+            try:
+                slides = json.loads(slides)
+            except json.JSONDecodeError as e:
+                return ErrorResponse(error=f"Invalid JSON in slides: {str(e)}").model_dump_json()
+        if not isinstance(slides, list) or not slides:
+            return ErrorResponse(error="slides must be a non-empty list").model_dump_json()
+
+        # Validate every entry before touching the presentation
+        for i, spec in enumerate(slides):
+            if not isinstance(spec, dict):
+                return ErrorResponse(
+                    error=f"Slide {i} must be a dict, got {type(spec).__name__}"
+                ).model_dump_json()
+            slide_type = spec.get("type", "content")
+            if slide_type not in _BATCH_SLIDE_LAYOUTS:
+                return ErrorResponse(
+                    error=f"Slide {i}: unknown type '{slide_type}'. "
+                    f"Available: {', '.join(_BATCH_SLIDE_LAYOUTS)}"
+                ).model_dump_json()
+            title = spec.get("title")
+            if not title:
+                return ErrorResponse(error=f"Slide {i}: missing title").model_dump_json()
+            if not isinstance(title, str):
+                return ErrorResponse(error=f"Slide {i}: title must be a string").model_dump_json()
+            if not isinstance(spec.get("subtitle", ""), str):
+                return ErrorResponse(
+                    error=f"Slide {i}: subtitle must be a string"
+                ).model_dump_json()
+            content = spec.get("content", [])
+            if not isinstance(content, list) or not all(isinstance(b, str) for b in content):
+                return ErrorResponse(
+                    error=f"Slide {i}: content must be a list of strings"
+                ).model_dump_json()
+
+        prs = await manager.get_presentation(presentation)
+        if not prs:
+            return ErrorResponse(error=ErrorMessages.NO_PRESENTATION).model_dump_json()
+
+        # Check if presentation was created from a template
+        metadata = await manager.get_metadata(presentation)
+        if metadata and metadata.template_path:
+            return _template_presentation_error(prs, metadata)
+
+        # Shared by every slide in the batch
+        slide_layouts = prs.slide_layouts
+        layouts = {
+            slide_type: slide_layouts[index] for slide_type, index in _BATCH_SLIDE_LAYOUTS.items()
+        }
+        theme_obj = _presentation_theme(metadata)
+        prs_slides = prs.slides
+        add_slide = prs_slides.add_slide
+        first_index = len(prs_slides)
+
+        for slide_index, spec in enumerate(slides, start=first_index):
+            slide_type = spec.get("type", "content")
+            slide = add_slide(layouts[slide_type])
+            if slide_type == "title":
+                _fill_title_slide(slide, spec["title"], spec.get("subtitle", ""))
+            else:
+                _fill_content_slide(slide, spec["title"], spec.get("content", []))
+            if theme_obj:
+                theme_obj.apply_to_slide(slide)
+            await manager.update_slide_metadata(slide_index)
+
+        # Save once for the whole batch
+        await manager.update(presentation)
+
+        pres_name = presentation or manager.get_current_name() or "presentation"
+
+        slide_count = first_index + len(slides)
+
+        return SlideResponse(
+            presentation=pres_name,
+            slide_index=slide_count - 1,
+            message=f"Added {len(slides)} slides to '{pres_name}'",
+            slide_count=slide_count,
+            layout_info=None,
+        ).model_dump_json()
+    except Exception as e:
+        logger.error(f"Failed to add slides: {e}")
+        return ErrorResponse(error=str(e)).model_dump_json()
+
+
 # Note: pptx_add_text_slide is now provided by text_tools.py
 # The function is registered via register_text_tools()
 
@@ -451,26 +601,28 @@ async def pptx_delete_slide(slide_index: int, presentation: str | None = None) -
         prs, metadata = result
 
         # Validate slide index
-        if slide_index < 0 or slide_index >= len(prs.slides):
+        sld_id_lst = prs.slides._sldIdLst
+        slide_count = len(sld_id_lst)
+        if slide_index < 0 or slide_index >= slide_count:
             return ErrorResponse(
-                error=f"Invalid slide index {slide_index}. Presentation has {len(prs.slides)} slides (indices 0-{len(prs.slides) - 1})"
+                error=f"Invalid slide index {slide_index}. Presentation has {slide_count} slides (indices 0-{slide_count - 1})"
             ).model_dump_json()
 
         # Get the rId for the slide to delete from the slide ID list
-        rId = prs.slides._sldIdLst[slide_index].rId
+        sld_id = sld_id_lst[slide_index]
 
         # Remove the relationship between presentation and slide
         # This properly handles both regular and template-based presentations
-        prs.part.drop_rel(rId)
+        prs.part.drop_rel(sld_id.rId)
 
         # Remove the slide from the XML slide ID list
-        del prs.slides._sldIdLst[slide_index]
+        sld_id_lst.remove(sld_id)
 
         # Update in VFS
         await manager.update(presentation)
 
         pres_name = presentation or manager.get_current_name() or "presentation"
-        new_slide_count = len(prs.slides)
+        new_slide_count = slide_count - 1
 
         return SuccessResponse(
             message=f"Deleted slide {slide_index} from presentation '{pres_name}'. Presentation now has {new_slide_count} slide(s)."
@@ -537,7 +689,7 @@ async def pptx_save(path: str, presentation: str | None = None) -> str:
 
                 pptx_path = Path(path)
                 if pptx_path.exists():
-                    pptx_data = pptx_path.read_bytes()
+                    pptx_data = await asyncio.to_thread(pptx_path.read_bytes)
 
                     # Store as artifact to get presigned URL
                     artifact_id = await store.store(
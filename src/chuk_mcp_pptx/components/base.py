@@ -7,13 +7,64 @@ from typing import Dict, Any, Optional, Tuple, Union, TYPE_CHECKING
 
 if TYPE_CHECKING:
     from ..themes.theme_manager import Theme
-from pptx.util import Pt
+import atexit
+import os
+from concurrent.futures import ThreadPoolExecutor
+from copy import deepcopy
+from functools import lru_cache, partial
+from pptx.util import Inches, Length, Pt
 from pptx.dml.color import RGBColor
+from pptx.oxml import parse_xml
+from pptx.oxml.ns import nsdecls
 import asyncio
 
-from ..tokens.colors import get_semantic_tokens
-from ..tokens.typography import get_text_style
-from ..tokens.spacing import SPACING, PADDING, MARGINS
+from ..tokens.colors import cached_rgb, get_semantic_tokens, hex_to_rgb
+from ..tokens.typography import get_text_style, FONT_SIZES, FONT_WEIGHTS, LINE_HEIGHTS
+from ..tokens.spacing import SPACING, PADDING, MARGINS, GAPS, RADIUS, BORDER_WIDTH
+
+
+@lru_cache(maxsize=4096)
+def cached_inches(value: float) -> Length:
+    """Inches(value), memoized. Layouts reuse the same few positions and margins."""
+    return Inches(value)
+
+
+@lru_cache(maxsize=1024)
+def cached_pt(value: float) -> Length:
+    """Pt(value), memoized for repeated line widths and font sizes."""
+    return Pt(value)
+
+
+# <a:solidFill> template, copied per fill instead of going through FillFormat
+_SOLID_FILL = parse_xml(f'<a:solidFill {nsdecls("a")}><a:srgbClr val="000000"/></a:solidFill>')
+
+
+def set_solid_fill(parent, hex_color: str) -> None:
+    """
+    Give an spPr, ln or table-cell tcPr element a solid fill of hex_color ("RRGGBB").
+
+    Writes the same XML as fill.solid() followed by fore_color.rgb = ..., but
+    skips the FillFormat/ColorFormat proxies that diagrams would otherwise
+    build for every node, edge and table cell.
+    """
+    fill = deepcopy(_SOLID_FILL)
+    fill[0].set("val", hex_color)
+    old = parent.eg_fillProperties
+    if old is not None:
+        parent.remove(old)
+    parent._insert_solidFill(fill)
+
+
+@lru_cache(maxsize=64)
+def _semantic_tokens(primary_hue: str, mode: str) -> Dict[str, Any]:
+    """
+    Shared semantic tokens for a (hue, mode) pair.
+
+    Diagrams build one component per item from the same theme, so resolve the
+    token tree once and share it. Components only read their tokens; Theme
+    objects, whose tokens callers may edit, keep calling get_semantic_tokens.
+    """
+    return get_semantic_tokens(primary_hue, mode)
 
 
 class Component:
@@ -36,7 +87,7 @@ class Component:
             # Theme object from new theme system
             mode = self._internal_theme.mode
             primary_hue = "blue"  # Default for new themes
-            self.tokens = get_semantic_tokens(primary_hue, mode)
+            self.tokens = _semantic_tokens(primary_hue, mode)
         elif isinstance(self._internal_theme, dict) and "colors" in self._internal_theme:
             # Design system theme with explicit colors - use them directly
             self.tokens = self._build_tokens_from_colors(self._internal_theme["colors"])
@@ -44,7 +95,17 @@ class Component:
             # Legacy dict theme
             mode = self._internal_theme.get("mode", "light")
             primary_hue = self._internal_theme.get("primary_hue", "blue")
-            self.tokens = get_semantic_tokens(primary_hue, mode)
+            self.tokens = _semantic_tokens(primary_hue, mode)
+
+    @property
+    def tokens(self) -> Dict[str, Any]:
+        return self._tokens
+
+    @tokens.setter
+    def tokens(self, value: Dict[str, Any]):
+        # Resolved colors are memoized per path; a new token tree starts fresh
+        self._tokens = value
+        self._colors: Dict[str, RGBColor] = {}
 
     @property
     def theme(self) -> Union["Theme", Dict[str, Any], None]:
@@ -67,7 +128,7 @@ class Component:
             primary_hue = self._internal_theme.get("primary_hue", "blue")
 
         # Update tokens when theme changes
-        self.tokens = get_semantic_tokens(primary_hue, mode)
+        self.tokens = _semantic_tokens(primary_hue, mode)
 
     def _build_tokens_from_colors(self, colors: Dict[str, str]) -> Dict[str, Any]:
         """
@@ -119,8 +180,7 @@ class Component:
 
     def hex_to_rgb(self, hex_color: str) -> Tuple[int, int, int]:
         """Convert hex color to RGB tuple."""
-        hex_color = hex_color.lstrip("#")
-        return tuple(int(hex_color[i : i + 2], 16) for i in (0, 2, 4))
+        return hex_to_rgb(hex_color)
 
     def get_theme_attr(self, attr: str, default: Any = None) -> Any:
         """
@@ -221,17 +281,25 @@ class Component:
         Returns:
             RGBColor object
         """
-        parts = color_path.split(".")
+        # Renders ask for the same few paths per row, cell or node; RGBColor
+        # is immutable, so share the result
+        rgb = self._colors.get(color_path)
+        if rgb is None:
+            rgb = self._colors[color_path] = self._resolve_color(color_path)
+        return rgb
+
+    def _resolve_color(self, color_path: str) -> RGBColor:
+        """Walk the token tree for a dotted color path."""
         value = self.tokens
 
-        for part in parts:
+        for part in color_path.split("."):
             if isinstance(value, dict):
                 value = value.get(part, "#000000")
             else:
                 break
 
         if isinstance(value, str):
-            return RGBColor(*self.hex_to_rgb(value))
+            return cached_rgb(value)
         return RGBColor(0, 0, 0)
 
     def get_spacing(self, size: str) -> float:
@@ -273,8 +341,6 @@ class Component:
 
     def get_gap(self, size: str = "md") -> float:
         """Get gap value in inches for spacing between elements."""
-        from ..tokens.spacing import GAPS
-
         # First check theme override
         theme_gap = self.get_theme_attr("gap")
         if theme_gap is not None:
@@ -283,8 +349,6 @@ class Component:
 
     def get_border_radius(self, size: str = "md") -> float:
         """Get border radius in points."""
-        from ..tokens.spacing import RADIUS
-
         # First check theme override
         theme_radius = self.get_theme_attr("border_radius")
         if theme_radius is not None:
@@ -293,8 +357,6 @@ class Component:
 
     def get_border_width(self, size: str = "2") -> float:
         """Get border width in points."""
-        from ..tokens.spacing import BORDER_WIDTH
-
         # First check theme override
         theme_width = self.get_theme_attr("border_width")
         if theme_width is not None:
@@ -303,8 +365,6 @@ class Component:
 
     def get_font_size(self, size: str = "base") -> int:
         """Get font size in points."""
-        from ..tokens.typography import FONT_SIZES
-
         # First check theme override
         theme_size = self.get_theme_attr("font_size")
         if theme_size is not None:
@@ -317,14 +377,10 @@ class Component:
 
     def get_font_weight(self, weight: str = "normal") -> int:
         """Get font weight value."""
-        from ..tokens.typography import FONT_WEIGHTS
-
         return FONT_WEIGHTS.get(weight, FONT_WEIGHTS["normal"])
 
     def get_line_height(self, size: str = "normal") -> float:
         """Get line height multiplier."""
-        from ..tokens.typography import LINE_HEIGHTS
-
         return LINE_HEIGHTS.get(size, LINE_HEIGHTS["normal"])
 
     def get_text_style(self, variant: str) -> Dict[str, Any]:
@@ -357,13 +413,16 @@ class Component:
         """
         style = self.get_text_style(variant)
 
-        for paragraph in text_frame.paragraphs:
-            paragraph.font.name = style.get("font_family", "Inter")
-            paragraph.font.size = Pt(style.get("font_size", 14))
+        font_name = style.get("font_family", "Inter")
+        font_size = cached_pt(style.get("font_size", 14))
+        # Apply font weight (PowerPoint has limited support)
+        bold = style.get("font_weight", 400) >= 600
 
-            # Apply font weight (PowerPoint has limited support)
-            weight = style.get("font_weight", 400)
-            paragraph.font.bold = weight >= 600
+        for paragraph in text_frame.paragraphs:
+            font = paragraph.font
+            font.name = font_name
+            font.size = font_size
+            font.bold = bold
 
             # Apply color
             paragraph.font.color.rgb = self.get_color("foreground.DEFAULT")
@@ -411,10 +470,12 @@ class Component:
             line.width = Pt(1)
 
         # Apply text color
-        if hasattr(shape, "text_frame") and shape.text_frame:
-            for paragraph in shape.text_frame.paragraphs:
+        text_frame = getattr(shape, "text_frame", None)
+        if text_frame:
+            fg_rgb = self.get_color(fg_path)
+            for paragraph in text_frame.paragraphs:
                 for run in paragraph.runs:
-                    run.font.color.rgb = self.get_color(fg_path)
+                    run.font.color.rgb = fg_rgb
 
     def _extract_placeholder_bounds(self, placeholder):
         """
@@ -430,27 +491,15 @@ class Component:
             return None
 
         try:
-            left = (
-                placeholder.left.inches
-                if hasattr(placeholder.left, "inches")
-                else placeholder.left / 914400
-            )
-            top = (
-                placeholder.top.inches
-                if hasattr(placeholder.top, "inches")
-                else placeholder.top / 914400
-            )
-            width = (
-                placeholder.width.inches
-                if hasattr(placeholder.width, "inches")
-                else placeholder.width / 914400
-            )
-            height = (
-                placeholder.height.inches
-                if hasattr(placeholder.height, "inches")
-                else placeholder.height / 914400
+            return tuple(
+                value.inches if hasattr(value, "inches") else value / 914400
+                for value in (
+                    placeholder.left,
+                    placeholder.top,
+                    placeholder.width,
+                    placeholder.height,
+                )
             )
-            return (left, top, width, height)
         except Exception as e:
             import logging
 
@@ -477,6 +526,22 @@ class Component:
 
                 logging.warning(f"Could not delete placeholder: {e}")
 
+    def _take_placeholder(self, placeholder, left, top, width, height):
+        """
+        Take over a placeholder's position and remove it from the slide.
+
+        Args:
+            placeholder: Placeholder shape to replace, or None
+            left, top, width, height: Position to use when there is no placeholder
+
+        Returns:
+            Tuple of (left, top, width, height): the placeholder's bounds in inches
+            when it has them, otherwise the values passed in
+        """
+        bounds = self._extract_placeholder_bounds(placeholder)
+        self._delete_placeholder_if_needed(placeholder)
+        return bounds if bounds is not None else (left, top, width, height)
+
     async def render(self, slide, **kwargs):
         """
         Render component to slide (to be implemented by subclasses).
@@ -488,14 +553,24 @@ class Component:
         raise NotImplementedError("Subclasses must implement render method")
 
 
+# Shared, bounded pool for AsyncComponent renders. python-pptx work holds the
+# GIL, so more threads only add churn; slides can't cross a process boundary.
+_RENDER_EXECUTOR = ThreadPoolExecutor(
+    max_workers=min(8, os.cpu_count() or 2), thread_name_prefix="pptx-render"
+)
+atexit.register(_RENDER_EXECUTOR.shutdown, wait=False)
+
+
 class AsyncComponent(Component):
     """Async version of Component base class."""
 
     async def render(self, slide, **kwargs):
         """Async render method."""
         # Run synchronous operations in thread pool
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(None, lambda: self._render_sync(slide, **kwargs))
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            _RENDER_EXECUTOR, partial(self._render_sync, slide, **kwargs)
+        )
 
     def _render_sync(self, slide, **kwargs):
         """Synchronous render implementation."""
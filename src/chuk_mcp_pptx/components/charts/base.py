@@ -2,12 +2,12 @@
 Base chart component with validation, theming, and composition support.
 """
 
-from typing import Dict, Any, Optional, Tuple, Union
-from pptx.chart.data import CategoryChartData, XyChartData, BubbleChartData
+from typing import Dict, Any, Optional, Tuple, Union, TYPE_CHECKING
+
 from pptx.enum.chart import XL_CHART_TYPE
 from pptx.util import Inches
-from pptx.dml.color import RGBColor
 
+from ..base import cached_rgb
 from ..composition import ComposableComponent
 from ..variants import CHART_VARIANTS
 from ...layout.helpers import (
@@ -20,6 +20,9 @@ from ...utilities.chart_utils import (
     apply_chart_colors,
 )
 
+if TYPE_CHECKING:
+    from pptx.chart.data import BubbleChartData, CategoryChartData, XyChartData
+
 
 class ChartComponent(ComposableComponent):
     """
@@ -129,12 +132,10 @@ class ChartComponent(ComposableComponent):
         # Get theme chart colors
         chart_colors = self.tokens.get("chart", [])
 
-        # Convert hex colors to RGBColor objects
-        rgb_colors = []
-        for color_hex in chart_colors:
-            if isinstance(color_hex, str):
-                rgb = self.hex_to_rgb(color_hex)
-                rgb_colors.append(RGBColor(*rgb))
+        # Convert hex colors to (memoized) RGBColor objects
+        rgb_colors = [
+            cached_rgb(color_hex) for color_hex in chart_colors if isinstance(color_hex, str)
+        ]
 
         # Apply using utility function
         if rgb_colors:
@@ -144,7 +145,7 @@ class ChartComponent(ComposableComponent):
         """Get font family from theme."""
         return self.get_theme_attr("font_family", "Inter")
 
-    def _prepare_chart_data(self) -> Union[CategoryChartData, XyChartData, BubbleChartData]:
+    def _prepare_chart_data(self) -> "Union[CategoryChartData, XyChartData, BubbleChartData]":
         """
         Prepare chart data (override in subclasses).
 
@@ -2,8 +2,8 @@
 Column and Bar chart components with variants and registry integration.
 """
 
-from typing import Dict, List, Optional, Tuple
-from pptx.chart.data import CategoryChartData
+from typing import Dict, List, Optional, Tuple, TYPE_CHECKING
+
 from pptx.enum.chart import XL_CHART_TYPE, XL_DATA_LABEL_POSITION
 from pptx.util import Pt
 from pptx.dml.color import RGBColor
@@ -12,6 +12,27 @@ from .base import ChartComponent
 from ..variants import COLUMN_CHART_VARIANTS
 from ..registry import component, ComponentCategory, prop, example
 
+if TYPE_CHECKING:
+    from pptx.chart.data import CategoryChartData
+
+# Waterfall bar colors, shared by every point
+_WATERFALL_UP = RGBColor(16, 185, 129)
+_WATERFALL_DOWN = RGBColor(239, 68, 68)
+
+# Variant -> chart type, shared by every ColumnChart/BarChart instance
+_COLUMN_CHART_TYPES = {
+    "clustered": XL_CHART_TYPE.COLUMN_CLUSTERED,
+    "stacked": XL_CHART_TYPE.COLUMN_STACKED,
+    "stacked100": XL_CHART_TYPE.COLUMN_STACKED_100,
+    "3d": XL_CHART_TYPE.THREE_D_COLUMN,
+}
+_BAR_CHART_TYPES = {
+    "clustered": XL_CHART_TYPE.BAR_CLUSTERED,
+    "stacked": XL_CHART_TYPE.BAR_STACKED,
+    "stacked100": XL_CHART_TYPE.BAR_STACKED_100,
+    "3d": XL_CHART_TYPE.THREE_D_BAR_CLUSTERED,
+}
+
 
 @component(
     name="ColumnChart",
@@ -157,13 +178,7 @@ class ColumnChart(ChartComponent):
         self.variant_props = COLUMN_CHART_VARIANTS.build(variant=variant, style=style)
 
         # Set chart type based on variant
-        variant_map = {
-            "clustered": XL_CHART_TYPE.COLUMN_CLUSTERED,
-            "stacked": XL_CHART_TYPE.COLUMN_STACKED,
-            "stacked100": XL_CHART_TYPE.COLUMN_STACKED_100,
-            "3d": XL_CHART_TYPE.THREE_D_COLUMN,
-        }
-        self.chart_type = variant_map.get(variant, XL_CHART_TYPE.COLUMN_CLUSTERED)
+        self.chart_type = _COLUMN_CHART_TYPES.get(variant, XL_CHART_TYPE.COLUMN_CLUSTERED)
 
     def validate_data(self) -> Tuple[bool, Optional[str]]:
         """Validate column chart data."""
@@ -184,8 +199,10 @@ class ColumnChart(ChartComponent):
 
         return True, None
 
-    def _prepare_chart_data(self) -> CategoryChartData:
+    def _prepare_chart_data(self) -> "CategoryChartData":
         """Prepare column chart data."""
+        from pptx.chart.data import CategoryChartData
+
         chart_data = CategoryChartData()
         chart_data.categories = self.categories
 
@@ -312,13 +329,7 @@ class BarChart(ColumnChart):
         super().__init__(variant=variant, **kwargs)
 
         # Override with bar chart types
-        variant_map = {
-            "clustered": XL_CHART_TYPE.BAR_CLUSTERED,
-            "stacked": XL_CHART_TYPE.BAR_STACKED,
-            "stacked100": XL_CHART_TYPE.BAR_STACKED_100,
-            "3d": XL_CHART_TYPE.THREE_D_BAR_CLUSTERED,
-        }
-        self.chart_type = variant_map.get(variant, XL_CHART_TYPE.BAR_CLUSTERED)
+        self.chart_type = _BAR_CHART_TYPES.get(variant, XL_CHART_TYPE.BAR_CLUSTERED)
 
 
 @component(
@@ -412,12 +423,14 @@ class WaterfallChart(ChartComponent):
 
         return True, None
 
-    def _prepare_chart_data(self) -> CategoryChartData:
+    def _prepare_chart_data(self) -> "CategoryChartData":
         """
         Prepare waterfall chart data using stacked column approach.
 
         Creates invisible base series and visible value series.
         """
+        from pptx.chart.data import CategoryChartData
+
         chart_data = CategoryChartData()
         chart_data.categories = self.categories
 
@@ -456,29 +469,28 @@ class WaterfallChart(ChartComponent):
         chart = chart_shape.chart  # Access the chart object from the shape
 
         try:
-            # Make base series invisible
             if len(chart.series) >= 2:
-                base_series = chart.series[0]
+                base_series, value_series = chart.series[0], chart.series[1]
+
+                # Make base series invisible
                 fill = base_series.format.fill
                 fill.background()  # Make transparent
 
-            # Color positive and negative values differently
-            if len(chart.series) >= 2:
-                value_series = chart.series[1]
-
-                # Apply colors based on positive/negative
+                # Color positive and negative values differently
+                points = value_series.points
+                n_points = len(points)
                 for i, val in enumerate(self.values):
-                    if i < len(value_series.points):
-                        point = value_series.points[i]
+                    if i < n_points:
+                        point = points[i]
                         fill = point.format.fill
                         fill.solid()
 
                         if val >= 0:
                             # Positive - green
-                            fill.fore_color.rgb = RGBColor(16, 185, 129)
+                            fill.fore_color.rgb = _WATERFALL_UP
                         else:
                             # Negative - red
-                            fill.fore_color.rgb = RGBColor(239, 68, 68)
+                            fill.fore_color.rgb = _WATERFALL_DOWN
 
             # Set gap width to 0 for connected appearance
             if hasattr(chart.plots[0], "gap_width"):
@@ -10,8 +10,14 @@ from pptx.slide import Slide
 from pptx.util import Inches, Pt
 from pptx.enum.text import PP_ALIGN, MSO_ANCHOR
 from pptx.dml.color import RGBColor
+from ..base import set_solid_fill
 from .base import ChartComponent
 
+# Fixed segment styling, built once instead of per segment
+_WHITE = RGBColor(255, 255, 255)
+_SEGMENT_BORDER_WIDTH = Pt(1)
+_SEGMENT_MARGIN = Inches(0.02)
+
 
 class FunnelChart(ChartComponent):
     """
@@ -201,8 +207,8 @@ class FunnelChart(ChartComponent):
 
             # Add border
             line = shape.line
-            line.color.rgb = RGBColor(255, 255, 255)
-            line.width = Pt(1)
+            line.color.rgb = _WHITE
+            line.width = _SEGMENT_BORDER_WIDTH
 
             # Add text to segment
             text_frame = shape.text_frame
@@ -211,10 +217,10 @@ class FunnelChart(ChartComponent):
             # Enable word wrap for narrow segments, disable for wide ones
             text_frame.word_wrap = seg_width < 1.5
 
-            text_frame.margin_left = Inches(0.02)
-            text_frame.margin_right = Inches(0.02)
-            text_frame.margin_top = Inches(0.02)
-            text_frame.margin_bottom = Inches(0.02)
+            text_frame.margin_left = _SEGMENT_MARGIN
+            text_frame.margin_right = _SEGMENT_MARGIN
+            text_frame.margin_top = _SEGMENT_MARGIN
+            text_frame.margin_bottom = _SEGMENT_MARGIN
             text_frame.vertical_anchor = MSO_ANCHOR.MIDDLE
 
             # Aggressive font size based on segment width
@@ -242,7 +248,7 @@ class FunnelChart(ChartComponent):
             p.alignment = PP_ALIGN.CENTER
             p.font.size = Pt(stage_font_size)
             p.font.bold = True
-            p.font.color.rgb = RGBColor(255, 255, 255)
+            p.font.color.rgb = _WHITE
 
             # Add value if requested
             if self.show_values:
@@ -250,7 +256,7 @@ class FunnelChart(ChartComponent):
                 p.text = f"{value:,.0f}"
                 p.alignment = PP_ALIGN.CENTER
                 p.font.size = Pt(value_font_size)
-                p.font.color.rgb = RGBColor(255, 255, 255)
+                p.font.color.rgb = _WHITE
 
             # Add percentage if requested (conversion rate from previous stage)
             if self.show_percentages and i > 0:
@@ -259,7 +265,7 @@ class FunnelChart(ChartComponent):
                 p.text = f"{conversion_rate:.1f}%"
                 p.alignment = PP_ALIGN.CENTER
                 p.font.size = Pt(pct_font_size)
-                p.font.color.rgb = RGBColor(255, 255, 255)
+                p.font.color.rgb = _WHITE
 
     def _get_chart_colors(self) -> List[str]:
         """Get colors for funnel segments."""
@@ -585,6 +591,11 @@ class HeatmapChart(ChartComponent):
             cell.text_frame.paragraphs[0].font.size = Pt(9)
             cell.text_frame.paragraphs[0].font.bold = True
 
+        # Heat scale bounds, computed once for the whole grid
+        all_values = [val for row in self.data for val in row]
+        min_val = min(all_values, default=0)
+        value_range = max(all_values, default=0) - min_val
+
         # Set row headers (y labels) and data
         for i, y_label in enumerate(self.y_labels):
             # Row header
@@ -601,26 +612,21 @@ class HeatmapChart(ChartComponent):
                     cell.text_frame.paragraphs[0].font.size = Pt(8)
 
                 # Color based on value (simple heat scale)
-                if self.data:
-                    all_values = [val for row in self.data for val in row]
-                    min_val = min(all_values)
-                    max_val = max(all_values)
-                    if max_val > min_val:
-                        normalized = (value - min_val) / (max_val - min_val)
-                        # Heat color scale: blue (low) to red (high)
-                        if normalized < 0.5:
-                            # Blue to yellow
-                            r = int(255 * (normalized * 2))
-                            g = int(255 * (normalized * 2))
-                            b = 255
-                        else:
-                            # Yellow to red
-                            r = 255
-                            g = int(255 * (1 - (normalized - 0.5) * 2))
-                            b = 0
-
-                        cell.fill.solid()
-                        cell.fill.fore_color.rgb = RGBColor(r, g, b)
+                if value_range > 0:
+                    normalized = (value - min_val) / value_range
+                    # Heat color scale: blue (low) to red (high)
+                    if normalized < 0.5:
+                        # Blue to yellow
+                        r = int(255 * (normalized * 2))
+                        g = int(255 * (normalized * 2))
+                        b = 255
+                    else:
+                        # Yellow to red
+                        r = 255
+                        g = int(255 * (1 - (normalized - 0.5) * 2))
+                        b = 0
+
+                    set_solid_fill(cell._tc.get_or_add_tcPr(), f"{r:02X}{g:02X}{b:02X}")
 
     def validate_data(self) -> Tuple[bool, Optional[str]]:
         """Validate heatmap chart data."""
@@ -2,8 +2,8 @@
 Line and Area chart components with variants and registry integration.
 """
 
-from typing import Dict, List, Optional, Tuple
-from pptx.chart.data import CategoryChartData
+from typing import Dict, List, Optional, Tuple, TYPE_CHECKING
+
 from pptx.enum.chart import XL_CHART_TYPE, XL_MARKER_STYLE
 from pptx.enum.text import MSO_ANCHOR
 from pptx.util import Pt, Inches
@@ -13,6 +13,17 @@ from .base import ChartComponent
 from ..variants import LINE_CHART_VARIANTS
 from ..registry import component, ComponentCategory, prop, example
 
+if TYPE_CHECKING:
+    from pptx.chart.data import CategoryChartData
+
+# Variant -> chart type, shared by every AreaChart instance
+_AREA_CHART_TYPES = {
+    "area": XL_CHART_TYPE.AREA,
+    "stacked": XL_CHART_TYPE.AREA_STACKED,
+    "stacked100": XL_CHART_TYPE.AREA_STACKED_100,
+    "3d": XL_CHART_TYPE.THREE_D_AREA,
+}
+
 
 @component(
     name="LineChart",
@@ -176,8 +187,10 @@ class LineChart(ChartComponent):
 
         return True, None
 
-    def _prepare_chart_data(self) -> CategoryChartData:
+    def _prepare_chart_data(self) -> "CategoryChartData":
         """Prepare line chart data."""
+        from pptx.chart.data import CategoryChartData
+
         chart_data = CategoryChartData()
         chart_data.categories = self.categories
 
@@ -319,13 +332,7 @@ class AreaChart(ChartComponent):
             raise ValueError(f"Invalid chart data: {error}")
 
         # Set chart type based on variant
-        variant_map = {
-            "area": XL_CHART_TYPE.AREA,
-            "stacked": XL_CHART_TYPE.AREA_STACKED,
-            "stacked100": XL_CHART_TYPE.AREA_STACKED_100,
-            "3d": XL_CHART_TYPE.THREE_D_AREA,
-        }
-        self.chart_type = variant_map.get(variant, XL_CHART_TYPE.AREA)
+        self.chart_type = _AREA_CHART_TYPES.get(variant, XL_CHART_TYPE.AREA)
 
     def validate_data(self) -> Tuple[bool, Optional[str]]:
         """Validate area chart data."""
@@ -345,8 +352,10 @@ class AreaChart(ChartComponent):
 
         return True, None
 
-    def _prepare_chart_data(self) -> CategoryChartData:
+    def _prepare_chart_data(self) -> "CategoryChartData":
         """Prepare area chart data."""
+        from pptx.chart.data import CategoryChartData
+
         chart_data = CategoryChartData()
         chart_data.categories = self.categories
 
@@ -2,8 +2,8 @@
 Pie and Doughnut chart components with variants and registry integration.
 """
 
-from typing import List, Optional, Tuple
-from pptx.chart.data import CategoryChartData
+from typing import List, Optional, Tuple, TYPE_CHECKING
+
 from pptx.enum.chart import XL_CHART_TYPE
 from pptx.dml.color import RGBColor
 
@@ -11,6 +11,15 @@ from .base import ChartComponent
 from ..variants import PIE_CHART_VARIANTS
 from ..registry import component, ComponentCategory, prop, example
 
+if TYPE_CHECKING:
+    from pptx.chart.data import CategoryChartData
+
+# Variant -> chart type; anything else renders as a plain pie
+_PIE_CHART_TYPES = {
+    "doughnut": XL_CHART_TYPE.DOUGHNUT,
+    "exploded": XL_CHART_TYPE.PIE_EXPLODED,
+}
+
 
 @component(
     name="PieChart",
@@ -155,12 +164,7 @@ class PieChart(ChartComponent):
         self.variant_props = PIE_CHART_VARIANTS.build(variant=variant, style=style)
 
         # Set chart type based on variant
-        if variant == "doughnut":
-            self.chart_type = XL_CHART_TYPE.DOUGHNUT
-        elif variant == "exploded":
-            self.chart_type = XL_CHART_TYPE.PIE_EXPLODED
-        else:
-            self.chart_type = XL_CHART_TYPE.PIE
+        self.chart_type = _PIE_CHART_TYPES.get(variant, XL_CHART_TYPE.PIE)
 
     def validate_data(self) -> Tuple[bool, Optional[str]]:
         """Validate pie chart data."""
@@ -186,8 +190,10 @@ class PieChart(ChartComponent):
 
         return True, None
 
-    def _prepare_chart_data(self) -> CategoryChartData:
+    def _prepare_chart_data(self) -> "CategoryChartData":
         """Prepare pie chart data."""
+        from pptx.chart.data import CategoryChartData
+
         chart_data = CategoryChartData()
         chart_data.categories = self.categories
         chart_data.add_series("Values", self.values)
@@ -265,10 +271,9 @@ class PieChart(ChartComponent):
         # Get theme colors
         chart_colors = self.tokens.get("chart", [])
 
-        # Apply colors to slices
-        if len(chart.series) > 0:
-            series = chart.series[0]
-
+        # Apply colors to slices (only the first series is drawn)
+        series = next(iter(chart.series), None)
+        if series is not None:
             for i, point in enumerate(series.points):
                 if i < len(chart_colors):
                     color_hex = chart_colors[i]
@@ -2,14 +2,28 @@
 Radar, Combo, and other specialized chart components.
 """
 
-from typing import Dict, List, Optional, Tuple
-from pptx.chart.data import CategoryChartData
+from typing import Dict, List, Optional, Tuple, TYPE_CHECKING
+
 from pptx.enum.chart import XL_CHART_TYPE
 from pptx.util import Pt, Inches
 from pptx.dml.color import RGBColor
 
 from .base import ChartComponent
 
+if TYPE_CHECKING:
+    from pptx.chart.data import CategoryChartData
+
+# Marker outline shared by every radar series
+_MARKER_OUTLINE = RGBColor(255, 255, 255)
+_MARKER_OUTLINE_WIDTH = Pt(1)
+
+# Variant -> chart type, shared by every RadarChart instance
+_RADAR_CHART_TYPES = {
+    "filled": XL_CHART_TYPE.RADAR_FILLED,
+    "markers": XL_CHART_TYPE.RADAR_MARKERS,
+    "lines": XL_CHART_TYPE.RADAR,
+}
+
 
 class RadarChart(ChartComponent):
     """
@@ -52,12 +66,7 @@ class RadarChart(ChartComponent):
             raise ValueError(f"Invalid chart data: {error}")
 
         # Set chart type based on variant
-        variant_map = {
-            "filled": XL_CHART_TYPE.RADAR_FILLED,
-            "markers": XL_CHART_TYPE.RADAR_MARKERS,
-            "lines": XL_CHART_TYPE.RADAR,
-        }
-        self.chart_type = variant_map.get(variant, XL_CHART_TYPE.RADAR_FILLED)
+        self.chart_type = _RADAR_CHART_TYPES.get(variant, XL_CHART_TYPE.RADAR_FILLED)
 
     def validate_data(self) -> Tuple[bool, Optional[str]]:
         """Validate radar chart data."""
@@ -80,8 +89,10 @@ class RadarChart(ChartComponent):
 
         return True, None
 
-    def _prepare_chart_data(self) -> CategoryChartData:
+    def _prepare_chart_data(self) -> "CategoryChartData":
         """Prepare radar chart data."""
+        from pptx.chart.data import CategoryChartData
+
         chart_data = CategoryChartData()
         chart_data.categories = self.categories
 
@@ -135,8 +146,8 @@ class RadarChart(ChartComponent):
                         marker_fill.fore_color.rgb = RGBColor(*rgb)
 
                         marker_line = series.marker.format.line
-                        marker_line.color.rgb = RGBColor(255, 255, 255)
-                        marker_line.width = Pt(1)
+                        marker_line.color.rgb = _MARKER_OUTLINE
+                        marker_line.width = _MARKER_OUTLINE_WIDTH
 
         # Configure radar-specific styling
         if hasattr(chart, "value_axis"):
@@ -225,8 +236,10 @@ class ComboChart(ChartComponent):
 
         return True, None
 
-    def _prepare_chart_data(self) -> CategoryChartData:
+    def _prepare_chart_data(self) -> "CategoryChartData":
         """Prepare combo chart data."""
+        from pptx.chart.data import CategoryChartData
+
         chart_data = CategoryChartData()
         chart_data.categories = self.categories
 
@@ -373,8 +386,10 @@ class GaugeChart(ChartComponent):
 
         return True, None
 
-    def _prepare_chart_data(self) -> CategoryChartData:
+    def _prepare_chart_data(self) -> "CategoryChartData":
         """Prepare gauge chart data."""
+        from pptx.chart.data import CategoryChartData
+
         chart_data = CategoryChartData()
         chart_data.categories = self.categories
         chart_data.add_series("Gauge", self.values)
@@ -394,9 +409,8 @@ class GaugeChart(ChartComponent):
         chart_shape = super().render(slide, placeholder=placeholder, **kwargs)
         chart = chart_shape.chart  # Access the chart object from the shape
 
-        if len(chart.series) > 0:
-            series = chart.series[0]
-
+        series = next(iter(chart.series), None)
+        if series is not None:
             # Style each segment
             for idx, point in enumerate(series.points):
                 fill = point.format.fill
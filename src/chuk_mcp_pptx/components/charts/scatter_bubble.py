@@ -2,14 +2,30 @@
 Scatter plot and Bubble chart components for correlation analysis.
 """
 
-from typing import Dict, Any, List, Optional, Tuple, Union
-from pptx.chart.data import XyChartData, BubbleChartData
+from typing import Dict, Any, List, Optional, Tuple, Union, TYPE_CHECKING
+
 from pptx.enum.chart import XL_CHART_TYPE, XL_MARKER_STYLE
 from pptx.util import Pt
 from pptx.dml.color import RGBColor
 
 from .base import ChartComponent
 
+if TYPE_CHECKING:
+    from pptx.chart.data import BubbleChartData, XyChartData
+
+# Marker outline shared by every scatter series
+_MARKER_OUTLINE = RGBColor(255, 255, 255)
+_MARKER_OUTLINE_WIDTH = Pt(1)
+
+# Variant -> chart type, shared by every ScatterChart instance
+_SCATTER_CHART_TYPES = {
+    "default": XL_CHART_TYPE.XY_SCATTER,
+    "smooth": XL_CHART_TYPE.XY_SCATTER_SMOOTH,
+    "smooth_markers": XL_CHART_TYPE.XY_SCATTER_SMOOTH_NO_MARKERS,
+    "lines": XL_CHART_TYPE.XY_SCATTER_LINES,
+    "lines_markers": XL_CHART_TYPE.XY_SCATTER_LINES_NO_MARKERS,
+}
+
 
 class ScatterChart(ChartComponent):
     """
@@ -52,14 +68,7 @@ class ScatterChart(ChartComponent):
             raise ValueError(f"Invalid chart data: {error}")
 
         # Set chart type based on variant
-        variant_map = {
-            "default": XL_CHART_TYPE.XY_SCATTER,
-            "smooth": XL_CHART_TYPE.XY_SCATTER_SMOOTH,
-            "smooth_markers": XL_CHART_TYPE.XY_SCATTER_SMOOTH_NO_MARKERS,
-            "lines": XL_CHART_TYPE.XY_SCATTER_LINES,
-            "lines_markers": XL_CHART_TYPE.XY_SCATTER_LINES_NO_MARKERS,
-        }
-        self.chart_type = variant_map.get(variant, XL_CHART_TYPE.XY_SCATTER)
+        self.chart_type = _SCATTER_CHART_TYPES.get(variant, XL_CHART_TYPE.XY_SCATTER)
 
     def validate_data(self) -> Tuple[bool, Optional[str]]:
         """Validate scatter chart data."""
@@ -87,8 +96,10 @@ class ScatterChart(ChartComponent):
 
         return True, None
 
-    def _prepare_chart_data(self) -> XyChartData:
+    def _prepare_chart_data(self) -> "XyChartData":
         """Prepare scatter chart data."""
+        from pptx.chart.data import XyChartData
+
         chart_data = XyChartData()
 
         for series in self.series_data:
@@ -132,8 +143,8 @@ class ScatterChart(ChartComponent):
 
                         # Marker border
                         line = series.marker.format.line
-                        line.color.rgb = RGBColor(255, 255, 255)
-                        line.width = Pt(1)
+                        line.color.rgb = _MARKER_OUTLINE
+                        line.width = _MARKER_OUTLINE_WIDTH
 
             # Configure lines if present
             if hasattr(series, "format") and hasattr(series.format, "line"):
@@ -235,8 +246,10 @@ class BubbleChart(ChartComponent):
 
         return True, None
 
-    def _prepare_chart_data(self) -> BubbleChartData:
+    def _prepare_chart_data(self) -> "BubbleChartData":
         """Prepare bubble chart data."""
+        from pptx.chart.data import BubbleChartData
+
         chart_data = BubbleChartData()
 
         for series in self.series_data:
@@ -10,7 +10,7 @@ from pptx.enum.text import PP_ALIGN, MSO_ANCHOR
 from pptx.enum.shapes import MSO_SHAPE
 from pptx.dml.color import RGBColor
 
-from ..base import Component
+from ..base import Component, cached_rgb
 from ...tokens.typography import FONT_SIZES, FONT_FAMILIES
 from ...tokens.platform_colors import get_chat_color, CHAT_COLORS
 from ...constants import ComponentSizing, Theme, Platform, ColorKey
@@ -74,7 +74,7 @@ class AndroidMessageBubble(Component):
     def _get_bubble_color(self) -> RGBColor:
         """Get Android Messages bubble color."""
         hex_color = get_chat_color(Platform.ANDROID, self.variant, Theme.LIGHT)
-        return RGBColor(*self.hex_to_rgb(hex_color))
+        return cached_rgb(hex_color)
 
     def _get_text_color(self) -> RGBColor:
         """Get text color."""
@@ -82,7 +82,7 @@ class AndroidMessageBubble(Component):
             hex_color = CHAT_COLORS[Platform.ANDROID][ColorKey.TEXT_SENT]
         else:
             hex_color = CHAT_COLORS[Platform.ANDROID][ColorKey.TEXT_RECEIVED]
-        return RGBColor(*self.hex_to_rgb(hex_color))
+        return cached_rgb(hex_color)
 
     def _calculate_bubble_height(self, width: float) -> float:
         """Estimate bubble height."""
@@ -148,9 +148,7 @@ class AndroidMessageBubble(Component):
             current_p.alignment = PP_ALIGN.LEFT
             current_p.font.size = Pt(FONT_SIZES["sm"])
             current_p.font.bold = True
-            current_p.font.color.rgb = RGBColor(
-                *self.hex_to_rgb(CHAT_COLORS[Platform.ANDROID][ColorKey.TIMESTAMP])
-            )
+            current_p.font.color.rgb = cached_rgb(CHAT_COLORS[Platform.ANDROID][ColorKey.TIMESTAMP])
             current_p = text_frame.add_paragraph()
             current_p.space_before = Pt(ComponentSizing.SPACE_SM)
 
@@ -179,9 +177,7 @@ class AndroidMessageBubble(Component):
             ts_p = ts_frame.paragraphs[0]
             ts_p.alignment = PP_ALIGN.LEFT if self.variant == ColorKey.RECEIVED else PP_ALIGN.RIGHT
             ts_p.font.size = Pt(FONT_SIZES["xs"])
-            ts_p.font.color.rgb = RGBColor(
-                *self.hex_to_rgb(CHAT_COLORS[Platform.ANDROID][ColorKey.TIMESTAMP])
-            )
+            ts_p.font.color.rgb = cached_rgb(CHAT_COLORS[Platform.ANDROID][ColorKey.TIMESTAMP])
             shapes.append(ts_box)
 
         return shapes
@@ -10,7 +10,7 @@ from pptx.enum.text import PP_ALIGN, MSO_ANCHOR
 from pptx.enum.shapes import MSO_SHAPE
 from pptx.dml.color import RGBColor
 
-from ..base import Component
+from ..base import Component, cached_rgb
 from ...tokens.typography import FONT_SIZES, FONT_FAMILIES
 from ...tokens.platform_colors import CHAT_COLORS
 from ...constants import Platform, ColorKey
@@ -68,12 +68,12 @@ class ChatGPTMessage(Component):
             hex_color = CHAT_COLORS[Platform.CHATGPT][ColorKey.SYSTEM]
         else:
             hex_color = CHAT_COLORS[Platform.CHATGPT][ColorKey.ASSISTANT]
-        return RGBColor(*self.hex_to_rgb(hex_color))
+        return cached_rgb(hex_color)
 
     def _get_text_color(self) -> RGBColor:
         """Get text color."""
         hex_color = CHAT_COLORS[Platform.CHATGPT][ColorKey.TEXT]
-        return RGBColor(*self.hex_to_rgb(hex_color))
+        return cached_rgb(hex_color)
 
     def _calculate_content_height(self, width: float) -> float:
         """Estimate content height."""
@@ -120,8 +120,8 @@ class ChatGPTMessage(Component):
 
             # ChatGPT green
             avatar_shape.fill.solid()
-            avatar_shape.fill.fore_color.rgb = RGBColor(
-                *self.hex_to_rgb(CHAT_COLORS[Platform.CHATGPT][ColorKey.AVATAR])
+            avatar_shape.fill.fore_color.rgb = cached_rgb(
+                CHAT_COLORS[Platform.CHATGPT][ColorKey.AVATAR]
             )
             avatar_shape.line.fill.background()
 
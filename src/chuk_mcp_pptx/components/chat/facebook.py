@@ -10,7 +10,7 @@ from pptx.enum.text import PP_ALIGN, MSO_ANCHOR
 from pptx.enum.shapes import MSO_SHAPE
 from pptx.dml.color import RGBColor
 
-from ..base import Component
+from ..base import Component, cached_rgb
 from ...tokens.typography import FONT_SIZES, FONT_FAMILIES
 from ...tokens.platform_colors import get_chat_color, CHAT_COLORS
 from ...constants import Theme, Platform, ColorKey
@@ -70,12 +70,12 @@ class FacebookMessengerBubble(Component):
     def _get_bubble_color(self) -> RGBColor:
         """Get Facebook Messenger bubble color."""
         hex_color = get_chat_color(Platform.FACEBOOK, self.variant, Theme.LIGHT)
-        return RGBColor(*self.hex_to_rgb(hex_color))
+        return cached_rgb(hex_color)
 
     def _get_text_color(self) -> RGBColor:
         """Get text color."""
         hex_color = CHAT_COLORS[Platform.FACEBOOK][ColorKey.TEXT]
-        return RGBColor(*self.hex_to_rgb(hex_color))
+        return cached_rgb(hex_color)
 
     def _calculate_bubble_height(self, width: float) -> float:
         """Estimate bubble height."""
@@ -121,9 +121,7 @@ class FacebookMessengerBubble(Component):
                 Inches(avatar_size),
             )
             avatar.fill.solid()
-            avatar.fill.fore_color.rgb = RGBColor(
-                *self.hex_to_rgb(CHAT_COLORS[Platform.FACEBOOK][ColorKey.SENT])
-            )
+            avatar.fill.fore_color.rgb = cached_rgb(CHAT_COLORS[Platform.FACEBOOK][ColorKey.SENT])
             avatar.line.fill.background()
 
             # Avatar text
@@ -10,7 +10,7 @@ from pptx.enum.text import PP_ALIGN, MSO_ANCHOR
 from pptx.enum.shapes import MSO_SHAPE
 from pptx.dml.color import RGBColor
 
-from ..base import Component
+from ..base import Component, cached_rgb
 from ...tokens.typography import FONT_SIZES, FONT_FAMILIES
 from ...tokens.platform_colors import get_chat_color, CHAT_COLORS
 from ...constants import Theme, Platform, ColorKey
@@ -71,7 +71,7 @@ class iMessageBubble(Component):
     def _get_bubble_color(self) -> RGBColor:
         """Get iMessage-specific bubble color."""
         hex_color = get_chat_color(Platform.IOS, self.variant, Theme.LIGHT)
-        return RGBColor(*self.hex_to_rgb(hex_color))
+        return cached_rgb(hex_color)
 
     def _get_text_color(self) -> RGBColor:
         """Get text color."""
@@ -79,7 +79,7 @@ class iMessageBubble(Component):
             hex_color = CHAT_COLORS[Platform.IOS][ColorKey.TEXT_SENT]
         else:
             hex_color = CHAT_COLORS[Platform.IOS][ColorKey.TEXT_RECEIVED]
-        return RGBColor(*self.hex_to_rgb(hex_color))
+        return cached_rgb(hex_color)
 
     def _calculate_bubble_height(self, width: float) -> float:
         """Estimate bubble height based on text length."""
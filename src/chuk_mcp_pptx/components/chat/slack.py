@@ -8,9 +8,8 @@ from typing import Optional, Dict, Any, List
 from pptx.util import Pt, Inches
 from pptx.enum.text import PP_ALIGN, MSO_ANCHOR
 from pptx.enum.shapes import MSO_SHAPE
-from pptx.dml.color import RGBColor
 
-from ..base import Component
+from ..base import Component, cached_rgb
 from ...tokens.typography import FONT_SIZES
 from ...tokens.platform_colors import CHAT_COLORS
 from ...constants import Platform, ColorKey
@@ -128,9 +127,7 @@ class SlackMessage(Component):
             Inches(avatar_size),
         )
         avatar.fill.solid()
-        avatar.fill.fore_color.rgb = RGBColor(
-            *self.hex_to_rgb(CHAT_COLORS[Platform.SLACK][ColorKey.AVATAR])
-        )
+        avatar.fill.fore_color.rgb = cached_rgb(CHAT_COLORS[Platform.SLACK][ColorKey.AVATAR])
         avatar.line.fill.background()
 
         # Avatar text
@@ -158,9 +155,7 @@ class SlackMessage(Component):
         sender_p.alignment = PP_ALIGN.LEFT
         sender_p.font.size = Pt(FONT_SIZES["base"])
         sender_p.font.bold = True
-        sender_p.font.color.rgb = RGBColor(
-            *self.hex_to_rgb(CHAT_COLORS[Platform.SLACK][ColorKey.TEXT])
-        )
+        sender_p.font.color.rgb = cached_rgb(CHAT_COLORS[Platform.SLACK][ColorKey.TEXT])
         shapes.append(sender_box)
         current_top += 0.18
 
@@ -174,8 +169,8 @@ class SlackMessage(Component):
         timestamp_p = timestamp_frame.paragraphs[0]
         timestamp_p.alignment = PP_ALIGN.LEFT
         timestamp_p.font.size = Pt(FONT_SIZES["sm"])
-        timestamp_p.font.color.rgb = RGBColor(
-            *self.hex_to_rgb(CHAT_COLORS[Platform.SLACK][ColorKey.SECONDARY_TEXT])
+        timestamp_p.font.color.rgb = cached_rgb(
+            CHAT_COLORS[Platform.SLACK][ColorKey.SECONDARY_TEXT]
         )
         shapes.append(timestamp_box)
         current_top += 0.18
@@ -191,9 +186,7 @@ class SlackMessage(Component):
         text_p = text_frame.paragraphs[0]
         text_p.alignment = PP_ALIGN.LEFT
         text_p.font.size = Pt(FONT_SIZES["sm"])
-        text_p.font.color.rgb = RGBColor(
-            *self.hex_to_rgb(CHAT_COLORS[Platform.SLACK][ColorKey.TEXT])
-        )
+        text_p.font.color.rgb = cached_rgb(CHAT_COLORS[Platform.SLACK][ColorKey.TEXT])
         shapes.append(text_box)
 
         # Calculate actual text height
@@ -213,8 +206,8 @@ class SlackMessage(Component):
             reactions_p = reactions_frame.paragraphs[0]
             reactions_p.alignment = PP_ALIGN.LEFT
             reactions_p.font.size = Pt(FONT_SIZES["sm"])
-            reactions_p.font.color.rgb = RGBColor(
-                *self.hex_to_rgb(CHAT_COLORS[Platform.SLACK][ColorKey.SECONDARY_TEXT])
+            reactions_p.font.color.rgb = cached_rgb(
+                CHAT_COLORS[Platform.SLACK][ColorKey.SECONDARY_TEXT]
             )
             shapes.append(reactions_box)
             current_top += 0.25
@@ -231,9 +224,7 @@ class SlackMessage(Component):
             thread_p = thread_frame.paragraphs[0]
             thread_p.alignment = PP_ALIGN.LEFT
             thread_p.font.size = Pt(FONT_SIZES["sm"])
-            thread_p.font.color.rgb = RGBColor(
-                *self.hex_to_rgb(CHAT_COLORS[Platform.SLACK][ColorKey.LINK])
-            )
+            thread_p.font.color.rgb = cached_rgb(CHAT_COLORS[Platform.SLACK][ColorKey.LINK])
             shapes.append(thread_box)
 
         return shapes
@@ -8,9 +8,8 @@ from typing import Optional, Dict, Any, List
 from pptx.util import Pt, Inches
 from pptx.enum.text import PP_ALIGN, MSO_ANCHOR
 from pptx.enum.shapes import MSO_SHAPE
-from pptx.dml.color import RGBColor
 
-from ..base import Component
+from ..base import Component, cached_rgb
 from ...tokens.typography import FONT_SIZES
 from ...tokens.platform_colors import CHAT_COLORS
 from ...constants import Platform, ColorKey
@@ -127,8 +126,8 @@ class TeamsMessage(Component):
             Inches(avatar_size),
         )
         avatar.fill.solid()
-        avatar.fill.fore_color.rgb = RGBColor(
-            *self.hex_to_rgb(CHAT_COLORS[Platform.TEAMS][ColorKey.PURPLE])
+        avatar.fill.fore_color.rgb = cached_rgb(
+            CHAT_COLORS[Platform.TEAMS][ColorKey.PURPLE]
         )  # Teams purple
         avatar.line.fill.background()
 
@@ -157,8 +156,8 @@ class TeamsMessage(Component):
         sender_p.alignment = PP_ALIGN.LEFT
         sender_p.font.size = Pt(FONT_SIZES["sm"])
         sender_p.font.bold = True
-        sender_p.font.color.rgb = RGBColor(
-            *self.hex_to_rgb(CHAT_COLORS[Platform.TEAMS][ColorKey.TEXT])
+        sender_p.font.color.rgb = cached_rgb(
+            CHAT_COLORS[Platform.TEAMS][ColorKey.TEXT]
         )  # Teams dark gray
         shapes.append(sender_box)
         current_top += 0.18
@@ -173,8 +172,8 @@ class TeamsMessage(Component):
         timestamp_p = timestamp_frame.paragraphs[0]
         timestamp_p.alignment = PP_ALIGN.LEFT
         timestamp_p.font.size = Pt(FONT_SIZES["xs"])
-        timestamp_p.font.color.rgb = RGBColor(
-            *self.hex_to_rgb(CHAT_COLORS[Platform.TEAMS][ColorKey.SECONDARY_TEXT])
+        timestamp_p.font.color.rgb = cached_rgb(
+            CHAT_COLORS[Platform.TEAMS][ColorKey.SECONDARY_TEXT]
         )  # Teams medium gray
         shapes.append(timestamp_box)
         current_top += 0.18
@@ -193,9 +192,7 @@ class TeamsMessage(Component):
         text_p = text_frame.paragraphs[0]
         text_p.alignment = PP_ALIGN.LEFT
         text_p.font.size = Pt(FONT_SIZES["sm"])
-        text_p.font.color.rgb = RGBColor(
-            *self.hex_to_rgb(CHAT_COLORS[Platform.TEAMS][ColorKey.TEXT])
-        )
+        text_p.font.color.rgb = cached_rgb(CHAT_COLORS[Platform.TEAMS][ColorKey.TEXT])
         shapes.append(text_box)
 
         # Calculate actual text height
@@ -215,8 +212,8 @@ class TeamsMessage(Component):
             reactions_p = reactions_frame.paragraphs[0]
             reactions_p.alignment = PP_ALIGN.LEFT
             reactions_p.font.size = Pt(FONT_SIZES["sm"])
-            reactions_p.font.color.rgb = RGBColor(
-                *self.hex_to_rgb(CHAT_COLORS[Platform.TEAMS][ColorKey.SECONDARY_TEXT])
+            reactions_p.font.color.rgb = cached_rgb(
+                CHAT_COLORS[Platform.TEAMS][ColorKey.SECONDARY_TEXT]
             )
             shapes.append(reactions_box)
             current_top += 0.22
@@ -233,8 +230,8 @@ class TeamsMessage(Component):
             reply_p = reply_frame.paragraphs[0]
             reply_p.alignment = PP_ALIGN.LEFT
             reply_p.font.size = Pt(FONT_SIZES["sm"])
-            reply_p.font.color.rgb = RGBColor(
-                *self.hex_to_rgb(CHAT_COLORS[Platform.TEAMS][ColorKey.PURPLE])
+            reply_p.font.color.rgb = cached_rgb(
+                CHAT_COLORS[Platform.TEAMS][ColorKey.PURPLE]
             )  # Teams purple
             shapes.append(reply_box)
 
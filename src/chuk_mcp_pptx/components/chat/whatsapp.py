@@ -10,7 +10,7 @@ from pptx.enum.text import PP_ALIGN, MSO_ANCHOR
 from pptx.enum.shapes import MSO_SHAPE
 from pptx.dml.color import RGBColor
 
-from ..base import Component
+from ..base import Component, cached_rgb
 from ...tokens.typography import FONT_SIZES, PARAGRAPH_SPACING, FONT_FAMILIES
 from ...tokens.platform_colors import get_chat_color, CHAT_COLORS
 from ...constants import ComponentSizing, Theme, Platform, ColorKey
@@ -78,12 +78,12 @@ class WhatsAppBubble(Component):
     def _get_bubble_color(self) -> RGBColor:
         """Get WhatsApp bubble color."""
         hex_color = get_chat_color(Platform.WHATSAPP, self.variant, Theme.LIGHT)
-        return RGBColor(*self.hex_to_rgb(hex_color))
+        return cached_rgb(hex_color)
 
     def _get_text_color(self) -> RGBColor:
         """Get text color."""
         hex_color = CHAT_COLORS[Platform.WHATSAPP][ColorKey.TEXT]
-        return RGBColor(*self.hex_to_rgb(hex_color))
+        return cached_rgb(hex_color)
 
     def _calculate_bubble_height(self, width: float) -> float:
         """Estimate bubble height."""
@@ -5,11 +5,10 @@ Provides syntax-highlighted code display.
 
 from typing import Optional, Dict, Any
 from pptx.util import Inches, Pt
-from pptx.dml.color import RGBColor
 from pptx.enum.shapes import MSO_SHAPE
 from pptx.enum.text import PP_ALIGN
 
-from .base import Component
+from .base import Component, cached_rgb
 from ..tokens.typography import FONT_FAMILIES, FONT_SIZES
 from ..tokens.platform_colors import get_language_color, TERMINAL_COLORS
 from ..constants import ComponentSizing
@@ -92,13 +91,8 @@ class CodeBlock(Component):
         Returns:
             Shape object containing the code
         """
-        # If placeholder provided, extract bounds and delete it
-        bounds = self._extract_placeholder_bounds(placeholder)
-        if bounds is not None:
-            left, top, width, height = bounds
-
-        # Delete placeholder after extracting bounds
-        self._delete_placeholder_if_needed(placeholder)
+        # If placeholder provided, take over its bounds and delete it
+        left, top, width, height = self._take_placeholder(placeholder, left, top, width, height)
 
         # Create container
         container = slide.shapes.add_shape(
@@ -109,7 +103,7 @@ class CodeBlock(Component):
         container.fill.solid()
         if self.get_theme_attr("mode") == "light":
             # Use a dark background even in light mode
-            container.fill.fore_color.rgb = RGBColor(*self.hex_to_rgb("#1e1e1e"))
+            container.fill.fore_color.rgb = cached_rgb("#1e1e1e")
         else:
             container.fill.fore_color.rgb = self.get_color("card.DEFAULT")
 
@@ -193,13 +187,8 @@ class InlineCode(Component):
         Returns:
             Shape object containing the code
         """
-        # If placeholder provided, extract bounds and delete it
-        bounds = self._extract_placeholder_bounds(placeholder)
-        if bounds is not None:
-            left, top, width, height = bounds
-
-        # Delete placeholder after extracting bounds
-        self._delete_placeholder_if_needed(placeholder)
+        # If placeholder provided, take over its bounds and delete it
+        left, top, width, height = self._take_placeholder(placeholder, left, top, width, height)
 
         # Calculate width based on text length if not provided
         if width is None:
@@ -263,13 +252,8 @@ class Terminal(CodeBlock):
         placeholder: Optional[Any] = None,
     ) -> Any:
         """Render terminal output or replace a placeholder."""
-        # If placeholder provided, extract bounds and delete it
-        bounds = self._extract_placeholder_bounds(placeholder)
-        if bounds is not None:
-            left, top, width, height = bounds
-
-        # Delete placeholder after extracting bounds
-        self._delete_placeholder_if_needed(placeholder)
+        # If placeholder provided, take over its bounds and delete it
+        left, top, width, height = self._take_placeholder(placeholder, left, top, width, height)
 
         # Create container with black background
         container = slide.shapes.add_shape(
@@ -278,10 +262,10 @@ class Terminal(CodeBlock):
 
         # Black background for terminal
         container.fill.solid()
-        container.fill.fore_color.rgb = RGBColor(*self.hex_to_rgb(TERMINAL_COLORS["background"]))
+        container.fill.fore_color.rgb = cached_rgb(TERMINAL_COLORS["background"])
 
         # Green border for classic terminal look
-        container.line.color.rgb = RGBColor(*self.hex_to_rgb(TERMINAL_COLORS["border"]))
+        container.line.color.rgb = cached_rgb(TERMINAL_COLORS["border"])
         container.line.width = Pt(ComponentSizing.BORDER_WIDTH_MEDIUM)
 
         # Add terminal content
@@ -297,7 +281,7 @@ class Terminal(CodeBlock):
         p.text = "Terminal"
         p.font.name = FONT_FAMILIES["mono"][0]  # Use design system mono font
         p.font.size = Pt(FONT_SIZES["xs"])
-        p.font.color.rgb = RGBColor(*self.hex_to_rgb(TERMINAL_COLORS["text"]))
+        p.font.color.rgb = cached_rgb(TERMINAL_COLORS["text"])
         p.font.bold = True
 
         # Add output lines
@@ -311,7 +295,7 @@ class Terminal(CodeBlock):
 
             p.font.name = FONT_FAMILIES["mono"][0]  # Use design system mono font
             p.font.size = Pt(FONT_SIZES["sm"])
-            p.font.color.rgb = RGBColor(*self.hex_to_rgb(TERMINAL_COLORS["text"]))
+            p.font.color.rgb = cached_rgb(TERMINAL_COLORS["text"])
             p.level = 0
             p.space_before = Pt(0)
             p.space_after = Pt(0)
@@ -14,6 +14,16 @@ from abc import ABC, abstractmethod
 from .base import Component
 
 
+# Badge variant -> color token path
+_BADGE_COLOR_PATHS = {
+    "default": "primary.DEFAULT",
+    "success": "success.DEFAULT",
+    "warning": "warning.DEFAULT",
+    "destructive": "destructive.DEFAULT",
+    "secondary": "secondary.DEFAULT",
+}
+
+
 T = TypeVar("T", bound="ComposableComponent")
 
 
@@ -293,14 +303,7 @@ class Badge(SubComponent):
         p.font.bold = True
 
         # Color based on variant
-        color_map = {
-            "default": "primary.DEFAULT",
-            "success": "success.DEFAULT",
-            "warning": "warning.DEFAULT",
-            "destructive": "destructive.DEFAULT",
-            "secondary": "secondary.DEFAULT",
-        }
-        p.font.color.rgb = self.get_color(color_map.get(self.variant, "primary.DEFAULT"))
+        p.font.color.rgb = self.get_color(_BADGE_COLOR_PATHS.get(self.variant, "primary.DEFAULT"))
 
         return p
 
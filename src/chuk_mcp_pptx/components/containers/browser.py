@@ -5,13 +5,14 @@ Provides authentic browser window mockups (Chrome, Safari, Firefox) for
 displaying web-based chat interfaces and applications.
 """
 
+from types import MappingProxyType
 from typing import Optional, Dict, Any
 from pptx.util import Pt, Inches
 from pptx.enum.text import PP_ALIGN, MSO_ANCHOR
 from pptx.enum.shapes import MSO_SHAPE
 from pptx.dml.color import RGBColor
 
-from ..base import Component
+from ..base import Component, cached_rgb
 from ...tokens.typography import FONT_SIZES
 from ...tokens.platform_colors import (
     get_browser_color,
@@ -20,6 +21,12 @@ from ...tokens.platform_colors import (
 )
 from ...constants import Platform, ColorKey, Theme
 
+# Safari traffic light fills, built once and read-only
+_CONTROL_FILLS = MappingProxyType(
+    {name: cached_rgb(color) for name, color in MACOS_CONTROLS.items()}
+)
+_HAIRLINE = Pt(0.5)
+
 
 class BrowserWindow(Component):
     """
@@ -89,19 +96,19 @@ class BrowserWindow(Component):
         """Get browser chrome color based on theme and browser type."""
         theme_mode = Theme.DARK if self._is_dark_mode() else Theme.LIGHT
         hex_color = get_browser_color(self.browser_type, ColorKey.BORDER, theme_mode)
-        return RGBColor(*self.hex_to_rgb(hex_color))
+        return cached_rgb(hex_color)
 
     def _get_text_color(self) -> RGBColor:
         """Get text color based on theme."""
         theme_mode = Theme.DARK if self._is_dark_mode() else Theme.LIGHT
         hex_color = get_container_ui_color(Platform.CHROME, ColorKey.TEXT, theme_mode)
-        return RGBColor(*self.hex_to_rgb(hex_color))
+        return cached_rgb(hex_color)
 
     def _get_address_bar_color(self) -> RGBColor:
         """Get address bar color."""
         theme_mode = Theme.DARK if self._is_dark_mode() else Theme.LIGHT
         hex_color = get_container_ui_color(Platform.CHROME, ColorKey.ADDRESSBAR, theme_mode)
-        return RGBColor(*self.hex_to_rgb(hex_color))
+        return cached_rgb(hex_color)
 
     def _get_content_bg_color(self) -> RGBColor:
         """Get content background color from theme."""
@@ -110,7 +117,7 @@ class BrowserWindow(Component):
             if bg and isinstance(bg, (list, tuple)) and len(bg) >= 3:
                 return RGBColor(bg[0], bg[1], bg[2])
         hex_color = get_container_ui_color(Platform.CHROME, ColorKey.PLACEHOLDER, Theme.LIGHT)
-        return RGBColor(*self.hex_to_rgb(hex_color))
+        return cached_rgb(hex_color)
 
     def render(
         self, slide, left: float, top: float, width: float = 8.0, height: float = 6.0
@@ -137,8 +144,8 @@ class BrowserWindow(Component):
         window_frame.fill.solid()
         window_frame.fill.fore_color.rgb = self._get_chrome_color()
         hex_color = get_container_ui_color(Platform.CHROME, ColorKey.BORDER, Theme.LIGHT)
-        window_frame.line.color.rgb = RGBColor(*self.hex_to_rgb(hex_color))
-        window_frame.line.width = Pt(0.5)
+        window_frame.line.color.rgb = cached_rgb(hex_color)
+        window_frame.line.width = _HAIRLINE
         shapes.append(window_frame)
 
         # Chrome/Title bar
@@ -163,7 +170,7 @@ class BrowserWindow(Component):
                 Inches(control_size),
             )
             close_btn.fill.solid()
-            close_btn.fill.fore_color.rgb = RGBColor(*self.hex_to_rgb(MACOS_CONTROLS["close"]))
+            close_btn.fill.fore_color.rgb = _CONTROL_FILLS["close"]
             close_btn.line.fill.background()
             shapes.append(close_btn)
 
@@ -176,7 +183,7 @@ class BrowserWindow(Component):
                 Inches(control_size),
             )
             min_btn.fill.solid()
-            min_btn.fill.fore_color.rgb = RGBColor(*self.hex_to_rgb(MACOS_CONTROLS["minimize"]))
+            min_btn.fill.fore_color.rgb = _CONTROL_FILLS["minimize"]
             min_btn.line.fill.background()
             shapes.append(min_btn)
 
@@ -189,7 +196,7 @@ class BrowserWindow(Component):
                 Inches(control_size),
             )
             max_btn.fill.solid()
-            max_btn.fill.fore_color.rgb = RGBColor(*self.hex_to_rgb(MACOS_CONTROLS["maximize"]))
+            max_btn.fill.fore_color.rgb = _CONTROL_FILLS["maximize"]
             max_btn.line.fill.background()
             shapes.append(max_btn)
 
@@ -237,7 +244,7 @@ class BrowserWindow(Component):
         address_bar.fill.solid()
         address_bar.fill.fore_color.rgb = self._get_address_bar_color()
         address_bar.line.color.rgb = self.get_color("border.DEFAULT")
-        address_bar.line.width = Pt(0.5)
+        address_bar.line.width = _HAIRLINE
 
         # Address bar text
         address_text = address_bar.text_frame
@@ -11,7 +11,7 @@ from pptx.enum.text import PP_ALIGN, MSO_ANCHOR
 from pptx.enum.shapes import MSO_SHAPE
 from pptx.dml.color import RGBColor
 
-from ..base import Component
+from ..base import Component, cached_rgb
 from ...tokens.platform_colors import get_container_ui_color
 from ...constants import Platform, ColorKey, Theme
 
@@ -96,7 +96,7 @@ class ChatContainer(Component):
                 return RGBColor(bg[0], bg[1], bg[2])
 
         hex_color = get_container_ui_color(Platform.GENERIC, ColorKey.CONTENT_BG, Theme.LIGHT)
-        return RGBColor(*self.hex_to_rgb(hex_color))
+        return cached_rgb(hex_color)
 
     def _get_border_color(self) -> RGBColor:
         """Get border color."""
@@ -107,7 +107,7 @@ class ChatContainer(Component):
 
         theme_mode = Theme.DARK if self._is_dark_mode() else Theme.LIGHT
         hex_color = get_container_ui_color(Platform.GENERIC, ColorKey.BORDER, theme_mode)
-        return RGBColor(*self.hex_to_rgb(hex_color))
+        return cached_rgb(hex_color)
 
     def _get_header_bg_color(self) -> RGBColor:
         """Get header background color."""
@@ -118,7 +118,7 @@ class ChatContainer(Component):
 
         theme_mode = Theme.DARK if self._is_dark_mode() else Theme.LIGHT
         hex_color = get_container_ui_color(Platform.GENERIC, ColorKey.HEADER_BG, theme_mode)
-        return RGBColor(*self.hex_to_rgb(hex_color))
+        return cached_rgb(hex_color)
 
     def _get_text_color(self) -> RGBColor:
         """Get text color."""
@@ -129,7 +129,7 @@ class ChatContainer(Component):
 
         theme_mode = Theme.DARK if self._is_dark_mode() else Theme.LIGHT
         hex_color = get_container_ui_color(Platform.GENERIC, ColorKey.HEADER_TEXT, theme_mode)
-        return RGBColor(*self.hex_to_rgb(hex_color))
+        return cached_rgb(hex_color)
 
     def render(
         self, slide, left: float, top: float, width: float = 6.0, height: float = 5.0
@@ -4,13 +4,14 @@ macOS application window container for PowerPoint presentations.
 Provides authentic macOS window mockups for displaying desktop applications.
 """
 
+from types import MappingProxyType
 from typing import Optional, Dict, Any
 from pptx.util import Pt, Inches
 from pptx.enum.text import PP_ALIGN, MSO_ANCHOR
 from pptx.enum.shapes import MSO_SHAPE
 from pptx.dml.color import RGBColor
 
-from ..base import Component
+from ..base import Component, cached_rgb
 from ...tokens.typography import FONT_SIZES
 from ...tokens.platform_colors import (
     MACOS_CONTROLS,
@@ -18,6 +19,19 @@ from ...tokens.platform_colors import (
 )
 from ...constants import Theme, Platform, ColorKey
 
+# Traffic light fills and their slightly darker borders, built once and read-only
+_CONTROL_FILLS = MappingProxyType(
+    {name: cached_rgb(color) for name, color in MACOS_CONTROLS.items()}
+)
+_CONTROL_BORDERS = MappingProxyType(
+    {
+        "close": RGBColor(220, 85, 76),
+        "minimize": RGBColor(225, 169, 41),
+        "maximize": RGBColor(35, 181, 57),
+    }
+)
+_HAIRLINE = Pt(0.5)
+
 
 class MacOSWindow(Component):
     """
@@ -75,13 +89,13 @@ class MacOSWindow(Component):
         """Get title bar color based on theme."""
         theme_mode = Theme.DARK if self._is_dark_mode() else Theme.LIGHT
         hex_color = get_container_ui_color(Platform.MACOS, ColorKey.TITLEBAR, theme_mode)
-        return RGBColor(*self.hex_to_rgb(hex_color))
+        return cached_rgb(hex_color)
 
     def _get_text_color(self) -> RGBColor:
         """Get text color based on theme."""
         theme_mode = Theme.DARK if self._is_dark_mode() else Theme.LIGHT
         hex_color = get_container_ui_color(Platform.MACOS, ColorKey.TEXT, theme_mode)
-        return RGBColor(*self.hex_to_rgb(hex_color))
+        return cached_rgb(hex_color)
 
     def _get_content_bg_color(self) -> RGBColor:
         """Get content background color."""
@@ -90,7 +104,7 @@ class MacOSWindow(Component):
             if bg and isinstance(bg, (list, tuple)) and len(bg) >= 3:
                 return RGBColor(bg[0], bg[1], bg[2])
         hex_color = get_container_ui_color(Platform.MACOS, ColorKey.CONTENT_BG, Theme.LIGHT)
-        return RGBColor(*self.hex_to_rgb(hex_color))
+        return cached_rgb(hex_color)
 
     def render(
         self, slide, left: float, top: float, width: float = 7.0, height: float = 5.0
@@ -117,8 +131,8 @@ class MacOSWindow(Component):
         window_frame.fill.solid()
         window_frame.fill.fore_color.rgb = self._get_content_bg_color()
         hex_color = get_container_ui_color(Platform.MACOS, ColorKey.BORDER, Theme.LIGHT)
-        window_frame.line.color.rgb = RGBColor(*self.hex_to_rgb(hex_color))
-        window_frame.line.width = Pt(0.5)
+        window_frame.line.color.rgb = cached_rgb(hex_color)
+        window_frame.line.width = _HAIRLINE
 
         # macOS-style shadow
         window_frame.shadow.visible = True
@@ -158,10 +172,10 @@ class MacOSWindow(Component):
             Inches(control_size),
         )
         close_btn.fill.solid()
-        close_btn.fill.fore_color.rgb = RGBColor(*self.hex_to_rgb(MACOS_CONTROLS["close"]))
+        close_btn.fill.fore_color.rgb = _CONTROL_FILLS["close"]
         # Border is slightly darker than fill
-        close_btn.line.color.rgb = RGBColor(220, 85, 76)
-        close_btn.line.width = Pt(0.5)
+        close_btn.line.color.rgb = _CONTROL_BORDERS["close"]
+        close_btn.line.width = _HAIRLINE
         shapes.append(close_btn)
 
         # Yellow (minimize)
@@ -173,10 +187,10 @@ class MacOSWindow(Component):
             Inches(control_size),
         )
         min_btn.fill.solid()
-        min_btn.fill.fore_color.rgb = RGBColor(*self.hex_to_rgb(MACOS_CONTROLS["minimize"]))
+        min_btn.fill.fore_color.rgb = _CONTROL_FILLS["minimize"]
         # Border is slightly darker than fill
-        min_btn.line.color.rgb = RGBColor(225, 169, 41)
-        min_btn.line.width = Pt(0.5)
+        min_btn.line.color.rgb = _CONTROL_BORDERS["minimize"]
+        min_btn.line.width = _HAIRLINE
         shapes.append(min_btn)
 
         # Green (maximize)
@@ -188,10 +202,10 @@ class MacOSWindow(Component):
             Inches(control_size),
         )
         max_btn.fill.solid()
-        max_btn.fill.fore_color.rgb = RGBColor(*self.hex_to_rgb(MACOS_CONTROLS["maximize"]))
+        max_btn.fill.fore_color.rgb = _CONTROL_FILLS["maximize"]
         # Border is slightly darker than fill
-        max_btn.line.color.rgb = RGBColor(35, 181, 57)
-        max_btn.line.width = Pt(0.5)
+        max_btn.line.color.rgb = _CONTROL_BORDERS["maximize"]
+        max_btn.line.width = _HAIRLINE
         shapes.append(max_btn)
 
         # Window title (centered)
@@ -233,7 +247,7 @@ class MacOSWindow(Component):
             # Toolbar is slightly lighter/darker than title bar
             theme_mode = Theme.DARK if self._is_dark_mode() else Theme.LIGHT
             hex_color = get_container_ui_color(Platform.MACOS, ColorKey.TOOLBAR, theme_mode)
-            toolbar.fill.fore_color.rgb = RGBColor(*self.hex_to_rgb(hex_color))
+            toolbar.fill.fore_color.rgb = cached_rgb(hex_color)
 
             toolbar.line.fill.background()
             shapes.append(toolbar)
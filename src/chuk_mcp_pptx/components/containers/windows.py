@@ -10,7 +10,7 @@ from pptx.enum.text import PP_ALIGN, MSO_ANCHOR
 from pptx.enum.shapes import MSO_SHAPE
 from pptx.dml.color import RGBColor
 
-from ..base import Component
+from ..base import Component, cached_rgb
 from ...tokens.typography import FONT_SIZES
 from ...tokens.platform_colors import (
     WINDOWS_CONTROLS,
@@ -18,6 +18,13 @@ from ...tokens.platform_colors import (
 )
 from ...constants import Theme, Platform, ColorKey
 
+# Fixed chrome colors and sizes, built once
+_CLOSE_FILL = cached_rgb(WINDOWS_CONTROLS["close"])
+_CLOSE_ICON_COLOR = RGBColor(255, 255, 255)
+_FRAME_BORDER = RGBColor(150, 150, 150)
+_HAIRLINE = Pt(0.5)
+_CONTROL_ICON_SIZE = Pt(14)
+
 
 class WindowsWindow(Component):
     """
@@ -75,13 +82,13 @@ class WindowsWindow(Component):
         """Get title bar color based on theme."""
         theme_mode = Theme.DARK if self._is_dark_mode() else Theme.LIGHT
         hex_color = get_container_ui_color(Platform.WINDOWS, ColorKey.TITLEBAR, theme_mode)
-        return RGBColor(*self.hex_to_rgb(hex_color))
+        return cached_rgb(hex_color)
 
     def _get_text_color(self) -> RGBColor:
         """Get text color based on theme."""
         theme_mode = Theme.DARK if self._is_dark_mode() else Theme.LIGHT
         hex_color = get_container_ui_color(Platform.WINDOWS, ColorKey.TEXT, theme_mode)
-        return RGBColor(*self.hex_to_rgb(hex_color))
+        return cached_rgb(hex_color)
 
     def _get_content_bg_color(self) -> RGBColor:
         """Get content background color."""
@@ -92,7 +99,7 @@ class WindowsWindow(Component):
 
         theme_mode = Theme.DARK if self._is_dark_mode() else Theme.LIGHT
         hex_color = get_container_ui_color(Platform.WINDOWS, ColorKey.MENUBAR, theme_mode)
-        return RGBColor(*self.hex_to_rgb(hex_color))
+        return cached_rgb(hex_color)
 
     def render(
         self, slide, left: float, top: float, width: float = 7.0, height: float = 5.0
@@ -118,8 +125,8 @@ class WindowsWindow(Component):
         )
         window_frame.fill.solid()
         window_frame.fill.fore_color.rgb = self._get_content_bg_color()
-        window_frame.line.color.rgb = RGBColor(150, 150, 150)
-        window_frame.line.width = Pt(0.5)
+        window_frame.line.color.rgb = _FRAME_BORDER
+        window_frame.line.width = _HAIRLINE
 
         # Windows 11 subtle shadow
         window_frame.shadow.visible = True
@@ -188,7 +195,7 @@ class WindowsWindow(Component):
         min_p = min_icon.text_frame.paragraphs[0]
         min_p.alignment = PP_ALIGN.CENTER
         min_icon.text_frame.vertical_anchor = MSO_ANCHOR.MIDDLE
-        min_p.font.size = Pt(14)
+        min_p.font.size = _CONTROL_ICON_SIZE
         min_p.font.color.rgb = self._get_text_color()
         shapes.extend([min_btn, min_icon])
 
@@ -215,7 +222,7 @@ class WindowsWindow(Component):
         max_p = max_icon.text_frame.paragraphs[0]
         max_p.alignment = PP_ALIGN.CENTER
         max_icon.text_frame.vertical_anchor = MSO_ANCHOR.MIDDLE
-        max_p.font.size = Pt(14)
+        max_p.font.size = _CONTROL_ICON_SIZE
         max_p.font.color.rgb = self._get_text_color()
         shapes.extend([max_btn, max_icon])
 
@@ -228,9 +235,7 @@ class WindowsWindow(Component):
             Inches(control_height),
         )
         close_btn.fill.solid()
-        close_btn.fill.fore_color.rgb = RGBColor(
-            *self.hex_to_rgb(WINDOWS_CONTROLS["close"])
-        )  # Windows red
+        close_btn.fill.fore_color.rgb = _CLOSE_FILL  # Windows red
         close_btn.line.fill.background()
 
         # Close icon (X)
@@ -244,8 +249,8 @@ class WindowsWindow(Component):
         close_p = close_icon.text_frame.paragraphs[0]
         close_p.alignment = PP_ALIGN.CENTER
         close_icon.text_frame.vertical_anchor = MSO_ANCHOR.MIDDLE
-        close_p.font.size = Pt(14)
-        close_p.font.color.rgb = RGBColor(255, 255, 255)
+        close_p.font.size = _CONTROL_ICON_SIZE
+        close_p.font.color.rgb = _CLOSE_ICON_COLOR
         shapes.extend([close_btn, close_icon])
 
         current_y = top + titlebar_height
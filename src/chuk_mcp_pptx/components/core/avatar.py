@@ -335,13 +335,8 @@ class AvatarWithLabel(Component):
         Returns:
             List of rendered shapes [avatar, label_box]
         """
-        # If placeholder provided, extract bounds and delete it
-        bounds = self._extract_placeholder_bounds(placeholder)
-        if bounds is not None:
-            left, top, width, height = bounds
-
-        # Delete placeholder after extracting bounds
-        self._delete_placeholder_if_needed(placeholder)
+        # If placeholder provided, take over its bounds and delete it
+        left, top, width, _ = self._take_placeholder(placeholder, left, top, width, None)
 
         shapes = []
 
@@ -487,13 +482,8 @@ class AvatarGroup(Component):
         Returns:
             List of rendered avatar shapes
         """
-        # If placeholder provided, extract bounds and delete it
-        bounds = self._extract_placeholder_bounds(placeholder)
-        if bounds is not None:
-            left, top, width, height = bounds
-
-        # Delete placeholder after extracting bounds
-        self._delete_placeholder_if_needed(placeholder)
+        # If placeholder provided, take over its bounds and delete it
+        left, top, _, _ = self._take_placeholder(placeholder, left, top, None, None)
 
         shapes = []
         avatar_diameter = Avatar.SIZE_MAP.get(self.size, 1.0)
@@ -14,6 +14,14 @@ from ...constants import ComponentSizing
 from ..variants import BADGE_VARIANTS
 from ..registry import component, ComponentCategory, prop, example
 
+# Dot badge variant -> color token path
+_DOT_COLOR_PATHS = {
+    "default": "primary.DEFAULT",
+    "success": "success.DEFAULT",
+    "warning": "warning.DEFAULT",
+    "destructive": "destructive.DEFAULT",
+}
+
 
 @component(
     name="Badge",
@@ -123,13 +131,8 @@ class Badge(Component):
         Returns:
             Shape object representing the badge
         """
-        # If placeholder provided, extract bounds and delete it
-        bounds = self._extract_placeholder_bounds(placeholder)
-        if bounds is not None:
-            left, top, width, height = bounds
-
-        # Delete placeholder after extracting bounds
-        self._delete_placeholder_if_needed(placeholder)
+        # If placeholder provided, take over its bounds and delete it
+        left, top, width, height = self._take_placeholder(placeholder, left, top, width, height)
 
         # Calculate dimensions
         badge_width = width or self._calculate_width()
@@ -298,13 +301,8 @@ class DotBadge(Component):
         Returns:
             Oval shape representing the dot
         """
-        # If placeholder provided, extract bounds and delete it
-        bounds = self._extract_placeholder_bounds(placeholder)
-        if bounds is not None:
-            left, top, width, height = bounds
-
-        # Delete placeholder after extracting bounds
-        self._delete_placeholder_if_needed(placeholder)
+        # If placeholder provided, take over its bounds and delete it
+        left, top, width, height = self._take_placeholder(placeholder, left, top, width, height)
 
         # Use size if width/height not provided
         dot_size = width or height or self.size
@@ -315,14 +313,7 @@ class DotBadge(Component):
         )
 
         # Get color based on variant
-        color_map = {
-            "default": "primary.DEFAULT",
-            "success": "success.DEFAULT",
-            "warning": "warning.DEFAULT",
-            "destructive": "destructive.DEFAULT",
-        }
-
-        color = self.get_color(color_map.get(self.variant, "primary.DEFAULT"))
+        color = self.get_color(_DOT_COLOR_PATHS.get(self.variant, "primary.DEFAULT"))
 
         # Apply color
         dot.fill.solid()
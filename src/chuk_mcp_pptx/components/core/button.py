@@ -142,13 +142,8 @@ class Button(ComposableComponent):
         Returns:
             Shape object representing the button
         """
-        # If placeholder provided, extract bounds and delete it
-        bounds = self._extract_placeholder_bounds(placeholder)
-        if bounds is not None:
-            left, top, width, height = bounds
-
-        # Delete placeholder after extracting bounds
-        self._delete_placeholder_if_needed(placeholder)
+        # If placeholder provided, take over its bounds and delete it
+        left, top, width, height = self._take_placeholder(placeholder, left, top, width, height)
 
         # Get dimensions from variant props or use provided
         btn_width = width if width is not None else self._get_default_width()
@@ -376,13 +371,8 @@ class IconButton(Button):
             height: Optional height (defaults to square)
             placeholder: Optional placeholder to replace
         """
-        # If placeholder provided, extract bounds and delete it
-        bounds = self._extract_placeholder_bounds(placeholder)
-        if bounds is not None:
-            left, top, width, height = bounds
-
-        # Delete placeholder after extracting bounds
-        self._delete_placeholder_if_needed(placeholder)
+        # If placeholder provided, take over its bounds and delete it
+        left, top, width, height = self._take_placeholder(placeholder, left, top, width, height)
 
         # Icon buttons are square by default
         size = width or self._get_default_width()
@@ -463,13 +453,8 @@ class ButtonGroup(ComposableComponent):
         Returns:
             List of button shapes
         """
-        # If placeholder provided, extract bounds and delete it
-        bounds = self._extract_placeholder_bounds(placeholder)
-        if bounds is not None:
-            left, top, width, height = bounds
-
-        # Delete placeholder after extracting bounds
-        self._delete_placeholder_if_needed(placeholder)
+        # If placeholder provided, take over its bounds and delete it
+        left, top, _, _ = self._take_placeholder(placeholder, left, top, None, None)
 
         shapes = []
         current_left = left
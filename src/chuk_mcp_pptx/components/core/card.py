@@ -5,7 +5,6 @@ Uses the new variant system and compositional API.
 """
 
 from typing import Optional, Dict, Any
-from pptx.util import Inches, Pt
 from pptx.enum.shapes import MSO_SHAPE
 from pptx.enum.text import PP_ALIGN, MSO_ANCHOR
 
@@ -17,6 +16,7 @@ from ..composition import (
     CardTitle,
     CardDescription,
 )
+from ..base import cached_inches, cached_pt
 from ..variants import CARD_VARIANTS
 from ..registry import component, ComponentCategory, prop, example
 from ...tokens.typography import FONT_SIZES, PARAGRAPH_SPACING
@@ -240,10 +240,10 @@ class Card(ComposableComponent):
         # Create card shape
         card = slide.shapes.add_shape(
             MSO_SHAPE.ROUNDED_RECTANGLE,
-            Inches(left),
-            Inches(top),
-            Inches(card_width),
-            Inches(card_height),
+            cached_inches(left),
+            cached_inches(top),
+            cached_inches(card_width),
+            cached_inches(card_height),
         )
 
         # Apply variant styles
@@ -260,10 +260,11 @@ class Card(ComposableComponent):
         variant_padding = self.variant_props.get("padding")
         if variant_padding is not None:
             padding_inches = variant_padding
-        text_frame.margin_left = Inches(padding_inches)
-        text_frame.margin_right = Inches(padding_inches)
-        text_frame.margin_top = Inches(padding_inches)
-        text_frame.margin_bottom = Inches(padding_inches)
+        margin = cached_inches(padding_inches)
+        text_frame.margin_left = margin
+        text_frame.margin_right = margin
+        text_frame.margin_top = margin
+        text_frame.margin_bottom = margin
 
         # Render children if any
         if self._children:
@@ -290,7 +291,7 @@ class Card(ComposableComponent):
         if border_width > 0:
             border_color = props.get("border_color", "border.DEFAULT")
             shape.line.color.rgb = self.get_color(border_color)
-            shape.line.width = Pt(border_width)
+            shape.line.width = cached_pt(border_width)
         else:
             shape.line.fill.background()
 
@@ -308,8 +309,8 @@ class Card(ComposableComponent):
         # Shadow (for elevated variant)
         if props.get("shadow"):
             shape.shadow.visible = True
-            shape.shadow.blur_radius = Pt(self.get_font_size("xs"))
-            shape.shadow.distance = Pt(4)
+            shape.shadow.blur_radius = cached_pt(self.get_font_size("xs"))
+            shape.shadow.distance = cached_pt(4)
             shape.shadow.angle = 90
             shape.shadow.transparency = 0.3
 
@@ -465,16 +466,17 @@ class MetricCard(Card):
         text_frame.vertical_anchor = MSO_ANCHOR.TOP  # Anchor text to top
 
         padding = self.variant_props.get("padding", 0.5)
-        text_frame.margin_left = Inches(padding)
-        text_frame.margin_right = Inches(padding)
-        text_frame.margin_top = Inches(padding)
-        text_frame.margin_bottom = Inches(padding)
+        margin = cached_inches(padding)
+        text_frame.margin_left = margin
+        text_frame.margin_right = margin
+        text_frame.margin_top = margin
+        text_frame.margin_bottom = margin
 
         # Label
         p = text_frame.paragraphs[0]
         p.text = self.label
         p.alignment = PP_ALIGN.CENTER
-        p.font.size = Pt(FONT_SIZES["sm"])
+        p.font.size = cached_pt(FONT_SIZES["sm"])
         p.font.color.rgb = self.get_color("muted.foreground")
         p.font.name = self.get_theme_attr("font_family", "Inter")
 
@@ -482,8 +484,8 @@ class MetricCard(Card):
         p = text_frame.add_paragraph()
         p.text = self.value
         p.alignment = PP_ALIGN.CENTER
-        p.space_before = Pt(PARAGRAPH_SPACING["xs"])
-        p.font.size = Pt(FONT_SIZES["2xl"])  # 22pt (was 20pt, using closest design token)
+        p.space_before = cached_pt(PARAGRAPH_SPACING["xs"])
+        p.font.size = cached_pt(FONT_SIZES["2xl"])  # 22pt (was 20pt, using closest design token)
         p.font.bold = True
         p.font.color.rgb = self.get_color(self.variant_props.get("fg_color", "card.foreground"))
         p.font.name = self.get_theme_attr("font_family", "Inter")
@@ -494,8 +496,8 @@ class MetricCard(Card):
             symbol = self.get_trend_symbol()
             p.text = f"{symbol} {self.change}" if symbol else self.change
             p.alignment = PP_ALIGN.CENTER
-            p.space_before = Pt(PARAGRAPH_SPACING["xs"])
-            p.font.size = Pt(FONT_SIZES["sm"])
+            p.space_before = cached_pt(PARAGRAPH_SPACING["xs"])
+            p.font.size = cached_pt(FONT_SIZES["sm"])
             p.font.color.rgb = self.get_trend_color()
             p.font.name = self.get_theme_attr("font_family", "Inter")
 
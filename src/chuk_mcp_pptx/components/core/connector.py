@@ -5,16 +5,24 @@ Connector and arrow components for PowerPoint presentations.
 Provides connector lines with arrows for diagrams and flows.
 """
 
+from copy import deepcopy
 from typing import Optional, Dict, Any
-from pptx.util import Inches, Pt
 from pptx.enum.shapes import MSO_CONNECTOR
 from pptx.dml.color import RGBColor
 from pptx.oxml import parse_xml
 
-from ..base import Component
+from ..base import Component, cached_inches, cached_pt, cached_rgb, set_solid_fill
 from ..registry import component, ComponentCategory, prop, example
 
 
+# Arrow head elements, parsed once and copied per connector
+_HEAD_END = parse_xml(
+    '<a:headEnd type="triangle" xmlns:a="http://schemas.openxmlformats.org/drawingml/2006/main"/>'
+)
+_TAIL_END = parse_xml(
+    '<a:tailEnd type="triangle" xmlns:a="http://schemas.openxmlformats.org/drawingml/2006/main"/>'
+)
+
 CONNECTOR_TYPES = {
     "straight": MSO_CONNECTOR.STRAIGHT,
     "elbow": MSO_CONNECTOR.ELBOW,
@@ -22,6 +30,58 @@ CONNECTOR_TYPES = {
 }
 
 
+def add_styled_connector(
+    slide,
+    start_x: float,
+    start_y: float,
+    end_x: float,
+    end_y: float,
+    line_hex: str,
+    connector_type: str = "straight",
+    line_width: float = 2.0,
+    arrow_start: bool = False,
+    arrow_end: bool = True,
+) -> Any:
+    """
+    Add a connector with an already-resolved line color.
+
+    This is the drawing half of Connector.render, for diagram components that
+    resolve their palette once instead of building a Connector per edge.
+
+    Args:
+        slide: PowerPoint slide object
+        start_x, start_y, end_x, end_y: End points in inches
+        line_hex: Line color as "RRGGBB"
+        connector_type: Type (straight, elbow, curved)
+        line_width: Line width in points
+        arrow_start: Whether to show arrow at start
+        arrow_end: Whether to show arrow at end
+
+    Returns:
+        Connector shape object
+    """
+    mso_connector = CONNECTOR_TYPES.get(connector_type.lower(), MSO_CONNECTOR.STRAIGHT)
+    connector = slide.shapes.add_connector(
+        mso_connector,
+        cached_inches(start_x),
+        cached_inches(start_y),
+        cached_inches(end_x),
+        cached_inches(end_y),
+    )
+
+    ln = connector._element.spPr.get_or_add_ln()
+    set_solid_fill(ln, line_hex)
+    ln.set("w", str(cached_pt(line_width)))
+
+    # Arrow at end, then arrow at start (schema order: headEnd before tailEnd)
+    if arrow_end:
+        ln.append(deepcopy(_HEAD_END))
+    if arrow_start:
+        ln.append(deepcopy(_TAIL_END))
+
+    return connector
+
+
 @component(
     name="Connector",
     category=ComponentCategory.UI,
@@ -170,59 +230,28 @@ class Connector(Component):
         # Delete placeholder after extracting bounds
         self._delete_placeholder_if_needed(placeholder)
 
-        # Get connector type
-        mso_connector = CONNECTOR_TYPES.get(self.connector_type.lower(), MSO_CONNECTOR.STRAIGHT)
-
-        # Create connector
-        connector = slide.shapes.add_connector(
-            mso_connector,
-            Inches(self.start_x),
-            Inches(self.start_y),
-            Inches(self.end_x),
-            Inches(self.end_y),
-        )
-
         # Set line color
         if self.line_color:
             color_rgb = self._parse_color(self.line_color)
         else:
             color_rgb = self.get_color("muted.foreground")
 
-        connector.line.color.rgb = color_rgb
-        connector.line.width = Pt(self.line_width)
-
-        # Add arrows
-        self._add_arrows(connector)
-
-        return connector
+        return add_styled_connector(
+            slide,
+            self.start_x,
+            self.start_y,
+            self.end_x,
+            self.end_y,
+            line_hex=str(color_rgb),
+            connector_type=self.connector_type,
+            line_width=self.line_width,
+            arrow_start=self.arrow_start,
+            arrow_end=self.arrow_end,
+        )
 
     def _parse_color(self, color_str: str) -> RGBColor:
         """Parse color string (hex or semantic path)."""
         if color_str.startswith("#"):
-            color_str = color_str[1:]
-            return RGBColor(
-                int(color_str[0:2], 16), int(color_str[2:4], 16), int(color_str[4:6], 16)
-            )
+            return cached_rgb(color_str)
         else:
             return self.get_color(color_str)
-
-    def _add_arrows(self, connector):
-        """Add arrow heads to connector."""
-        # Get or create line element
-        line_elem = connector._element.spPr.ln if hasattr(connector._element.spPr, "ln") else None
-        if line_elem is None:
-            line_elem = connector._element.spPr._add_ln()
-
-        # Add arrow at end
-        if self.arrow_end:
-            headEnd = parse_xml(
-                '<a:headEnd type="triangle" xmlns:a="http://schemas.openxmlformats.org/drawingml/2006/main"/>'
-            )
-            line_elem.append(headEnd)
-
-        # Add arrow at start
-        if self.arrow_start:
-            tailEnd = parse_xml(
-                '<a:tailEnd type="triangle" xmlns:a="http://schemas.openxmlformats.org/drawingml/2006/main"/>'
-            )
-            line_elem.append(tailEnd)
@@ -75,13 +75,8 @@ class Divider(Component):
         placeholder: Optional[Any] = None,
     ):
         """Render divider line."""
-        # If placeholder provided, extract bounds and delete it
-        bounds = self._extract_placeholder_bounds(placeholder)
-        if bounds is not None:
-            left, top, width, height = bounds
-
-        # Delete placeholder after extracting bounds
-        self._delete_placeholder_if_needed(placeholder)
+        # If placeholder provided, take over its bounds and delete it
+        left, top, width, height = self._take_placeholder(placeholder, left, top, width, height)
 
         if self.orientation == "horizontal":
             # Horizontal line
@@ -7,11 +7,12 @@ Uses Unicode symbols and shapes for common business icons.
 """
 
 from typing import Optional, Dict, Any
-from pptx.util import Pt
+from pptx.util import Inches, Pt
 from pptx.enum.text import PP_ALIGN
 from pptx.dml.color import RGBColor
 
 from ..base import Component
+from ...tokens.typography import get_text_style
 
 
 # Icon mappings using Unicode symbols
@@ -95,6 +96,17 @@ ICON_SYMBOLS = {
 }
 
 
+# Variant -> color token path
+_VARIANT_COLOR_PATHS = {
+    "default": "foreground.DEFAULT",
+    "primary": "primary.DEFAULT",
+    "success": "success.DEFAULT",
+    "warning": "warning.DEFAULT",
+    "error": "destructive.DEFAULT",
+    "muted": "muted.foreground",
+}
+
+
 class Icon(Component):
     """
     Icon component - standardized icon symbols.
@@ -164,15 +176,7 @@ class Icon(Component):
 
     def _get_icon_color(self) -> RGBColor:
         """Get color based on variant."""
-        color_map = {
-            "default": "foreground.DEFAULT",
-            "primary": "primary.DEFAULT",
-            "success": "success.DEFAULT",
-            "warning": "warning.DEFAULT",
-            "error": "destructive.DEFAULT",
-            "muted": "muted.foreground",
-        }
-        color_path = color_map.get(self.variant, "foreground.DEFAULT")
+        color_path = _VARIANT_COLOR_PATHS.get(self.variant, "foreground.DEFAULT")
         return self.get_color(color_path)
 
     def _get_size_inches(self) -> float:
@@ -198,15 +202,8 @@ class Icon(Component):
         Returns:
             Shape containing the icon
         """
-        # If placeholder provided, extract bounds and delete it
-        bounds = self._extract_placeholder_bounds(placeholder)
-        if bounds is not None:
-            left, top, width, height = bounds
-
-        # Delete placeholder after extracting bounds
-        self._delete_placeholder_if_needed(placeholder)
-
-        from pptx.util import Inches
+        # If placeholder provided, take over its bounds and delete it
+        left, top, _, _ = self._take_placeholder(placeholder, left, top, None, None)
 
         font_family = self._get_font_family()
         size_inches = self._get_size_inches()
@@ -305,16 +302,8 @@ class IconList(Component):
         Returns:
             List of rendered shapes
         """
-        # If placeholder provided, extract bounds and delete it
-        bounds = self._extract_placeholder_bounds(placeholder)
-        if bounds is not None:
-            left, top, width, height = bounds
-
-        # Delete placeholder after extracting bounds
-        self._delete_placeholder_if_needed(placeholder)
-
-        from pptx.util import Inches
-        from ...tokens.typography import get_text_style
+        # If placeholder provided, take over its bounds and delete it
+        left, top, width, _ = self._take_placeholder(placeholder, left, top, width, None)
 
         font_family = self._get_font_family()
         shapes = []
@@ -6,17 +6,31 @@ Provides image placement with effects and transformations.
 """
 
 from typing import Optional, Dict, Any
-from pptx.util import Inches, Pt
-from pathlib import Path
 import base64
 import io
 import asyncio
-from PIL import Image as PILImage, ImageFilter, ImageEnhance
+import urllib.request
+from copy import deepcopy
+from PIL import Image as PILImage, ImageFilter, ImageEnhance, ImageOps
+from pptx.oxml import parse_xml
+from pptx.oxml.ns import nsdecls
 
-from ..base import Component
+from ..base import Component, cached_inches, cached_pt
 from ..registry import component, ComponentCategory, prop, example
 
 
+# Picture drop shadow: 4pt distance and blur, 45 degrees, 50% transparent black.
+# Built once from the Pt(4) constants and copied onto each picture.
+_SHADOW_PT = cached_pt(4)
+_SHADOW_EFFECT = parse_xml(
+    f"<a:effectLst {nsdecls('a')}>"
+    f'<a:outerShdw blurRad="{_SHADOW_PT}" dist="{_SHADOW_PT}" dir="2700000" '
+    'algn="tl" rotWithShape="0">'
+    '<a:srgbClr val="000000"><a:alpha val="50000"/></a:srgbClr>'
+    "</a:outerShdw></a:effectLst>"
+)
+
+
 @component(
     name="Image",
     category=ComponentCategory.UI,
@@ -232,8 +246,6 @@ class Image(Component):
             # No processing needed, use original
             # Handle HTTP/HTTPS URLs
             if self.image_source.startswith(("http://", "https://")):
-                import urllib.request
-
                 try:
                     # Download image from URL - scheme already validated above (http/https only)
                     with urllib.request.urlopen(self.image_source) as response:  # nosec B310
@@ -247,28 +259,28 @@ class Image(Component):
 
             # Handle base64 image data
             elif self.image_source.startswith("data:image/"):
-                header, encoded = self.image_source.split(",", 1)
-                image_data = base64.b64decode(encoded)
-                image_stream = io.BytesIO(image_data)
-                image_source_for_insertion = image_stream
+                image_source_for_insertion = self._decode_data_uri()
 
-            # Handle file path
-            elif Path(self.image_source).exists():
+            # Handle file path - python-pptx opens it on insert, so a missing file
+            # surfaces there rather than costing a stat() up front
+            else:
                 image_source_for_insertion = self.image_source
 
+        try:
+            # Insert into placeholder if provided, otherwise add to slide
+            if placeholder is not None:
+                # Use placeholder's insert_picture method
+                try:
+                    pic = placeholder.insert_picture(image_source_for_insertion)
+                except AttributeError:
+                    # Fallback if placeholder doesn't support insert_picture
+                    pic = self._add_picture(
+                        slide, image_source_for_insertion, left, top, width, height
+                    )
             else:
-                raise FileNotFoundError(f"Image not found: {self.image_source}")
-
-        # Insert into placeholder if provided, otherwise add to slide
-        if placeholder is not None:
-            # Use placeholder's insert_picture method
-            try:
-                pic = placeholder.insert_picture(image_source_for_insertion)
-            except AttributeError:
-                # Fallback if placeholder doesn't support insert_picture
                 pic = self._add_picture(slide, image_source_for_insertion, left, top, width, height)
-        else:
-            pic = self._add_picture(slide, image_source_for_insertion, left, top, width, height)
+        except FileNotFoundError as e:
+            raise FileNotFoundError(f"Image not found: {self.image_source}") from e
 
         # Apply PowerPoint effects
         if self.shadow:
@@ -278,35 +290,32 @@ class Image(Component):
 
     def _add_picture(self, slide, image_source, left, top, width, height):
         """Add picture to slide with specified dimensions."""
-        if width and height:
-            return slide.shapes.add_picture(
-                image_source, Inches(left), Inches(top), width=Inches(width), height=Inches(height)
-            )
-        elif width:
-            return slide.shapes.add_picture(
-                image_source, Inches(left), Inches(top), width=Inches(width)
-            )
-        elif height:
-            return slide.shapes.add_picture(
-                image_source, Inches(left), Inches(top), height=Inches(height)
-            )
-        else:
-            return slide.shapes.add_picture(image_source, Inches(left), Inches(top))
+        # add_picture scales from the native size for whichever dimension is None
+        return slide.shapes.add_picture(
+            image_source,
+            cached_inches(left),
+            cached_inches(top),
+            width=cached_inches(width) if width else None,
+            height=cached_inches(height) if height else None,
+        )
+
+    def _decode_data_uri(self) -> io.BytesIO:
+        """Decode a data:image/...;base64 source into a stream."""
+        # BytesIO shares the decoded buffer until written to, so no second copy is
+        # made; partition avoids building a list just to take the payload
+        return io.BytesIO(base64.b64decode(self.image_source.partition(",")[2]))
 
     async def _load_image(self) -> PILImage.Image:
         """Load image from source (file path or base64)."""
         if self.image_source.startswith("data:image/"):
-            # Handle base64 data
-            header, encoded = self.image_source.split(",", 1)
-            image_data = base64.b64decode(encoded)
-            image_stream = io.BytesIO(image_data)
-            # Wrap blocking I/O in asyncio.to_thread
-            return await asyncio.to_thread(PILImage.open, image_stream)
-        elif Path(self.image_source).exists():
-            # Handle file path - wrap blocking I/O in asyncio.to_thread
+            # Handle base64 data - wrap blocking I/O in asyncio.to_thread
+            return await asyncio.to_thread(PILImage.open, self._decode_data_uri())
+
+        # Handle file path - wrap blocking I/O in asyncio.to_thread
+        try:
             return await asyncio.to_thread(PILImage.open, self.image_source)
-        else:
-            raise FileNotFoundError(f"Image not found: {self.image_source}")
+        except FileNotFoundError as e:
+            raise FileNotFoundError(f"Image not found: {self.image_source}") from e
 
     def _apply_filters(self, pil_image: PILImage.Image) -> PILImage.Image:
         """Apply PIL filters to image."""
@@ -347,8 +356,6 @@ class Image(Component):
 
         # Apply invert
         if self.invert:
-            from PIL import ImageOps
-
             pil_image = ImageOps.invert(pil_image)
 
         return pil_image
@@ -375,10 +382,6 @@ class Image(Component):
 
     def _apply_shadow(self, picture_shape):
         """Apply shadow effect to picture."""
-        shadow_format = picture_shape.shadow
-        shadow_format.inherit = False
-        shadow_format.visible = True
-        shadow_format.distance = Pt(4)
-        shadow_format.blur_radius = Pt(4)
-        shadow_format.transparency = 0.5
-        shadow_format.angle = 45
+        sp_pr = picture_shape._element.spPr
+        sp_pr._remove_effectLst()
+        sp_pr._insert_effectLst(deepcopy(_SHADOW_EFFECT))
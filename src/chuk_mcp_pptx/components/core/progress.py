@@ -7,13 +7,22 @@ KPI achievement, and task progress.
 """
 
 from typing import Optional, Dict, Any
-from pptx.util import Pt
+from pptx.util import Inches, Pt
+from pptx.enum.shapes import MSO_SHAPE
 from pptx.enum.text import PP_ALIGN
 from pptx.dml.color import RGBColor
 
 from ..base import Component
 from ...tokens.typography import get_text_style
 
+# Variant -> color token path for the filled portion
+_VARIANT_COLOR_PATHS = {
+    "default": "primary.DEFAULT",
+    "success": "success.DEFAULT",
+    "warning": "warning.DEFAULT",
+    "error": "destructive.DEFAULT",
+}
+
 
 class ProgressBar(Component):
     """
@@ -92,13 +101,7 @@ class ProgressBar(Component):
 
     def _get_progress_color(self) -> RGBColor:
         """Get color based on variant."""
-        color_map = {
-            "default": "primary.DEFAULT",
-            "success": "success.DEFAULT",
-            "warning": "warning.DEFAULT",
-            "error": "destructive.DEFAULT",
-        }
-        color_path = color_map.get(self.variant, "primary.DEFAULT")
+        color_path = _VARIANT_COLOR_PATHS.get(self.variant, "primary.DEFAULT")
         return self.get_color(color_path)
 
     def _get_background_color(self) -> RGBColor:
@@ -125,15 +128,8 @@ class ProgressBar(Component):
         Returns:
             List of rendered shapes
         """
-        # If placeholder provided, extract bounds and delete it
-        bounds = self._extract_placeholder_bounds(placeholder)
-        if bounds is not None:
-            left, top, width, height = bounds
-
-        # Delete placeholder after extracting bounds
-        self._delete_placeholder_if_needed(placeholder)
-
-        from pptx.util import Inches
+        # If placeholder provided, take over its bounds and delete it
+        left, top, width, _ = self._take_placeholder(placeholder, left, top, width, None)
 
         shapes = []
         current_top = top
@@ -189,9 +185,6 @@ class ProgressBar(Component):
 
     def _render_linear(self, slide, left: float, top: float, width: float):
         """Render linear progress bar."""
-        from pptx.util import Inches
-        from pptx.enum.shapes import MSO_SHAPE
-
         shapes = []
 
         # Background bar (unfilled)
@@ -226,9 +219,6 @@ class ProgressBar(Component):
 
     def _render_segmented(self, slide, left: float, top: float, width: float):
         """Render segmented progress bar."""
-        from pptx.util import Inches
-        from pptx.enum.shapes import MSO_SHAPE
-
         shapes = []
         gap = 0.05
         segment_width = (width - (gap * (self.segments - 1))) / self.segments
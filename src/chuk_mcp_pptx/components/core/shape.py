@@ -6,12 +6,11 @@ Provides basic geometric shapes with design system integration.
 """
 
 from typing import Optional, Dict, Any
-from pptx.util import Inches, Pt
 from pptx.enum.shapes import MSO_SHAPE
 from pptx.enum.text import PP_ALIGN, MSO_ANCHOR
 from pptx.dml.color import RGBColor
 
-from ..base import Component
+from ..base import Component, cached_inches, cached_pt, cached_rgb, set_solid_fill
 from ..registry import component, ComponentCategory, prop, example
 
 
@@ -45,6 +44,75 @@ SHAPE_TYPES = {
 }
 
 
+def add_styled_shape(
+    slide,
+    shape_type: str,
+    left: float,
+    top: float,
+    width: float,
+    height: float,
+    fill_hex: str,
+    line_hex: str,
+    line_width: float = 1.0,
+    text: Optional[str] = None,
+    text_rgb: Optional[RGBColor] = None,
+) -> Any:
+    """
+    Add an autoshape with already-resolved colors.
+
+    Fill and line colors are "RRGGBB" strings, written straight into the
+    shape XML, so a diagram can format its palette once and reuse it.
+
+    This is the drawing half of Shape.render. Diagram components that resolve
+    their palette once call it directly instead of building a Shape (and
+    re-resolving theme colors) per item.
+
+    Args:
+        slide: PowerPoint slide object
+        shape_type: Type of shape (see SHAPE_TYPES)
+        left, top, width, height: Position and size in inches
+        fill_hex: Fill color as "RRGGBB"
+        line_hex: Border color as "RRGGBB"
+        line_width: Border width in points
+        text: Optional text content
+        text_rgb: Text color (required when text is given)
+
+    Returns:
+        Shape object
+    """
+    mso_shape = SHAPE_TYPES.get(shape_type.lower(), MSO_SHAPE.RECTANGLE)
+    shape = slide.shapes.add_shape(
+        mso_shape,
+        cached_inches(left),
+        cached_inches(top),
+        cached_inches(width),
+        cached_inches(height),
+    )
+
+    sp_pr = shape._element.spPr
+    set_solid_fill(sp_pr, fill_hex)
+    ln = sp_pr.get_or_add_ln()
+    set_solid_fill(ln, line_hex)
+    ln.set("w", str(cached_pt(line_width)))
+
+    if text and shape.has_text_frame:
+        text_frame = shape.text_frame
+        text_frame.text = text
+        text_frame.word_wrap = True
+        text_frame.margin_left = cached_inches(0.1)
+        text_frame.margin_right = cached_inches(0.1)
+        text_frame.margin_top = cached_inches(0.05)
+        text_frame.margin_bottom = cached_inches(0.05)
+
+        # Center text
+        paragraph = text_frame.paragraphs[0]
+        paragraph.alignment = PP_ALIGN.CENTER
+        text_frame.vertical_anchor = MSO_ANCHOR.MIDDLE
+        paragraph.font.color.rgb = text_rgb
+
+    return shape
+
+
 @component(
     name="Shape",
     category=ComponentCategory.UI,
@@ -166,73 +234,40 @@ class Shape(Component):
         Returns:
             Shape object
         """
-        # If placeholder provided, extract bounds and delete it
-        bounds = self._extract_placeholder_bounds(placeholder)
-        if bounds is not None:
-            left, top, width, height = bounds
+        # If placeholder provided, take over its bounds and delete it
+        left, top, width, height = self._take_placeholder(placeholder, left, top, width, height)
 
-        # Delete placeholder after extracting bounds
-        self._delete_placeholder_if_needed(placeholder)
-
-        # Get MSO shape type
-        mso_shape = SHAPE_TYPES.get(self.shape_type.lower(), MSO_SHAPE.RECTANGLE)
-
-        # Create shape
-        shape = slide.shapes.add_shape(
-            mso_shape, Inches(left), Inches(top), Inches(width), Inches(height)
+        # Resolve colors (hex or semantic path), falling back to theme defaults
+        fill_rgb = (
+            self._parse_color(self.fill_color)
+            if self.fill_color
+            else self.get_color("accent.DEFAULT")
         )
+        line_rgb = (
+            self._parse_color(self.line_color)
+            if self.line_color
+            else self.get_color("border.DEFAULT")
+        )
+        text_rgb = self.get_color("foreground.DEFAULT") if self.text else None
 
-        # Apply fill color
-        if self.fill_color:
-            color_rgb = self._parse_color(self.fill_color)
-            shape.fill.solid()
-            shape.fill.fore_color.rgb = color_rgb
-        else:
-            # Use theme default
-            shape.fill.solid()
-            shape.fill.fore_color.rgb = self.get_color("accent.DEFAULT")
-
-        # Apply line color and width
-        if self.line_color:
-            color_rgb = self._parse_color(self.line_color)
-            shape.line.color.rgb = color_rgb
-        else:
-            shape.line.color.rgb = self.get_color("border.DEFAULT")
-
-        shape.line.width = Pt(self.line_width)
-
-        # Add text if provided
-        if self.text and shape.has_text_frame:
-            self._add_text(shape)
-
-        return shape
+        return add_styled_shape(
+            slide,
+            self.shape_type,
+            left,
+            top,
+            width,
+            height,
+            fill_hex=str(fill_rgb),
+            line_hex=str(line_rgb),
+            line_width=self.line_width,
+            text=self.text,
+            text_rgb=text_rgb,
+        )
 
     def _parse_color(self, color_str: str) -> RGBColor:
         """Parse color string (hex or semantic path)."""
         if color_str.startswith("#"):
-            # Parse hex color
-            color_str = color_str[1:]
-            return RGBColor(
-                int(color_str[0:2], 16), int(color_str[2:4], 16), int(color_str[4:6], 16)
-            )
+            return cached_rgb(color_str)
         else:
             # Use semantic color from theme
             return self.get_color(color_str)
-
-    def _add_text(self, shape):
-        """Add text content to shape."""
-        text_frame = shape.text_frame
-        text_frame.text = self.text
-        text_frame.word_wrap = True
-        text_frame.margin_left = Inches(0.1)
-        text_frame.margin_right = Inches(0.1)
-        text_frame.margin_top = Inches(0.05)
-        text_frame.margin_bottom = Inches(0.05)
-
-        # Center text
-        paragraph = text_frame.paragraphs[0]
-        paragraph.alignment = PP_ALIGN.CENTER
-        text_frame.vertical_anchor = MSO_ANCHOR.MIDDLE
-
-        # Set text color from theme
-        paragraph.font.color.rgb = self.get_color("foreground.DEFAULT")
@@ -5,13 +5,91 @@ SmartArt-style diagram components for PowerPoint presentations.
 Provides professional diagrams like process flows, cycles, hierarchies, etc.
 """
 
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Tuple
 import math
 
-from ..base import Component
+from ..base import Component, cached_rgb
 from ..registry import component, ComponentCategory, prop, example
-from .shape import Shape
-from .connector import Connector
+from .shape import add_styled_shape
+from .connector import add_styled_connector
+
+_ALTERNATING_COLORS = ("primary.DEFAULT", "secondary.DEFAULT", "accent.DEFAULT")
+# Node fills plus the shared border, text and connector colors
+_PALETTE_PATHS = (
+    *_ALTERNATING_COLORS,
+    "border.DEFAULT",
+    "foreground.DEFAULT",
+    "muted.foreground",
+)
+
+# Hierarchy geometry (inches)
+_ROOT_WIDTH = 3.0
+_NODE_HEIGHT = 0.8
+_CHILD_MAX_WIDTH = 1.8
+_CHILD_GAP = 0.3
+_LEVEL_OFFSET = 2.0  # root top -> child top
+
+
+def _row_positions(start: float, count: int, item_width: float, gap: float) -> List[float]:
+    """Left edges of `count` items laid out in a row from `start`."""
+    pitch = item_width + gap
+    return [start + idx * pitch for idx in range(count)]
+
+
+def _cycle_layout(
+    num_items: int,
+    center_x: float,
+    center_y: float,
+    radius: float,
+    shape_width: float,
+    shape_height: float,
+) -> Tuple[List[Tuple[float, float]], List[Optional[Tuple[float, float, float, float]]]]:
+    """
+    Compute CycleDiagram geometry.
+
+    Nodes sit on a circle starting at 12 o'clock. Each connector runs from the
+    edge of one node to the edge of the next.
+
+    Returns:
+        (nodes, edges): top-left (x, y) per node, and (start_x, start_y, end_x,
+        end_y) per node for the connector to its successor, or None when the two
+        coincide (a single-item cycle).
+    """
+    # Node centres, computed once so each connector reuses its neighbour's.
+    # Rotate a unit vector by the fixed step rather than calling cos/sin per node.
+    step = 2 * math.pi / num_items
+    cos_step = math.cos(step)
+    sin_step = math.sin(step)
+    ux, uy = 0.0, -1.0  # 12 o'clock
+    centers = []
+    for _ in range(num_items):
+        centers.append((center_x + radius * ux, center_y + radius * uy))
+        ux, uy = ux * cos_step - uy * sin_step, ux * sin_step + uy * cos_step
+    half_w = shape_width * 0.5
+    half_h = shape_height * 0.5
+
+    nodes = [(cx - half_w, cy - half_h) for cx, cy in centers]
+    edges: List[Optional[Tuple[float, float, float, float]]] = []
+    for idx, (curr_cx, curr_cy) in enumerate(centers):
+        next_cx, next_cy = centers[(idx + 1) % num_items]
+        dx = next_cx - curr_cx
+        dy = next_cy - curr_cy
+        dist = math.hypot(dx, dy)
+        if dist > 0:
+            dx /= dist
+            dy /= dist
+            edges.append(
+                (
+                    curr_cx + dx * half_w,
+                    curr_cy + dy * half_h,
+                    next_cx - dx * half_w,
+                    next_cy - dy * half_h,
+                )
+            )
+        else:
+            edges.append(None)
+
+    return nodes, edges
 
 
 class SmartArtBase(Component):
@@ -30,11 +108,45 @@ class SmartArtBase(Component):
 
     def _get_color(self, index: int, color_type: str = "primary") -> str:
         """Get alternating colors for items."""
-        colors = ["primary.DEFAULT", "secondary.DEFAULT", "accent.DEFAULT"]
         if color_type == "alternating":
-            return colors[index % len(colors)]
+            return _ALTERNATING_COLORS[index % len(_ALTERNATING_COLORS)]
         return f"{color_type}.DEFAULT"
 
+    def _palette(self) -> Dict[str, str]:
+        """Resolve every color a diagram draws with to "RRGGBB", once per render."""
+        return {path: str(self.get_color(path)) for path in _PALETTE_PATHS}
+
+    def _add_node(
+        self,
+        slide,
+        palette: Dict[str, str],
+        shape_type: str,
+        text: str,
+        fill_color: str,
+        left: float,
+        top: float,
+        width: float,
+        height: float,
+    ) -> Any:
+        """
+        Add one diagram node.
+
+        Draws the shape directly with the diagram's resolved palette rather than
+        building a Shape component (and resolving the same colors) per item.
+        """
+        return add_styled_shape(
+            slide,
+            shape_type,
+            left,
+            top,
+            width,
+            height,
+            fill_hex=palette[fill_color],
+            line_hex=palette["border.DEFAULT"],
+            text=text,
+            text_rgb=cached_rgb(palette["foreground.DEFAULT"]),
+        )
+
 
 @component(
     name="ProcessFlow",
@@ -80,13 +192,8 @@ class ProcessFlow(SmartArtBase):
         placeholder: Optional[Any] = None,
     ) -> List[Any]:
         """Render process flow diagram."""
-        # If placeholder provided, extract bounds and delete it
-        bounds = self._extract_placeholder_bounds(placeholder)
-        if bounds is not None:
-            left, top, width, height = bounds
-
-        # Delete placeholder after extracting bounds
-        self._delete_placeholder_if_needed(placeholder)
+        # If placeholder provided, take over its bounds and delete it
+        left, top, width, height = self._take_placeholder(placeholder, left, top, width, height)
 
         shapes = []
         num_items = len(self.items)
@@ -94,6 +201,8 @@ class ProcessFlow(SmartArtBase):
         if num_items == 0:
             return shapes
 
+        palette = self._palette()
+
         # Calculate spacing
         min_spacing = 0.2
         total_spacing = min_spacing * (num_items - 1)
@@ -107,17 +216,16 @@ class ProcessFlow(SmartArtBase):
         else:
             start_offset = 0
 
-        for idx, item in enumerate(self.items):
-            x = left + start_offset + idx * (item_width + min_spacing)
+        xs = _row_positions(left + start_offset, num_items, item_width, min_spacing)
 
+        for idx, (x, item) in enumerate(zip(xs, self.items)):
             # Create chevron shape (or rectangle for last item)
             shape_type = "chevron" if idx < num_items - 1 else "rounded_rectangle"
             fill_color = self._get_color(idx, "alternating")
 
-            shape_comp = Shape(
-                shape_type=shape_type, text=item, fill_color=fill_color, theme=self.theme
+            shape = self._add_node(
+                slide, palette, shape_type, item, fill_color, x, top, item_width, height * 0.8
             )
-            shape = shape_comp.render(slide, x, top, item_width, height * 0.8)
             shapes.append(shape)
 
         return shapes
@@ -167,13 +275,8 @@ class CycleDiagram(SmartArtBase):
         placeholder: Optional[Any] = None,
     ) -> List[Any]:
         """Render cycle diagram."""
-        # If placeholder provided, extract bounds and delete it
-        bounds = self._extract_placeholder_bounds(placeholder)
-        if bounds is not None:
-            left, top, width, height = bounds
-
-        # Delete placeholder after extracting bounds
-        self._delete_placeholder_if_needed(placeholder)
+        # If placeholder provided, take over its bounds and delete it
+        left, top, width, height = self._take_placeholder(placeholder, left, top, width, height)
 
         shapes = []
         num_items = len(self.items)
@@ -181,6 +284,8 @@ class CycleDiagram(SmartArtBase):
         if num_items == 0:
             return shapes
 
+        palette = self._palette()
+
         center_x = left + width / 2
         center_y = top + height / 2
 
@@ -198,55 +303,40 @@ class CycleDiagram(SmartArtBase):
             shape_width = 0.9
             shape_height = 0.6
 
-        for idx, item in enumerate(self.items):
-            angle = 2 * math.pi * idx / num_items - math.pi / 2
-            x = center_x + radius * math.cos(angle) - shape_width / 2
-            y = center_y + radius * math.sin(angle) - shape_height / 2
+        nodes, edges = _cycle_layout(
+            num_items, center_x, center_y, radius, shape_width, shape_height
+        )
 
+        for idx, item in enumerate(self.items):
+            x, y = nodes[idx]
             fill_color = self._get_color(idx, "alternating")
 
-            shape_comp = Shape(
-                shape_type="rounded_rectangle", text=item, fill_color=fill_color, theme=self.theme
+            shape = self._add_node(
+                slide,
+                palette,
+                "rounded_rectangle",
+                item,
+                fill_color,
+                x,
+                y,
+                shape_width,
+                shape_height,
             )
-            shape = shape_comp.render(slide, x, y, shape_width, shape_height)
             shapes.append(shape)
 
             # Add curved connector to next item
-            next_idx = (idx + 1) % num_items
-            next_angle = 2 * math.pi * next_idx / num_items - math.pi / 2
-            next_x = center_x + radius * math.cos(next_angle) - shape_width / 2
-            next_y = center_y + radius * math.sin(next_angle) - shape_height / 2
-
-            # Calculate edge points for connector
-            curr_cx = x + shape_width / 2
-            curr_cy = y + shape_height / 2
-            next_cx = next_x + shape_width / 2
-            next_cy = next_y + shape_height / 2
-
-            dx = next_cx - curr_cx
-            dy = next_cy - curr_cy
-            dist = math.sqrt(dx * dx + dy * dy)
-
-            if dist > 0:
-                dx /= dist
-                dy /= dist
-
-                start_x = curr_cx + dx * shape_width * 0.5
-                start_y = curr_cy + dy * shape_height * 0.5
-                end_x = next_cx - dx * shape_width * 0.5
-                end_y = next_cy - dy * shape_height * 0.5
-
-                connector_comp = Connector(
-                    start_x=start_x,
-                    start_y=start_y,
-                    end_x=end_x,
-                    end_y=end_y,
+            edge = edges[idx]
+            if edge is not None:
+                start_x, start_y, end_x, end_y = edge
+                connector = add_styled_connector(
+                    slide,
+                    start_x,
+                    start_y,
+                    end_x,
+                    end_y,
+                    line_hex=palette["muted.foreground"],
                     connector_type="curved",
-                    line_color="muted.foreground",
-                    arrow_end=True,
-                    theme=self.theme,
                 )
-                connector = connector_comp.render(slide)
                 shapes.append(connector)
 
         return shapes
@@ -296,66 +386,68 @@ class HierarchyDiagram(SmartArtBase):
         placeholder: Optional[Any] = None,
     ) -> List[Any]:
         """Render hierarchy diagram."""
-        # If placeholder provided, extract bounds and delete it
-        bounds = self._extract_placeholder_bounds(placeholder)
-        if bounds is not None:
-            left, top, width, height = bounds
-
-        # Delete placeholder after extracting bounds
-        self._delete_placeholder_if_needed(placeholder)
+        # If placeholder provided, take over its bounds and delete it
+        left, top, width, height = self._take_placeholder(placeholder, left, top, width, height)
 
         shapes = []
 
         if len(self.items) == 0:
             return shapes
 
+        palette = self._palette()
+
         # Top level (root)
-        top_x = left + width / 2 - 1.5
+        top_x = left + (width - _ROOT_WIDTH) / 2
         top_y = top
 
-        root_shape_comp = Shape(
-            shape_type="rounded_rectangle",
-            text=self.items[0],
-            fill_color="primary.DEFAULT",
-            theme=self.theme,
+        root_shape = self._add_node(
+            slide,
+            palette,
+            "rounded_rectangle",
+            self.items[0],
+            "primary.DEFAULT",
+            top_x,
+            top_y,
+            _ROOT_WIDTH,
+            _NODE_HEIGHT,
         )
-        root_shape = root_shape_comp.render(slide, top_x, top_y, 3.0, 0.8)
         shapes.append(root_shape)
 
         # Second level items
         if len(self.items) > 1:
             remaining = self.items[1:]
             num_items = len(remaining)
-            item_width = min(1.8, (width - 0.3 * (num_items - 1)) / num_items)
+            item_width = min(_CHILD_MAX_WIDTH, (width - _CHILD_GAP * (num_items - 1)) / num_items)
 
-            total_width = num_items * item_width + (num_items - 1) * 0.3
+            total_width = num_items * item_width + (num_items - 1) * _CHILD_GAP
             start_x = left + (width - total_width) / 2
 
-            for idx, item in enumerate(remaining):
-                x = start_x + idx * (item_width + 0.3)
-                y = top + 2.0
-
-                child_shape_comp = Shape(
-                    shape_type="rectangle",
-                    text=item,
-                    fill_color="secondary.DEFAULT",
-                    theme=self.theme,
+            xs = _row_positions(start_x, num_items, item_width, _CHILD_GAP)
+            y = top + _LEVEL_OFFSET
+
+            for x, item in zip(xs, remaining):
+                child_shape = self._add_node(
+                    slide,
+                    palette,
+                    "rectangle",
+                    item,
+                    "secondary.DEFAULT",
+                    x,
+                    y,
+                    item_width,
+                    _NODE_HEIGHT,
                 )
-                child_shape = child_shape_comp.render(slide, x, y, item_width, 0.8)
                 shapes.append(child_shape)
 
                 # Add connector from root to child
-                connector_comp = Connector(
-                    start_x=top_x + 1.5,  # Center of root
-                    start_y=top_y + 0.8,  # Bottom of root
-                    end_x=x + item_width / 2,  # Center of child
-                    end_y=y,  # Top of child
-                    connector_type="straight",
-                    line_color="border.DEFAULT",
-                    arrow_end=True,
-                    theme=self.theme,
+                connector = add_styled_connector(
+                    slide,
+                    top_x + _ROOT_WIDTH / 2,  # Center of root
+                    top_y + _NODE_HEIGHT,  # Bottom of root
+                    x + item_width / 2,  # Center of child
+                    y,  # Top of child
+                    line_hex=palette["border.DEFAULT"],
                 )
-                connector = connector_comp.render(slide)
                 shapes.append(connector)
 
         return shapes
@@ -9,6 +9,16 @@ from ..base import Component
 from ...tokens.spacing import SPACING
 from ..registry import component, ComponentCategory, prop
 
+# Spacer size name -> inches
+_SIZES = {
+    "xs": SPACING["4"],
+    "sm": SPACING["6"],
+    "md": SPACING["8"],
+    "lg": SPACING["12"],
+    "xl": SPACING["16"],
+    "2xl": SPACING["24"],
+}
+
 
 @component(
     name="Spacer",
@@ -54,25 +64,12 @@ class Spacer(Component):
 
     def get_size(self) -> float:
         """Get the spacer size in inches."""
-        size_map = {
-            "xs": SPACING["4"],
-            "sm": SPACING["6"],
-            "md": SPACING["8"],
-            "lg": SPACING["12"],
-            "xl": SPACING["16"],
-            "2xl": SPACING["24"],
-        }
-        return size_map.get(self.size, SPACING["8"])
+        return _SIZES.get(self.size, SPACING["8"])
 
     def render(self, slide, left: float = 0, top: float = 0, placeholder: Optional[Any] = None):
         """Spacer doesn't render anything, just returns size."""
-        # If placeholder provided, extract bounds and delete it
-        bounds = self._extract_placeholder_bounds(placeholder)
-        if bounds is not None:
-            left, top, width, height = bounds
-
-        # Delete placeholder after extracting bounds
-        self._delete_placeholder_if_needed(placeholder)
+        # If placeholder provided, take over its bounds and delete it
+        left, top, _, _ = self._take_placeholder(placeholder, left, top, None, None)
 
         size = self.get_size()
         if self.direction == "vertical":
@@ -7,6 +7,7 @@ from typing import Optional, Any, List
 from pptx.util import Inches, Pt
 from pptx.enum.text import PP_ALIGN
 
+from ..base import set_solid_fill
 from ..composition import ComposableComponent
 from ..variants import create_variants
 from ..registry import component, ComponentCategory, prop, example
@@ -296,44 +297,68 @@ class Table(ComposableComponent):
         props = self.variant_props
         font_family = self._get_font_family()
 
+        # Every header cell gets the same styling; resolve it once
+        center = PP_ALIGN.CENTER
+        font_size = Pt(props.get("header_font_size", 13))
+        bold = props.get("header_bold", True)
+        fg_rgb = self.get_color(props.get("header_fg", "card.foreground"))
+        header_bg = props.get("header_bg", "card.DEFAULT")
+        bg_hex = str(self.get_color(header_bg)) if header_bg != "transparent" else None
+        padding = props.get("padding", 0.08)
+        margin_x = Inches(padding)
+        margin_y = Inches(padding / 2)
+
         for col_idx, header_text in enumerate(self.headers):
             cell = table.cell(0, col_idx)
             cell.text = str(header_text)
 
             # Text formatting
             paragraph = cell.text_frame.paragraphs[0]
-            paragraph.alignment = PP_ALIGN.CENTER
+            paragraph.alignment = center
             paragraph.font.name = font_family
-            paragraph.font.size = Pt(props.get("header_font_size", 13))
+            paragraph.font.size = font_size
 
-            if props.get("header_bold", True):
+            if bold:
                 paragraph.font.bold = True
 
             # Text color
-            header_fg = props.get("header_fg", "card.foreground")
-            paragraph.font.color.rgb = self.get_color(header_fg)
+            paragraph.font.color.rgb = fg_rgb
 
             # Cell background
-            header_bg = props.get("header_bg", "card.DEFAULT")
-            if header_bg != "transparent":
-                cell.fill.solid()
-                cell.fill.fore_color.rgb = self.get_color(header_bg)
+            if bg_hex is not None:
+                set_solid_fill(cell._tc.get_or_add_tcPr(), bg_hex)
 
             # Cell margins
-            padding = props.get("padding", 0.08)
-            cell.text_frame.margin_left = Inches(padding)
-            cell.text_frame.margin_right = Inches(padding)
-            cell.text_frame.margin_top = Inches(padding / 2)
-            cell.text_frame.margin_bottom = Inches(padding / 2)
+            text_frame = cell.text_frame
+            text_frame.margin_left = margin_x
+            text_frame.margin_right = margin_x
+            text_frame.margin_top = margin_y
+            text_frame.margin_bottom = margin_y
 
     def _apply_data_styles(self, table):
         """Apply styling to data cells."""
         props = self.variant_props
         font_family = self._get_font_family()
 
+        # Styling only varies by row parity and first column; resolve it once
+        # rather than per cell, which adds up on large tables
+        left, center = PP_ALIGN.LEFT, PP_ALIGN.CENTER
+        font_size = Pt(props.get("font_size", 12))
+        fg_rgb = self.get_color(props.get("cell_fg", "foreground.DEFAULT"))
+        striped = self.variant == "striped"
+        alt_hex = str(self.get_color(props.get("alt_bg", "muted.DEFAULT"))) if striped else None
+        cell_bg = props.get("cell_bg", "background.DEFAULT")
+        bg_hex = str(self.get_color(cell_bg)) if cell_bg != "transparent" else None
+        padding = props.get("padding", 0.08)
+        margin_x = Inches(padding)
+        margin_y = Inches(padding / 2)
+
         for row_idx, row_data in enumerate(self.data):
             actual_row_idx = row_idx + 1  # Skip header row
 
+            # Cell background (with alternating rows for striped variant)
+            row_hex = alt_hex if striped and actual_row_idx % 2 == 0 else bg_hex
+
             for col_idx, value in enumerate(row_data):
                 cell = table.cell(actual_row_idx, col_idx)
                 cell.text = str(value)
@@ -341,34 +366,20 @@ class Table(ComposableComponent):
                 # Text formatting
                 paragraph = cell.text_frame.paragraphs[0]
                 paragraph.font.name = font_family
-                paragraph.font.size = Pt(props.get("font_size", 12))
+                paragraph.font.size = font_size
 
                 # Text color
-                cell_fg = props.get("cell_fg", "foreground.DEFAULT")
-                paragraph.font.color.rgb = self.get_color(cell_fg)
-
-                # Cell background (with alternating rows for striped variant)
-                if self.variant == "striped" and actual_row_idx % 2 == 0:
-                    # Alternate row
-                    alt_bg = props.get("alt_bg", "muted.DEFAULT")
-                    cell.fill.solid()
-                    cell.fill.fore_color.rgb = self.get_color(alt_bg)
-                else:
-                    # Normal row
-                    cell_bg = props.get("cell_bg", "background.DEFAULT")
-                    if cell_bg != "transparent":
-                        cell.fill.solid()
-                        cell.fill.fore_color.rgb = self.get_color(cell_bg)
+                paragraph.font.color.rgb = fg_rgb
+
+                if row_hex is not None:
+                    set_solid_fill(cell._tc.get_or_add_tcPr(), row_hex)
 
                 # Cell margins
-                padding = props.get("padding", 0.08)
-                cell.text_frame.margin_left = Inches(padding)
-                cell.text_frame.margin_right = Inches(padding)
-                cell.text_frame.margin_top = Inches(padding / 2)
-                cell.text_frame.margin_bottom = Inches(padding / 2)
+                text_frame = cell.text_frame
+                text_frame.margin_left = margin_x
+                text_frame.margin_right = margin_x
+                text_frame.margin_top = margin_y
+                text_frame.margin_bottom = margin_y
 
                 # Text alignment - left for first column, center for others
-                if col_idx == 0:
-                    paragraph.alignment = PP_ALIGN.LEFT
-                else:
-                    paragraph.alignment = PP_ALIGN.CENTER
+                paragraph.alignment = left if col_idx == 0 else center
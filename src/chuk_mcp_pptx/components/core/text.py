@@ -5,15 +5,23 @@ Text components for PowerPoint presentations.
 Provides text box and bullet list components with formatting.
 """
 
+from copy import deepcopy
 from typing import Optional, Dict, Any, List
-from pptx.util import Inches, Pt
 from pptx.enum.text import PP_ALIGN, MSO_AUTO_SIZE
 from pptx.dml.color import RGBColor
 
-from ..base import Component
+from ..base import Component, cached_inches, cached_pt, cached_rgb
 from ..registry import component, ComponentCategory, prop, example
 
 
+ALIGNMENT_MAP = {
+    "left": PP_ALIGN.LEFT,
+    "center": PP_ALIGN.CENTER,
+    "right": PP_ALIGN.RIGHT,
+    "justify": PP_ALIGN.JUSTIFY,
+}
+
+
 @component(
     name="TextBox",
     category=ComponentCategory.UI,
@@ -159,7 +167,7 @@ class TextBox(Component):
             # Delete placeholder if it exists but doesn't have text_frame
             self._delete_placeholder_if_needed(placeholder)
             text_box = slide.shapes.add_textbox(
-                Inches(left), Inches(top), Inches(width), Inches(height)
+                cached_inches(left), cached_inches(top), cached_inches(width), cached_inches(height)
             )
 
         text_frame = text_box.text_frame
@@ -169,45 +177,40 @@ class TextBox(Component):
         # Get font family from theme if not explicitly set
         font_family = self._get_font_family() if self.font_name == "Calibri" else self.font_name
 
+        alignment = ALIGNMENT_MAP.get(self.alignment.lower(), PP_ALIGN.LEFT)
+        font_size = cached_pt(self.font_size)
+
+        # Resolve the color once; every paragraph shares it
+        rgb = None
+        if self.color:
+            rgb = self._parse_color(self.color)
+        elif self.theme:
+            # Default to theme foreground color if no color specified
+            try:
+                rgb = self.theme.get_color("foreground.DEFAULT")
+            except (AttributeError, KeyError, TypeError, ValueError):
+                pass
+
         # Format text
         for paragraph in text_frame.paragraphs:
-            # Set alignment
-            alignment_map = {
-                "left": PP_ALIGN.LEFT,
-                "center": PP_ALIGN.CENTER,
-                "right": PP_ALIGN.RIGHT,
-                "justify": PP_ALIGN.JUSTIFY,
-            }
-            paragraph.alignment = alignment_map.get(self.alignment.lower(), PP_ALIGN.LEFT)
+            paragraph.alignment = alignment
 
             # Format font
             font = paragraph.font
             font.name = font_family
-            font.size = Pt(self.font_size)
+            font.size = font_size
             font.bold = self.bold
             font.italic = self.italic
-
-            # Apply color
-            if self.color:
-                rgb = self._parse_color(self.color)
-                if rgb:
-                    font.color.rgb = rgb
-            elif self.theme:
-                # Default to theme foreground color if no color specified
-                try:
-                    rgb = self.theme.get_color("foreground.DEFAULT")
-                    if rgb:
-                        font.color.rgb = rgb
-                except (AttributeError, KeyError, TypeError, ValueError):
-                    pass
+            if rgb:
+                font.color.rgb = rgb
 
         # Apply auto-fit if requested
         if self.auto_fit:
             text_frame.auto_size = MSO_AUTO_SIZE.TEXT_TO_FIT_SHAPE
-            text_frame.margin_left = Inches(0.1)
-            text_frame.margin_right = Inches(0.1)
-            text_frame.margin_top = Inches(0.05)
-            text_frame.margin_bottom = Inches(0.05)
+            text_frame.margin_left = cached_inches(0.1)
+            text_frame.margin_right = cached_inches(0.1)
+            text_frame.margin_top = cached_inches(0.05)
+            text_frame.margin_bottom = cached_inches(0.05)
 
         return text_box
 
@@ -215,11 +218,7 @@ class TextBox(Component):
         """Parse color string (semantic or hex) to RGBColor."""
         # Handle hex colors
         if color_str.startswith("#"):
-            hex_color = color_str.lstrip("#")
-            r = int(hex_color[0:2], 16)
-            g = int(hex_color[2:4], 16)
-            b = int(hex_color[4:6], 16)
-            return RGBColor(r, g, b)
+            return cached_rgb(color_str)
 
         # Handle semantic colors
         if self.theme and "." in color_str:
@@ -360,39 +359,45 @@ class BulletList(Component):
             # Delete placeholder if it exists but doesn't have text_frame
             self._delete_placeholder_if_needed(placeholder)
             text_box = slide.shapes.add_textbox(
-                Inches(left), Inches(top), Inches(width), Inches(height)
+                cached_inches(left), cached_inches(top), cached_inches(width), cached_inches(height)
             )
 
         text_frame = text_box.text_frame
         text_frame.word_wrap = True
 
-        font_family = self._get_font_family()
-
-        # Add items
-        for idx, item in enumerate(self.items):
-            if idx == 0:
-                p = text_frame.paragraphs[0]
-            else:
-                p = text_frame.add_paragraph()
-
-            p.text = f"{self.bullet_char} {item}"
-            p.font.name = font_family
-            p.font.size = Pt(self.font_size)
-            p.space_after = Pt(self.spacing)
-
-            # Apply color
-            if self.color:
-                rgb = self._parse_color(self.color)
-                if rgb:
-                    p.font.color.rgb = rgb
-            elif self.theme:
-                # Default to theme foreground color if no color specified
-                try:
-                    rgb = self.theme.get_color("foreground.DEFAULT")
-                    if rgb:
-                        p.font.color.rgb = rgb
-                except (AttributeError, KeyError, TypeError, ValueError):
-                    pass
+        if not self.items:
+            return text_box
+
+        # Every item shares one style, so resolve the color once
+        rgb = None
+        if self.color:
+            rgb = self._parse_color(self.color)
+        elif self.theme:
+            # Default to theme foreground color if no color specified
+            try:
+                rgb = self.theme.get_color("foreground.DEFAULT")
+            except (AttributeError, KeyError, TypeError, ValueError):
+                pass
+
+        # Style the first paragraph, then clone its properties for the rest
+        # rather than re-assigning font attributes item by item
+        prefix = self.bullet_char + " "
+        p = text_frame.paragraphs[0]
+        p.text = prefix + str(self.items[0])
+        p.font.name = self._get_font_family()
+        p.font.size = cached_pt(self.font_size)
+        p.space_after = cached_pt(self.spacing)
+        if rgb:
+            p.font.color.rgb = rgb
+
+        styled_p = deepcopy(p._p)
+        for run in styled_p.content_children:
+            styled_p.remove(run)
+        tx_body = text_frame._txBody
+        for item in self.items[1:]:
+            new_p = deepcopy(styled_p)
+            new_p.append_text(prefix + str(item))
+            tx_body.append(new_p)
 
         return text_box
 
@@ -400,11 +405,7 @@ class BulletList(Component):
         """Parse color string (semantic or hex) to RGBColor."""
         # Handle hex colors
         if color_str.startswith("#"):
-            hex_color = color_str.lstrip("#")
-            r = int(hex_color[0:2], 16)
-            g = int(hex_color[2:4], 16)
-            b = int(hex_color[4:6], 16)
-            return RGBColor(r, g, b)
+            return cached_rgb(color_str)
 
         # Handle semantic colors
         if self.theme and "." in color_str:
@@ -174,13 +174,8 @@ class Tile(Component):
         Returns:
             Shape object representing the tile
         """
-        # If placeholder provided, extract bounds and delete it
-        bounds = self._extract_placeholder_bounds(placeholder)
-        if bounds is not None:
-            left, top, width, height = bounds
-
-        # Delete placeholder after extracting bounds
-        self._delete_placeholder_if_needed(placeholder)
+        # If placeholder provided, take over its bounds and delete it
+        left, top, width, height = self._take_placeholder(placeholder, left, top, width, height)
 
         # Get dimensions from size if not provided
         default_width, default_height = self.SIZE_MAP.get(self.size, (2.0, 2.0))
@@ -5,7 +5,7 @@ Provides discovery, documentation, and validation for PowerPoint components.
 
 from __future__ import annotations
 
-from typing import Any, Type, List, Dict
+from typing import Any, Type, List, Dict, Iterable
 from enum import Enum
 import json
 import inspect
@@ -69,6 +69,9 @@ class ComponentRegistry:
         self._components: dict[str, ComponentMetadata] = {}
         self._categories: dict[ComponentCategory, list[str]] = defaultdict(list)
         self._tags: dict[str, list[str]] = defaultdict(list)
+        # Listing entries built once at registration; discovery tools list
+        # components far more often than components are registered
+        self._summaries: dict[str, dict[str, Any]] = {}
 
     def register(
         self,
@@ -116,6 +119,12 @@ class ComponentRegistry:
 
         self._components[name] = metadata
         self._categories[category].append(name)
+        self._summaries[name] = {
+            "name": name,
+            "category": metadata.category.value,
+            "description": description,
+            "tags": metadata.tags,
+        }
 
         for tag in tags or []:
             self._tags[tag].append(name)
@@ -134,6 +143,19 @@ class ComponentRegistry:
         """List components in a category."""
         return self._categories.get(category, [])
 
+    def summaries(self, names: Iterable[str]) -> list[dict[str, Any]]:
+        """
+        Get the listing entry (name, category, description, tags) for each component.
+
+        Args:
+            names: Component names; unknown names are skipped
+
+        Returns:
+            List of summary dicts in the order given
+        """
+        summaries = self._summaries
+        return [dict(summaries[name]) for name in names if name in summaries]
+
     def search(self, query: str) -> list[ComponentMetadata]:
         """
         Search components by name, description, or tags.
@@ -12,7 +12,7 @@ from dataclasses import dataclass, field
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(slots=True)
 class ComponentInstance:
     """
     Instance of a component on a slide.
@@ -101,11 +101,7 @@ class ComponentTracker:
         Returns:
             ComponentInstance
         """
-        if presentation not in self._instances:
-            self._instances[presentation] = {}
-
-        if slide_index not in self._instances[presentation]:
-            self._instances[presentation][slide_index] = {}
+        slide_instances = self._instances.setdefault(presentation, {}).setdefault(slide_index, {})
 
         comp_instance = ComponentInstance(
             component_id=component_id,
@@ -124,7 +120,7 @@ class ComponentTracker:
             instance=instance,
         )
 
-        self._instances[presentation][slide_index][component_id] = comp_instance
+        slide_instances[component_id] = comp_instance
 
         # Update parent's children list
         if parent_id:
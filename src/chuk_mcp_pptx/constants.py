@@ -9,7 +9,7 @@ from enum import IntEnum
 from typing import Literal
 
 from .tokens.spacing import LINE_WIDTHS, SHADOWS
-from .tokens.colors import PALETTE, UTILITY_COLORS
+from .tokens.colors import PALETTE, UTILITY_COLORS, hex_to_rgb
 
 
 # Slide Layout Indices (python-pptx defaults)
@@ -384,24 +384,15 @@ class Spacing:
 # Color Constants (RGB tuples)
 # NOTE: These now reference the design token system
 # For new code, import directly from tokens.colors instead
-
-
-def _hex_to_rgb(hex_str: str) -> tuple[int, int, int]:
-    """Convert hex color to RGB tuple."""
-    hex_str = hex_str.lstrip("#")
-    rgb = tuple(int(hex_str[i : i + 2], 16) for i in (0, 2, 4))
-    return rgb  # type: ignore[return-value]
-
-
 class Colors:
     """Common color constants - using design tokens."""
 
-    PRIMARY_BLUE = _hex_to_rgb(PALETTE["blue"][600])  # type: ignore[index]
-    ACCENT_ORANGE = _hex_to_rgb(PALETTE["orange"][500])  # type: ignore[index]
-    SUCCESS_GREEN = _hex_to_rgb(UTILITY_COLORS["status"]["success"])  # type: ignore[index]
-    WARNING_YELLOW = _hex_to_rgb(UTILITY_COLORS["status"]["warning"])  # type: ignore[index]
-    ERROR_RED = _hex_to_rgb(UTILITY_COLORS["status"]["error"])  # type: ignore[index]
-    NEUTRAL_GRAY = _hex_to_rgb(PALETTE["zinc"][500])  # type: ignore[index]
+    PRIMARY_BLUE = hex_to_rgb(PALETTE["blue"][600])  # type: ignore[index]
+    ACCENT_ORANGE = hex_to_rgb(PALETTE["orange"][500])  # type: ignore[index]
+    SUCCESS_GREEN = hex_to_rgb(UTILITY_COLORS["status"]["success"])  # type: ignore[index]
+    WARNING_YELLOW = hex_to_rgb(UTILITY_COLORS["status"]["warning"])  # type: ignore[index]
+    ERROR_RED = hex_to_rgb(UTILITY_COLORS["status"]["error"])  # type: ignore[index]
+    NEUTRAL_GRAY = hex_to_rgb(PALETTE["zinc"][500])  # type: ignore[index]
     WHITE = (255, 255, 255)
     BLACK = (0, 0, 0)
 
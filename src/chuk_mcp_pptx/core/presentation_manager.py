@@ -34,6 +34,27 @@ from ..models import (
 
 logger = logging.getLogger(__name__)
 
+# Every .pptx is a zip archive, which starts with a local file header
+_ZIP_MAGIC = b"PK\x03\x04"
+
+
+def _remove_all_slides(prs: PresentationType) -> int:
+    """
+    Drop every slide from a presentation, keeping its masters and layouts.
+
+    Snapshots the slide id list once and removes each entry as it goes, so
+    there is no index bookkeeping or repeated lookup per slide.
+
+    Returns:
+        Number of slides removed
+    """
+    sld_id_lst = prs.slides._sldIdLst
+    sld_ids = list(sld_id_lst)
+    for sld_id in sld_ids:
+        prs.part.drop_rel(sld_id.rId)
+        sld_id_lst.remove(sld_id)
+    return len(sld_ids)
+
 
 class PresentationManager:
     """
@@ -91,10 +112,10 @@ class PresentationManager:
 
     def _is_cache_valid(self, name: str) -> bool:
         """Check if cached presentation is still valid (within TTL)."""
-        if name not in self._cache_timestamps:
+        loaded_at = self._cache_timestamps.get(name)
+        if loaded_at is None:
             return False
-        age = time.time() - self._cache_timestamps[name]
-        return age < self.CACHE_TTL
+        return time.time() - loaded_at < self.CACHE_TTL
 
     def _update_cache_timestamp(self, name: str) -> None:
         """Update the cache timestamp for a presentation."""
@@ -265,7 +286,7 @@ class PresentationManager:
                 return None
 
             buffer = io.BytesIO(data)
-            prs = Presentation(buffer)
+            prs = await asyncio.to_thread(Presentation, buffer)
 
             # Update cache
             self._presentations[name] = prs
@@ -369,14 +390,8 @@ class PresentationManager:
 
                 # Remove all existing slides from the template - we only want the layouts/master
                 # Users will add slides using pptx_add_slide_from_template
-                slide_ids_to_remove = list(range(len(prs.slides) - 1, -1, -1))
-                for slide_idx in slide_ids_to_remove:
-                    rId = prs.slides._sldIdLst[slide_idx].rId
-                    prs.part.drop_rel(rId)
-                    del prs.slides._sldIdLst[slide_idx]
-                logger.info(
-                    f"Removed {len(slide_ids_to_remove)} template slides, keeping only layouts"
-                )
+                removed = _remove_all_slides(prs)
+                logger.info(f"Removed {removed} template slides, keeping only layouts")
             else:
                 # Fallback to artifact store template
                 template_data = await self._load_template_from_store(template_name)
@@ -389,14 +404,8 @@ class PresentationManager:
                     )
 
                     # Remove all existing slides from the template - we only want the layouts/master
-                    slide_ids_to_remove = list(range(len(prs.slides) - 1, -1, -1))
-                    for slide_idx in slide_ids_to_remove:
-                        rId = prs.slides._sldIdLst[slide_idx].rId
-                        prs.part.drop_rel(rId)
-                        del prs.slides._sldIdLst[slide_idx]
-                    logger.info(
-                        f"Removed {len(slide_ids_to_remove)} template slides, keeping only layouts"
-                    )
+                    removed = _remove_all_slides(prs)
+                    logger.info(f"Removed {removed} template slides, keeping only layouts")
                 else:
                     # Fallback to blank presentation if template not found
                     logger.warning(
@@ -608,12 +617,9 @@ class PresentationManager:
 
         # Clean up all cache data
         del self._presentations[name]
-        if name in self._metadata:
-            del self._metadata[name]
-        if name in self._cache_timestamps:
-            del self._cache_timestamps[name]
-        if name in self._namespace_ids:
-            del self._namespace_ids[name]
+        self._metadata.pop(name, None)
+        self._cache_timestamps.pop(name, None)
+        self._namespace_ids.pop(name, None)
 
         # Update current if we deleted it
         if self._current_presentation == name:
@@ -764,18 +770,20 @@ class PresentationManager:
             metadata.slides.append(SlideMetadata(index=len(metadata.slides), layout="Blank"))
 
         # Get the slide
-        if slide_index < len(prs.slides):
-            slide = prs.slides[slide_index]
+        slides = prs.slides
+        if slide_index < len(slides):
+            shapes = slides[slide_index].shapes
             slide_meta = metadata.slides[slide_index]
 
             # Update metadata from slide
-            slide_meta.shape_count = len(slide.shapes)
-            slide_meta.has_title = slide.shapes.title is not None
-            if slide_meta.has_title and slide.shapes.title:
-                slide_meta.title_text = slide.shapes.title.text
+            slide_meta.shape_count = len(shapes)
+            title_shape = shapes.title
+            slide_meta.has_title = title_shape is not None
+            if title_shape:
+                slide_meta.title_text = title_shape.text
 
             # Check for charts, tables, images
-            for shape in slide.shapes:
+            for shape in shapes:
                 # Check for charts - has_chart raises exception on non-chart shapes
                 try:
                     if hasattr(shape, "has_chart") and shape.has_chart:
@@ -833,8 +841,12 @@ class PresentationManager:
             True if successful, False otherwise
         """
         try:
-            buffer = io.BytesIO(base64.b64decode(data))
-            prs = await asyncio.to_thread(Presentation, buffer)
+            raw = base64.b64decode(data)
+            # Reject non-pptx payloads here rather than in a parse thread
+            if not raw.startswith(_ZIP_MAGIC):
+                logger.error("Failed to import from base64: data is not a .pptx archive")
+                return False
+            prs = await asyncio.to_thread(Presentation, io.BytesIO(raw))
             self._presentations[name] = prs
             self._update_cache_timestamp(name)  # Mark as freshly cached
 
@@ -886,8 +898,10 @@ class PresentationManager:
                 data = await asyncio.to_thread(f.read)
 
             # Verify it's a valid presentation
-            buffer = io.BytesIO(data)
-            prs = await asyncio.to_thread(Presentation, buffer)
+            if not data.startswith(_ZIP_MAGIC):
+                logger.error(f"Failed to import template: {file_path} is not a .pptx archive")
+                return False
+            prs = await asyncio.to_thread(Presentation, io.BytesIO(data))
             logger.info(f"Validated template file: {file_path} ({len(prs.slides)} slides)")
 
             # Create namespace for template
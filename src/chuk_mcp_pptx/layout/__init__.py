@@ -24,6 +24,7 @@ from .helpers import (
     CONTENT_LEFT,
     CONTENT_TOP,
     validate_position,
+    position_changed,
     calculate_grid_layout,
     get_logo_position,
     get_safe_content_area,
@@ -47,6 +48,7 @@ __all__ = [
     "CONTENT_TOP",
     # Helper functions
     "validate_position",
+    "position_changed",
     "validate_boundaries",
     "adjust_to_boundaries",
     "calculate_grid_layout",
@@ -6,6 +6,7 @@ Provides utilities for ensuring proper positioning and sizing of elements
 within standard PowerPoint slide dimensions.
 """
 
+from functools import lru_cache
 from typing import Tuple, List, Dict, Optional
 
 
@@ -21,6 +22,9 @@ from .boundaries import (
     validate_boundaries,
 )
 
+# English Metric Units per inch, PowerPoint's native length unit
+EMU_PER_INCH = 914400
+
 # Content area (safe zone)
 CONTENT_WIDTH = SLIDE_WIDTH - MARGIN_LEFT - MARGIN_RIGHT  # 9.0 inches
 CONTENT_HEIGHT = SLIDE_HEIGHT - MARGIN_TOP - MARGIN_BOTTOM  # 4.125 inches
@@ -125,6 +129,29 @@ def validate_position(
     return left, top, width, height
 
 
+def position_changed(
+    original: Tuple[float, float, float, float], adjusted: Tuple[float, float, float, float]
+) -> bool:
+    """
+    Check whether validate_position actually moved or resized an element.
+
+    Compares both positions in whole EMUs (the unit PowerPoint stores), so
+    floating-point noise from the adjustment arithmetic is not reported as
+    a change.
+
+    Args:
+        original: (left, top, width, height) in inches
+        adjusted: (left, top, width, height) in inches
+
+    Returns:
+        True if any edge differs by at least one EMU
+    """
+    return any(
+        round(before * EMU_PER_INCH) != round(after * EMU_PER_INCH)
+        for before, after in zip(original, adjusted)
+    )
+
+
 def calculate_grid_layout(
     num_items: int,
     columns: Optional[int] = None,
@@ -232,6 +259,20 @@ def get_logo_position(
     return {"left": left, "top": top, "width": width, "height": height}
 
 
+@lru_cache(maxsize=8)
+def _safe_content_area(has_title: bool, aspect_ratio: str) -> Dict[str, float]:
+    """Compute the safe area once per (has_title, aspect_ratio); callers must not mutate it."""
+    top_margin = MARGIN_TOP if has_title else 0.5
+    slide_height = SLIDE_HEIGHT if aspect_ratio == "16:9" else SLIDE_HEIGHT_4_3
+
+    return {
+        "left": CONTENT_LEFT,
+        "top": top_margin,
+        "width": CONTENT_WIDTH,
+        "height": slide_height - top_margin - MARGIN_BOTTOM,
+    }
+
+
 def get_safe_content_area(has_title: bool = True, aspect_ratio: str = "16:9") -> Dict[str, float]:
     """
     Get the safe content area for placing elements.
@@ -243,12 +284,4 @@ def get_safe_content_area(has_title: bool = True, aspect_ratio: str = "16:9") ->
     Returns:
         Dictionary with 'left', 'top', 'width', 'height'
     """
-    top_margin = MARGIN_TOP if has_title else 0.5
-    slide_height = SLIDE_HEIGHT if aspect_ratio == "16:9" else SLIDE_HEIGHT_4_3
-
-    return {
-        "left": CONTENT_LEFT,
-        "top": top_margin,
-        "width": CONTENT_WIDTH,
-        "height": slide_height - top_margin - MARGIN_BOTTOM,
-    }
+    return dict(_safe_content_area(bool(has_title), aspect_ratio))
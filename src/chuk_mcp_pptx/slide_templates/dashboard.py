@@ -4,12 +4,45 @@ Dashboard slide templates.
 Provides templates for metric dashboards and KPI displays.
 """
 
-from typing import List, Dict, Any, Optional
+from functools import lru_cache
+from typing import List, Dict, Any, Optional, Tuple
 
 from .base import SlideTemplate
 from .registry import template, TemplateCategory, TemplateProp
 
 
+@lru_cache(maxsize=16)
+def _metric_positions(layout: str, count: int) -> Tuple[Dict[str, float], ...]:
+    """
+    Card positions for `count` metrics in the given layout.
+
+    The slide geometry is fixed, so positions depend only on the layout and the
+    metric count. Decks reuse the same few counts (usually 3 or 4), so each
+    table is computed once. Callers unpack the dicts and must not mutate them.
+    """
+    if layout == "grid":
+        from ..layout.patterns import get_dashboard_positions
+
+        positions = get_dashboard_positions(gap="md", left=0.5, top=1.8, width=9.0, height=5.5)
+        return tuple(positions["metrics"][:count])
+
+    from ..components.core import Grid
+
+    grid = Grid(columns=count, rows=1, gap="md")
+    return tuple(
+        grid.get_cell(
+            col_span=1,
+            col_start=i,
+            left=0.5,
+            top=2.5,
+            width=9.0,
+            height=2.5,
+            auto_height=False,
+        )
+        for i in range(count)
+    )
+
+
 @template(
     name="MetricsDashboard",
     category=TemplateCategory.DASHBOARD,
@@ -76,7 +109,6 @@ class MetricsDashboard(SlideTemplate):
     def render(self, prs) -> int:
         """Render dashboard slide using Grid system."""
         from ..components.core import MetricCard, TextBox
-        from ..layout.patterns import get_dashboard_positions
 
         # Add blank slide
         slide = prs.slides.add_slide(prs.slide_layouts[6])
@@ -85,45 +117,23 @@ class MetricsDashboard(SlideTemplate):
         title_text = TextBox(text=self.title, font_size=32, bold=True, theme=self.theme)
         title_text.render(slide, left=0.5, top=0.5, width=9.0, height=0.8)
 
-        # Use grid-based dashboard positions
+        # Grid layout fills the dashboard's top row (3 metrics); row layout
+        # splits one Grid row across every metric
         if self.layout == "grid":
-            positions = get_dashboard_positions(gap="md", left=0.5, top=1.8, width=9.0, height=5.5)
-
-            # Render metrics using grid positions
-            for i, metric_data in enumerate(self.metrics[:3]):  # Top 3 metrics row
-                pos = positions["metrics"][i]
-                card = MetricCard(
-                    label=metric_data["label"],
-                    value=metric_data["value"],
-                    change=metric_data.get("change"),
-                    trend=metric_data.get("trend"),
-                    theme=self.theme,
-                )
-                card.render(slide, **pos)
-
-        else:  # row layout
-            from ..components.core import Grid
-
-            # Use Grid component directly for row layout
-            grid = Grid(columns=len(self.metrics), rows=1, gap="md")
-
-            for i, metric_data in enumerate(self.metrics):
-                pos = grid.get_cell(
-                    col_span=1,
-                    col_start=i,
-                    left=0.5,
-                    top=2.5,
-                    width=9.0,
-                    height=2.5,
-                    auto_height=False,
-                )
-                card = MetricCard(
-                    label=metric_data["label"],
-                    value=metric_data["value"],
-                    change=metric_data.get("change"),
-                    trend=metric_data.get("trend"),
-                    theme=self.theme,
-                )
-                card.render(slide, **pos)
+            metrics = self.metrics[:3]
+            positions = _metric_positions("grid", len(metrics))
+        else:
+            metrics = self.metrics
+            positions = _metric_positions("row", len(metrics))
+
+        for metric_data, pos in zip(metrics, positions):
+            card = MetricCard(
+                label=metric_data["label"],
+                value=metric_data["value"],
+                change=metric_data.get("change"),
+                trend=metric_data.get("trend"),
+                theme=self.theme,
+            )
+            card.render(slide, **pos)
 
         return len(prs.slides) - 1
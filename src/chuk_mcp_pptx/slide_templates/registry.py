@@ -6,7 +6,9 @@ component registry. Templates are self-documenting with metadata including
 props, examples, and tags for LLM discovery.
 """
 
+from copy import deepcopy
 from enum import Enum
+from functools import lru_cache
 from typing import Dict, List, Any, Optional
 from pydantic import BaseModel, field_validator
 
@@ -23,6 +25,10 @@ class TemplateCategory(Enum):
     LAYOUT = "layout"  # Generic layouts
 
 
+# Category values never change after import
+_CATEGORY_VALUES = tuple(cat.value for cat in TemplateCategory)
+
+
 class TemplateProp(BaseModel):
     """Metadata for a template property."""
 
@@ -58,7 +64,16 @@ class TemplateProp(BaseModel):
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for JSON serialization."""
-        return self.model_dump()
+        # Plain literal rather than model_dump(): same keys and copy semantics,
+        # without pydantic's per-field serializer walk
+        return {
+            "name": self.name,
+            "type": self.type,
+            "description": self.description,
+            "required": self.required,
+            "options": list(self.options) if self.options is not None else None,
+            "default": deepcopy(self.default),
+        }
 
 
 class TemplateMetadata(BaseModel):
@@ -118,6 +133,11 @@ class TemplateMetadata(BaseModel):
 # Global template registry
 _TEMPLATE_REGISTRY: Dict[str, TemplateMetadata] = {}
 
+# Serialized metadata and per-category names, built once at registration.
+# Discovery tools list templates far more often than templates are registered.
+_TEMPLATE_DICTS: Dict[str, Dict[str, Any]] = {}
+_TEMPLATES_BY_CATEGORY: Dict[str, List[str]] = {}
+
 
 def template(
     name: str,
@@ -165,8 +185,14 @@ def template(
             tags=tags or [],
             class_ref=cls,
         )
+        previous = _TEMPLATE_REGISTRY.get(name)
+        if previous is not None:
+            _TEMPLATES_BY_CATEGORY[previous.category.value].remove(name)
         _TEMPLATE_REGISTRY[name] = metadata
+        _TEMPLATE_DICTS[name] = metadata.to_dict()
+        _TEMPLATES_BY_CATEGORY.setdefault(category.value, []).append(name)
         cls._template_metadata = metadata
+        _clear_registry_caches()
         return cls
 
     return decorator
@@ -182,16 +208,8 @@ def list_templates(category: Optional[str] = None) -> List[Dict[str, Any]]:
     Returns:
         List of template metadata dictionaries
     """
-    templates = []
-
-    for metadata in _TEMPLATE_REGISTRY.values():
-        # Filter by category if specified
-        if category and metadata.category.value != category:
-            continue
-
-        templates.append(metadata.to_dict())
-
-    return templates
+    names = _TEMPLATES_BY_CATEGORY.get(category, []) if category else _TEMPLATE_DICTS
+    return [dict(_TEMPLATE_DICTS[name]) for name in names]
 
 
 def get_template_info(name: str) -> Optional[Dict[str, Any]]:
@@ -204,13 +222,14 @@ def get_template_info(name: str) -> Optional[Dict[str, Any]]:
     Returns:
         Template metadata dictionary or None if not found
     """
-    metadata = _TEMPLATE_REGISTRY.get(name)
-    if not metadata:
+    info = _TEMPLATE_DICTS.get(name)
+    if info is None:
         return None
 
-    return metadata.to_dict()
+    return dict(info)
 
 
+@lru_cache(maxsize=128)
 def get_template(name: str) -> Optional[type]:
     """
     Get the template class by name.
@@ -228,6 +247,11 @@ def get_template(name: str) -> Optional[type]:
     return metadata.class_ref
 
 
+def _clear_registry_caches() -> None:
+    """Drop memoized lookups so a new registration is visible immediately."""
+    get_template.cache_clear()
+
+
 def get_all_categories() -> List[str]:
     """
     Get list of all template categories.
@@ -235,4 +259,4 @@ def get_all_categories() -> List[str]:
     Returns:
         List of category values
     """
-    return [cat.value for cat in TemplateCategory]
+    return list(_CATEGORY_VALUES)
@@ -8,6 +8,7 @@ Similar to ThemeManager, provides access to pre-built templates.
 import asyncio
 import io
 import logging
+from dataclasses import dataclass
 from pathlib import Path
 from pydantic import BaseModel, Field
 from pptx import Presentation
@@ -30,6 +31,36 @@ class TemplateMetadata(BaseModel):
         extra = "forbid"
 
 
+@dataclass(slots=True, frozen=True)
+class _SearchKey:
+    """Lowercased searchable fields of a template, built once at registration."""
+
+    name: str
+    display_name: str
+    description: str
+    category: str
+    tags: tuple[str, ...]
+
+    @classmethod
+    def from_metadata(cls, template: TemplateMetadata) -> "_SearchKey":
+        return cls(
+            template.name.lower(),
+            template.display_name.lower(),
+            template.description.lower(),
+            template.category.lower(),
+            tuple(tag.lower() for tag in template.tags),
+        )
+
+    def matches(self, query_lower: str) -> bool:
+        return (
+            query_lower in self.name
+            or query_lower in self.display_name
+            or query_lower in self.description
+            or query_lower in self.category
+            or any(query_lower in tag for tag in self.tags)
+        )
+
+
 class TemplateManager:
     """
     Manages PowerPoint templates similar to ThemeManager.
@@ -44,6 +75,8 @@ class TemplateManager:
         self.templates_dir = self._find_templates_dir()
         self._templates: dict[str, TemplateMetadata] = {}
         self._template_cache: dict[str, bytes] = {}
+        self._search_keys: dict[str, _SearchKey] = {}
+        self._categories: tuple[str, ...] | None = None
 
         # Log template directory for debugging
         logger.info(f"TemplateManager initialized with templates_dir: {self.templates_dir}")
@@ -149,7 +182,13 @@ class TemplateManager:
         ]
 
         for template in builtin_templates:
-            self._templates[template.name] = template
+            self._add_template(template)
+
+    def _add_template(self, template: TemplateMetadata) -> None:
+        """Store template metadata alongside its search key."""
+        self._templates[template.name] = template
+        self._search_keys[template.name] = _SearchKey.from_metadata(template)
+        self._categories = None
 
     async def get_template_data(self, template_name: str) -> bytes | None:
         """
@@ -234,19 +273,11 @@ class TemplateManager:
             List of matching TemplateMetadata objects
         """
         query_lower = query.lower()
-        results = []
-
-        for template in self._templates.values():
-            if (
-                query_lower in template.name.lower()
-                or query_lower in template.display_name.lower()
-                or query_lower in template.description.lower()
-                or query_lower in template.category.lower()
-                or any(query_lower in tag.lower() for tag in template.tags)
-            ):
-                results.append(template)
-
-        return results
+        return [
+            self._templates[name]
+            for name, key in self._search_keys.items()
+            if key.matches(query_lower)
+        ]
 
     def register_custom_template(
         self,
@@ -277,7 +308,7 @@ class TemplateManager:
             tags=tags or [],
             is_builtin=False,
         )
-        self._templates[name] = template
+        self._add_template(template)
         logger.info(f"Registered custom template: {name}")
 
     def get_categories(self) -> list[str]:
@@ -287,4 +318,7 @@ class TemplateManager:
         Returns:
             List of unique category names
         """
-        return sorted(set(t.category for t in self._templates.values()))
+        # Rebuilt only after a registration changes the template set
+        if self._categories is None:
+            self._categories = tuple(sorted({t.category for t in self._templates.values()}))
+        return list(self._categories)
@@ -16,7 +16,7 @@ from dataclasses import dataclass, field
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(slots=True)
 class ResolvedDesignSystem:
     """
     Resolved design system with all properties.
@@ -181,18 +181,17 @@ def extract_placeholder_styles(placeholder) -> dict[str, Any]:
                         try:
                             rgb = font.color.rgb
                             styles["text_color"] = f"#{rgb[0]:02x}{rgb[1]:02x}{rgb[2]:02x}"
-                        except Exception:
+                        except (TypeError, IndexError):
                             pass
 
-        # Extract fill color
-        if hasattr(placeholder, "fill"):
-            fill = placeholder.fill
-            if hasattr(fill, "fore_color") and hasattr(fill.fore_color, "rgb"):
-                try:
-                    rgb = fill.fore_color.rgb
-                    styles["background_color"] = f"#{rgb[0]:02x}{rgb[1]:02x}{rgb[2]:02x}"
-                except Exception:
-                    pass
+        # Extract fill color; an unfilled placeholder raises TypeError on fore_color
+        fill = getattr(placeholder, "fill", None)
+        if fill is not None and fill.type is not None:
+            try:
+                rgb = fill.fore_color.rgb
+                styles["background_color"] = f"#{rgb[0]:02x}{rgb[1]:02x}{rgb[2]:02x}"
+            except (AttributeError, TypeError, IndexError):
+                pass
 
     except Exception as e:
         logger.warning(f"Could not extract placeholder styles: {e}")
@@ -320,17 +319,16 @@ def apply_design_system_to_shape(shape, design_system: ResolvedDesignSystem):
     """
     try:
         from pptx.util import Pt
-        from pptx.dml.color import RGBColor
+        from ..tokens.colors import cached_rgb
 
         # Apply fill color
         if hasattr(shape, "fill"):
             shape.fill.solid()
-            rgb = _hex_to_rgb(design_system.background_color)
-            shape.fill.fore_color.rgb = RGBColor(*rgb)
+            shape.fill.fore_color.rgb = cached_rgb(design_system.background_color)
 
         # Apply line/border
         if hasattr(shape, "line"):
-            shape.line.color.rgb = RGBColor(*_hex_to_rgb(design_system.border_color))
+            shape.line.color.rgb = cached_rgb(design_system.border_color)
             shape.line.width = Pt(design_system.border_width)
 
         # Apply text styles
@@ -342,18 +340,9 @@ def apply_design_system_to_shape(shape, design_system: ResolvedDesignSystem):
                     run.font.size = Pt(design_system.font_size)
                     run.font.bold = design_system.font_bold
                     run.font.italic = design_system.font_italic
-                    run.font.color.rgb = RGBColor(*_hex_to_rgb(design_system.text_color))
+                    run.font.color.rgb = cached_rgb(design_system.text_color)
 
         logger.debug(f"Applied design system to shape (source: {design_system.source})")
 
     except Exception as e:
         logger.warning(f"Could not fully apply design system to shape: {e}")
-
-
-def _hex_to_rgb(hex_color: str) -> tuple[int, int, int]:
-    """Convert hex color to RGB tuple."""
-    hex_color = hex_color.lstrip("#")
-    r = int(hex_color[0:2], 16)
-    g = int(hex_color[2:4], 16)
-    b = int(hex_color[4:6], 16)
-    return (r, g, b)
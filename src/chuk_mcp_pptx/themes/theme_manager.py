@@ -28,12 +28,79 @@ Usage:
     mgr.register_theme(custom)
 """
 
-from typing import Dict, Any, Optional, List
+from collections.abc import Iterator, MutableMapping
+from typing import Callable, Dict, Any, Optional, List
 import json
+import warnings
 from pptx.util import Pt
 from pptx.dml.color import RGBColor
+from pptx.enum.dml import MSO_COLOR_TYPE, MSO_FILL
 
-from ..tokens.colors import get_semantic_tokens, GRADIENTS, PALETTE
+from ..tokens.colors import cached_rgb, get_semantic_tokens, hex_to_rgb, GRADIENTS, PALETTE
+
+# apply_to_shape styles: (fill, text, border) semantic color paths
+SHAPE_STYLES = {
+    "card": ("card.DEFAULT", "card.foreground", "border.DEFAULT"),
+    "primary": ("primary.DEFAULT", "primary.foreground", "primary.DEFAULT"),
+    "secondary": ("secondary.DEFAULT", "secondary.foreground", "border.DEFAULT"),
+    "accent": ("accent.DEFAULT", "accent.foreground", "accent.DEFAULT"),
+    "muted": ("muted.DEFAULT", "muted.foreground", "border.secondary"),
+}
+
+
+# Shared fallback for paths that don't resolve to a hex color
+_BLACK = RGBColor(0, 0, 0)
+
+
+def _set_background(slide, rgb: RGBColor) -> None:
+    """Give a slide a solid background, leaving the fill alone if it already has it."""
+    fill = slide.background.fill
+    if (
+        fill.type == MSO_FILL.SOLID
+        and fill.fore_color.type == MSO_COLOR_TYPE.RGB
+        and fill.fore_color.rgb == rgb
+    ):
+        return
+    fill.solid()
+    fill.fore_color.rgb = rgb
+
+
+class _ThemeRegistry(MutableMapping[str, "Theme"]):
+    """
+    Theme name -> Theme.
+
+    Every built-in name is listed up front, but each built-in Theme is only
+    constructed the first time it is looked up.
+    """
+
+    def __init__(self) -> None:
+        self._factories: Dict[str, Callable[[], "Theme"]] = dict(_BUILTIN_THEMES)
+        self._themes: Dict[str, "Theme"] = {}
+
+    def __getitem__(self, name: str) -> "Theme":
+        theme = self._themes.get(name)
+        if theme is None:
+            theme = self._themes[name] = self._factories[name]()
+        return theme
+
+    def __setitem__(self, name: str, theme: "Theme") -> None:
+        self._themes[name] = theme
+
+    def __delitem__(self, name: str) -> None:
+        if name not in self:
+            raise KeyError(name)
+        self._themes.pop(name, None)
+        self._factories.pop(name, None)
+
+    def __contains__(self, name: object) -> bool:
+        return name in self._factories or name in self._themes
+
+    def __iter__(self) -> Iterator[str]:
+        yield from self._factories
+        yield from (name for name in self._themes if name not in self._factories)
+
+    def __len__(self) -> int:
+        return len(self._factories) + sum(name not in self._factories for name in self._themes)
 
 
 class ThemeManager:
@@ -44,38 +111,9 @@ class ThemeManager:
 
     def __init__(self):
         """Initialize theme manager with built-in themes."""
-        self.themes = {}
-        self._register_builtin_themes()
+        self.themes: MutableMapping[str, "Theme"] = _ThemeRegistry()
         self.current_theme = None
 
-    def _register_builtin_themes(self):
-        """Register all built-in themes."""
-        # Dark themes
-        self.register_theme(Theme("dark", primary_hue="blue", mode="dark"))
-        self.register_theme(Theme("dark-blue", primary_hue="blue", mode="dark"))
-        self.register_theme(Theme("dark-violet", primary_hue="violet", mode="dark"))
-        self.register_theme(Theme("dark-green", primary_hue="emerald", mode="dark"))
-        self.register_theme(Theme("dark-orange", primary_hue="orange", mode="dark"))
-        self.register_theme(Theme("dark-red", primary_hue="red", mode="dark"))
-        self.register_theme(Theme("dark-pink", primary_hue="pink", mode="dark"))
-        self.register_theme(Theme("dark-purple", primary_hue="purple", mode="dark"))
-
-        # Light themes
-        self.register_theme(Theme("light", primary_hue="blue", mode="light"))
-        self.register_theme(Theme("light-blue", primary_hue="blue", mode="light"))
-        self.register_theme(Theme("light-violet", primary_hue="violet", mode="light"))
-        self.register_theme(Theme("light-green", primary_hue="emerald", mode="light"))
-        self.register_theme(Theme("light-orange", primary_hue="orange", mode="light"))
-        self.register_theme(Theme("light-warm", primary_hue="amber", mode="light"))
-
-        # Special themes
-        self.register_theme(CyberpunkTheme())
-        self.register_theme(GradientTheme("sunset", GRADIENTS["sunset"]))
-        self.register_theme(GradientTheme("ocean", GRADIENTS["ocean"]))
-        self.register_theme(GradientTheme("aurora", GRADIENTS["aurora"]))
-        self.register_theme(MinimalTheme())
-        self.register_theme(CorporateTheme())
-
     def register_theme(self, theme: "Theme"):
         """Register a theme."""
         self.themes[theme.name] = theme
@@ -91,6 +129,11 @@ class ThemeManager:
             raise ValueError("Default theme 'dark' not found")
         return theme
 
+    def resolve(self, name: Optional[str] = None) -> "Theme":
+        """Get theme by name, falling back to the default theme for unknown or empty names."""
+        theme = self.get_theme(name) if name else None
+        return theme or self.get_default_theme()
+
     def set_current_theme(self, name: str):
         """Set the current active theme."""
         theme = self.get_theme(name)
@@ -164,12 +207,11 @@ class ThemeManager:
             slide: PowerPoint slide object
             theme_name: Theme name or None for current theme
         """
-        theme = self.get_theme(theme_name) if theme_name else self.current_theme
-        if not theme:
-            theme = self.get_theme("dark")  # Default
-
-        if theme:
-            theme.apply_to_slide(slide)
+        if theme_name or self.current_theme is None:
+            theme = self.resolve(theme_name)
+        else:
+            theme = self.current_theme
+        theme.apply_to_slide(slide)
 
 
 class Theme:
@@ -177,6 +219,9 @@ class Theme:
     Base theme class.
     """
 
+    # Themes are long-lived and numerous; slots drop the per-instance __dict__
+    __slots__ = ("font_family", "mode", "name", "primary_hue", "tokens")
+
     def __init__(
         self, name: str, primary_hue: str = "blue", mode: str = "dark", font_family: str = "Inter"
     ):
@@ -222,23 +267,26 @@ class Theme:
 
     def hex_to_rgb(self, hex_color: str) -> tuple:
         """Convert hex to RGB."""
-        hex_color = hex_color.lstrip("#")
-        return tuple(int(hex_color[i : i + 2], 16) for i in (0, 2, 4))
+        return hex_to_rgb(hex_color)
 
     def get_color(self, path: str) -> RGBColor:
-        """Get color from tokens."""
-        parts = path.split(".")
+        """
+        Get color from tokens.
+
+        The tree is walked on every call so in-place token edits take effect;
+        only the hex parse is memoized.
+        """
         value = self.tokens
 
-        for part in parts:
+        for part in path.split("."):
             if isinstance(value, dict):
                 value = value.get(part, "#000000")
             else:
                 break
 
         if isinstance(value, str):
-            return RGBColor(*self.hex_to_rgb(value))
-        return RGBColor(0, 0, 0)
+            return cached_rgb(value)
+        return _BLACK
 
     def apply_to_slide(self, slide, override_text_colors: bool = True):
         """
@@ -250,10 +298,7 @@ class Theme:
                                  If False, only set background (useful for slides with pre-styled components).
         """
         # Set background
-        background = slide.background
-        fill = background.fill
-        fill.solid()
-        fill.fore_color.rgb = self.get_color("background.DEFAULT")
+        _set_background(slide, self.get_color("background.DEFAULT"))
 
         # Optionally set default text color for all existing text shapes
         if override_text_colors:
@@ -270,15 +315,7 @@ class Theme:
 
     def apply_to_shape(self, shape, style: str = "card"):
         """Apply theme to shape."""
-        style_map = {
-            "card": ("card.DEFAULT", "card.foreground", "border.DEFAULT"),
-            "primary": ("primary.DEFAULT", "primary.foreground", "primary.DEFAULT"),
-            "secondary": ("secondary.DEFAULT", "secondary.foreground", "border.DEFAULT"),
-            "accent": ("accent.DEFAULT", "accent.foreground", "accent.DEFAULT"),
-            "muted": ("muted.DEFAULT", "muted.foreground", "border.secondary"),
-        }
-
-        bg_path, fg_path, border_path = style_map.get(style, style_map["card"])
+        bg_path, fg_path, border_path = SHAPE_STYLES.get(style, SHAPE_STYLES["card"])
 
         # Apply fill
         if hasattr(shape, "fill"):
@@ -290,17 +327,22 @@ class Theme:
             shape.line.color.rgb = self.get_color(border_path)
             shape.line.width = Pt(1)
 
-        # Apply text color
-        if hasattr(shape, "text_frame") and shape.text_frame:
-            for paragraph in shape.text_frame.paragraphs:
+        # Apply text color; decorative shapes carry no runs, so skip building
+        # paragraph and run proxies for them
+        text_frame = getattr(shape, "text_frame", None)
+        if text_frame and text_frame._txBody.xpath("./a:p/a:r"):
+            fg_rgb = self.get_color(fg_path)
+            font_family = self.font_family
+            for paragraph in text_frame.paragraphs:
                 for run in paragraph.runs:
-                    run.font.color.rgb = self.get_color(fg_path)
-                    run.font.name = self.font_family
+                    font = run.font
+                    font.color.rgb = fg_rgb
+                    font.name = font_family
 
     def get_chart_colors(self) -> List[RGBColor]:
         """Get chart colors for data visualization."""
         chart_colors = self.tokens.get("chart", [])
-        return [RGBColor(*self.hex_to_rgb(color)) for color in chart_colors]
+        return [cached_rgb(color) for color in chart_colors]
 
     def to_dict(self) -> Dict[str, Any]:
         """
@@ -316,6 +358,24 @@ class Theme:
             "font_family": self.font_family,
         }
 
+    @property
+    def __dict__(self) -> Dict[str, Any]:  # type: ignore[override]
+        """
+        Deprecated: the attribute dict themes had before they were slotted.
+
+        Returns a fresh snapshot of the slot values, so writes to it are not
+        reflected on the theme. Use to_dict() instead.
+        """
+        warnings.warn(
+            "Theme.__dict__ is deprecated; use Theme.to_dict()", DeprecationWarning, stacklevel=2
+        )
+        return {
+            name: getattr(self, name)
+            for cls in type(self).__mro__
+            for name in getattr(cls, "__slots__", ())
+            if hasattr(self, name)
+        }
+
     def export_json(self) -> str:
         """
         Export theme as JSON string.
@@ -347,38 +407,41 @@ class Theme:
 class CyberpunkTheme(Theme):
     """Cyberpunk theme with neon colors."""
 
+    __slots__ = ()
+
     def __init__(self):
         super().__init__("cyberpunk", primary_hue="violet", mode="dark")
 
         # Override with cyberpunk colors using PALETTE
-        self.tokens.update(
-            {
-                "background": {"DEFAULT": PALETTE["slate"][950]},  # Very dark
-                "foreground": {"DEFAULT": PALETTE["cyan"][400]},  # Bright cyan
-                "primary": {
-                    "DEFAULT": PALETTE["fuchsia"][500],  # Magenta
-                    "foreground": PALETTE["slate"][950],
-                },
-                "accent": {
-                    "DEFAULT": PALETTE["yellow"][400],  # Electric yellow
-                    "foreground": PALETTE["slate"][950],
-                },
-                "border": {"DEFAULT": PALETTE["fuchsia"][500]},
-                "chart": [
-                    PALETTE["fuchsia"][500],  # Magenta
-                    PALETTE["cyan"][400],  # Cyan
-                    PALETTE["yellow"][400],  # Yellow
-                    PALETTE["pink"][500],  # Pink
-                    PALETTE["lime"][400],  # Green
-                ],
-            }
-        )
+        self.tokens = {
+            **self.tokens,
+            "background": {"DEFAULT": PALETTE["slate"][950]},  # Very dark
+            "foreground": {"DEFAULT": PALETTE["cyan"][400]},  # Bright cyan
+            "primary": {
+                "DEFAULT": PALETTE["fuchsia"][500],  # Magenta
+                "foreground": PALETTE["slate"][950],
+            },
+            "accent": {
+                "DEFAULT": PALETTE["yellow"][400],  # Electric yellow
+                "foreground": PALETTE["slate"][950],
+            },
+            "border": {"DEFAULT": PALETTE["fuchsia"][500]},
+            "chart": [
+                PALETTE["fuchsia"][500],  # Magenta
+                PALETTE["cyan"][400],  # Cyan
+                PALETTE["yellow"][400],  # Yellow
+                PALETTE["pink"][500],  # Pink
+                PALETTE["lime"][400],  # Green
+            ],
+        }
         self.font_family = "Orbitron"
 
 
 class GradientTheme(Theme):
     """Theme with gradient backgrounds."""
 
+    __slots__ = ("gradient_colors",)
+
     def __init__(self, name: str, gradient_colors: List[str]):
         super().__init__(name, mode="dark")
         self.gradient_colors = gradient_colors
@@ -387,15 +450,14 @@ class GradientTheme(Theme):
         """Apply gradient background (using first color as fallback)."""
         # PowerPoint doesn't easily support gradients via python-pptx
         # Use first color as solid background
-        background = slide.background
-        fill = background.fill
-        fill.solid()
-        fill.fore_color.rgb = RGBColor(*self.hex_to_rgb(self.gradient_colors[0]))
+        _set_background(slide, cached_rgb(self.gradient_colors[0]))
 
 
 class MinimalTheme(Theme):
     """Minimal black and white theme."""
 
+    __slots__ = ()
+
     def __init__(self):
         super().__init__("minimal", primary_hue="zinc", mode="light")
         self.tokens = {
@@ -439,32 +501,61 @@ class MinimalTheme(Theme):
 class CorporateTheme(Theme):
     """Professional corporate theme."""
 
+    __slots__ = ()
+
     def __init__(self):
         super().__init__("corporate", primary_hue="blue", mode="light")
-        self.tokens.update(
-            {
-                "background": {"DEFAULT": PALETTE["slate"][50]},
-                "foreground": {"DEFAULT": PALETTE["slate"][900]},
-                "primary": {
-                    "DEFAULT": PALETTE["blue"][600],
-                    "foreground": PALETTE["slate"][50],
-                },
-                "secondary": {
-                    "DEFAULT": PALETTE["slate"][200],
-                    "foreground": PALETTE["slate"][800],
-                },
-                "accent": {
-                    "DEFAULT": PALETTE["green"][500],
-                    "foreground": PALETTE["slate"][50],
-                },
-                "chart": [
-                    PALETTE["blue"][600],
-                    PALETTE["green"][500],
-                    PALETTE["orange"][500],
-                    PALETTE["violet"][500],
-                    PALETTE["teal"][500],
-                    PALETTE["red"][500],
-                ],
-            }
-        )
+        self.tokens = {
+            **self.tokens,
+            "background": {"DEFAULT": PALETTE["slate"][50]},
+            "foreground": {"DEFAULT": PALETTE["slate"][900]},
+            "primary": {
+                "DEFAULT": PALETTE["blue"][600],
+                "foreground": PALETTE["slate"][50],
+            },
+            "secondary": {
+                "DEFAULT": PALETTE["slate"][200],
+                "foreground": PALETTE["slate"][800],
+            },
+            "accent": {
+                "DEFAULT": PALETTE["green"][500],
+                "foreground": PALETTE["slate"][50],
+            },
+            "chart": [
+                PALETTE["blue"][600],
+                PALETTE["green"][500],
+                PALETTE["orange"][500],
+                PALETTE["violet"][500],
+                PALETTE["teal"][500],
+                PALETTE["red"][500],
+            ],
+        }
         self.font_family = "Segoe UI"
+
+
+# Built-in themes by name; ThemeManager builds each one on first use
+_BUILTIN_THEMES: Dict[str, Callable[[], Theme]] = {
+    # Dark themes
+    "dark": lambda: Theme("dark", primary_hue="blue", mode="dark"),
+    "dark-blue": lambda: Theme("dark-blue", primary_hue="blue", mode="dark"),
+    "dark-violet": lambda: Theme("dark-violet", primary_hue="violet", mode="dark"),
+    "dark-green": lambda: Theme("dark-green", primary_hue="emerald", mode="dark"),
+    "dark-orange": lambda: Theme("dark-orange", primary_hue="orange", mode="dark"),
+    "dark-red": lambda: Theme("dark-red", primary_hue="red", mode="dark"),
+    "dark-pink": lambda: Theme("dark-pink", primary_hue="pink", mode="dark"),
+    "dark-purple": lambda: Theme("dark-purple", primary_hue="purple", mode="dark"),
+    # Light themes
+    "light": lambda: Theme("light", primary_hue="blue", mode="light"),
+    "light-blue": lambda: Theme("light-blue", primary_hue="blue", mode="light"),
+    "light-violet": lambda: Theme("light-violet", primary_hue="violet", mode="light"),
+    "light-green": lambda: Theme("light-green", primary_hue="emerald", mode="light"),
+    "light-orange": lambda: Theme("light-orange", primary_hue="orange", mode="light"),
+    "light-warm": lambda: Theme("light-warm", primary_hue="amber", mode="light"),
+    # Special themes
+    "cyberpunk": CyberpunkTheme,
+    "sunset": lambda: GradientTheme("sunset", GRADIENTS["sunset"]),
+    "ocean": lambda: GradientTheme("ocean", GRADIENTS["ocean"]),
+    "aurora": lambda: GradientTheme("aurora", GRADIENTS["aurora"]),
+    "minimal": MinimalTheme,
+    "corporate": CorporateTheme,
+}
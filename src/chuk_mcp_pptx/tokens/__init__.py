@@ -23,7 +23,7 @@ Usage:
 """
 
 from typing import Dict, Any
-from .colors import PALETTE, get_semantic_tokens, GRADIENTS
+from .colors import PALETTE, cached_rgb, get_semantic_tokens, hex_to_rgb, GRADIENTS
 from .typography import (
     FONT_FAMILIES,
     FONT_SIZES,
@@ -51,6 +51,8 @@ __all__ = [
     # Colors
     "PALETTE",
     "get_semantic_tokens",
+    "hex_to_rgb",
+    "cached_rgb",
     "GRADIENTS",
     # Typography
     "FONT_FAMILIES",
@@ -4,7 +4,11 @@ Design tokens for colors - the foundation of our theme system.
 Similar to CSS variables in shadcn/ui.
 """
 
-from typing import Dict, Any
+import string
+from functools import lru_cache
+from typing import Dict, Any, Tuple
+
+from pptx.dml.color import RGBColor
 
 # Base color palette - raw colors that themes can reference
 PALETTE = {
@@ -260,6 +264,25 @@ PALETTE = {
 }
 
 
+_HEX_DIGITS = frozenset(string.hexdigits)
+
+
+def hex_to_rgb(hex_color: str) -> Tuple[int, int, int]:
+    """(r, g, b) for a '#rrggbb' (or 'rrggbb') value, parsed with a single int()."""
+    digits = hex_color.removeprefix("#")
+    # int(..., 16) alone would also take signs, underscores and whitespace
+    if len(digits) != 6 or not _HEX_DIGITS.issuperset(digits):
+        raise ValueError(f"Invalid hex color: {hex_color!r}")
+    value = int(digits, 16)
+    return (value >> 16) & 0xFF, (value >> 8) & 0xFF, value & 0xFF
+
+
+@lru_cache(maxsize=256)
+def cached_rgb(hex_color: str) -> RGBColor:
+    """RGBColor for a '#rrggbb' (or 'rrggbb') value, memoized (RGBColor is immutable)."""
+    return RGBColor(*hex_to_rgb(hex_color))
+
+
 # Semantic token definitions
 def get_semantic_tokens(primary_hue: str = "blue", mode: str = "dark") -> Dict[str, Any]:
     """
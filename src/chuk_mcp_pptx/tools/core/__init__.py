@@ -5,5 +5,6 @@ Essential tools for template-aware presentation creation.
 """
 
 from .placeholder import register_placeholder_tools
+from .shapes import register_shape_tools
 
-__all__ = ["register_placeholder_tools"]
+__all__ = ["register_placeholder_tools", "register_shape_tools"]
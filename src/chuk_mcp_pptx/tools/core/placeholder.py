@@ -4,11 +4,103 @@ Core Placeholder Tools
 Essential tool for populating template placeholders, respecting the template's design system.
 """
 
+import inspect
+import json
 import logging
+from typing import Any
+
+from ...components.registry import get_component_class
+from ...components.tracking import component_tracker
+from ...constants import ErrorMessages
+from ...models import ErrorResponse, SuccessResponse
 
 logger = logging.getLogger(__name__)
 
 
+def get_slide(slides, slide_index: int):
+    """
+    Return the slide at ``slide_index`` in ``slides``, or None if it is out of range.
+
+    Indexes straight into the collection rather than checking len() first;
+    negative indexes are out of range instead of counting from the end.
+    """
+    if slide_index < 0:
+        return None
+    try:
+        return slides[slide_index]
+    except IndexError:
+        return None
+
+
+def slide_not_found(slide_index: int, slides) -> str:
+    """ErrorResponse JSON for a slide index that get_slide could not resolve."""
+    return ErrorResponse(
+        error=f"Slide index {slide_index} not found. Presentation has {len(slides)} slides."
+    ).model_dump_json()
+
+
+def find_placeholder(slide, idx: int):
+    """Return the placeholder with ``idx`` on ``slide``, or None if it has none."""
+    # Looked up by idx on the XML, so only the match gets a shape proxy
+    try:
+        return slide.placeholders[idx]
+    except KeyError:
+        return None
+
+
+# Media placeholder types that only take text when they expose a text frame
+_MEDIA_PLACEHOLDER_NAMES = {12: "CHART", 14: "TABLE", 18: "PICTURE"}
+
+
+def _text_support_error(placeholder, placeholder_idx: int) -> str | None:
+    """Return why ``placeholder`` cannot take text content, or None if it can."""
+    placeholder_type = placeholder.placeholder_format.type
+
+    # BODY (2) or OBJECT (7) - content placeholders that need a frame for bullets
+    if placeholder_type in (2, 7):
+        if not hasattr(placeholder, "text_frame"):
+            return f"Placeholder {placeholder_idx} does not have a text frame"
+        return None
+
+    if hasattr(placeholder, "text_frame") or hasattr(placeholder, "text"):
+        return None
+
+    if placeholder_type in _MEDIA_PLACEHOLDER_NAMES:
+        type_name = _MEDIA_PLACEHOLDER_NAMES[placeholder_type]
+        return (
+            f"Placeholder {placeholder_idx} is a {type_name} placeholder without text capability. "
+            f"Use dict content: pptx_populate_placeholder(placeholder_idx={placeholder_idx}, "
+            f"content={{'type': 'Image/Table/ColumnChart', ...}})"
+        )
+    return f"Placeholder {placeholder_idx} (type {placeholder_type}) does not support text content"
+
+
+def _set_placeholder_text(placeholder, content: str) -> None:
+    """Write text content into a placeholder that passed _text_support_error."""
+    # BODY (2) or OBJECT (7) - one bullet per line
+    if placeholder.placeholder_format.type in (2, 7):
+        text_frame = placeholder.text_frame
+        text_frame.clear()  # Clear existing content
+
+        # Split content by newlines to create bullet points
+        lines = content.split("\\n")
+        for idx, line in enumerate(lines):
+            if idx == 0:
+                # Use existing first paragraph
+                p = text_frame.paragraphs[0]
+            else:
+                # Add new paragraphs for additional bullets
+                p = text_frame.add_paragraph()
+            p.text = line
+            p.level = 0  # Top-level bullet
+
+    # TITLE, SUBTITLE, media captions and everything else take plain text
+    elif hasattr(placeholder, "text_frame"):
+        placeholder.text_frame.text = content
+    else:
+        placeholder.text = content
+
+
 def register_placeholder_tools(mcp, manager):
     """Register placeholder population tool."""
 
@@ -159,10 +251,6 @@ def register_placeholder_tools(mcp, manager):
             # This is automatically parsed and handled as a dict
         """
         try:
-            from ...models import ErrorResponse
-            from ...constants import ErrorMessages
-            import json
-
             # Parse content if it's a JSON string
             parsed_content = content
             if isinstance(content, str):
@@ -203,19 +291,13 @@ def register_placeholder_tools(mcp, manager):
                 prs, metadata = result
 
                 # Validate slide index
-                if slide_index < 0 or slide_index >= len(prs.slides):
-                    return ErrorResponse(
-                        error=f"Slide index {slide_index} not found. Presentation has {len(prs.slides)} slides."
-                    ).model_dump_json()
-
-                slide = prs.slides[slide_index]
+                slides = prs.slides
+                slide = get_slide(slides, slide_index)
+                if slide is None:
+                    return slide_not_found(slide_index, slides)
 
                 # Find the placeholder
-                placeholder = None
-                for shape in slide.placeholders:
-                    if shape.placeholder_format.idx == placeholder_idx:
-                        placeholder = shape
-                        break
+                placeholder = find_placeholder(slide, placeholder_idx)
 
                 if not placeholder:
                     available = [
@@ -227,10 +309,6 @@ def register_placeholder_tools(mcp, manager):
                         f"Available placeholders: {', '.join(available) if available else 'none'}"
                     ).model_dump_json()
 
-                # Import component registry and get component class
-                from ...components.registry import get_component_class
-                from ...components.tracking import component_tracker
-
                 try:
                     component_class = get_component_class(component_type)
                     if not component_class:
@@ -239,8 +317,6 @@ def register_placeholder_tools(mcp, manager):
                         ).model_dump_json()
 
                     # Filter params to only include valid parameters for this component
-                    import inspect
-
                     sig = inspect.signature(component_class.__init__)
                     valid_params = set(sig.parameters.keys()) - {"self"}
 
@@ -268,7 +344,7 @@ def register_placeholder_tools(mcp, manager):
                     height = placeholder.height.inches
 
                     # Render component to placeholder
-                    shape = await component_instance.render(
+                    await component_instance.render(
                         slide=slide,
                         left=left,
                         top=top,
@@ -295,8 +371,6 @@ def register_placeholder_tools(mcp, manager):
                     # Update presentation
                     await manager.update(presentation)
 
-                    from ...models import SuccessResponse
-
                     return SuccessResponse(
                         message=f"Populated placeholder {placeholder_idx} with {component_type} on slide {slide_index}"
                     ).model_dump_json()
@@ -321,19 +395,13 @@ def register_placeholder_tools(mcp, manager):
                 return ErrorResponse(error=ErrorMessages.NO_PRESENTATION).model_dump_json()
 
             # Validate slide index
-            if slide_index < 0 or slide_index >= len(prs.slides):
-                return ErrorResponse(
-                    error=f"Slide index {slide_index} not found. Presentation has {len(prs.slides)} slides."
-                ).model_dump_json()
-
-            slide = prs.slides[slide_index]
+            slides = prs.slides
+            slide = get_slide(slides, slide_index)
+            if slide is None:
+                return slide_not_found(slide_index, slides)
 
             # Find the placeholder by idx
-            placeholder = None
-            for shape in slide.placeholders:
-                if shape.placeholder_format.idx == placeholder_idx:
-                    placeholder = shape
-                    break
+            placeholder = find_placeholder(slide, placeholder_idx)
 
             if not placeholder:
                 # List available placeholders to help debugging
@@ -346,93 +414,133 @@ def register_placeholder_tools(mcp, manager):
                     f"Available placeholders: {', '.join(available) if available else 'none'}"
                 ).model_dump_json()
 
-            # Populate based on placeholder type
-            placeholder_type = placeholder.placeholder_format.type
+            error = _text_support_error(placeholder, placeholder_idx)
+            if error:
+                return ErrorResponse(error=error).model_dump_json()
 
-            # For TITLE (1), SUBTITLE (3), or simple text placeholders
-            if placeholder_type in (1, 3):  # TITLE or SUBTITLE
-                if hasattr(placeholder, "text_frame"):
-                    placeholder.text_frame.text = content
-                elif hasattr(placeholder, "text"):
-                    placeholder.text = content
-                else:
+            _set_placeholder_text(placeholder, content)
+
+            # Update in VFS
+            await manager.update(presentation)
+
+            pres_name = presentation or manager.get_current_name() or "presentation"
+
+            return SuccessResponse(
+                message=f"Populated placeholder {placeholder_idx} on slide {slide_index} in {pres_name}"
+            ).model_dump_json()
+
+        except Exception as e:
+            logger.error(f"Failed to populate placeholder: {e}", exc_info=True)
+            return ErrorResponse(error=str(e)).model_dump_json()
+
+    @mcp.tool
+    async def pptx_populate_placeholders(
+        slide_index: int,
+        placeholders: list[dict[str, Any]] | str,
+        presentation: str | None = None,
+    ) -> str:
+        """
+        Populate several text placeholders on one slide in a single call.
+
+        Every entry is checked before any text is written, so a bad entry leaves the
+        slide untouched. The presentation is saved once for the whole batch, which
+        makes this much cheaper than one pptx_populate_placeholder call per
+        placeholder when filling in a template slide.
+
+        Text follows the same rules as pptx_populate_placeholder: BODY and OBJECT
+        placeholders get one bullet per "\\n"-separated line. Use
+        pptx_populate_placeholder with dict content for tables, charts and images.
+
+        Args:
+            slide_index: Index of the slide (0-based)
+            placeholders: List of dicts (or a JSON string of that list). Each dict takes:
+                - placeholder_idx: Index of the placeholder to populate
+                - content: Text content for it
+            presentation: Name of presentation (uses current if not specified)
+
+        Returns:
+            JSON string with success/error message
+
+        Example:
+            await pptx_populate_placeholders(
+                slide_index=1,
+                placeholders=[
+                    {"placeholder_idx": 0, "content": "Q4 Highlights"},
+                    {"placeholder_idx": 1, "content": "Revenue up 20%\\nChurn down 5%"},
+                ],
+            )
+        """
+        try:
+            # Handle placeholders - could be a list or a JSON string
+            if isinstance(placeholders, str):
+                try:
+                    placeholders = json.loads(placeholders)
+                except json.JSONDecodeError as e:
                     return ErrorResponse(
-                        error=f"Placeholder {placeholder_idx} (type {placeholder_type}) "
-                        f"does not support text content"
+                        error=f"Invalid JSON in placeholders: {str(e)}"
                     ).model_dump_json()
+            if not isinstance(placeholders, list) or not placeholders:
+                return ErrorResponse(
+                    error="placeholders must be a non-empty list"
+                ).model_dump_json()
 
-            # For BODY (2) or OBJECT (7) - content placeholders that can have bullets
-            elif placeholder_type in (2, 7):  # BODY or OBJECT
-                if not hasattr(placeholder, "text_frame"):
+            entries: list[tuple[int, str]] = []
+            for i, entry in enumerate(placeholders):
+                if not isinstance(entry, dict):
                     return ErrorResponse(
-                        error=f"Placeholder {placeholder_idx} does not have a text frame"
+                        error=f"Placeholder entry {i} must be a dict, got {type(entry).__name__}"
                     ).model_dump_json()
-
-                text_frame = placeholder.text_frame
-                text_frame.clear()  # Clear existing content
-
-                # Split content by newlines to create bullet points
-                lines = content.split("\\n")
-                for idx, line in enumerate(lines):
-                    if idx == 0:
-                        # Use existing first paragraph
-                        p = text_frame.paragraphs[0]
-                    else:
-                        # Add new paragraphs for additional bullets
-                        p = text_frame.add_paragraph()
-                    p.text = line
-                    p.level = 0  # Top-level bullet
-
-            # For PICTURE, CHART, TABLE placeholders when given string content
-            # Handle intelligently - treat as text content for these placeholders
-            elif placeholder_type in (12, 14, 18):  # CHART, TABLE, PICTURE
-                # These placeholders can have text content too (caption, title, etc.)
-                # Try to populate as text if they have a text_frame
-                if hasattr(placeholder, "text_frame"):
-                    text_frame = placeholder.text_frame
-                    text_frame.text = content
-                elif hasattr(placeholder, "text"):
-                    placeholder.text = content
-                else:
-                    # Only error if we truly can't add text
-                    type_names = {12: "CHART", 14: "TABLE", 18: "PICTURE"}
-                    type_name = type_names.get(placeholder_type, "content")
+                placeholder_idx = entry.get("placeholder_idx")
+                content = entry.get("content")
+                if not isinstance(placeholder_idx, int):
                     return ErrorResponse(
-                        error=f"Placeholder {placeholder_idx} is a {type_name} placeholder without text capability. "
-                        f"Use dict content: pptx_populate_placeholder(placeholder_idx={placeholder_idx}, "
-                        f"content={{'type': 'Image/Table/ColumnChart', ...}})"
+                        error=f"Placeholder entry {i}: placeholder_idx must be an int"
                     ).model_dump_json()
+                if not isinstance(content, str):
+                    return ErrorResponse(
+                        error=f"Placeholder entry {i}: content must be a string, "
+                        f"got {type(content).__name__}"
+                    ).model_dump_json()
+                entries.append((placeholder_idx, content))
 
-            # Other placeholder types
-            else:
-                # Try to populate as text
-                if hasattr(placeholder, "text_frame"):
-                    placeholder.text_frame.text = content
-                elif hasattr(placeholder, "text"):
-                    placeholder.text = content
-                else:
+            prs = await manager.get_presentation(presentation)
+            if not prs:
+                return ErrorResponse(error=ErrorMessages.NO_PRESENTATION).model_dump_json()
+
+            slides = prs.slides
+            slide = get_slide(slides, slide_index)
+            if slide is None:
+                return slide_not_found(slide_index, slides)
+
+            # Resolve and check every placeholder before writing any text
+            targets = []
+            for placeholder_idx, content in entries:
+                placeholder = find_placeholder(slide, placeholder_idx)
+                if not placeholder:
                     return ErrorResponse(
-                        error=f"Placeholder {placeholder_idx} (type {placeholder_type}) "
-                        f"does not support text content"
+                        error=f"Placeholder {placeholder_idx} not found on slide {slide_index}"
                     ).model_dump_json()
+                error = _text_support_error(placeholder, placeholder_idx)
+                if error:
+                    return ErrorResponse(error=error).model_dump_json()
+                targets.append((placeholder, content))
 
-            # Update in VFS
+            for placeholder, content in targets:
+                _set_placeholder_text(placeholder, content)
+
+            # Save once for the whole batch
             await manager.update(presentation)
 
             pres_name = presentation or manager.get_current_name() or "presentation"
-
-            from ...models import SuccessResponse
-
             return SuccessResponse(
-                message=f"Populated placeholder {placeholder_idx} on slide {slide_index} in {pres_name}"
+                message=f"Populated {len(targets)} placeholders on slide {slide_index} in {pres_name}"
             ).model_dump_json()
 
         except Exception as e:
-            logger.error(f"Failed to populate placeholder: {e}", exc_info=True)
-            from ...models import ErrorResponse
-
+            logger.error(f"Failed to populate placeholders: {e}", exc_info=True)
             return ErrorResponse(error=str(e)).model_dump_json()
 
     return {
         "pptx_populate_placeholder": pptx_populate_placeholder,
+        "pptx_populate_placeholders": pptx_populate_placeholders,
     }
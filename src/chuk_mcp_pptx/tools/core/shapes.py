@@ -0,0 +1,230 @@
+"""
+Core Shape Tools
+
+Bulk shape insertion for building diagrams and flows in a single call.
+"""
+
+import json
+import logging
+import math
+from dataclasses import dataclass
+from typing import Any
+
+from ...components.core.shape import SHAPE_TYPES, Shape
+from ...constants import ErrorMessages
+from ...layout.helpers import position_changed, validate_position
+from ...models import ErrorResponse, SuccessResponse
+from ...tokens.colors import hex_to_rgb
+from .placeholder import get_slide
+
+logger = logging.getLogger(__name__)
+
+_POSITION_KEYS = ("left", "top", "width", "height")
+_COLOR_KEYS = ("fill_color", "line_color")
+_RESPONSE_FORMATS = ("text", "dict")
+
+
+@dataclass(slots=True, frozen=True)
+class ShapeSpec:
+    """A validated entry from a pptx_add_shapes batch."""
+
+    shape_type: str
+    left: float  # inches
+    top: float  # inches
+    width: float  # inches
+    height: float  # inches
+    text: str | None = None
+    fill_color: str | None = None
+    line_color: str | None = None
+    line_width: float = 1.0
+
+
+def _is_valid_color(color: Any) -> bool:
+    """Whether Shape can resolve color: a semantic path or a parseable '#rrggbb'."""
+    if not isinstance(color, str):
+        return False
+    if not color.startswith("#"):
+        return True
+    try:
+        hex_to_rgb(color)
+    except ValueError:
+        return False
+    return True
+
+
+def _to_float(value: Any) -> float | None:
+    """value as a finite float, or None if it is not numeric."""
+    try:
+        number = float(value)
+    except (TypeError, ValueError):
+        return None
+    return number if math.isfinite(number) else None
+
+
+def register_shape_tools(mcp, manager):
+    """Register bulk shape tools."""
+
+    @mcp.tool
+    async def pptx_add_shapes(
+        slide_index: int,
+        shapes: list[dict[str, Any]] | str,
+        presentation: str | None = None,
+        response_format: str = "text",
+    ) -> str | dict[str, Any]:
+        """
+        Add several shapes to a slide in one call.
+
+        Every shape is validated before anything is drawn, so a bad entry leaves
+        the slide untouched. The presentation is saved once after all shapes are
+        added, which makes this much cheaper than one pptx_add_component call per
+        shape when building diagrams, flows or other multi-shape layouts.
+
+        Args:
+            slide_index: Index of the slide (0-based)
+            shapes: List of shape dicts (or a JSON string of that list). Each dict takes:
+                - shape_type: Shape type (rectangle, oval, star, arrow, ...). Default "rectangle"
+                - left, top, width, height: Position and size in inches (required)
+                - text: Optional text content
+                - fill_color: Fill color (hex or semantic path like "primary.DEFAULT")
+                - line_color: Border color (hex or semantic path)
+                - line_width: Border width in points. Default 1.0
+            presentation: Name of presentation (uses current if not specified)
+            response_format: "text" (default) for a JSON string, or "dict" to get a
+                structured dict back (status, slide, shapes, adjusted) for
+                programmatic callers. Errors use the same format.
+
+        Returns:
+            JSON string (or dict) with success/error message
+
+        Example:
+            await pptx_add_shapes(
+                slide_index=1,
+                shapes=[
+                    {"shape_type": "rounded_rectangle", "text": "Plan",
+                     "left": 1.0, "top": 2.5, "width": 2.0, "height": 1.0},
+                    {"shape_type": "arrow_right",
+                     "left": 3.2, "top": 2.8, "width": 0.8, "height": 0.4},
+                    {"shape_type": "rounded_rectangle", "text": "Build",
+                     "left": 4.2, "top": 2.5, "width": 2.0, "height": 1.0},
+                ],
+            )
+        """
+        as_dict = response_format == "dict"
+
+        def _reply(response):
+            return response.model_dump() if as_dict else response.model_dump_json()
+
+        try:
+            if response_format not in _RESPONSE_FORMATS:
+                return _reply(
+                    ErrorResponse(
+                        error=f"Unknown response_format '{response_format}'. "
+                        f"Available: {', '.join(_RESPONSE_FORMATS)}"
+                    )
+                )
+
+            # Handle shapes - could be a list or a JSON string
+            if isinstance(shapes, str):
+                try:
+                    shapes = json.loads(shapes)
+                except json.JSONDecodeError as e:
+                    return _reply(ErrorResponse(error=f"Invalid JSON in shapes: {str(e)}"))
+            if not isinstance(shapes, list) or not shapes:
+                return _reply(ErrorResponse(error="shapes must be a non-empty list"))
+
+            # Validate every entry before touching the slide
+            specs: list[ShapeSpec] = []
+            adjusted = 0
+            for i, raw in enumerate(shapes):
+                if not isinstance(raw, dict):
+                    return _reply(
+                        ErrorResponse(error=f"Shape {i} must be a dict, got {type(raw).__name__}")
+                    )
+                shape_type = raw.get("shape_type", "rectangle")
+                if not isinstance(shape_type, str):
+                    return _reply(ErrorResponse(error=f"Shape {i}: invalid shape_type"))
+                if shape_type.lower() not in SHAPE_TYPES:
+                    return _reply(
+                        ErrorResponse(
+                            error=f"Shape {i}: unknown shape_type '{shape_type}'. "
+                            f"Available: {', '.join(SHAPE_TYPES)}"
+                        )
+                    )
+                missing = [key for key in _POSITION_KEYS if raw.get(key) is None]
+                if missing:
+                    return _reply(ErrorResponse(error=f"Shape {i}: missing {', '.join(missing)}"))
+                text = raw.get("text")
+                invalid = [
+                    key
+                    for key in _COLOR_KEYS
+                    if raw.get(key) is not None and not _is_valid_color(raw[key])
+                ]
+                if text is not None and not isinstance(text, str):
+                    invalid.append("text")
+                numbers: dict[str, float] = {}
+                for key, value in (
+                    *((key, raw[key]) for key in _POSITION_KEYS),
+                    ("line_width", raw.get("line_width", 1.0)),
+                ):
+                    number = _to_float(value)
+                    if number is None:
+                        invalid.append(key)
+                    else:
+                        numbers[key] = number
+                if invalid:
+                    return _reply(ErrorResponse(error=f"Shape {i}: invalid {', '.join(invalid)}"))
+                left, top, width, height = (numbers[key] for key in _POSITION_KEYS)
+                validated = validate_position(left, top, width, height)
+                adjusted += position_changed((left, top, width, height), validated)
+                specs.append(
+                    ShapeSpec(
+                        shape_type,
+                        *validated,
+                        text=text,
+                        fill_color=raw.get("fill_color"),
+                        line_color=raw.get("line_color"),
+                        line_width=numbers["line_width"],
+                    )
+                )
+
+            result = await manager.get(presentation)
+            if not result:
+                return _reply(ErrorResponse(error=ErrorMessages.NO_PRESENTATION))
+
+            prs, metadata = result
+
+            slide = get_slide(prs.slides, slide_index)
+            if slide is None:
+                return _reply(
+                    ErrorResponse(error=ErrorMessages.SLIDE_NOT_FOUND.format(index=slide_index))
+                )
+
+            for spec in specs:
+                Shape(
+                    shape_type=spec.shape_type,
+                    text=spec.text,
+                    fill_color=spec.fill_color,
+                    line_color=spec.line_color,
+                    line_width=spec.line_width,
+                ).render(slide, left=spec.left, top=spec.top, width=spec.width, height=spec.height)
+
+            # Save once for the whole batch
+            await manager.update_slide_metadata(slide_index)
+            await manager.update(presentation)
+
+            if as_dict:
+                return {
+                    "status": "ok",
+                    "slide": slide_index,
+                    "shapes": len(specs),
+                    "adjusted": adjusted,
+                }
+            return SuccessResponse(
+                message=f"Added {len(specs)} shapes to slide {slide_index}"
+            ).model_dump_json()
+
+        except Exception as e:
+            logger.error(f"Failed to add shapes: {e}")
+            return _reply(ErrorResponse(error=str(e)))
+
+    return {"pptx_add_shapes": pptx_add_shapes}
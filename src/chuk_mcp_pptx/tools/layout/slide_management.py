@@ -19,15 +19,29 @@ from ...constants import (
 )
 
 from pptx.util import Inches, Pt
+from pptx.dml.color import RGBColor
 from pptx.enum.text import PP_ALIGN
-from pptx.enum.shapes import MSO_SHAPE_TYPE
+from pptx.enum.shapes import MSO_SHAPE_TYPE, PP_PLACEHOLDER
+
+from ...themes.theme_manager import ThemeManager
+from ...tokens.colors import cached_rgb
 
 # Import design system typography tokens
 from ...tokens.typography import FONT_SIZES
 
 
-def register_layout_tools(mcp, manager):
+def _parse_hex_color(color: str) -> RGBColor | None:
+    """Parse a "#RRGGBB" or "RRGGBB" string, returning None if it is malformed."""
+    try:
+        return cached_rgb(color)
+    except ValueError:
+        return None
+
+
+def register_layout_tools(mcp, manager, theme_manager=None):
     """Register all layout-related tools with the MCP server."""
+    if theme_manager is None:
+        theme_manager = ThemeManager()
 
     # ========================================================================
     # TRADITIONAL LAYOUT MANAGEMENT TOOLS
@@ -175,14 +189,17 @@ def register_layout_tools(mcp, manager):
             # Add slide with this layout
             slide = prs.slides.add_slide(layout)
 
+            # Resolve the title once; shapes.title walks the shape tree on each access
+            title_shape = slide.shapes.title
+
             # Populate placeholders
-            if title and slide.shapes.title:
-                slide.shapes.title.text = title
+            if title and title_shape:
+                title_shape.text = title
 
             # Handle different placeholder types
             for shape in slide.placeholders:
                 # Skip if already handled
-                if shape == slide.shapes.title:
+                if shape == title_shape:
                     continue
 
                 # Handle subtitle placeholder
@@ -208,9 +225,6 @@ def register_layout_tools(mcp, manager):
 
             # Apply presentation theme to the slide
             if metadata and metadata.theme:
-                from ...themes.theme_manager import ThemeManager
-
-                theme_manager = ThemeManager()
                 theme_obj = theme_manager.get_theme(metadata.theme)
                 if theme_obj:
                     theme_obj.apply_to_slide(slide)
@@ -222,8 +236,6 @@ def register_layout_tools(mcp, manager):
             layout_name = str(layout.name)
 
             # Analyze placeholders on the new slide
-            from pptx.enum.shapes import PP_PLACEHOLDER
-
             placeholder_info = []
             chart_placeholders = []
             picture_placeholders = []
@@ -323,33 +335,27 @@ def register_layout_tools(mcp, manager):
 
             prs, metadata = result
 
-            if slide_index >= len(prs.slides):
+            slides = prs.slides
+            if slide_index >= len(slides):
                 return ErrorResponse(
                     error=f"Slide index {slide_index} not found in presentation"
                 ).model_dump_json()
 
-            slide = prs.slides[slide_index]
+            slide = slides[slide_index]
             customizations = []
+            # Only set once something is actually written to the slide
+            changed = False
 
             # Set background color
             if background_color:
-                from pptx.dml.color import RGBColor
-
-                # Parse hex color
-                bg_color = (
-                    background_color[1:] if background_color.startswith("#") else background_color
-                )
-
-                try:
-                    r = int(bg_color[0:2], 16)
-                    g = int(bg_color[2:4], 16)
-                    b = int(bg_color[4:6], 16)
-
+                bg_rgb = _parse_hex_color(background_color)
+                if bg_rgb is not None:
                     fill = slide.background.fill
                     fill.solid()
-                    fill.fore_color.rgb = RGBColor(r, g, b)
-                    customizations.append(f"background color {bg_color}")
-                except (ValueError, AttributeError):
+                    fill.fore_color.rgb = bg_rgb
+                    customizations.append(f"background color {bg_rgb}")
+                    changed = True
+                else:
                     customizations.append("background color (failed - invalid format)")
 
             # Add footer
@@ -361,6 +367,7 @@ def register_layout_tools(mcp, manager):
                 footer_box.text_frame.paragraphs[0].alignment = PP_ALIGN.CENTER
                 footer_box.text_frame.paragraphs[0].font.size = Pt(FONT_SIZES["xs"])
                 customizations.append("footer text")
+                changed = True
 
             # Add page number
             if add_page_number:
@@ -371,6 +378,7 @@ def register_layout_tools(mcp, manager):
                 page_box.text_frame.paragraphs[0].alignment = PP_ALIGN.RIGHT
                 page_box.text_frame.paragraphs[0].font.size = Pt(FONT_SIZES["xs"])
                 customizations.append("page number")
+                changed = True
 
             # Add date
             if add_date:
@@ -380,9 +388,11 @@ def register_layout_tools(mcp, manager):
                 date_box.text_frame.text = add_date
                 date_box.text_frame.paragraphs[0].font.size = Pt(FONT_SIZES["xs"])
                 customizations.append("date")
+                changed = True
 
-            # Update in VFS if enabled
-            await manager.update(presentation)
+            # Skip the save when nothing was written
+            if changed:
+                await manager.update(presentation)
 
             if customizations:
                 return SuccessResponse(
@@ -435,49 +445,28 @@ def register_layout_tools(mcp, manager):
 
             prs, metadata = result
 
-            from pptx.dml.color import RGBColor
+            # Parse colors (malformed values are ignored)
+            title_rgb = _parse_hex_color(title_color) if title_color else None
+            body_rgb = _parse_hex_color(body_color) if body_color else None
 
-            # Parse colors
-            title_rgb = None
-            body_rgb = None
-
-            if title_color:
-                t_color = title_color[1:] if title_color.startswith("#") else title_color
-                try:
-                    r = int(t_color[0:2], 16)
-                    g = int(t_color[2:4], 16)
-                    b = int(t_color[4:6], 16)
-                    title_rgb = RGBColor(r, g, b)
-                except (ValueError, IndexError):
-                    pass
-
-            if body_color:
-                b_color = body_color[1:] if body_color.startswith("#") else body_color
-                try:
-                    r = int(b_color[0:2], 16)
-                    g = int(b_color[2:4], 16)
-                    b = int(b_color[4:6], 16)
-                    body_rgb = RGBColor(r, g, b)
-                except (ValueError, IndexError):
-                    pass
-
-            # Apply to all slides
+            # Apply to all slides (nothing to do, and nothing to save, without settings)
             slides_updated = 0
+            slides = prs.slides if font_name or title_rgb or body_rgb else ()
 
-            for slide in prs.slides:
+            for slide in slides:
                 # Update title formatting
-                if slide.shapes.title:
-                    title = slide.shapes.title
-                    if font_name:
-                        for paragraph in title.text_frame.paragraphs:
+                title_shape = slide.shapes.title
+                if title_shape:
+                    # One pass over the title's paragraphs for both settings
+                    for paragraph in title_shape.text_frame.paragraphs:
+                        if font_name:
                             paragraph.font.name = font_name
-                    if title_rgb:
-                        for paragraph in title.text_frame.paragraphs:
+                        if title_rgb:
                             paragraph.font.color.rgb = title_rgb
 
                 # Update body text formatting
                 for shape in slide.shapes:
-                    if shape.has_text_frame and shape != slide.shapes.title:
+                    if shape.has_text_frame and shape != title_shape:
                         for paragraph in shape.text_frame.paragraphs:
                             if font_name:
                                 paragraph.font.name = font_name
@@ -487,7 +476,8 @@ def register_layout_tools(mcp, manager):
                 slides_updated += 1
 
             # Update in VFS if enabled
-            await manager.update(presentation)
+            if slides_updated:
+                await manager.update(presentation)
 
             settings = []
             if font_name:
@@ -529,16 +519,19 @@ def register_layout_tools(mcp, manager):
 
             prs, metadata = result
 
-            if slide_index >= len(prs.slides):
+            slides = prs.slides
+            if slide_index >= len(slides):
                 return ErrorResponse(
                     error=f"Slide index {slide_index} not found in presentation"
                 ).model_dump_json()
 
             # Get the source slide
-            source_slide = prs.slides[slide_index]
+            source_slide = slides[slide_index]
 
             # Create new slide with same layout
-            new_slide = prs.slides.add_slide(source_slide.slide_layout)
+            new_slide = slides.add_slide(source_slide.slide_layout)
+
+            source_title = source_slide.shapes.title
 
             # Copy shapes (simplified - full duplication would require more complex logic)
             for shape in source_slide.shapes:
@@ -549,7 +542,7 @@ def register_layout_tools(mcp, manager):
                     )
                     if shape.has_text_frame:
                         new_shape.text_frame.text = shape.text_frame.text
-                elif hasattr(shape, "text") and shape != source_slide.shapes.title:
+                elif hasattr(shape, "text") and shape != source_title:
                     # Copy other text content
                     try:
                         for new_shape in new_slide.shapes:
@@ -561,13 +554,14 @@ def register_layout_tools(mcp, manager):
                         pass
 
             # Copy title if exists
-            if source_slide.shapes.title and new_slide.shapes.title:
-                new_slide.shapes.title.text = source_slide.shapes.title.text
+            new_title = new_slide.shapes.title
+            if source_title and new_title:
+                new_title.text = source_title.text
 
             # Update in VFS if enabled
             await manager.update(presentation)
 
-            new_idx = len(prs.slides) - 1
+            new_idx = len(slides) - 1
             return SuccessResponse(
                 message=f"Duplicated slide {slide_index} as new slide {new_idx}"
             ).model_dump_json()
@@ -603,12 +597,13 @@ def register_layout_tools(mcp, manager):
 
             prs, metadata = result
 
-            if slide_index >= len(prs.slides):
+            slide_count = len(prs.slides)
+            if slide_index >= slide_count:
                 return ErrorResponse(
                     error=f"Slide index {slide_index} not found in presentation"
                 ).model_dump_json()
 
-            if new_position >= len(prs.slides):
+            if new_position >= slide_count:
                 return SuccessResponse(
                     message=f"Error: New position {new_position} out of range"
                 ).model_dump_json()
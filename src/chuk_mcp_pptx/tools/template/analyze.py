@@ -5,6 +5,7 @@ Provides tools to analyze template layouts, placeholders, and structure.
 All responses use Pydantic models for type safety.
 """
 
+import asyncio
 import io
 import logging
 from pptx import Presentation
@@ -100,7 +101,7 @@ def register_analyze_tools(mcp, manager, template_manager):
             if template_data:
                 # Load builtin template
                 buffer = io.BytesIO(template_data)
-                prs = Presentation(buffer)
+                prs = await asyncio.to_thread(Presentation, buffer)
                 metadata = None
             else:
                 # Get from artifact store
@@ -179,7 +180,7 @@ def register_analyze_tools(mcp, manager, template_manager):
             if template_data:
                 # Load builtin template
                 buffer = io.BytesIO(template_data)
-                prs = Presentation(buffer)
+                prs = await asyncio.to_thread(Presentation, buffer)
             else:
                 # Get from artifact store
                 result = await manager.get(template_name)
@@ -170,7 +170,7 @@ def _rgb_to_hex(rgb_color) -> str:
             rgb = rgb_color.rgb
             return f"#{rgb[0]:02x}{rgb[1]:02x}{rgb[2]:02x}"
         return "#000000"
-    except Exception:
+    except (TypeError, IndexError):
         return "#000000"
 
 
@@ -220,14 +220,14 @@ def _extract_colors_from_shapes(slide) -> list[str]:
 
     try:
         for shape in slide.shapes:
-            # Extract fill colors
-            if hasattr(shape, "fill") and shape.fill:
+            # Extract fill colors; unfilled shapes raise TypeError on fore_color
+            fill = getattr(shape, "fill", None)
+            if fill and fill.type is not None:
                 try:
-                    if hasattr(shape.fill, "fore_color"):
-                        hex_color = _rgb_to_hex(shape.fill.fore_color)
-                        if hex_color != "#000000":
-                            colors.add(hex_color)
-                except Exception:
+                    hex_color = _rgb_to_hex(fill.fore_color)
+                    if hex_color != "#000000":
+                        colors.add(hex_color)
+                except TypeError:
                     pass
 
             # Extract line colors
@@ -237,7 +237,7 @@ def _extract_colors_from_shapes(slide) -> list[str]:
                         hex_color = _rgb_to_hex(shape.line.color)
                         if hex_color != "#000000":
                             colors.add(hex_color)
-                except Exception:
+                except TypeError:
                     pass
 
             # Extract text colors
@@ -745,24 +745,31 @@ def register_extraction_tools(mcp, manager, theme_manager):
             result = await manager.get(presentation)
             if not result:
                 from ...models import ErrorResponse
-            return ErrorResponse(error=f"Presentation not found: {presentation}").model_dump_json()
+
+                return ErrorResponse(
+                    error=f"Presentation not found: {presentation}"
+                ).model_dump_json()
 
             gen_prs, _ = result
 
-            if slide_index >= len(gen_prs.slides):
+            gen_slides = gen_prs.slides
+            gen_slide_count = len(gen_slides)
+            if slide_index >= gen_slide_count:
                 from ...models import ErrorResponse
-            return ErrorResponse(
-                error=f"Slide index {slide_index} out of range (max {len(gen_prs.slides) - 1})"
-            ).model_dump_json()
 
-            gen_slide = gen_prs.slides[slide_index]
+                return ErrorResponse(
+                    error=f"Slide index {slide_index} out of range (max {gen_slide_count - 1})"
+                ).model_dump_json()
+
+            gen_slide = gen_slides[slide_index]
             layout_name = gen_slide.slide_layout.name
 
             # Get template presentation
             template_result = await manager.get(template_name)
             if not template_result:
                 from ...models import ErrorResponse
-            return ErrorResponse(error=f"Template not found: {template_name}").model_dump_json()
+
+                return ErrorResponse(error=f"Template not found: {template_name}").model_dump_json()
 
             template_prs, _ = template_result
 
@@ -770,12 +777,13 @@ def register_extraction_tools(mcp, manager, theme_manager):
             template_slide = None
             template_idx = template_slide_index
 
+            template_slides = template_prs.slides
             if template_slide_index is not None:
-                if template_slide_index < len(template_prs.slides):
-                    template_slide = template_prs.slides[template_slide_index]
+                if template_slide_index < len(template_slides):
+                    template_slide = template_slides[template_slide_index]
             else:
                 # Find first slide using this layout
-                for idx, slide in enumerate(template_prs.slides):
+                for idx, slide in enumerate(template_slides):
                     if slide.slide_layout.name == layout_name:
                         template_slide = slide
                         template_idx = idx
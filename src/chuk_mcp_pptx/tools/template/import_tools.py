@@ -5,6 +5,7 @@ Provides tools to import templates from files or builtin sources.
 All responses use Pydantic models for type safety.
 """
 
+import asyncio
 import io
 import logging
 from pptx import Presentation
@@ -97,7 +98,7 @@ def register_import_tools(mcp, manager, template_manager):
 
             # Verify it's a valid presentation
             buffer = io.BytesIO(template_data)
-            prs = Presentation(buffer)
+            prs = await asyncio.to_thread(Presentation, buffer)
 
             # Create namespace for template
             safe_name = manager._sanitize_name(save_as)
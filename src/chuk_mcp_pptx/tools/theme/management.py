@@ -7,6 +7,8 @@ Consolidates all theme-related functionality including design tokens.
 """
 
 import json
+from functools import lru_cache
+
 from ...tokens.colors import PALETTE, get_semantic_tokens
 from ...tokens.typography import (
     FONT_FAMILIES,
@@ -20,12 +22,51 @@ from ...tokens.spacing import SPACING, PADDING, MARGINS, RADIUS
 from ...constants import (
     ErrorMessages,
 )
+from ...themes.theme_manager import Theme, ThemeManager
+
+
+@lru_cache(maxsize=1)
+def _theme_list_text(themes: tuple[tuple[str, Theme], ...]) -> str:
+    """Format the theme listing; cached on the registry contents, so it is rebuilt on change."""
+    theme_list = []
+    for theme_name, theme_obj in themes:
+        mode = theme_obj.mode
+        # Access primary color through property
+        primary = (
+            theme_obj.primary.get("DEFAULT", "N/A")
+            if isinstance(theme_obj.primary, dict)
+            else "N/A"
+        )
+        theme_list.append(f"• {theme_name} ({mode}): Primary: {primary}")
+
+    return "Available themes:\n" + "\n".join(theme_list)
+
+
+_COMPONENT_THEME_STYLES = {
+    "card": "Default card styling with neutral background",
+    "primary": "Primary color styling (brand color)",
+    "secondary": "Secondary color styling (subtle)",
+    "accent": "Accent color styling (highlight)",
+    "muted": "Muted styling (low emphasis)",
+}
+
+# The style listing is static; format it once at import
+_COMPONENT_THEME_STYLES_TEXT = "Available component theme styles:\n" + "\n".join(
+    f"• {name}: {desc}" for name, desc in _COMPONENT_THEME_STYLES.items()
+)
 
 
-def register_theme_tools(mcp, manager):
-    """Register all theme-related tools with the MCP server."""
+def register_theme_tools(mcp, manager, theme_manager=None):
+    """
+    Register all theme-related tools with the MCP server.
 
-    from ...themes.theme_manager import ThemeManager
+    Args:
+        mcp: The MCP server instance
+        manager: PresentationManager instance
+        theme_manager: Optional ThemeManager shared with the other tool groups
+    """
+    if theme_manager is None:
+        theme_manager = ThemeManager()
 
     @mcp.tool
     async def pptx_list_themes() -> str:
@@ -47,24 +88,7 @@ def register_theme_tools(mcp, manager):
             # • light (light): Primary: #2563eb
             # ...
         """
-        theme_manager = ThemeManager()
-        themes = theme_manager.list_themes()
-
-        theme_list = []
-        for theme_name in themes:
-            theme_obj = theme_manager.get_theme(theme_name)
-            if theme_obj is None:
-                continue
-            mode = theme_obj.mode
-            # Access primary color through property
-            primary = (
-                theme_obj.primary.get("DEFAULT", "N/A")
-                if isinstance(theme_obj.primary, dict)
-                else "N/A"
-            )
-            theme_list.append(f"• {theme_name} ({mode}): Primary: {primary}")
-
-        return "Available themes:\n" + "\n".join(theme_list)
+        return _theme_list_text(tuple(theme_manager.themes.items()))
 
     @mcp.tool
     async def pptx_get_theme_info(theme_name: str) -> str:
@@ -85,7 +109,6 @@ def register_theme_tools(mcp, manager):
             # Returns theme configuration with all colors and settings
         """
 
-        theme_manager = ThemeManager()
         info = theme_manager.get_theme_info(theme_name)
 
         if not info:
@@ -228,31 +251,28 @@ def register_theme_tools(mcp, manager):
             await pptx_apply_theme(slide_index=0, theme="corporate")
         """
         try:
+            # Reject bad arguments before loading the presentation
+            if slide_index is not None and slide_index < 0:
+                return f"Error: Slide index {slide_index} out of range"
+
+            # One dict lookup; the name list is only built for the error
+            theme_obj = theme_manager.get_theme(theme)
+
+            if theme_obj is None:
+                available_themes = ", ".join(theme_manager.list_themes()[:10])
+                return f"Error: Unknown theme '{theme}'. Available: {available_themes}"
+
             result = await manager.get(presentation)
             if not result:
                 return ErrorMessages.NO_PRESENTATION
 
             prs, metadata = result
 
-            theme_manager = ThemeManager()
-            available_themes = theme_manager.list_themes()
-
-            if theme not in available_themes:
-                return (
-                    f"Error: Unknown theme '{theme}'. Available: {', '.join(available_themes[:10])}"
-                )
-
-            theme_obj = theme_manager.get_theme(theme)
-
-            if theme_obj is None:
-                return f"Error: Could not load theme '{theme}'"
-
+            slides = prs.slides
             if slide_index is not None:
-                if slide_index >= len(prs.slides):
+                if slide_index >= len(slides):
                     return f"Error: Slide index {slide_index} out of range"
-                slides = [prs.slides[slide_index]]
-            else:
-                slides = prs.slides
+                slides = [slides[slide_index]]
 
             # Apply theme to slides using the theme's built-in method
             for slide in slides:
@@ -302,31 +322,33 @@ def register_theme_tools(mcp, manager):
             )
         """
         try:
+            # Reject bad arguments before loading the presentation
+            if slide_index < 0:
+                return f"Error: Slide index {slide_index} out of range"
+            if shape_index < 0:
+                return f"Error: Shape index {shape_index} out of range"
+
             result = await manager.get(presentation)
             if not result:
                 return ErrorMessages.NO_PRESENTATION
 
             prs, metadata = result
 
-            if slide_index >= len(prs.slides):
+            slides = prs.slides
+            if slide_index >= len(slides):
                 return f"Error: Slide index {slide_index} out of range"
 
-            slide = prs.slides[slide_index]
+            slide = slides[slide_index]
 
             if shape_index >= len(slide.shapes):
                 return f"Error: Shape index {shape_index} out of range"
 
             shape = slide.shapes[shape_index]
 
-            theme_manager = ThemeManager()
-            theme_obj = theme_manager.get_theme("dark")  # Get default theme
-
-            if theme_obj:
-                theme_obj.apply_to_shape(shape, style=theme_style)
-                await manager.update(presentation)
-                return f"Applied {theme_style} theme to shape {shape_index} on slide {slide_index}"
-            else:
-                return "Error: No default theme available"
+            theme_obj = theme_manager.resolve()  # Default theme
+            theme_obj.apply_to_shape(shape, style=theme_style)
+            await manager.update(presentation)
+            return f"Applied {theme_style} theme to shape {shape_index} on slide {slide_index}"
 
         except Exception as e:
             return f"Error applying component theme: {str(e)}"
@@ -346,16 +368,7 @@ def register_theme_tools(mcp, manager):
             themes = await pptx_list_component_themes()
             # Returns available style variants
         """
-        styles = {
-            "card": "Default card styling with neutral background",
-            "primary": "Primary color styling (brand color)",
-            "secondary": "Secondary color styling (subtle)",
-            "accent": "Accent color styling (highlight)",
-            "muted": "Muted styling (low emphasis)",
-        }
-
-        style_list = [f"• {name}: {desc}" for name, desc in styles.items()]
-        return "Available component theme styles:\n" + "\n".join(style_list)
+        return _COMPONENT_THEME_STYLES_TEXT
 
     # Design Token Tools
     @mcp.tool
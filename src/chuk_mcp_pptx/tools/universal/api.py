@@ -10,12 +10,55 @@ Single unified tool for adding components anywhere:
 All with automatic design system resolution.
 """
 
+import asyncio
+import inspect
+import json
 import logging
 from typing import Any
+from pptx.enum.shapes import MSO_SHAPE_TYPE, PP_PLACEHOLDER
 from pptx.util import Inches
 
+from ...components.core.stack import Stack
+from ...components.registry import get_component_class
+from ...components.tracking import component_tracker
+from ...constants import ErrorMessages
+from ...layout.helpers import validate_position
+from ...models import (
+    ComponentInfo,
+    ComponentListResponse,
+    ComponentPosition,
+    ComponentResponse,
+    ComponentTarget,
+    ErrorResponse,
+    ImageStatus,
+    LayoutType,
+    PlaceholderStatus,
+    TargetType,
+    ValidationWarning,
+)
+from ...themes.design_system import resolve_design_system
+from ..core.placeholder import find_placeholder, get_slide, slide_not_found
+
 logger = logging.getLogger(__name__)
 
+_CHART_PLACEHOLDERS = frozenset({PP_PLACEHOLDER.CHART, PP_PLACEHOLDER.OBJECT})
+
+# Placeholder types each component should be placed into instead of free-form positioning
+_COMPONENT_PLACEHOLDER_TYPES = {
+    "Table": frozenset({PP_PLACEHOLDER.TABLE, PP_PLACEHOLDER.OBJECT}),
+    "ColumnChart": _CHART_PLACEHOLDERS,
+    "BarChart": _CHART_PLACEHOLDERS,
+    "LineChart": _CHART_PLACEHOLDERS,
+    "AreaChart": _CHART_PLACEHOLDERS,
+    "PieChart": _CHART_PLACEHOLDERS,
+    "DoughnutChart": _CHART_PLACEHOLDERS,
+    "ScatterChart": _CHART_PLACEHOLDERS,
+    "BubbleChart": _CHART_PLACEHOLDERS,
+    "WaterfallChart": _CHART_PLACEHOLDERS,
+    "SparklineChart": _CHART_PLACEHOLDERS,
+    "Image": frozenset({PP_PLACEHOLDER.PICTURE, PP_PLACEHOLDER.OBJECT}),
+}
+
 
 def register_universal_component_api(mcp, manager):
     """Register the universal component API tools."""
@@ -132,21 +175,6 @@ def register_universal_component_api(mcp, manager):
             # ✅ All good! Safe to move to next slide
         """
         try:
-            from ...models import (
-                ErrorResponse,
-                ComponentListResponse,
-                ComponentInfo,
-                ComponentPosition,
-                ComponentTarget,
-                TargetType,
-                PlaceholderStatus,
-                ImageStatus,
-                ValidationWarning,
-            )
-            from ...components.tracking import component_tracker
-            from ...constants import ErrorMessages
-            from pptx.enum.shapes import MSO_SHAPE_TYPE
-
             # Get presentation
             result = await manager.get(presentation)
             if not result:
@@ -155,12 +183,10 @@ def register_universal_component_api(mcp, manager):
             prs, metadata = result
 
             # Validate slide index
-            if slide_index < 0 or slide_index >= len(prs.slides):
-                return ErrorResponse(
-                    error=f"Slide index {slide_index} not found. Presentation has {len(prs.slides)} slides."
-                ).model_dump_json()
-
-            slide = prs.slides[slide_index]
+            slides = prs.slides
+            slide = get_slide(slides, slide_index)
+            if slide is None:
+                return slide_not_found(slide_index, slides)
 
             # Get all components on slide
             components = component_tracker.list_on_slide(metadata.name, slide_index)
@@ -353,8 +379,6 @@ def register_universal_component_api(mcp, manager):
 
         except Exception as e:
             logger.error(f"Failed to list components: {e}")
-            from ...models import ErrorResponse
-
             return ErrorResponse(error=str(e)).model_dump_json()
 
     @mcp.tool
@@ -521,12 +545,6 @@ def register_universal_component_api(mcp, manager):
             )
         """
         try:
-            import json
-            from ...models import ErrorResponse, ComponentResponse
-            from ...themes.design_system import resolve_design_system
-            from ...components.registry import get_component_class
-            from ...constants import ErrorMessages
-
             # Handle params - could be dict, JSON string, or None
             if params is None:
                 params = {}
@@ -550,12 +568,10 @@ def register_universal_component_api(mcp, manager):
             prs, metadata = result
 
             # Validate slide index
-            if slide_index < 0 or slide_index >= len(prs.slides):
-                return ErrorResponse(
-                    error=f"Slide index {slide_index} not found. Presentation has {len(prs.slides)} slides."
-                ).model_dump_json()
-
-            slide = prs.slides[slide_index]
+            slides = prs.slides
+            slide = get_slide(slides, slide_index)
+            if slide is None:
+                return slide_not_found(slide_index, slides)
 
             # Determine target and positioning
             target_placeholder_obj = None
@@ -564,28 +580,10 @@ def register_universal_component_api(mcp, manager):
             # VALIDATION: Check if using free-form positioning for content that should use placeholders
             if target_placeholder is None and target_component is None and left is not None:
                 # This is free-form positioning - check if slide has appropriate placeholders
-                from pptx.enum.shapes import PP_PLACEHOLDER
-
-                # Map component types to placeholder types they should use
-                component_to_placeholder_map = {
-                    "Table": [PP_PLACEHOLDER.TABLE, PP_PLACEHOLDER.OBJECT],
-                    "ColumnChart": [PP_PLACEHOLDER.CHART, PP_PLACEHOLDER.OBJECT],
-                    "BarChart": [PP_PLACEHOLDER.CHART, PP_PLACEHOLDER.OBJECT],
-                    "LineChart": [PP_PLACEHOLDER.CHART, PP_PLACEHOLDER.OBJECT],
-                    "AreaChart": [PP_PLACEHOLDER.CHART, PP_PLACEHOLDER.OBJECT],
-                    "PieChart": [PP_PLACEHOLDER.CHART, PP_PLACEHOLDER.OBJECT],
-                    "DoughnutChart": [PP_PLACEHOLDER.CHART, PP_PLACEHOLDER.OBJECT],
-                    "ScatterChart": [PP_PLACEHOLDER.CHART, PP_PLACEHOLDER.OBJECT],
-                    "BubbleChart": [PP_PLACEHOLDER.CHART, PP_PLACEHOLDER.OBJECT],
-                    "WaterfallChart": [PP_PLACEHOLDER.CHART, PP_PLACEHOLDER.OBJECT],
-                    "SparklineChart": [PP_PLACEHOLDER.CHART, PP_PLACEHOLDER.OBJECT],
-                    "Image": [PP_PLACEHOLDER.PICTURE, PP_PLACEHOLDER.OBJECT],
-                }
-
-                if component in component_to_placeholder_map:
+                placeholder_types = _COMPONENT_PLACEHOLDER_TYPES.get(component)
+                if placeholder_types:
                     # Check if slide has matching placeholders
                     available_placeholders = []
-                    placeholder_types = component_to_placeholder_map[component]
 
                     for shape in slide.placeholders:
                         try:
@@ -619,11 +617,7 @@ def register_universal_component_api(mcp, manager):
 
             # MODE 1: Target placeholder
             if target_placeholder is not None:
-                # Find placeholder
-                for shape in slide.placeholders:
-                    if shape.placeholder_format.idx == target_placeholder:
-                        target_placeholder_obj = shape
-                        break
+                target_placeholder_obj = find_placeholder(slide, target_placeholder)
 
                 if not target_placeholder_obj:
                     return ErrorResponse(
@@ -658,8 +652,6 @@ def register_universal_component_api(mcp, manager):
 
             # MODE 2: Target component (composition)
             elif target_component is not None:
-                from ...components.tracking import component_tracker
-
                 # Get parent component tracking info
                 parent_tracked = component_tracker.get(
                     presentation=metadata.name,
@@ -689,8 +681,6 @@ def register_universal_component_api(mcp, manager):
                 parent_left, parent_top, parent_width, parent_height = parent_bounds
 
                 # Check if parent is a Stack - if so, use its distribute logic
-                from ...components.core.stack import Stack
-
                 if parent_instance and isinstance(parent_instance, Stack):
                     # Get current child count for this stack
                     children = component_tracker.get_children(
@@ -738,9 +728,6 @@ def register_universal_component_api(mcp, manager):
 
             # MODE 3: Target layout (grid/flex positioning)
             elif target_layout is not None:
-                from ...components.tracking import component_tracker
-                from ...models import LayoutType, TargetType
-
                 # Get existing components in this layout on this slide
                 all_components = component_tracker.list_on_slide(metadata.name, slide_index)
                 layout_components = [
@@ -876,8 +863,6 @@ def register_universal_component_api(mcp, manager):
             }
 
             # Get component's __init__ signature to filter params
-            import inspect
-
             sig = inspect.signature(component_class.__init__)
             accepted_params = set(sig.parameters.keys()) - {"self"}
 
@@ -888,8 +873,6 @@ def register_universal_component_api(mcp, manager):
             component_instance = component_class(**filtered_params)
 
             # Check if render is async
-            import asyncio
-
             # Validate and adjust position to fit within slide bounds
             # This prevents overlapping with title areas and slide boundaries
             if (
@@ -898,8 +881,6 @@ def register_universal_component_api(mcp, manager):
                 and final_width is not None
                 and final_height is not None
             ):
-                from ...layout.helpers import validate_position
-
                 final_left, final_top, final_width, final_height = validate_position(
                     final_left, final_top, final_width, final_height
                 )
@@ -927,8 +908,6 @@ def register_universal_component_api(mcp, manager):
 
             # Track component in registry if component_id provided
             if component_id:
-                from ...components.tracking import component_tracker
-
                 # Get shape index (last shape added)
                 shape_index = len(slide.shapes) - 1 if slide.shapes else None
 
@@ -938,8 +917,6 @@ def register_universal_component_api(mcp, manager):
                     parent_id = target_component
 
                 # Determine target type using enum
-                from ...models import TargetType
-
                 target_id_value: str | int | None = None
                 if target_placeholder is not None:
                     target_type_value = TargetType.PLACEHOLDER.value
@@ -1003,8 +980,6 @@ def register_universal_component_api(mcp, manager):
 
         except Exception as e:
             logger.error(f"Failed to add component: {e}", exc_info=True)
-            from ...models import ErrorResponse
-
             return ErrorResponse(error=str(e)).model_dump_json()
 
     @mcp.tool
@@ -1068,12 +1043,6 @@ def register_universal_component_api(mcp, manager):
             )
         """
         try:
-            import json
-            from ...models import ErrorResponse, ComponentResponse
-            from ...components.tracking import component_tracker
-            from ...components.registry import get_component_class
-            from ...constants import ErrorMessages
-
             # Handle params - could be dict, JSON string, or None
             if params is None:
                 params = {}
@@ -1097,12 +1066,10 @@ def register_universal_component_api(mcp, manager):
             prs, metadata = result
 
             # Validate slide index
-            if slide_index < 0 or slide_index >= len(prs.slides):
-                return ErrorResponse(
-                    error=f"Slide index {slide_index} not found. Presentation has {len(prs.slides)} slides."
-                ).model_dump_json()
-
-            slide = prs.slides[slide_index]
+            slides = prs.slides
+            slide = get_slide(slides, slide_index)
+            if slide is None:
+                return slide_not_found(slide_index, slides)
 
             # Get existing component
             component_instance = component_tracker.get(
@@ -1148,8 +1115,6 @@ def register_universal_component_api(mcp, manager):
                     pass  # Shape may have been moved/deleted
 
             # Recreate component with new params/position
-            from ...themes.design_system import resolve_design_system
-
             design_system = resolve_design_system(
                 slide=slide, placeholder=None, theme=component_instance.theme, params=merged_params
             )
@@ -1230,8 +1195,6 @@ def register_universal_component_api(mcp, manager):
 
         except Exception as e:
             logger.error(f"Failed to update component: {e}", exc_info=True)
-            from ...models import ErrorResponse
-
             return ErrorResponse(error=str(e)).model_dump_json()
 
     return {
@@ -19,7 +19,6 @@ def register_registry_tools(mcp, manager):
     Returns:
         Dictionary of registered tools
     """
-    tools = {}
 
     @mcp.tool
     async def pptx_list_components(category: str | None = None) -> str:
@@ -60,18 +59,7 @@ def register_registry_tools(mcp, manager):
         else:
             component_names = registry.list_components()
 
-        components = []
-        for name in component_names:
-            metadata = registry.get(name)
-            if metadata:
-                components.append(
-                    {
-                        "name": name,
-                        "category": metadata.category.value,
-                        "description": metadata.description,
-                        "tags": metadata.tags,
-                    }
-                )
+        components = registry.summaries(component_names)
 
         return json.dumps(
             {"components": components, "count": len(components), "category_filter": category},
@@ -129,16 +117,7 @@ def register_registry_tools(mcp, manager):
 
         results = registry.search(query)
 
-        components = []
-        for metadata in results:
-            components.append(
-                {
-                    "name": metadata.name,
-                    "category": metadata.category.value,
-                    "description": metadata.description,
-                    "tags": metadata.tags,
-                }
-            )
+        components = registry.summaries(metadata.name for metadata in results)
 
         return json.dumps(
             {"query": query, "results": components, "count": len(components)}, indent=2
@@ -215,12 +194,14 @@ def register_registry_tools(mcp, manager):
 
         return registry.export_for_llm()
 
-    # Store tools for return
-    tools["pptx_list_components"] = pptx_list_components
-    tools["pptx_get_component_schema"] = pptx_get_component_schema
-    tools["pptx_search_components"] = pptx_search_components
-    tools["pptx_get_component_variants"] = pptx_get_component_variants
-    tools["pptx_get_component_examples"] = pptx_get_component_examples
-    tools["pptx_export_registry_docs"] = pptx_export_registry_docs
-
-    return tools
+    return {
+        tool.__name__: tool
+        for tool in (
+            pptx_list_components,
+            pptx_get_component_schema,
+            pptx_search_components,
+            pptx_get_component_variants,
+            pptx_get_component_examples,
+            pptx_export_registry_docs,
+        )
+    }
@@ -12,19 +12,20 @@ from ...constants import (
 )
 
 
-def register_semantic_tools(mcp, manager):
+def register_semantic_tools(mcp, manager, theme_manager=None):
     """
     Register high-level semantic tools with the MCP server.
 
     Args:
         mcp: ChukMCPServer instance
         manager: PresentationManager instance
+        theme_manager: Optional ThemeManager shared with the other tool groups
 
     Returns:
         Dictionary of registered tools
     """
-    tools = {}
-    theme_manager = ThemeManager()
+    if theme_manager is None:
+        theme_manager = ThemeManager()
 
     @mcp.tool
     async def pptx_create_quick_deck(
@@ -64,8 +65,13 @@ def register_semantic_tools(mcp, manager):
         slide_layout = prs.slide_layouts[SlideLayoutIndex.TITLE]
         slide = prs.slides.add_slide(slide_layout)
         slide.shapes.title.text = title
-        if subtitle and len(slide.placeholders) > 1:
-            slide.placeholders[1].text = subtitle
+        if subtitle:
+            # One walk of the shape tree; stops at the subtitle placeholder
+            subtitle_shape = next(
+                (ph for ph in slide.placeholders if ph.placeholder_format.idx == 1), None
+            )
+            if subtitle_shape is not None:
+                subtitle_shape.text = subtitle
 
         # Apply theme to title slide
         theme_obj = theme_manager.get_theme(theme)
@@ -75,11 +81,4 @@ def register_semantic_tools(mcp, manager):
         await manager.update(name)
         return f"Created '{name}' with title slide (theme: {theme})"
 
-    # Store tools for return
-    tools.update(
-        {
-            "pptx_create_quick_deck": pptx_create_quick_deck,
-        }
-    )
-
-    return tools
+    return {"pptx_create_quick_deck": pptx_create_quick_deck}
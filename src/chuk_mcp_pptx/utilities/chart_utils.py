@@ -8,7 +8,6 @@ Also contains legacy API functions for MCP tool compatibility.
 """
 
 from typing import List, Optional, Dict, Any
-from pptx.chart.data import CategoryChartData, XyChartData
 from pptx.enum.chart import XL_CHART_TYPE, XL_LEGEND_POSITION
 from pptx.util import Inches, Pt
 from pptx.dml.color import RGBColor
@@ -16,6 +15,14 @@ from pptx.dml.color import RGBColor
 # Import design system typography tokens
 from ..tokens.typography import FONT_SIZES, FONT_FAMILIES
 
+# Fixed add_data_table styling, built once instead of per cell
+_TABLE_HEADER_SIZE = Pt(12)
+_TABLE_BODY_SIZE = Pt(10)
+_DARK_HEADER_FILL = RGBColor(68, 68, 68)
+_DARK_HEADER_TEXT = RGBColor(255, 255, 255)
+_MEDIUM_HEADER_FILL = RGBColor(217, 217, 217)
+_MEDIUM_STRIPE_FILL = RGBColor(242, 242, 242)
+
 
 def configure_legend(
     chart,
@@ -233,6 +240,8 @@ def add_chart(
     Returns:
         The created chart shape
     """
+    from pptx.chart.data import CategoryChartData
+
     xl_chart_type = CHART_TYPES.get(chart_type, XL_CHART_TYPE.COLUMN_CLUSTERED)
 
     chart_data = CategoryChartData()
@@ -287,6 +296,8 @@ def add_scatter_chart(
     Returns:
         The created chart shape
     """
+    from pptx.chart.data import XyChartData
+
     chart_data = XyChartData()
 
     for series in series_data:
@@ -349,6 +360,8 @@ def add_pie_chart(
     Returns:
         The created chart shape
     """
+    from pptx.chart.data import CategoryChartData
+
     chart_data = CategoryChartData()
     chart_data.categories = categories
     chart_data.add_series("", values)
@@ -417,15 +430,15 @@ def add_data_table(
 
         paragraph = cell.text_frame.paragraphs[0]
         paragraph.font.bold = True
-        paragraph.font.size = Pt(12)
+        paragraph.font.size = _TABLE_HEADER_SIZE
 
         if style == "dark":
             cell.fill.solid()
-            cell.fill.fore_color.rgb = RGBColor(68, 68, 68)
-            paragraph.font.color.rgb = RGBColor(255, 255, 255)
+            cell.fill.fore_color.rgb = _DARK_HEADER_FILL
+            paragraph.font.color.rgb = _DARK_HEADER_TEXT
         elif style == "medium":
             cell.fill.solid()
-            cell.fill.fore_color.rgb = RGBColor(217, 217, 217)
+            cell.fill.fore_color.rgb = _MEDIUM_HEADER_FILL
 
     # Add data
     for row_idx, row_data in enumerate(data):
@@ -434,10 +447,10 @@ def add_data_table(
             cell.text = str(value)
 
             paragraph = cell.text_frame.paragraphs[0]
-            paragraph.font.size = Pt(10)
+            paragraph.font.size = _TABLE_BODY_SIZE
 
             if style == "medium" and row_idx % 2 == 1:
                 cell.fill.solid()
-                cell.fill.fore_color.rgb = RGBColor(242, 242, 242)
+                cell.fill.fore_color.rgb = _MEDIUM_STRIPE_FILL
 
     return table_shape
@@ -12,6 +12,13 @@ from pptx.util import Pt, Inches
 from pptx.enum.text import PP_ALIGN, MSO_AUTO_SIZE
 from pptx.dml.color import RGBColor
 
+_ALIGNMENTS = {
+    "left": PP_ALIGN.LEFT,
+    "center": PP_ALIGN.CENTER,
+    "right": PP_ALIGN.RIGHT,
+    "justify": PP_ALIGN.JUSTIFY,
+}
+
 
 def extract_slide_text(slide) -> Dict[str, Any]:
     """
@@ -33,6 +40,8 @@ def extract_slide_text(slide) -> Dict[str, Any]:
         "all_text": [],
     }
 
+    title_shape = slide.shapes.title
+
     # Extract from shapes
     for shape in slide.shapes:
         if not shape.has_text_frame:
@@ -45,7 +54,7 @@ def extract_slide_text(slide) -> Dict[str, Any]:
         result["all_text"].append(text)
 
         # Check if it's title
-        if shape == slide.shapes.title:
+        if shape == title_shape:
             result["title"] = text
         # Check if it's a placeholder
         elif shape.is_placeholder:
@@ -149,31 +158,28 @@ def format_text_frame(
         color: RGB color tuple
         alignment: Text alignment (left, center, right, justify)
     """
+    # Resolve per-frame settings once; they are the same for every paragraph
+    align = _ALIGNMENTS.get(alignment.lower()) if alignment else None
+    size = Pt(font_size) if font_size else None
+    rgb = RGBColor(*color) if color else None
+
     for paragraph in text_frame.paragraphs:
         # Set alignment
-        if alignment:
-            if alignment.lower() == "left":
-                paragraph.alignment = PP_ALIGN.LEFT
-            elif alignment.lower() == "center":
-                paragraph.alignment = PP_ALIGN.CENTER
-            elif alignment.lower() == "right":
-                paragraph.alignment = PP_ALIGN.RIGHT
-            elif alignment.lower() == "justify":
-                paragraph.alignment = PP_ALIGN.JUSTIFY
+        if align is not None:
+            paragraph.alignment = align
 
         # Format font
         font = paragraph.font
         if font_name:
             font.name = font_name
-        if font_size:
-            font.size = Pt(font_size)
+        if size is not None:
+            font.size = size
         if bold is not None:
             font.bold = bold
         if italic is not None:
             font.italic = italic
-        if color:
-            r, g, b = color
-            font.color.rgb = RGBColor(r, g, b)
+        if rgb is not None:
+            font.color.rgb = rgb
 
 
 def validate_text_fit(
@@ -245,6 +245,15 @@ class TestChartComponentThemeIntegration:
         # Should not raise errors
         chart.apply_theme_colors(result.chart)
 
+    def test_apply_theme_colors_uses_first_chart_token(self, slide):
+        """Test the first series is filled with the first theme chart color."""
+        chart = _TestChartBase()
+        result = chart.render(slide)
+        chart.apply_theme_colors(result.chart)
+
+        fill = result.chart.series[0].format.fill
+        assert str(fill.fore_color.rgb) == chart.tokens["chart"][0].lstrip("#").upper()
+
 
 class TestChartComponentHelpers:
     """Test chart helper methods."""
@@ -104,6 +104,19 @@ class TestChartsInit:
         for export in expected_exports:
             assert export in charts.__all__, f"{export} should be in __all__"
 
+    def test_import_defers_chart_data(self):
+        """Test importing charts does not load pptx.chart.data (and xlsxwriter)."""
+        import subprocess
+
+        code = (
+            "import sys, chuk_mcp_pptx.components.charts; "
+            "print('pptx.chart.data' in sys.modules, 'xlsxwriter' in sys.modules)"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        )
+        assert result.stdout.split() == ["False", "False"]
+
 
 class TestChartsImportFallbacks:
     """Test ImportError fallback behavior in charts/__init__.py."""
@@ -147,3 +147,23 @@ class TestWaterfallChart:
         )
         assert chart.values[1] == -30  # Negative value preserved
         assert chart.values[3] is None  # Total value preserved as None
+
+    def test_render_colors_gains_and_losses(self):
+        """Test rendering hides the base series and colors value points by sign."""
+        from pptx import Presentation
+        from pptx.dml.color import RGBColor
+        from pptx.enum.dml import MSO_FILL
+
+        prs = Presentation()
+        slide = prs.slides.add_slide(prs.slide_layouts[6])
+        chart = WaterfallChart(categories=["Start", "Loss", "Gain"], values=[100, -30, 50])
+        shape = chart.render(slide, left=1, top=1, width=6, height=4)
+
+        base_series, value_series = shape.chart.series
+        assert base_series.format.fill.type == MSO_FILL.BACKGROUND
+        colors = [point.format.fill.fore_color.rgb for point in value_series.points]
+        assert colors == [
+            RGBColor(16, 185, 129),
+            RGBColor(239, 68, 68),
+            RGBColor(16, 185, 129),
+        ]
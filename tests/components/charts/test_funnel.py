@@ -431,6 +431,22 @@ class TestHeatmapChart:
         result = await chart.render(mock_slide)
         assert result is None
 
+    def test_render_heat_scale_colors(self, dark_theme):
+        """Test cells are colored from the grid-wide min (blue) to max (red)."""
+        from pptx import Presentation
+        from pptx.dml.color import RGBColor
+
+        prs = Presentation()
+        slide = prs.slides.add_slide(prs.slide_layouts[6])
+        chart = HeatmapChart(
+            x_labels=["A", "B"], y_labels=["1", "2"], data=[[0, 5], [5, 10]], theme=dark_theme
+        )
+        chart._render_sync(slide, left=1, top=1, width=4, height=3)
+
+        table = slide.shapes[0].table
+        assert table.cell(1, 1).fill.fore_color.rgb == RGBColor(0, 0, 255)
+        assert table.cell(2, 2).fill.fore_color.rgb == RGBColor(255, 0, 0)
+
     def test_validate_empty_data(self, dark_theme):
         """Test validation with empty data."""
         with pytest.raises(ValueError, match="Heatmap requires data"):
@@ -6,6 +6,8 @@ import pytest
 import base64
 import io
 from pptx import Presentation
+from pptx.oxml.ns import qn
+from pptx.util import Pt
 from PIL import Image as PILImage
 
 from chuk_mcp_pptx.components.core.image import Image
@@ -128,7 +130,9 @@ class TestImageComponent:
         result = await image.render(slide, left=1.0, top=1.0, width=4.0)
         assert result is not None
         # Verify shadow is applied
-        assert result.shadow.visible is True
+        assert result.shadow.inherit is False
+        shadow = result._element.spPr.effectLst.find(qn("a:outerShdw"))
+        assert shadow.get("dist") == shadow.get("blurRad") == str(Pt(4))
 
     @pytest.mark.asyncio
     async def test_render_base64_image(self, slide, base64_image):
@@ -159,6 +163,15 @@ class TestImageComponent:
         with pytest.raises(FileNotFoundError):
             await image.render(slide, left=1.0, top=1.0)
 
+    @pytest.mark.asyncio
+    async def test_file_not_found_leaves_slide_untouched(self, slide):
+        """Test a missing file reports the path and adds nothing."""
+        before = len(slide.shapes)
+        image = Image(image_source="/path/to/nonexistent/image.png")
+        with pytest.raises(FileNotFoundError, match="Image not found"):
+            await image.render(slide, left=1.0, top=1.0, width=2.0)
+        assert len(slide.shapes) == before
+
     @pytest.mark.asyncio
     async def test_load_image_file_not_found(self):
         """Test _load_image with non-existent file (covers line 255)."""
@@ -243,7 +256,7 @@ class TestImageComponent:
         )
         result = await image.render(slide, left=1.0, top=1.0, width=4.0)
         assert result is not None
-        assert result.shadow.visible is True
+        assert result._element.spPr.effectLst.find(qn("a:outerShdw")) is not None
 
     @pytest.mark.asyncio
     async def test_apply_filters_with_rgba_image(self, slide, test_rgba_image_path):
@@ -334,9 +347,10 @@ class TestImageEffects:
         image = Image(image_source=test_image_path, shadow=True)
         result = await image.render(slide, left=1.0, top=1.0, width=4.0)
 
-        shadow = result.shadow
-        assert shadow.visible is True
-        assert shadow.inherit is False
+        assert result.shadow.inherit is False
+        shadow = result._element.spPr.effectLst.find(qn("a:outerShdw"))
+        assert shadow.get("dir") == "2700000"  # 45 degrees
+        assert shadow.find(qn("a:srgbClr")).find(qn("a:alpha")).get("val") == "50000"
 
     @pytest.mark.asyncio
     async def test_multiple_images_on_slide(self, slide, test_image_path):
@@ -677,6 +677,14 @@ class TestMacOSWindow:
         assert "width" in content_area
         assert "height" in content_area
 
+    def test_render_traffic_lights(self, slide) -> None:
+        """Test traffic light controls use the platform control colors."""
+        from chuk_mcp_pptx.components.containers import MacOSWindow
+
+        MacOSWindow().render(slide, left=1.0, top=1.0)
+        fills = {str(shape.fill.fore_color.rgb) for shape in slide.shapes if shape.width < 200000}
+        assert {"FF5F56", "FFBD2E", "28C940"} <= fills
+
     def test_render_custom_size(self, slide) -> None:
         """Test rendering with custom size."""
         from chuk_mcp_pptx.components.containers import MacOSWindow
@@ -132,6 +132,11 @@ class TestComponentInstance:
         assert instance.shape_index is None
         assert instance.instance is None
 
+    def test_slotted(self):
+        """Test tracked instances carry no per-instance dict."""
+        instance = ComponentInstance(component_id="test_id", component_type="Badge", slide_index=0)
+        assert not hasattr(instance, "__dict__")
+
 
 class TestComponentTracker:
     """Tests for ComponentTracker class."""
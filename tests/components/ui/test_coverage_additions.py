@@ -741,6 +741,20 @@ class TestRegistryCoverage:
             results = registry.list_by_category(cat)
             assert isinstance(results, list)
 
+    def test_registry_summaries(self) -> None:
+        """Test listing entries match metadata and skip unknown names."""
+        from chuk_mcp_pptx.components.registry import registry
+
+        summaries = registry.summaries(["Button", "NoSuchComponent"])
+        assert len(summaries) == 1
+        metadata = registry.get("Button")
+        assert summaries[0] == {
+            "name": "Button",
+            "category": metadata.category.value,
+            "description": metadata.description,
+            "tags": metadata.tags,
+        }
+
     def test_registry_get_schema(self) -> None:
         """Test getting component schema."""
         from chuk_mcp_pptx.components.registry import registry
@@ -951,5 +965,90 @@ class TestVariantsCoverage:
         assert props["smooth"] is True
 
 
+class TestAsyncComponentCoverage:
+    """Tests for AsyncComponent rendering."""
+
+    @pytest.mark.asyncio
+    async def test_render_runs_on_shared_pool(self) -> None:
+        """Test async renders run _render_sync on the bounded render pool."""
+        import threading
+
+        from chuk_mcp_pptx.components.base import AsyncComponent
+
+        class Probe(AsyncComponent):
+            def _render_sync(self, slide, **kwargs):
+                return threading.current_thread().name, slide, kwargs
+
+        thread_name, slide, kwargs = await Probe().render("slide", left=1.0)
+
+        assert thread_name.startswith("pptx-render")
+        assert slide == "slide"
+        assert kwargs == {"left": 1.0}
+
+
+class TestComponentColorCoverage:
+    """Tests for Component.get_color memoization."""
+
+    def test_get_color_reuses_resolved_color(self) -> None:
+        """Test repeated lookups of a path share one RGBColor."""
+        from chuk_mcp_pptx.components.base import Component
+
+        component = Component()
+        color = component.get_color("primary.DEFAULT")
+
+        assert component.get_color("primary.DEFAULT") is color
+
+    def test_get_color_after_tokens_replaced(self) -> None:
+        """Test assigning a new token tree drops previously resolved colors."""
+        from chuk_mcp_pptx.components.base import Component
+
+        component = Component()
+        component.get_color("background.DEFAULT")
+
+        component.tokens = {"background": {"DEFAULT": "#102030"}}
+
+        assert tuple(component.get_color("background.DEFAULT")) == (0x10, 0x20, 0x30)
+
+    def test_design_system_colors_build_own_tokens(self) -> None:
+        """Test components built from equal design-system colors get independent token trees."""
+        from chuk_mcp_pptx.components.base import Component
+
+        first = Component(theme={"colors": {"primary": "#102030", "text": "#FFFFFF"}})
+        second = Component(theme={"colors": {"primary": "#102030", "text": "#FFFFFF"}})
+
+        first.tokens["primary"]["DEFAULT"] = "#000000"
+
+        assert tuple(second.get_color("primary.DEFAULT")) == (0x10, 0x20, 0x30)
+        assert second.tokens["card"]["foreground"] == "#FFFFFF"
+
+
+class TestTakePlaceholderCoverage:
+    """Tests for Component._take_placeholder."""
+
+    def test_takes_bounds_and_removes_placeholder(self) -> None:
+        """Test the placeholder's bounds win and the placeholder is deleted."""
+        from chuk_mcp_pptx.components.core import Spacer
+
+        prs = Presentation()
+        slide = prs.slides.add_slide(prs.slide_layouts[1])
+        placeholder = slide.placeholders[1]
+        expected = tuple(
+            v.inches
+            for v in (placeholder.left, placeholder.top, placeholder.width, placeholder.height)
+        )
+        count = len(slide.shapes)
+
+        bounds = Spacer()._take_placeholder(placeholder, 0, 0, 1, 1)
+
+        assert bounds == expected
+        assert len(slide.shapes) == count - 1
+
+    def test_without_placeholder_keeps_given_bounds(self) -> None:
+        """Test the passed-in position is used when there is no placeholder."""
+        from chuk_mcp_pptx.components.core import Spacer
+
+        assert Spacer()._take_placeholder(None, 1, 2, 3, None) == (1, 2, 3, None)
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -2,10 +2,12 @@
 Tests for shape components (Shape, Connector, Image, SmartArt).
 """
 
+import math
 import pytest
 import tempfile
 import os
 from pptx import Presentation
+from pptx.oxml.ns import qn
 from PIL import Image as PILImage
 
 from chuk_mcp_pptx.components.core import (
@@ -16,6 +18,7 @@ from chuk_mcp_pptx.components.core import (
     CycleDiagram,
     HierarchyDiagram,
 )
+from chuk_mcp_pptx.components.core.smart_art import _cycle_layout, _row_positions
 
 
 @pytest.fixture
@@ -73,6 +76,18 @@ class TestShape:
         )
         rendered = shape.render(slide, left=1, top=1, width=2, height=1.5)
         assert rendered is not None
+        assert str(rendered.fill.fore_color.rgb) == "FF5733"
+        assert str(rendered.line.color.rgb) == "000000"
+
+    def test_shape_fill_written_once(self, slide, dark_theme):
+        """Test fill and line each carry exactly one solidFill."""
+        rendered = Shape(shape_type="rectangle", line_width=2.5, theme=dark_theme).render(
+            slide, left=1, top=1, width=2, height=1.5
+        )
+        sp_pr = rendered._element.spPr
+        assert len(sp_pr.findall(qn("a:solidFill"))) == 1
+        assert len(sp_pr.ln.findall(qn("a:solidFill"))) == 1
+        assert rendered.line.width.pt == 2.5
 
     def test_shape_with_semantic_color(self, slide, dark_theme):
         """Test shape with semantic color."""
@@ -160,6 +175,25 @@ class TestConnector:
         rendered3 = connector3.render(slide)
         assert rendered3 is not None
 
+    def test_connector_arrow_heads_not_shared(self, slide, dark_theme):
+        """Test each connector gets its own arrow head elements."""
+        first, second = (
+            Connector(
+                start_x=1.0,
+                start_y=y,
+                end_x=5.0,
+                end_y=y,
+                arrow_start=True,
+                theme=dark_theme,
+            ).render(slide)
+            for y in (2.0, 3.0)
+        )
+
+        for rendered in (first, second):
+            ln = rendered._element.spPr.ln
+            assert len(ln.findall(qn("a:headEnd"))) == 1
+            assert len(ln.findall(qn("a:tailEnd"))) == 1
+
     def test_connector_with_colors(self, slide, dark_theme):
         """Test connector with custom colors."""
         # Hex color
@@ -364,6 +398,28 @@ class TestProcessFlow:
         shapes = process.render(slide, left=0.5, top=2, width=9, height=2)
         assert len(shapes) == 7
 
+    def test_row_positions(self):
+        """Test row layout steps by item width plus gap."""
+        assert _row_positions(1.0, 3, 1.5, 0.2) == pytest.approx([1.0, 2.7, 4.4])
+        assert _row_positions(1.0, 0, 1.5, 0.2) == []
+
+    def test_nodes_match_shape_component(self, slide, dark_theme):
+        """Test diagram nodes get the same styling as an equivalent Shape."""
+        process = ProcessFlow(items=["Only One"], theme=dark_theme)
+        node = process.render(slide, left=1, top=2, width=8, height=2)[0]
+        reference = Shape(
+            shape_type="rounded_rectangle",
+            text="Only One",
+            fill_color="primary.DEFAULT",
+            theme=dark_theme,
+        ).render(slide, left=1, top=2, width=1.5, height=1.6)
+
+        assert node.fill.fore_color.rgb == reference.fill.fore_color.rgb
+        assert node.line.color.rgb == reference.line.color.rgb
+        assert node.text_frame.text == reference.text_frame.text
+        node_font = node.text_frame.paragraphs[0].font
+        assert node_font.color.rgb == reference.text_frame.paragraphs[0].font.color.rgb
+
 
 class TestCycleDiagram:
     """Tests for CycleDiagram."""
@@ -398,6 +454,34 @@ class TestCycleDiagram:
         shapes = cycle.render(slide, left=1, top=1, width=6, height=5)
         assert len(shapes) == 0
 
+    def test_single_item_has_no_connector(self, slide, dark_theme):
+        """Test a one-item cycle draws just the node."""
+        cycle = CycleDiagram(items=["Solo"], theme=dark_theme)
+        shapes = cycle.render(slide, left=1, top=1, width=6, height=5)
+        assert len(shapes) == 1
+
+    def test_cycle_layout_geometry(self):
+        """Test node placement and connector end points."""
+        nodes, edges = _cycle_layout(4, 5.0, 4.0, 2.0, 1.2, 0.8)
+
+        # First node is centred at 12 o'clock, third at 6 o'clock
+        assert nodes[0] == pytest.approx((5.0 - 0.6, 2.0 - 0.4))
+        assert nodes[2] == pytest.approx((5.0 - 0.6, 6.0 - 0.4))
+        # Last edge wraps around to the first node
+        assert len(edges) == 4
+        end_x, end_y = edges[-1][2:]
+        assert end_x == pytest.approx(5.0 - 0.6 * 2**-0.5)
+        assert end_y == pytest.approx(2.0 + 0.4 * 2**-0.5)
+
+    def test_cycle_layout_matches_trig(self):
+        """Test incremental rotation agrees with per-node cos/sin."""
+        n = 12
+        nodes, _ = _cycle_layout(n, 5.0, 4.0, 2.0, 1.0, 0.5)
+        for idx, node in enumerate(nodes):
+            angle = idx * 2 * math.pi / n - math.pi / 2
+            expected = (5.0 + 2.0 * math.cos(angle) - 0.5, 4.0 + 2.0 * math.sin(angle) - 0.25)
+            assert node == pytest.approx(expected)
+
 
 class TestHierarchyDiagram:
     """Tests for HierarchyDiagram."""
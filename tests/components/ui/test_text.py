@@ -4,6 +4,7 @@ Tests for text components (TextBox, BulletList).
 
 import pytest
 from pptx import Presentation
+from pptx.dml.color import RGBColor
 
 from chuk_mcp_pptx.components.core import TextBox, BulletList
 
@@ -54,6 +55,17 @@ class TestTextBox:
         rendered = textbox.render(slide, left=1, top=1, width=4, height=1)
         assert rendered is not None
 
+    def test_render_multiline_shares_style(self, slide, dark_theme):
+        """Test every line of a multi-line textbox gets the same font and color."""
+        textbox = TextBox(text="One\nTwo", font_size=24, color="#FF5733", theme=dark_theme)
+        rendered = textbox.render(slide, left=1, top=1, width=4, height=1)
+
+        paragraphs = rendered.text_frame.paragraphs
+        assert len(paragraphs) == 2
+        for p in paragraphs:
+            assert p.font.size.pt == 24
+            assert p.font.color.rgb == RGBColor(0xFF, 0x57, 0x33)
+
     def test_render_with_semantic_color(self, slide, dark_theme):
         """Test textbox with semantic color."""
         textbox = TextBox(text="Theme Text", color="primary.DEFAULT", theme=dark_theme)
@@ -139,3 +151,23 @@ class TestBulletList:
         bullets = BulletList(items=["Red", "Green", "Blue"], color="#FF0000", theme=dark_theme)
         rendered = bullets.render(slide, left=1, top=2, width=8, height=4)
         assert rendered is not None
+
+    def test_render_items_share_style(self, slide, dark_theme):
+        """Test every bullet paragraph gets the same formatting and its own text."""
+        bullets = BulletList(
+            items=["Red", "Green", "Blue"], font_size=20, color="#FF0000", theme=dark_theme
+        )
+        rendered = bullets.render(slide, left=1, top=2, width=8, height=4)
+
+        paragraphs = rendered.text_frame.paragraphs
+        assert [p.text for p in paragraphs] == ["• Red", "• Green", "• Blue"]
+        for p in paragraphs:
+            assert p.font.size.pt == 20
+            assert p.font.color.rgb == RGBColor(0xFF, 0x00, 0x00)
+            assert p.space_after.pt == 6
+
+    def test_render_non_string_items(self, slide, dark_theme):
+        """Test numeric items are rendered with the bullet prefix."""
+        bullets = BulletList(items=[1, 2.5], bullet_char="→", theme=dark_theme)
+        rendered = bullets.render(slide, left=1, top=2, width=8, height=4)
+        assert [p.text for p in rendered.text_frame.paragraphs] == ["→ 1", "→ 2.5"]
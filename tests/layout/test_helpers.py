@@ -6,6 +6,7 @@ Tests validate_position, calculate_grid_layout, get_logo_position, get_safe_cont
 import pytest
 from chuk_mcp_pptx.layout.helpers import (
     validate_position,
+    position_changed,
     calculate_grid_layout,
     get_logo_position,
     get_safe_content_area,
@@ -87,6 +88,24 @@ class TestValidatePosition:
         assert width < 15.0
 
 
+class TestPositionChanged:
+    """Test position_changed function."""
+
+    def test_unchanged_position(self):
+        """Test an untouched position reports no change."""
+        position = (1.0, 2.0, 3.0, 1.5)
+        assert position_changed(position, validate_position(*position)) is False
+
+    def test_float_noise_is_not_a_change(self):
+        """Test sub-EMU differences are ignored."""
+        assert position_changed((1.0, 2.0, 3.0, 1.5), (1.0 + 1e-12, 2.0, 3.0, 1.5)) is False
+
+    def test_adjusted_position(self):
+        """Test a moved element reports a change."""
+        position = (1.0, 2.0, 15.0, 2.0)
+        assert position_changed(position, validate_position(*position)) is True
+
+
 class TestCalculateGridLayout:
     """Test calculate_grid_layout function."""
 
@@ -393,3 +412,10 @@ class TestGetSafeContentArea:
         assert area["top"] >= 0
         assert area["left"] + area["width"] <= SLIDE_WIDTH
         assert area["top"] + area["height"] <= SLIDE_HEIGHT
+
+    def test_get_safe_content_area_returns_independent_copies(self):
+        """Test mutating a returned area does not leak into later calls."""
+        area = get_safe_content_area(has_title=True)
+        area["top"] = 99.0
+
+        assert get_safe_content_area(has_title=True)["top"] != 99.0
@@ -96,6 +96,19 @@ class TestTemplateRegistry:
         assert "comparison" in categories
         assert "timeline" in categories
 
+    def test_listings_are_fresh_copies(self):
+        """Test callers can't mutate the registry's cached listings."""
+        from chuk_mcp_pptx.slide_templates.registry import (
+            get_all_categories,
+            get_template_info,
+        )
+
+        get_all_categories().clear()
+        get_template_info("MetricsDashboard")["name"] = "changed"
+
+        assert "dashboard" in get_all_categories()
+        assert get_template_info("MetricsDashboard")["name"] == "MetricsDashboard"
+
 
 class TestTemplateCategory:
     """Tests for TemplateCategory enum."""
@@ -194,6 +207,23 @@ class TestTemplateProp:
         assert d["type"] == "string"
         assert d["description"] == "Test prop"
 
+    def test_prop_to_dict_matches_model_dump(self):
+        """Test to_dict keeps model_dump's keys and doesn't share mutable values."""
+        from chuk_mcp_pptx.slide_templates.registry import TemplateProp
+
+        prop = TemplateProp(
+            name="layout",
+            type="array",
+            description="Layouts",
+            required=False,
+            options=["grid", "row"],
+            default=["grid"],
+        )
+        d = prop.to_dict()
+        assert d == prop.model_dump()
+        assert d["options"] is not prop.options
+        assert d["default"] is not prop.default
+
 
 class TestTemplateMetadata:
     """Tests for TemplateMetadata model."""
@@ -356,6 +386,55 @@ class TestTemplateDecorator:
         assert info["category"] == "content"
         assert info["tags"] == ["test", "decorator"]
 
+    def test_template_reregistration_moves_category(self):
+        """Test re-registering a name replaces its listing and category."""
+        from chuk_mcp_pptx.slide_templates.registry import (
+            template,
+            TemplateCategory,
+            list_templates,
+        )
+        from chuk_mcp_pptx.slide_templates.base import SlideTemplate
+
+        for category in (TemplateCategory.CONTENT, TemplateCategory.CLOSING):
+
+            @template(
+                name="ReregisteredTemplate",
+                category=category,
+                description="Registered twice",
+                props=[],
+            )
+            class ReregisteredTemplate(SlideTemplate):
+                def render(self, prs):
+                    return 0
+
+        names = [t["name"] for t in list_templates()]
+        assert names.count("ReregisteredTemplate") == 1
+        assert "ReregisteredTemplate" not in [t["name"] for t in list_templates("content")]
+        assert "ReregisteredTemplate" in [t["name"] for t in list_templates("closing")]
+
+    def test_template_registration_visible_after_cached_miss(self):
+        """Test a cached get_template miss is dropped when the name is registered."""
+        from chuk_mcp_pptx.slide_templates.registry import (
+            template,
+            TemplateCategory,
+            get_template,
+        )
+        from chuk_mcp_pptx.slide_templates.base import SlideTemplate
+
+        assert get_template("LateRegisteredTemplate") is None
+
+        @template(
+            name="LateRegisteredTemplate",
+            category=TemplateCategory.LAYOUT,
+            description="Registered after a lookup",
+            props=[],
+        )
+        class LateRegisteredTemplate(SlideTemplate):
+            def render(self, prs):
+                return 0
+
+        assert get_template("LateRegisteredTemplate") is LateRegisteredTemplate
+
     def test_template_decorator_adds_metadata_to_class(self):
         """Test that decorator adds _template_metadata to class."""
         from chuk_mcp_pptx.slide_templates.registry import (
@@ -507,6 +586,21 @@ class TestMetricsDashboard:
         assert slide_index == 0
         assert len(presentation.slides) == 1
 
+    def test_render_layout_places_cards(self, presentation):
+        """Test grid caps at 3 cards and row spreads every card left to right."""
+        from chuk_mcp_pptx.slide_templates import MetricsDashboard
+
+        metrics = [{"label": f"M{i}", "value": str(i)} for i in range(4)]
+        for layout, expected in (("grid", 3), ("row", 4)):
+            index = MetricsDashboard(title="Cards", metrics=metrics, layout=layout).render(
+                presentation
+            )
+            # Skip the title text box
+            cards = list(presentation.slides[index].shapes)[1:]
+            assert len(cards) == expected
+            lefts = [card.left for card in cards]
+            assert lefts == sorted(lefts)
+
     def test_render_single_metric(self, presentation):
         """Test rendering with single metric."""
         from chuk_mcp_pptx.slide_templates import MetricsDashboard
@@ -538,6 +538,22 @@ class TestRegisterCustomTemplate:
         assert len(results) == 1
         assert results[0].name == "searchable_custom"
 
+    def test_reregister_custom_template_updates_search(self):
+        """Test that re-registering a template replaces its searchable fields."""
+        from chuk_mcp_pptx.templates.template_manager import TemplateManager
+
+        manager = TemplateManager()
+
+        manager.register_custom_template(
+            name="renamed", display_name="Old", description="Old", layout_count=1, tags=["oldtag"]
+        )
+        manager.register_custom_template(
+            name="renamed", display_name="New", description="New", layout_count=1, tags=["newtag"]
+        )
+
+        assert manager.search_templates("oldtag") == []
+        assert [t.display_name for t in manager.search_templates("newtag")] == ["New"]
+
     def test_register_custom_template_no_tags(self):
         """Test registering custom template with no tags."""
         from chuk_mcp_pptx.templates.template_manager import TemplateManager
@@ -622,6 +638,26 @@ class TestGetCategories:
         categories = manager.get_categories()
         assert "my_new_category" in categories
 
+    def test_get_categories_refreshes_after_registration(self):
+        """Test a cached category list picks up later registrations and is not shared."""
+        from chuk_mcp_pptx.templates.template_manager import TemplateManager
+
+        manager = TemplateManager()
+        first = manager.get_categories()
+        first.append("mutated")
+
+        manager.register_custom_template(
+            name="late_category_template",
+            display_name="Late Category",
+            description="Registered after a lookup",
+            layout_count=1,
+            category="late_category",
+        )
+
+        categories = manager.get_categories()
+        assert "late_category" in categories
+        assert "mutated" not in categories
+
 
 # ============================================================================
 # Test Edge Cases
@@ -50,6 +50,12 @@ class TestToolsRegistration:
 
         assert placeholder_tools is not None
 
+    def test_shape_tools_registered(self) -> None:
+        """Test that shape tools are registered."""
+        from chuk_mcp_pptx.async_server import shape_tools
+
+        assert "pptx_add_shapes" in shape_tools
+
     def test_inspection_tools_registered(self) -> None:
         """Test that inspection tools are registered."""
         from chuk_mcp_pptx.async_server import inspection_tools
@@ -164,6 +170,8 @@ class TestPptxAddTitleSlide:
         assert "error" not in data
         assert data["slide_index"] == 0
         assert data["slide_count"] == 1
+        prs, _ = await manager.get()
+        assert prs.slides[0].placeholders[1].text == "Test Subtitle"
 
         manager.clear_all()
 
@@ -248,6 +256,9 @@ class TestPptxAddSlide:
         assert "error" not in data
         assert data["slide_index"] == 0
         assert data["slide_count"] == 1
+        prs, _ = await manager.get()
+        body = prs.slides[0].placeholders[1].text_frame
+        assert [p.text for p in body.paragraphs] == ["Point 1", "Point 2", "Point 3"]
 
         manager.clear_all()
 
@@ -294,6 +305,122 @@ class TestPptxAddSlide:
         manager.clear_all()
 
 
+class TestPptxAddSlides:
+    """Tests for pptx_add_slides tool."""
+
+    @pytest.mark.asyncio
+    async def test_add_slides_mixed_types(self) -> None:
+        """Test adding title and content slides in one batch."""
+        from chuk_mcp_pptx.async_server import pptx_create, pptx_add_slides, manager
+
+        manager.clear_all()
+        await pptx_create(name="test_batch_slides", theme="tech-blue")
+
+        result = await pptx_add_slides(
+            slides=[
+                {"type": "title", "title": "Report", "subtitle": "2024"},
+                {"title": "Highlights", "content": ["Up", "Right"]},
+            ]
+        )
+        data = json.loads(result)
+
+        assert "error" not in data
+        assert data["slide_index"] == 1
+        assert data["slide_count"] == 2
+        prs, _ = await manager.get()
+        assert prs.slides[0].shapes.title.text == "Report"
+        assert prs.slides[0].placeholders[1].text == "2024"
+        body = prs.slides[1].placeholders[1].text_frame
+        assert [p.text for p in body.paragraphs] == ["Up", "Right"]
+
+        manager.clear_all()
+
+    @pytest.mark.asyncio
+    async def test_add_slides_accepts_json_string(self) -> None:
+        """Test that slides can be passed as a JSON string."""
+        from chuk_mcp_pptx.async_server import pptx_create, pptx_add_slides, manager
+
+        manager.clear_all()
+        await pptx_create(name="test_batch_json")
+
+        result = await pptx_add_slides(slides=json.dumps([{"title": "Only", "content": ["A"]}]))
+
+        assert json.loads(result)["slide_count"] == 1
+
+        manager.clear_all()
+
+    @pytest.mark.asyncio
+    async def test_add_slides_bad_entry_adds_nothing(self) -> None:
+        """Test that one invalid entry rejects the whole batch."""
+        from chuk_mcp_pptx.async_server import pptx_create, pptx_add_slides, manager
+
+        manager.clear_all()
+        await pptx_create(name="test_batch_invalid")
+
+        result = await pptx_add_slides(
+            slides=[{"title": "Fine", "content": ["A"]}, {"type": "chart", "title": "Bad"}]
+        )
+
+        assert "chart" in json.loads(result)["error"]
+        prs, _ = await manager.get()
+        assert len(prs.slides) == 0
+
+        manager.clear_all()
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        "entry, field",
+        [
+            ({"title": "Bad bullets", "content": ["A", 3]}, "content"),
+            ({"type": "title", "title": "Bad subtitle", "subtitle": 7}, "subtitle"),
+            ({"title": ["Not", "a", "string"]}, "title"),
+        ],
+    )
+    async def test_add_slides_bad_types_add_nothing(self, entry, field) -> None:
+        """Test that a wrongly typed title, subtitle or bullet rejects the whole batch."""
+        from chuk_mcp_pptx.async_server import pptx_create, pptx_add_slides, manager
+
+        manager.clear_all()
+        await pptx_create(name="test_batch_bad_types")
+
+        result = await pptx_add_slides(slides=[{"title": "Fine", "content": ["A"]}, entry])
+
+        assert field in json.loads(result)["error"]
+        prs, _ = await manager.get()
+        assert len(prs.slides) == 0
+
+        manager.clear_all()
+
+    @pytest.mark.asyncio
+    async def test_add_slides_missing_title(self) -> None:
+        """Test error when an entry has no title."""
+        from chuk_mcp_pptx.async_server import pptx_add_slides
+
+        result = await pptx_add_slides(slides=[{"content": ["A"]}])
+
+        assert "missing title" in json.loads(result)["error"]
+
+    @pytest.mark.asyncio
+    async def test_add_slides_empty_list(self) -> None:
+        """Test error on an empty batch."""
+        from chuk_mcp_pptx.async_server import pptx_add_slides
+
+        result = await pptx_add_slides(slides=[])
+
+        assert "error" in json.loads(result)
+
+    @pytest.mark.asyncio
+    async def test_add_slides_no_presentation(self) -> None:
+        """Test error when no presentation exists."""
+        from chuk_mcp_pptx.async_server import pptx_add_slides, manager
+
+        manager.clear_all()
+
+        result = await pptx_add_slides(slides=[{"title": "Test", "content": ["Item"]}])
+
+        assert "error" in json.loads(result)
+
+
 class TestPptxDeleteSlide:
     """Tests for pptx_delete_slide tool."""
 
@@ -17,6 +17,8 @@ All tests use:
 - Proper type hints
 """
 
+import base64
+
 import pytest
 from unittest.mock import MagicMock, AsyncMock, patch
 from datetime import datetime
@@ -658,6 +660,19 @@ class TestImportBase64:
         result = await manager.import_base64(data="not-valid-base64!", name="test")
         assert result is False
 
+    @pytest.mark.asyncio
+    async def test_import_non_pptx_skips_parse(self) -> None:
+        """Test decodable data that is not a .pptx is rejected before parsing."""
+        manager = PresentationManager()
+        data = base64.b64encode(b"plain text, not a zip archive").decode()
+
+        with patch("chuk_mcp_pptx.core.presentation_manager.Presentation") as mock_prs:
+            result = await manager.import_base64(data=data, name="test")
+
+        assert result is False
+        mock_prs.assert_not_called()
+        assert "test" not in manager._presentations
+
 
 class TestClearAll:
     """Tests for clearing all presentations."""
@@ -809,6 +824,37 @@ class TestArtifactStoreIntegration:
         assert result is not None
         mock_store.read_namespace.assert_called_once_with("ns-stored-789")
 
+    @pytest.mark.asyncio
+    async def test_load_from_store_parses_off_event_loop(self) -> None:
+        """Test the stored bytes are parsed in a worker thread, not on the loop."""
+        import threading
+
+        manager = PresentationManager()
+
+        mock_ns_info = MagicMock()
+        mock_ns_info.name = "presentations/stored_pres"
+        mock_ns_info.namespace_id = "ns-stored-789"
+
+        mock_store = MagicMock()
+        mock_store.list_namespaces = AsyncMock(return_value=[mock_ns_info])
+        mock_store.read_namespace = AsyncMock(return_value=b"PK\x03\x04")
+
+        loop_thread = threading.current_thread()
+        parse_threads = []
+
+        def fake_presentation(buffer):
+            parse_threads.append(threading.current_thread())
+            return MagicMock()
+
+        with (
+            patch.object(manager, "_get_store", return_value=mock_store),
+            patch("chuk_mcp_pptx.core.presentation_manager.Presentation", fake_presentation),
+        ):
+            result = await manager._load_from_store("stored_pres")
+
+        assert result is not None
+        assert parse_threads and parse_threads[0] is not loop_thread
+
     @pytest.mark.asyncio
     async def test_load_from_store_no_namespace_id(self) -> None:
         """Test loading when namespace ID doesn't exist."""
@@ -1203,6 +1249,33 @@ class TestCreateWithTemplate:
         assert metadata.slide_count == 0  # Slides removed from template
         mock_template_manager.get_template_data.assert_called_once_with("modern")
 
+    @pytest.mark.asyncio
+    async def test_create_with_template_removes_every_slide(self) -> None:
+        """Test all template slides and their relationships are dropped."""
+        from pptx import Presentation as PptxPresentation
+        from pptx.opc.constants import RELATIONSHIP_TYPE as RT
+        import io
+
+        manager = PresentationManager()
+
+        prs = PptxPresentation()
+        for i in range(3):
+            prs.slides.add_slide(prs.slide_layouts[i])
+        buffer = io.BytesIO()
+        prs.save(buffer)
+
+        mock_template_manager = MagicMock()
+        mock_template_manager.get_template_data = AsyncMock(return_value=buffer.getvalue())
+
+        with patch("chuk_mcp_pptx.templates.TemplateManager", return_value=mock_template_manager):
+            metadata = await manager.create(name="multi_slide_template", template_name="modern")
+
+        assert metadata.slide_count == 0
+        created = await manager.get_presentation("multi_slide_template")
+        assert len(created.slides) == 0
+        assert len(created.slide_layouts) == len(prs.slide_layouts)
+        assert not [rel for rel in created.part.rels.values() if rel.reltype == RT.SLIDE]
+
     @pytest.mark.asyncio
     async def test_create_with_artifact_store_template(self) -> None:
         """Test creating presentation from artifact store template."""
@@ -1614,6 +1687,21 @@ class TestImportTemplate:
             result = await manager.import_template("/nonexistent/file.pptx", "template")
             assert result is False
 
+    @pytest.mark.asyncio
+    async def test_import_template_not_pptx(self, tmp_path) -> None:
+        """Test import_template rejects a file that is not a .pptx archive."""
+        manager = PresentationManager()
+        bogus = tmp_path / "notes.pptx"
+        bogus.write_text("not a presentation")
+
+        mock_store = MagicMock()
+        mock_store.create_namespace = AsyncMock()
+        with patch.object(manager, "_get_store", return_value=mock_store):
+            result = await manager.import_template(str(bogus), "template")
+
+        assert result is False
+        mock_store.create_namespace.assert_not_called()
+
     @pytest.mark.asyncio
     async def test_import_template_exception(self) -> None:
         """Test import_template handles exceptions."""
@@ -297,3 +297,34 @@ class TestTableStripedVariant:
         cell_even = pptx_table.cell(2, 0)
         # The striped variant should have alternating background
         assert cell_even.fill.type is not None
+
+    def test_striped_rows_share_colors(self, slide, sample_data, theme):
+        """Test rows of the same parity share a fill and all cells share a text color."""
+        table = Table(
+            headers=sample_data["headers"], data=sample_data["data"], variant="striped", theme=theme
+        )
+        pptx_table = table.render(slide, left=1, top=2, width=6, height=3).table
+
+        odd = pptx_table.cell(1, 0).fill.fore_color.rgb
+        even = pptx_table.cell(2, 0).fill.fore_color.rgb
+        assert odd != even
+        assert pptx_table.cell(3, 2).fill.fore_color.rgb == odd
+        text_colors = {
+            pptx_table.cell(row, col).text_frame.paragraphs[0].font.color.rgb
+            for row in range(1, 4)
+            for col in range(4)
+        }
+        assert len(text_colors) == 1
+
+    def test_cell_fills_are_single_solid_fills(self, slide, sample_data, theme):
+        """Test header and data cells carry exactly one solid fill of the theme color."""
+        table = Table(
+            headers=sample_data["headers"], data=sample_data["data"], variant="striped", theme=theme
+        )
+        pptx_table = table.render(slide, left=1, top=2, width=6, height=3).table
+
+        header = pptx_table.cell(0, 0)
+        header_bg = table.variant_props.get("header_bg", "card.DEFAULT")
+        assert header.fill.fore_color.rgb == table.get_color(header_bg)
+        for cell in (header, pptx_table.cell(1, 1), pptx_table.cell(2, 1)):
+            assert len(cell._tc.tcPr.xpath("a:solidFill")) == 1
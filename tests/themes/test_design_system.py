@@ -4,6 +4,7 @@ Tests for themes/design_system.py
 Comprehensive tests for design system resolution for >90% coverage.
 """
 
+import pytest
 from unittest.mock import MagicMock
 from pptx import Presentation
 from pptx.util import Inches, Pt
@@ -14,7 +15,6 @@ from chuk_mcp_pptx.themes.design_system import (
     extract_placeholder_styles,
     resolve_design_system,
     apply_design_system_to_shape,
-    _hex_to_rgb,
 )
 
 
@@ -51,6 +51,13 @@ class TestResolvedDesignSystem:
         assert ds.source == "default"
         assert ds.overrides == {}
 
+    def test_slotted(self):
+        """Test the design system carries no per-instance dict and rejects unknown fields."""
+        ds = ResolvedDesignSystem()
+        assert not hasattr(ds, "__dict__")
+        with pytest.raises(AttributeError):
+            ds.not_a_field = 1
+
     def test_custom_values(self):
         """Test creating design system with custom values."""
         ds = ResolvedDesignSystem(
@@ -81,31 +88,6 @@ class TestResolvedDesignSystem:
         assert ds.overrides == {"font_size": "explicit"}
 
 
-class TestHexToRgb:
-    """Tests for _hex_to_rgb function."""
-
-    def test_hex_with_hash(self):
-        """Test hex color with hash prefix."""
-        assert _hex_to_rgb("#FF0000") == (255, 0, 0)
-        assert _hex_to_rgb("#00FF00") == (0, 255, 0)
-        assert _hex_to_rgb("#0000FF") == (0, 0, 255)
-
-    def test_hex_without_hash(self):
-        """Test hex color without hash prefix."""
-        assert _hex_to_rgb("FF0000") == (255, 0, 0)
-        assert _hex_to_rgb("00FF00") == (0, 255, 0)
-
-    def test_lowercase_hex(self):
-        """Test lowercase hex colors."""
-        assert _hex_to_rgb("#ff0000") == (255, 0, 0)
-        assert _hex_to_rgb("aabbcc") == (170, 187, 204)
-
-    def test_black_and_white(self):
-        """Test black and white colors."""
-        assert _hex_to_rgb("#000000") == (0, 0, 0)
-        assert _hex_to_rgb("#FFFFFF") == (255, 255, 255)
-
-
 class TestExtractTemplateDesignSystem:
     """Tests for extract_template_design_system function."""
 
@@ -159,6 +141,23 @@ class TestExtractPlaceholderStyles:
                 # Should return dict (may be empty or have values)
                 assert isinstance(styles, dict)
 
+    def test_extract_from_unfilled_placeholder_keeps_text_styles(self, caplog):
+        """Test an unfilled placeholder is not treated as an extraction error."""
+        from pptx.dml.color import RGBColor
+
+        prs = Presentation()
+        slide = prs.slides.add_slide(prs.slide_layouts[1])
+        placeholder = slide.placeholders[0]
+        placeholder.text = "Title"
+        placeholder.text_frame.paragraphs[0].runs[0].font.color.rgb = RGBColor(0x12, 0x34, 0x56)
+
+        with caplog.at_level("WARNING"):
+            styles = extract_placeholder_styles(placeholder)
+
+        assert styles["text_color"] == "#123456"
+        assert "background_color" not in styles
+        assert "Could not extract placeholder styles" not in caplog.text
+
     def test_extract_handles_missing_text_frame(self):
         """Test extraction handles missing text_frame."""
         mock_placeholder = MagicMock()
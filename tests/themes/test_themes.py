@@ -15,6 +15,7 @@ from chuk_mcp_pptx.themes.theme_manager import (
     MinimalTheme,
     CorporateTheme,
 )
+from chuk_mcp_pptx.themes import theme_manager
 from chuk_mcp_pptx.tokens.colors import PALETTE, GRADIENTS
 
 
@@ -74,6 +75,53 @@ class TestTheme:
         bg = theme.get_color("background.DEFAULT")
         assert bg is not None
 
+    def test_get_color_matches_hex_to_rgb(self):
+        """Test memoized colors agree with hex_to_rgb and are reused."""
+        theme = Theme("test", primary_hue="blue", mode="dark")
+        color = theme.get_color("primary.DEFAULT")
+
+        assert tuple(color) == theme.hex_to_rgb(theme.tokens["primary"]["DEFAULT"])
+        assert theme.get_color("primary.DEFAULT") is color
+
+    def test_get_color_after_tokens_replaced(self):
+        """Test assigning a new token tree drops previously resolved colors."""
+        theme = Theme("test", primary_hue="blue", mode="dark")
+        theme.get_color("background.DEFAULT")
+
+        theme.tokens = {"background": {"DEFAULT": "#102030"}}
+
+        assert tuple(theme.get_color("background.DEFAULT")) == (0x10, 0x20, 0x30)
+
+    def test_get_color_sees_in_place_token_edits(self):
+        """Test editing a nested token in place changes the resolved color."""
+        theme = Theme("test")
+        theme.get_color("primary.DEFAULT")
+
+        theme.tokens["primary"]["DEFAULT"] = "#123456"
+
+        assert tuple(theme.get_color("primary.DEFAULT")) == (0x12, 0x34, 0x56)
+
+    def test_same_hue_and_mode_token_edits_stay_local(self):
+        """Test editing one theme's tokens never leaks into another with the same hue and mode."""
+        first = Theme("dark", primary_hue="blue", mode="dark")
+        second = Theme("dark-blue", primary_hue="blue", mode="dark")
+        original = second.tokens["primary"]["DEFAULT"]
+
+        first.tokens["primary"]["DEFAULT"] = "#123456"
+        first.tokens["simple"] = "#123456"
+
+        assert second.tokens["primary"]["DEFAULT"] == original
+        assert "simple" not in second.tokens
+        fresh = Theme("other", primary_hue="blue", mode="dark")
+        assert fresh.tokens["primary"]["DEFAULT"] == original
+
+    def test_subclass_overrides_resolved(self):
+        """Test token overrides made by theme subclasses are what get_color returns."""
+        theme = CyberpunkTheme()
+
+        expected = theme.hex_to_rgb(PALETTE["fuchsia"][500])
+        assert tuple(theme.get_color("primary.DEFAULT")) == expected
+
     def test_get_chart_colors(self):
         """Test getting chart colors."""
         theme = Theme("test")
@@ -142,6 +190,36 @@ class TestTheme:
         # Shape should have styling applied
         assert shape.fill is not None
 
+    def test_apply_to_shape_styles_every_run(self):
+        """Test every run gets the style's text color and the theme font."""
+        prs = Presentation()
+        slide = prs.slides.add_slide(prs.slide_layouts[6])
+        shape = slide.shapes.add_textbox(Inches(1), Inches(1), Inches(2), Inches(1))
+        shape.text_frame.text = "One"
+        shape.text_frame.add_paragraph().text = "Two"
+
+        theme = Theme("test", font_family="Arial")
+        theme.apply_to_shape(shape, "primary")
+
+        runs = [run for p in shape.text_frame.paragraphs for run in p.runs]
+        assert len(runs) == 2
+        for run in runs:
+            assert run.font.color.rgb == theme.get_color("primary.foreground")
+            assert run.font.name == "Arial"
+
+    def test_apply_to_shape_without_text_skips_runs(self):
+        """Test an empty text frame is left untouched while fill and border are styled."""
+        prs = Presentation()
+        slide = prs.slides.add_slide(prs.slide_layouts[6])
+        shape = slide.shapes.add_textbox(Inches(1), Inches(1), Inches(2), Inches(1))
+        before = shape.text_frame._txBody.xml
+
+        theme = Theme("test")
+        theme.apply_to_shape(shape, "primary")
+
+        assert shape.fill.fore_color.rgb == theme.get_color("primary.DEFAULT")
+        assert shape.text_frame._txBody.xml == before
+
 
 class TestThemeManager:
     """Test ThemeManager class."""
@@ -180,6 +258,45 @@ class TestThemeManager:
         assert theme.mode == "dark"
         assert theme.primary_hue == "violet"
 
+    def test_builtin_themes_built_on_first_use(self, monkeypatch):
+        """Test built-in themes are only constructed when first requested."""
+        built = []
+
+        def factory():
+            built.append("cyberpunk")
+            return CyberpunkTheme()
+
+        monkeypatch.setitem(theme_manager._BUILTIN_THEMES, "cyberpunk", factory)
+        mgr = ThemeManager()
+        assert "cyberpunk" in mgr.themes
+        assert built == []
+
+        theme = mgr.get_theme("cyberpunk")
+        assert isinstance(theme, CyberpunkTheme)
+        assert mgr.get_theme("cyberpunk") is theme
+        assert mgr.themes["cyberpunk"] is theme
+        assert built == ["cyberpunk"]
+
+    def test_themes_only_hold_built_themes(self):
+        """Test every value in themes is a Theme, built-in or registered."""
+        mgr = ThemeManager()
+        mgr.register_theme(Theme("my-theme", primary_hue="amber", mode="dark"))
+
+        assert list(mgr.themes) == mgr.list_themes()
+        assert len(mgr.themes) == len(mgr.list_themes())
+        assert list(mgr.themes)[-1] == "my-theme"
+        assert all(isinstance(theme, Theme) for theme in mgr.themes.values())
+
+    def test_resolve_falls_back_to_default(self):
+        """Test resolve returns the named theme, or the default for unknown/empty names."""
+        mgr = ThemeManager()
+        default = mgr.get_default_theme()
+
+        assert mgr.resolve("ocean").name == "ocean"
+        assert mgr.resolve("nonexistent") is default
+        assert mgr.resolve(None) is default
+        assert mgr.resolve("") is default
+
     def test_get_nonexistent_theme(self):
         """Test getting a theme that doesn't exist."""
         mgr = ThemeManager()
@@ -331,6 +448,38 @@ class TestSpecialThemes:
         assert theme.mode == "light"
         assert theme.primary_hue == "blue"
 
+    @pytest.mark.parametrize(
+        "theme",
+        [
+            Theme("plain"),
+            CyberpunkTheme(),
+            GradientTheme("sunset", GRADIENTS["sunset"]),
+            MinimalTheme(),
+            CorporateTheme(),
+        ],
+    )
+    def test_slotted(self, theme):
+        """Test every theme class carries no per-instance dict."""
+        assert type(theme).__dictoffset__ == 0
+        with pytest.raises(AttributeError):
+            theme.not_a_field = 1
+
+    def test_dict_compat_is_deprecated(self):
+        """Test __dict__ still returns the attribute dict, with a deprecation warning."""
+        theme = GradientTheme("sunset", GRADIENTS["sunset"])
+
+        with pytest.warns(DeprecationWarning, match="to_dict"):
+            attrs = vars(theme)
+
+        assert attrs == {
+            "font_family": theme.font_family,
+            "gradient_colors": theme.gradient_colors,
+            "mode": theme.mode,
+            "name": "sunset",
+            "primary_hue": theme.primary_hue,
+            "tokens": theme.tokens,
+        }
+
 
 class TestThemeVariations:
     """Test theme variations and edge cases."""
@@ -561,6 +710,27 @@ class TestThemeApplyToSlideBranches:
         # Both runs should have color applied
         assert slide.background.fill.type is not None
 
+    def test_apply_to_slide_skips_matching_background(self, monkeypatch):
+        """Test re-applying a theme leaves an already matching background untouched."""
+        from pptx.dml.fill import FillFormat
+
+        prs = Presentation()
+        slide = prs.slides.add_slide(prs.slide_layouts[6])
+        dark = Theme("dark", mode="dark")
+        dark.apply_to_slide(slide)
+
+        calls = []
+        solid = FillFormat.solid
+        monkeypatch.setattr(FillFormat, "solid", lambda fill: calls.append(fill) or solid(fill))
+
+        dark.apply_to_slide(slide)
+        assert calls == []
+
+        light = Theme("light", mode="light")
+        light.apply_to_slide(slide)
+        assert len(calls) == 1
+        assert slide.background.fill.fore_color.rgb == light.get_color("background.DEFAULT")
+
 
 class TestThemeApplyToShapeBranches:
     """Test Theme.apply_to_shape branch coverage."""
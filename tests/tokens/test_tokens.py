@@ -6,6 +6,8 @@ import pytest
 from chuk_mcp_pptx.tokens import (
     PALETTE,
     get_semantic_tokens,
+    hex_to_rgb,
+    cached_rgb,
     GRADIENTS,
     FONT_FAMILIES,
     FONT_SIZES,
@@ -125,6 +127,49 @@ class TestColorTokens:
             assert len(GRADIENTS[grad]) >= 3
 
 
+class TestHexToRgb:
+    """Tests for hex_to_rgb function."""
+
+    def test_hex_with_hash(self):
+        """Test hex color with hash prefix."""
+        assert hex_to_rgb("#FF0000") == (255, 0, 0)
+        assert hex_to_rgb("#00FF00") == (0, 255, 0)
+        assert hex_to_rgb("#0000FF") == (0, 0, 255)
+
+    def test_hex_without_hash(self):
+        """Test hex color without hash prefix."""
+        assert hex_to_rgb("FF0000") == (255, 0, 0)
+        assert hex_to_rgb("00FF00") == (0, 255, 0)
+
+    def test_lowercase_hex(self):
+        """Test lowercase hex colors."""
+        assert hex_to_rgb("#ff0000") == (255, 0, 0)
+        assert hex_to_rgb("aabbcc") == (170, 187, 204)
+
+    def test_black_and_white(self):
+        """Test black and white colors."""
+        assert hex_to_rgb("#000000") == (0, 0, 0)
+        assert hex_to_rgb("#FFFFFF") == (255, 255, 255)
+
+    def test_short_hex_rejected(self):
+        """Test hex strings shorter than six digits raise."""
+        with pytest.raises(ValueError):
+            hex_to_rgb("#FFF")
+
+    def test_cached_rgb_shared(self):
+        """Test cached_rgb parses once and shares the immutable RGBColor."""
+        assert tuple(cached_rgb("#102030")) == (0x10, 0x20, 0x30)
+        assert cached_rgb("#102030") is cached_rgb("#102030")
+
+    @pytest.mark.parametrize(
+        "value", ["#-00001", "#1_2345", "# 12345", "#FF0000\n", "#FF000000", "##FF0000"]
+    )
+    def test_non_hex_digits_rejected(self, value):
+        """Test only exactly six hex digits are accepted."""
+        with pytest.raises(ValueError):
+            hex_to_rgb(value)
+
+
 class TestTypographyTokens:
     """Test typography token system."""
 
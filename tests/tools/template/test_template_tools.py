@@ -1796,6 +1796,32 @@ class TestExtractionToolsRegistration:
 
         assert isinstance(result, str)
 
+    @pytest.mark.asyncio
+    async def test_compare_slide_to_template_success_returns_comparison(self, mock_mcp):
+        """Test a valid comparison is returned rather than a not-found error."""
+        from chuk_mcp_pptx.tools.template.extraction import register_extraction_tools
+
+        prs = Presentation()
+        prs.slides.add_slide(prs.slide_layouts[0])
+        template_prs = Presentation()
+        template_prs.slides.add_slide(template_prs.slide_layouts[0])
+
+        manager = MagicMock()
+        manager.get = AsyncMock(side_effect=[(prs, MagicMock()), (template_prs, MagicMock())])
+
+        register_extraction_tools(mock_mcp, manager, MagicMock())
+
+        result = await mock_mcp._tools["pptx_compare_slide_to_template"](
+            presentation="test_prs",
+            slide_index=0,
+            template_name="template",
+        )
+
+        data = json.loads(result)
+        assert "error" not in data
+        assert data["generated_slide_index"] == 0
+        assert data["template_slide_index"] == 0
+
     @pytest.mark.asyncio
     async def test_compare_slide_to_template_with_specific_template_slide(self, mock_mcp):
         """Test pptx_compare_slide_to_template with specific template slide index."""
@@ -504,6 +504,19 @@ class TestOutOfBoundsElements:
         # Should mention out of bounds or layout issues
         assert "OUT OF BOUNDS" in result or "LAYOUT ISSUES" in result
 
+    @pytest.mark.asyncio
+    async def test_inspect_reports_oob_edge_in_inches(self, inspection_tools_with_oob):
+        """Test the out-of-bounds issue names the edge and its position in inches."""
+        result = await inspection_tools_with_oob["pptx_inspect_slide"](slide_index=0)
+        assert "TextBox extends beyond right edge (12.0 > 10.0)" in result
+        assert "left edge" not in result
+
+    @pytest.mark.asyncio
+    async def test_analyze_counts_oob(self, inspection_tools_with_oob):
+        """Test presentation analysis counts the out-of-bounds element."""
+        result = await inspection_tools_with_oob["pptx_analyze_presentation_layout"]()
+        assert "1 out-of-bounds elements" in result
+
     @pytest.mark.asyncio
     async def test_fix_oob(self, inspection_tools_with_oob):
         """Test fixing out of bounds elements."""
@@ -1236,3 +1249,104 @@ class TestMissingElementTypes:
         assert "RECOMMENDATIONS" in result
         # Should recommend adding variety
         assert "variety" in result.lower() or "adding" in result.lower() or "No" in result
+
+
+class TestIsTitlePlaceholder:
+    """Tests for the _is_title_placeholder helper."""
+
+    def test_title_and_center_title(self):
+        """Test that both title placeholder kinds are detected."""
+        from chuk_mcp_pptx.tools.inspection.analysis import _is_title_placeholder
+
+        prs = Presentation()
+        title_slide = prs.slides.add_slide(prs.slide_layouts[0])  # CENTER_TITLE + SUBTITLE
+        content_slide = prs.slides.add_slide(prs.slide_layouts[1])  # TITLE + BODY
+
+        assert _is_title_placeholder(title_slide.shapes.title)
+        assert _is_title_placeholder(content_slide.shapes.title)
+
+    def test_non_title_shapes(self):
+        """Test that body placeholders and plain shapes are not titles."""
+        from chuk_mcp_pptx.tools.inspection.analysis import _is_title_placeholder
+
+        prs = Presentation()
+        slide = prs.slides.add_slide(prs.slide_layouts[1])
+        body = [ph for ph in slide.placeholders if ph.placeholder_format.idx == 1][0]
+        box = slide.shapes.add_textbox(Inches(1), Inches(1), Inches(2), Inches(1))
+        rect = slide.shapes.add_shape(1, Inches(1), Inches(3), Inches(2), Inches(1))
+
+        assert not _is_title_placeholder(body)
+        assert not _is_title_placeholder(box)
+        assert not _is_title_placeholder(rect)
+
+
+class TestNonTitleShapes:
+    """Tests for the _non_title_shapes helper."""
+
+    def test_drops_title_placeholder(self):
+        """Test that title placeholders are removed from the list."""
+        from chuk_mcp_pptx.tools.inspection.analysis import _non_title_shapes
+
+        prs = Presentation()
+        slide = prs.slides.add_slide(prs.slide_layouts[1])
+        slide.shapes.add_textbox(Inches(1), Inches(1), Inches(2), Inches(1))
+
+        result = _non_title_shapes(slide.shapes)
+
+        assert slide.shapes.title not in result
+        assert len(result) == len(slide.shapes) - 1
+
+    def test_blank_slide_fast_path(self):
+        """Test that slides without placeholders keep every shape."""
+        from chuk_mcp_pptx.tools.inspection.analysis import _non_title_shapes
+
+        prs = Presentation()
+        slide = prs.slides.add_slide(prs.slide_layouts[6])
+        slide.shapes.add_textbox(Inches(1), Inches(1), Inches(2), Inches(1))
+        slide.shapes.add_shape(1, Inches(1), Inches(3), Inches(2), Inches(1))
+
+        assert len(_non_title_shapes(slide.shapes)) == 2
+
+
+class TestOverlappingPairs:
+    """Tests for the _overlapping_pairs helper."""
+
+    def test_finds_overlaps_only(self):
+        """Test that touching shapes are not reported but intersecting ones are."""
+        from chuk_mcp_pptx.tools.inspection.analysis import _overlapping_pairs
+
+        prs = Presentation()
+        slide = prs.slides.add_slide(prs.slide_layouts[6])
+        a = slide.shapes.add_textbox(Inches(1), Inches(1), Inches(2), Inches(1))
+        b = slide.shapes.add_textbox(Inches(2), Inches(1.5), Inches(2), Inches(1))
+        slide.shapes.add_textbox(Inches(4), Inches(1.5), Inches(1), Inches(1))
+
+        assert list(_overlapping_pairs(list(slide.shapes))) == [(a, b)]
+
+    def test_matches_pairwise_check(self):
+        """Test the sweep finds exactly the pairs a brute-force comparison does."""
+        import random
+
+        from chuk_mcp_pptx.tools.inspection.analysis import _emu_bounds, _overlapping_pairs
+
+        rng = random.Random(7)
+        prs = Presentation()
+        slide = prs.slides.add_slide(prs.slide_layouts[6])
+        for _ in range(40):
+            slide.shapes.add_textbox(
+                Inches(rng.randint(0, 8)),
+                Inches(rng.randint(0, 5)),
+                Inches(rng.randint(0, 3)),
+                Inches(rng.randint(0, 2)),
+            )
+        shapes = list(slide.shapes)
+
+        expected = []
+        for i, a in enumerate(shapes):
+            l1, t1, r1, b1 = _emu_bounds(a)
+            for b in shapes[i + 1 :]:
+                l2, t2, r2, b2 = _emu_bounds(b)
+                if not (r1 <= l2 or r2 <= l1 or b1 <= t2 or b2 <= t1):
+                    expected.append((a, b))
+
+        assert _overlapping_pairs(shapes) == expected
@@ -9,7 +9,11 @@ import pytest
 from unittest.mock import MagicMock
 from pptx import Presentation
 
-from chuk_mcp_pptx.tools.core.placeholder import register_placeholder_tools
+from chuk_mcp_pptx.tools.core.placeholder import (
+    find_placeholder,
+    get_slide,
+    register_placeholder_tools,
+)
 
 
 @pytest.fixture
@@ -39,6 +43,16 @@ def create_presentation_with_placeholders():
     return prs
 
 
+class _Placeholders(list):
+    """Placeholder list indexed by placeholder idx, like python-pptx's SlidePlaceholders."""
+
+    def __getitem__(self, idx):
+        for placeholder in self:
+            if placeholder.placeholder_format.idx == idx:
+                return placeholder
+        raise KeyError(idx)
+
+
 class MockPresentationManager:
     """Mock presentation manager for testing."""
 
@@ -767,7 +781,7 @@ class TestPlaceholderTextAttribute:
         # Use spec to remove text_frame attribute properly
         mock_placeholder.configure_mock(**{"text_frame": None})
 
-        mock_slide.placeholders = [mock_placeholder]
+        mock_slide.placeholders = _Placeholders([mock_placeholder])
 
         # Mock prs.slides as a MagicMock list-like object
         mock_slides = MagicMock()
@@ -801,7 +815,7 @@ class TestPlaceholderTextAttribute:
 def create_mock_slides_with_placeholder(mock_placeholder):
     """Helper to create mock slides with proper MagicMock structure."""
     mock_slide = MagicMock()
-    mock_slide.placeholders = [mock_placeholder]
+    mock_slide.placeholders = _Placeholders([mock_placeholder])
 
     mock_slides = MagicMock()
     mock_slides.__getitem__ = MagicMock(return_value=mock_slide)
@@ -1145,3 +1159,119 @@ class TestObjectPlaceholder:
         assert isinstance(result, str)
         data = json.loads(result)
         assert "message" in data or "error" in data
+
+
+class TestFindPlaceholder:
+    """Tests for the find_placeholder lookup."""
+
+    def test_finds_placeholder_by_idx(self):
+        """Test lookup returns the placeholder with the matching idx."""
+        prs = create_presentation_with_placeholders()
+        slide = prs.slides[0]
+
+        placeholder = find_placeholder(slide, 1)
+        assert placeholder.placeholder_format.idx == 1
+        assert find_placeholder(slide, 1) == placeholder
+        assert find_placeholder(slide, 99) is None
+
+    def test_removed_placeholder_not_returned(self):
+        """Test a placeholder removed from the slide is no longer found."""
+        prs = create_presentation_with_placeholders()
+        slide = prs.slides[0]
+
+        placeholder = find_placeholder(slide, 1)
+        placeholder._element.getparent().remove(placeholder._element)
+
+        assert find_placeholder(slide, 1) is None
+
+
+class TestGetSlide:
+    """Tests for the shared get_slide lookup."""
+
+    def test_returns_slide_in_range(self):
+        """Test an in-range index returns that slide."""
+        prs = create_presentation_with_placeholders()
+        assert get_slide(prs.slides, 0) == prs.slides[0]
+
+    def test_out_of_range_and_negative_return_none(self):
+        """Test indexes past the end, and negative ones, are out of range."""
+        prs = create_presentation_with_placeholders()
+        assert get_slide(prs.slides, len(prs.slides)) is None
+        assert get_slide(prs.slides, -1) is None
+
+
+class TestPopulatePlaceholders:
+    """Tests for the batch pptx_populate_placeholders tool."""
+
+    @pytest.mark.asyncio
+    async def test_populates_all_and_saves_once(self, placeholder_tools, mock_manager):
+        """Test every placeholder is filled with a single presentation update."""
+        calls = []
+
+        async def update(name=None):
+            calls.append(name)
+
+        mock_manager.update = update
+
+        result = await placeholder_tools["pptx_populate_placeholders"](
+            slide_index=0,
+            placeholders=[
+                {"placeholder_idx": 0, "content": "Title"},
+                {"placeholder_idx": 1, "content": "One\\nTwo"},
+            ],
+        )
+
+        assert "message" in json.loads(result)
+        assert len(calls) == 1
+        slide = mock_manager._presentation.slides[0]
+        assert slide.placeholders[0].text_frame.text == "Title"
+        assert [p.text for p in slide.placeholders[1].text_frame.paragraphs] == ["One", "Two"]
+
+    @pytest.mark.asyncio
+    async def test_accepts_json_string(self, placeholder_tools, mock_manager):
+        """Test placeholders can be passed as a JSON string."""
+        result = await placeholder_tools["pptx_populate_placeholders"](
+            slide_index=0,
+            placeholders='[{"placeholder_idx": 0, "content": "Title"}]',
+        )
+        assert "message" in json.loads(result)
+
+    @pytest.mark.asyncio
+    async def test_bad_entry_leaves_slide_untouched(self, placeholder_tools, mock_manager):
+        """Test a missing placeholder fails the batch before any text is written."""
+        result = await placeholder_tools["pptx_populate_placeholders"](
+            slide_index=0,
+            placeholders=[
+                {"placeholder_idx": 0, "content": "Title"},
+                {"placeholder_idx": 99, "content": "Nowhere"},
+            ],
+        )
+
+        assert "Placeholder 99 not found" in json.loads(result)["error"]
+        assert mock_manager._presentation.slides[0].placeholders[0].text_frame.text == ""
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        "placeholders",
+        [
+            "not json",
+            [],
+            ["text"],
+            [{"placeholder_idx": "0", "content": "x"}],
+            [{"placeholder_idx": 0}],
+        ],
+    )
+    async def test_invalid_entries(self, placeholder_tools, placeholders):
+        """Test malformed batches are rejected."""
+        result = await placeholder_tools["pptx_populate_placeholders"](
+            slide_index=0, placeholders=placeholders
+        )
+        assert "error" in json.loads(result)
+
+    @pytest.mark.asyncio
+    async def test_invalid_slide_index(self, placeholder_tools):
+        """Test an out-of-range slide index is rejected."""
+        result = await placeholder_tools["pptx_populate_placeholders"](
+            slide_index=5, placeholders=[{"placeholder_idx": 0, "content": "Title"}]
+        )
+        assert "not found" in json.loads(result)["error"]
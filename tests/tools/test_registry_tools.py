@@ -32,6 +32,14 @@ def mock_registry():
         mock_metadata.description = "A clickable button component"
         mock_metadata.tags = ["interactive", "action"]
         mock_reg.get.return_value = mock_metadata
+        mock_reg.summaries.return_value = [
+            {
+                "name": "Button",
+                "category": "ui",
+                "description": "A clickable button component",
+                "tags": ["interactive", "action"],
+            }
+        ]
 
         # Mock schema
         mock_schema = {
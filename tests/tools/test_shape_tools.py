@@ -0,0 +1,222 @@
+"""
+Tests for tools/core/shapes.py
+
+Tests the bulk shape insertion tool.
+"""
+
+import json
+import pytest
+from unittest.mock import AsyncMock
+
+from chuk_mcp_pptx.tools.core.shapes import ShapeSpec, register_shape_tools
+
+
+@pytest.fixture
+def shape_tools(mock_mcp_server, mock_presentation_manager):
+    """Register shape tools and return them."""
+    return register_shape_tools(mock_mcp_server, mock_presentation_manager)
+
+
+def _flow_shapes():
+    return [
+        {"shape_type": "rounded_rectangle", "text": "Plan", "left": 1.0, "top": 2.5},
+        {"shape_type": "arrow_right", "left": 3.2, "top": 2.8},
+        {"shape_type": "rounded_rectangle", "text": "Build", "left": 4.2, "top": 2.5},
+    ]
+
+
+def _with_size(shapes, width=2.0, height=1.0):
+    return [{**spec, "width": width, "height": height} for spec in shapes]
+
+
+class TestAddShapes:
+    """Tests for pptx_add_shapes."""
+
+    @pytest.mark.asyncio
+    async def test_add_shapes_renders_all(self, shape_tools, mock_presentation_manager):
+        """Test that every shape is added to the slide."""
+        prs, _ = await mock_presentation_manager.get()
+        before = len(prs.slides[0].shapes)
+
+        result = await shape_tools["pptx_add_shapes"](
+            slide_index=0, shapes=_with_size(_flow_shapes())
+        )
+
+        data = json.loads(result)
+        assert "error" not in data
+        assert "3 shapes" in data["message"]
+        assert len(prs.slides[0].shapes) == before + 3
+
+    @pytest.mark.asyncio
+    async def test_add_shapes_saves_once(self, shape_tools, mock_presentation_manager):
+        """Test that the presentation is updated once per batch."""
+        mock_presentation_manager.update = AsyncMock(return_value=True)
+
+        await shape_tools["pptx_add_shapes"](slide_index=0, shapes=_with_size(_flow_shapes()))
+
+        mock_presentation_manager.update.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_add_shapes_accepts_json_string(self, shape_tools):
+        """Test that shapes can be passed as a JSON string."""
+        result = await shape_tools["pptx_add_shapes"](
+            slide_index=0, shapes=json.dumps(_with_size(_flow_shapes()))
+        )
+        assert "error" not in json.loads(result)
+
+    @pytest.mark.asyncio
+    async def test_add_shapes_invalid_json(self, shape_tools):
+        """Test error on malformed JSON."""
+        result = await shape_tools["pptx_add_shapes"](slide_index=0, shapes="[{not json")
+        assert "Invalid JSON" in json.loads(result)["error"]
+
+    @pytest.mark.asyncio
+    async def test_add_shapes_empty_list(self, shape_tools):
+        """Test error on an empty batch."""
+        result = await shape_tools["pptx_add_shapes"](slide_index=0, shapes=[])
+        assert "error" in json.loads(result)
+
+    @pytest.mark.asyncio
+    async def test_add_shapes_unknown_type_adds_nothing(
+        self, shape_tools, mock_presentation_manager
+    ):
+        """Test that one bad entry rejects the whole batch."""
+        prs, _ = await mock_presentation_manager.get()
+        before = len(prs.slides[0].shapes)
+        shapes = _with_size(_flow_shapes())
+        shapes[2]["shape_type"] = "spiral"
+
+        result = await shape_tools["pptx_add_shapes"](slide_index=0, shapes=shapes)
+
+        assert "spiral" in json.loads(result)["error"]
+        assert len(prs.slides[0].shapes) == before
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("key", ["fill_color", "line_color"])
+    @pytest.mark.parametrize("color", ["#12", "#zzzzzz", "#-00001", 0x123456])
+    async def test_add_shapes_bad_color_adds_nothing(
+        self, shape_tools, mock_presentation_manager, key, color
+    ):
+        """Test that an unparseable color rejects the whole batch."""
+        prs, _ = await mock_presentation_manager.get()
+        before = len(prs.slides[0].shapes)
+        shapes = _with_size(_flow_shapes())
+        shapes[2][key] = color
+
+        result = await shape_tools["pptx_add_shapes"](slide_index=0, shapes=shapes)
+
+        assert f"Shape 2: invalid {key}" in json.loads(result)["error"]
+        assert len(prs.slides[0].shapes) == before
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        "key, value",
+        [
+            ("shape_type", 3),
+            ("text", ["not", "text"]),
+            ("line_width", "thick"),
+            ("left", "far"),
+            ("height", float("nan")),
+        ],
+    )
+    async def test_add_shapes_bad_field_adds_nothing(
+        self, shape_tools, mock_presentation_manager, key, value
+    ):
+        """Test that a wrongly typed field rejects the whole batch, naming the shape."""
+        prs, _ = await mock_presentation_manager.get()
+        before = len(prs.slides[0].shapes)
+        shapes = _with_size(_flow_shapes())
+        shapes[2][key] = value
+
+        result = await shape_tools["pptx_add_shapes"](slide_index=0, shapes=shapes)
+
+        assert f"Shape 2: invalid {key}" in json.loads(result)["error"]
+        assert len(prs.slides[0].shapes) == before
+
+    @pytest.mark.asyncio
+    async def test_add_shapes_numeric_strings(self, shape_tools):
+        """Test that numeric strings are converted before drawing."""
+        shapes = _with_size(_flow_shapes(), width="2.0")
+        shapes[0]["line_width"] = "2.5"
+
+        result = await shape_tools["pptx_add_shapes"](slide_index=0, shapes=shapes)
+
+        assert "error" not in json.loads(result)
+
+    @pytest.mark.asyncio
+    async def test_add_shapes_semantic_colors(self, shape_tools):
+        """Test that semantic color paths pass validation."""
+        shapes = _with_size(_flow_shapes())
+        shapes[0].update(fill_color="primary.DEFAULT", line_color="#112233")
+
+        result = await shape_tools["pptx_add_shapes"](slide_index=0, shapes=shapes)
+
+        assert "error" not in json.loads(result)
+
+    @pytest.mark.asyncio
+    async def test_add_shapes_missing_position(self, shape_tools):
+        """Test error when a shape has no size."""
+        result = await shape_tools["pptx_add_shapes"](slide_index=0, shapes=_flow_shapes())
+        assert "missing width, height" in json.loads(result)["error"]
+
+    @pytest.mark.asyncio
+    async def test_add_shapes_invalid_slide(self, shape_tools):
+        """Test error on an out-of-range slide index."""
+        result = await shape_tools["pptx_add_shapes"](
+            slide_index=99, shapes=_with_size(_flow_shapes())
+        )
+        assert "99" in json.loads(result)["error"]
+
+    @pytest.mark.asyncio
+    async def test_add_shapes_no_presentation(self, mock_mcp_server):
+        """Test error when no presentation exists."""
+        from chuk_mcp_pptx.core.presentation_manager import PresentationManager
+
+        tools = register_shape_tools(mock_mcp_server, PresentationManager())
+        result = await tools["pptx_add_shapes"](slide_index=0, shapes=_with_size(_flow_shapes()))
+        assert "No presentation" in json.loads(result)["error"]
+
+    @pytest.mark.asyncio
+    async def test_add_shapes_dict_response(self, shape_tools):
+        """Test the opt-in structured response."""
+        shapes = _with_size(_flow_shapes())
+        shapes[0]["left"] = 12.0  # off the right edge, gets clamped
+
+        result = await shape_tools["pptx_add_shapes"](
+            slide_index=0, shapes=shapes, response_format="dict"
+        )
+
+        assert result == {"status": "ok", "slide": 0, "shapes": 3, "adjusted": 1}
+
+    @pytest.mark.asyncio
+    async def test_add_shapes_dict_error(self, shape_tools):
+        """Test errors come back as dicts in dict mode."""
+        result = await shape_tools["pptx_add_shapes"](
+            slide_index=99, shapes=_with_size(_flow_shapes()), response_format="dict"
+        )
+        assert "99" in result["error"]
+
+    @pytest.mark.asyncio
+    async def test_add_shapes_unknown_response_format(self, shape_tools):
+        """Test error on an unsupported response_format."""
+        result = await shape_tools["pptx_add_shapes"](
+            slide_index=0, shapes=_with_size(_flow_shapes()), response_format="xml"
+        )
+        assert "response_format" in json.loads(result)["error"]
+
+
+class TestShapeSpec:
+    """Tests for the ShapeSpec parameter bundle."""
+
+    def test_defaults(self):
+        """Test optional fields default sensibly."""
+        spec = ShapeSpec("rectangle", 1.0, 2.0, 3.0, 1.5)
+        assert spec.text is None
+        assert spec.line_width == 1.0
+
+    def test_frozen_and_slotted(self):
+        """Test specs are immutable and carry no instance dict."""
+        spec = ShapeSpec("oval", 1.0, 2.0, 3.0, 1.5)
+        with pytest.raises(AttributeError):
+            spec.left = 5.0
+        assert not hasattr(spec, "__dict__")
@@ -7,7 +7,7 @@ Tests all slide layout management MCP tools for >90% coverage.
 import pytest
 from unittest.mock import MagicMock, AsyncMock
 from pptx import Presentation
-from chuk_mcp_pptx.tools.layout.slide_management import register_layout_tools
+from chuk_mcp_pptx.tools.layout.slide_management import register_layout_tools, _parse_hex_color
 
 
 @pytest.fixture
@@ -158,6 +158,18 @@ class TestCustomizeLayout:
         assert isinstance(result, str)
         assert "No customizations" in result or "Customized" in result
 
+    @pytest.mark.asyncio
+    async def test_customize_layout_no_options_skips_save(
+        self, layout_tools, mock_presentation_manager
+    ):
+        """Test nothing is saved when no customization was written."""
+        mock_presentation_manager.update = AsyncMock()
+        await layout_tools["pptx_customize_layout"](slide_index=0, background_color="INVALID")
+        mock_presentation_manager.update.assert_not_awaited()
+
+        await layout_tools["pptx_customize_layout"](slide_index=0, add_date="2024-12-01")
+        mock_presentation_manager.update.assert_awaited_once()
+
     @pytest.mark.asyncio
     async def test_customize_layout_invalid_color(self, layout_tools, mock_presentation_manager):
         """Test with invalid background color format."""
@@ -172,9 +184,31 @@ class TestCustomizeLayout:
     ):
         """Test background color without # prefix."""
         result = await layout_tools["pptx_customize_layout"](
-            slide_index=0, background_color="F5F5F5"
+            slide_index=0, background_color="f5f5f5"
         )
-        assert isinstance(result, str)
+        assert "background color F5F5F5" in result
+
+    @pytest.mark.asyncio
+    async def test_customize_layout_truncated_color(self, layout_tools, mock_presentation_manager):
+        """Test that a short hex string is reported as invalid."""
+        result = await layout_tools["pptx_customize_layout"](slide_index=0, background_color="#F5F")
+        assert "invalid format" in result
+
+
+class TestParseHexColor:
+    """Test the _parse_hex_color helper."""
+
+    def test_parse_with_and_without_hash(self):
+        """Test both accepted spellings produce the same color."""
+        assert _parse_hex_color("#1A2b3C") == (0x1A, 0x2B, 0x3C)
+        assert _parse_hex_color("1A2b3C") == (0x1A, 0x2B, 0x3C)
+
+    @pytest.mark.parametrize(
+        "value", ["", "#", "#12345", "#1234567", "GGGGGG", "#12 456", "#FF0000\n", "#-12345"]
+    )
+    def test_parse_rejects_malformed(self, value):
+        """Test malformed values return None instead of raising."""
+        assert _parse_hex_color(value) is None
 
 
 class TestApplyMasterLayout:
@@ -187,6 +221,19 @@ class TestApplyMasterLayout:
         assert isinstance(result, str)
         assert "Applied" in result or "slides" in result.lower()
 
+    @pytest.mark.asyncio
+    async def test_apply_master_layout_without_settings_skips_save(
+        self, layout_tools, mock_presentation_manager
+    ):
+        """Test nothing is saved when there are no settings to apply."""
+        mock_presentation_manager.update = AsyncMock()
+        result = await layout_tools["pptx_apply_master_layout"](layout_name="corporate")
+        assert "to 0 slides" in result
+        mock_presentation_manager.update.assert_not_awaited()
+
+        await layout_tools["pptx_apply_master_layout"](layout_name="corporate", font_name="Arial")
+        mock_presentation_manager.update.assert_awaited_once()
+
     @pytest.mark.asyncio
     async def test_apply_master_layout_with_font(self, layout_tools, mock_presentation_manager):
         """Test applying with font."""
@@ -487,6 +534,32 @@ class TestApplyMasterLayoutBodyFormatting:
         assert isinstance(result, str)
         assert "Applied" in result
 
+    @pytest.mark.asyncio
+    async def test_apply_master_keeps_title_color_off_body(self, mock_mcp_server):
+        """Test the title gets the title color and other text shapes the body color."""
+        from pptx.dml.color import RGBColor
+        from pptx.util import Inches
+
+        prs = Presentation()
+        slide = prs.slides.add_slide(prs.slide_layouts[1])
+        slide.shapes.title.text = "Title"
+        textbox = slide.shapes.add_textbox(Inches(1), Inches(2), Inches(4), Inches(1))
+        textbox.text_frame.text = "Body"
+
+        mock_manager = MagicMock()
+        mock_manager.get = AsyncMock(return_value=(prs, MagicMock()))
+        mock_manager.update = AsyncMock()
+
+        tools = register_layout_tools(mock_mcp_server, mock_manager)
+        await tools["pptx_apply_master_layout"](
+            layout_name="corporate", title_color="#FF0000", body_color="#0000FF"
+        )
+
+        title_font = slide.shapes.title.text_frame.paragraphs[0].font
+        body_font = textbox.text_frame.paragraphs[0].font
+        assert title_font.color.rgb == RGBColor(0xFF, 0x00, 0x00)
+        assert body_font.color.rgb == RGBColor(0x00, 0x00, 0xFF)
+
     @pytest.mark.asyncio
     async def test_apply_master_exception_handling(self, mock_mcp_server):
         """Test exception handling - covers lines 504-505."""
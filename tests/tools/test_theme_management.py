@@ -9,6 +9,7 @@ import pytest
 from unittest.mock import MagicMock
 from pptx import Presentation
 
+from chuk_mcp_pptx.themes.theme_manager import Theme, ThemeManager
 from chuk_mcp_pptx.tools.theme.management import register_theme_tools
 
 
@@ -111,6 +112,33 @@ class TestListThemes:
         # Should have themes listed (contains theme names)
         assert "dark" in result.lower() or "light" in result.lower()
 
+    @pytest.mark.asyncio
+    async def test_list_themes_is_cached(self, theme_tools):
+        """Test that repeated calls reuse the precomputed listing."""
+        first = await theme_tools["pptx_list_themes"]()
+        second = await theme_tools["pptx_list_themes"]()
+        assert first is second
+
+
+class TestSharedThemeManager:
+    """Tests for tools registered against a shared ThemeManager."""
+
+    @pytest.mark.asyncio
+    async def test_registered_theme_is_listed_and_applied(self, mock_mcp, mock_manager):
+        """Test a theme registered after setup is seen by the listing and by apply."""
+        theme_manager = ThemeManager()
+        register_theme_tools(mock_mcp, mock_manager, theme_manager)
+        tools = mock_mcp._tools
+
+        before = await tools["pptx_list_themes"]()
+        theme_manager.register_theme(Theme("brand", primary_hue="emerald", mode="light"))
+        after = await tools["pptx_list_themes"]()
+
+        assert "brand" not in before
+        assert "• brand (light)" in after
+        result = await tools["pptx_apply_theme"](slide_index=None, theme="brand")
+        assert result.startswith("Applied brand theme")
+
 
 class TestGetThemeInfo:
     """Tests for pptx_get_theme_info."""
@@ -248,6 +276,41 @@ class TestApplyTheme:
         assert isinstance(result, str)
 
 
+class TestApplyThemeReapply:
+    """Tests for re-applying a theme to an already themed slide."""
+
+    @pytest.mark.asyncio
+    async def test_recolored_run_is_reset(self, theme_tools, mock_manager):
+        """Test that a run recolored after theming gets the theme color back."""
+        from pptx.dml.color import RGBColor
+        from pptx.util import Inches
+
+        slide = mock_manager._presentation.slides[0]
+        box = slide.shapes.add_textbox(Inches(1), Inches(3), Inches(2), Inches(1))
+        box.text_frame.text = "Text"
+        await theme_tools["pptx_apply_theme"](slide_index=0, theme="dark")
+        run = box.text_frame.paragraphs[0].runs[0]
+        themed = run.font.color.rgb
+        run.font.color.rgb = RGBColor(0x12, 0x34, 0x56)
+
+        await theme_tools["pptx_apply_theme"](slide_index=0, theme="dark")
+
+        assert run.font.color.rgb == themed
+
+    @pytest.mark.asyncio
+    async def test_changed_background_is_reset(self, theme_tools, mock_manager):
+        """Test that a background changed elsewhere is restored on re-apply."""
+        from pptx.dml.color import RGBColor
+
+        await theme_tools["pptx_apply_theme"](slide_index=0, theme="dark")
+        slide = mock_manager._presentation.slides[0]
+        slide.background.fill.fore_color.rgb = RGBColor(0x12, 0x34, 0x56)
+
+        await theme_tools["pptx_apply_theme"](slide_index=0, theme="dark")
+
+        assert slide.background.fill.fore_color.rgb != RGBColor(0x12, 0x34, 0x56)
+
+
 class TestApplyComponentTheme:
     """Tests for pptx_apply_component_theme."""
 
@@ -495,3 +558,22 @@ class TestEdgeCases:
         result = await theme_tools["pptx_apply_theme"](slide_index=-1, theme="dark")
         assert isinstance(result, str)
         # The API may allow negative indexing, so just verify we get a result
+
+    @pytest.mark.asyncio
+    async def test_apply_theme_rejects_bad_args_without_loading(self, mock_mcp):
+        """Test that invalid arguments fail before the presentation is fetched."""
+        from unittest.mock import AsyncMock
+
+        manager = MockPresentationManager()
+        manager.get = AsyncMock(side_effect=AssertionError("should not load"))
+        register_theme_tools(mock_mcp, manager)
+        tools = mock_mcp._tools
+
+        result = await tools["pptx_apply_theme"](slide_index=-1, theme="dark")
+        assert "out of range" in result
+        result = await tools["pptx_apply_theme"](slide_index=0, theme="no-such-theme")
+        assert "Unknown theme" in result
+        assert "Available: dark, dark-blue" in result
+        result = await tools["pptx_apply_component_theme"](slide_index=0, shape_index=-2)
+        assert "out of range" in result
+        manager.get.assert_not_awaited()